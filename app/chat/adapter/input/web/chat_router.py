@@ -1,29 +1,39 @@
-import json
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from uuid import uuid4
 
 from config.connection_manager import manager
+from config.websocket_codec import encode_json
 from app.chat.application.use_case.get_chat_history_use_case import GetChatHistoryUseCase
 from app.chat.application.use_case.get_my_chat_rooms_use_case import GetMyChatRoomsUseCase
+from app.chat.application.use_case.get_unread_counts_use_case import GetUnreadCountsUseCase
 from app.chat.application.use_case.mark_chat_room_as_read_use_case import MarkChatRoomAsReadUseCase
 from app.chat.application.use_case.leave_chat_room_use_case import LeaveChatRoomUseCase
 from app.chat.application.use_case.report_user_use_case import ReportUserUseCase
 from app.chat.application.use_case.rate_user_use_case import RateUserUseCase
 from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
 from app.chat.application.port.report_repository_port import ReportRepositoryPort
 from app.chat.application.port.rating_repository_port import RatingRepositoryPort
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
+from app.chat.application.port.active_chat_pair_port import ActiveChatPairPort
 from app.chat.infrastructure.repository.mysql_chat_message_repository import MySQLChatMessageRepository
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
+from app.chat.infrastructure.repository.mysql_chat_room_summary_repository import MySQLChatRoomSummaryRepository
 from app.chat.infrastructure.repository.mysql_report_repository import MySQLReportRepository
 from app.chat.infrastructure.repository.mysql_rating_repository import MySQLRatingRepository
+from app.chat.infrastructure.repository.redis_unread_counter_repository import RedisUnreadCounterRepository
+from app.chat.infrastructure.repository.redis_active_chat_pair_repository import RedisActiveChatPairRepository
+from app.chat.infrastructure.writer.buffered_chat_message_writer import flush_pending_chat_messages
 from app.chat.domain.report import ReportReason
 from app.chat.application.dto.rate_user_request import RateUserRequest
 from config.database import get_db
+from config.redis import get_redis
 
 chat_router = APIRouter()
 
@@ -38,6 +48,11 @@ def get_chat_room_repository(db: Session = Depends(get_db)) -> ChatRoomRepositor
     return MySQLChatRoomRepository(db)
 
 
+def get_chat_room_summary_repository(db: Session = Depends(get_db)) -> ChatRoomSummaryRepositoryPort:
+    """ChatRoomSummary Repository 의존성 주입"""
+    return MySQLChatRoomSummaryRepository(db)
+
+
 def get_report_repository(db: Session = Depends(get_db)) -> ReportRepositoryPort:
     """Report Repository 의존성 주입"""
     return MySQLReportRepository(db)
@@ -48,6 +63,16 @@ def get_rating_repository(db: Session = Depends(get_db)) -> RatingRepositoryPort
     return MySQLRatingRepository(db)
 
 
+def get_unread_counter() -> UnreadCounterPort:
+    """UnreadCounter 의존성 주입"""
+    return RedisUnreadCounterRepository(get_redis())
+
+
+def get_active_chat_pairs() -> ActiveChatPairPort:
+    """ActiveChatPair 의존성 주입"""
+    return RedisActiveChatPairRepository(get_redis())
+
+
 class ChatMessageResponse(BaseModel):
     """채팅 메시지 응답 DTO"""
     id: str
@@ -62,6 +87,8 @@ class ChatHistoryResponse(BaseModel):
     user1_id: str
     user2_id: str
     messages: list[ChatMessageResponse]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class ChatRoomPreviewResponse(BaseModel):
@@ -80,9 +107,16 @@ class MyChatRoomsResponse(BaseModel):
     rooms: list[ChatRoomPreviewResponse]
 
 
-@chat_router.get("/chat/{room_id}/messages", response_model=ChatHistoryResponse)
+@chat_router.get(
+    "/chat/{room_id}/messages",
+    response_model=ChatHistoryResponse,
+    dependencies=[Depends(flush_pending_chat_messages)]
+)
 def get_chat_history(
     room_id: str,
+    before: Optional[str] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=GetChatHistoryUseCase.MAX_PAGE_SIZE),
     message_repository: ChatMessageRepositoryPort = Depends(get_chat_message_repository),
     room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository)
 ):
@@ -90,7 +124,13 @@ def get_chat_history(
     채팅방의 메시지 기록을 조회한다.
 
     - room_id: 채팅방 ID
+    - before: 이 커서 이전의 메시지를 조회 (위로 스크롤, 선택)
+    - after: 이 커서 이후의 메시지를 조회 (선택, before와 동시 사용 불가)
+    - limit: 페이지 크기 (선택)
     - 반환: 채팅방 참여자 정보와 시간순으로 정렬된 메시지 목록
+
+    before/after/limit 중 하나라도 지정하면 커서 페이지 모드로 동작하며,
+    더 조회할 메시지가 있으면 next_cursor를 함께 반환한다.
     """
     # 채팅방 정보 조회
     room = room_repository.find_by_id(room_id)
@@ -98,7 +138,24 @@ def get_chat_history(
         raise HTTPException(status_code=404, detail="채팅방을 찾을 수 없습니다")
 
     use_case = GetChatHistoryUseCase(message_repository)
-    messages = use_case.execute(room_id)
+    next_cursor = None
+    has_more = False
+
+    if before is None and after is None and limit is None:
+        messages = use_case.execute(room_id)
+    else:
+        try:
+            page = use_case.execute_page(
+                room_id,
+                limit=limit or GetChatHistoryUseCase.DEFAULT_PAGE_SIZE,
+                before=before,
+                after=after,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        messages = page.messages
+        next_cursor = page.next_cursor
+        has_more = page.has_more
 
     message_responses = [
         ChatMessageResponse(
@@ -114,15 +171,23 @@ def get_chat_history(
     return ChatHistoryResponse(
         user1_id=room.user1_id,
         user2_id=room.user2_id,
-        messages=message_responses
+        messages=message_responses,
+        next_cursor=next_cursor,
+        has_more=has_more
     )
 
 
-@chat_router.get("/chat/rooms/my", response_model=MyChatRoomsResponse)
-def get_my_chat_rooms(
+@chat_router.get(
+    "/chat/rooms/my",
+    response_model=MyChatRoomsResponse,
+    dependencies=[Depends(flush_pending_chat_messages)]
+)
+async def get_my_chat_rooms(
     user_id: str,
     room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository),
-    message_repository: ChatMessageRepositoryPort = Depends(get_chat_message_repository)
+    message_repository: ChatMessageRepositoryPort = Depends(get_chat_message_repository),
+    summary_repository: ChatRoomSummaryRepositoryPort = Depends(get_chat_room_summary_repository),
+    unread_counter: UnreadCounterPort = Depends(get_unread_counter)
 ):
     """
     사용자의 채팅방 목록을 조회한다.
@@ -130,8 +195,13 @@ def get_my_chat_rooms(
     - user_id: 사용자 ID
     - 반환: 최신 메시지 미리보기와 읽지 않은 메시지 수를 포함한 채팅방 목록
     """
-    use_case = GetMyChatRoomsUseCase(room_repository, message_repository)
-    room_previews = use_case.execute(user_id)
+    use_case = GetMyChatRoomsUseCase(room_repository, message_repository, summary_repository)
+    room_previews = await run_in_threadpool(use_case.execute, user_id)
+
+    # 읽지 않은 수는 Redis 카운터가 기준이다 (읽음 워터마크는 MySQL에 지연 반영되므로)
+    unread_counts = await GetUnreadCountsUseCase(
+        unread_counter, room_repository, message_repository, summary_repository
+    ).execute(user_id)
 
     room_responses = []
     for preview in room_previews:
@@ -152,7 +222,7 @@ def get_my_chat_rooms(
             created_at=preview.created_at,
             status=preview.status,
             latest_message=latest_message_response,
-            unread_count=preview.unread_count
+            unread_count=unread_counts.get(preview.id, 0)
         )
         room_responses.append(room_response)
 
@@ -160,26 +230,55 @@ def get_my_chat_rooms(
 
 
 @chat_router.post("/chat/{room_id}/read")
-def mark_room_as_read(
+async def mark_room_as_read(
     room_id: str,
     user_id: str,
-    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository)
+    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository),
+    summary_repository: ChatRoomSummaryRepositoryPort = Depends(get_chat_room_summary_repository),
+    unread_counter: UnreadCounterPort = Depends(get_unread_counter)
 ):
     """
     채팅방의 메시지를 읽음 처리한다.
 
     - room_id: 채팅방 ID
     - user_id: 읽음 처리할 사용자 ID (query parameter)
+    - 읽지 않은 수는 Redis에서 즉시 초기화되고, 마지막 읽은 시각은 MySQL에 지연 반영된다
     """
-    use_case = MarkChatRoomAsReadUseCase(room_repository)
-    use_case.execute(room_id, user_id)
+    use_case = MarkChatRoomAsReadUseCase(room_repository, summary_repository, unread_counter)
+    await use_case.execute(room_id, user_id)
 
     return {"status": "success", "message": "채팅방이 읽음 처리되었습니다"}
 
 
+class UnreadTotalResponse(BaseModel):
+    """전체 읽지 않은 메시지 수 응답 DTO"""
+    user_id: str
+    total_unread_count: int
+
+
+@chat_router.get("/chat/unread/total", response_model=UnreadTotalResponse)
+async def get_unread_total(
+    user_id: str,
+    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository),
+    message_repository: ChatMessageRepositoryPort = Depends(get_chat_message_repository),
+    summary_repository: ChatRoomSummaryRepositoryPort = Depends(get_chat_room_summary_repository),
+    unread_counter: UnreadCounterPort = Depends(get_unread_counter)
+):
+    """
+    사용자의 전체 읽지 않은 메시지 수(배지 수)를 조회한다.
+
+    - user_id: 사용자 ID (query parameter)
+    - Redis 카운터 한 번의 조회로 계산한다 (최초 조회 시에만 채팅방 요약으로부터 초기화)
+    """
+    use_case = GetUnreadCountsUseCase(unread_counter, room_repository, message_repository, summary_repository)
+    total = await use_case.execute_total(user_id)
+
+    return UnreadTotalResponse(user_id=user_id, total_unread_count=total)
+
+
 async def _notify_partner_left(room_id: str, left_user_id: str):
     """상대방에게 파트너가 나갔음을 알린다"""
-    message = json.dumps({
+    message = encode_json({
         "type": "partner_left",
         "room_id": room_id,
         "user_id": left_user_id
@@ -192,7 +291,9 @@ async def leave_chat_room(
     room_id: str,
     user_id: str,
     background_tasks: BackgroundTasks,
-    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository)
+    room_repository: ChatRoomRepositoryPort = Depends(get_chat_room_repository),
+    unread_counter: UnreadCounterPort = Depends(get_unread_counter),
+    active_chat_pairs: ActiveChatPairPort = Depends(get_active_chat_pairs)
 ):
     """
     채팅방을 나간다.
@@ -201,7 +302,13 @@ async def leave_chat_room(
     - user_id: 나가는 사용자 ID (query parameter)
     """
     use_case = LeaveChatRoomUseCase(room_repository)
-    use_case.execute(room_id, user_id)
+    room = use_case.execute(room_id, user_id)
+
+    # 더 이상 활성 채팅 쌍이 아니므로 다시 매칭될 수 있게 한다
+    await active_chat_pairs.remove(room.user1_id, room.user2_id)
+
+    # 나간 채팅방의 읽지 않은 수가 배지 수에 남지 않도록 초기화
+    await unread_counter.mark_read(room_id, user_id, datetime.now())
 
     # WebSocket으로 상대방에게 알림
     await _notify_partner_left(room_id, user_id)
@@ -222,7 +329,11 @@ class ReportMessageResponse(BaseModel):
     message: str
 
 
-@chat_router.post("/chat/messages/{message_id}/report", response_model=ReportMessageResponse)
+@chat_router.post(
+    "/chat/messages/{message_id}/report",
+    response_model=ReportMessageResponse,
+    dependencies=[Depends(flush_pending_chat_messages)]
+)
 def report_message(
     message_id: str,
     request: ReportMessageRequest,
@@ -1,15 +1,22 @@
-import json
 import uuid
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from config.connection_manager import manager
-from app.chat.application.use_case.save_chat_message_use_case import SaveChatMessageUseCase
-from app.chat.infrastructure.repository.mysql_chat_message_repository import MySQLChatMessageRepository
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.adapter.input.web.chat_router import get_unread_counter
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
+from app.chat.domain.chat_room import ChatRoom
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
+from app.chat.infrastructure.writer.buffered_chat_message_writer import (
+    BufferedChatMessageWriter,
+    get_chat_message_writer,
+)
 from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
-from config.database import get_db
+from config.database import get_session_factory
 from config.redis import get_redis
+from config.websocket_codec import WebSocketCodec, encode_json, negotiate_codec
 
 chat_websocket_router = APIRouter()
 
@@ -32,15 +39,36 @@ async def _set_user_chatting(user_id: str, room_id: str):
         print(f"[WebSocket] Set chatting state for user {user_id} in room {room_id}")
 
 
-@chat_websocket_router.websocket("/ws/chat/{room_id}")
-async def websocket_endpoint(websocket: WebSocket, room_id: str, db: Session = Depends(get_db)):
-    await manager.connect(websocket, room_id)
+def _find_chat_room(session_factory: sessionmaker, room_id: str) -> ChatRoom | None:
+    """짧은 세션으로 채팅방을 조회한다 (스레드풀에서 실행)"""
+    with session_factory() as db:
+        return MySQLChatRoomRepository(db).find_by_id(room_id)
+
+
+async def _send_error(websocket: WebSocket, codec: WebSocketCodec, error: str):
+    """에러 응답을 클라이언트가 협상한 형식으로 보낸다"""
+    await codec.send(websocket, codec.encode({"error": error}))
+
 
-    room_repository = MySQLChatRoomRepository(db)
-    chat_room = room_repository.find_by_id(room_id)
+@chat_websocket_router.websocket("/ws/chat/{room_id}")
+async def websocket_endpoint(
+    websocket: WebSocket,
+    room_id: str,
+    session_factory: sessionmaker = Depends(get_session_factory),
+    writer: BufferedChatMessageWriter = Depends(get_chat_message_writer),
+    unread_counter: UnreadCounterPort = Depends(get_unread_counter)
+):
+    # 소켓 수명 동안 커넥션 풀의 세션을 점유하지 않도록, DB 작업마다 세션을 열고
+    # 블로킹 쿼리는 이벤트 루프 밖(스레드풀)에서 실행한다
+    # Sec-WebSocket-Protocol로 msgpack을 요청한 클라이언트는 바이너리 프레임, 그 외는 JSON 텍스트
+    codec = negotiate_codec(websocket)
+    await manager.connect(websocket, room_id, codec=codec)
+
+    chat_room = await run_in_threadpool(_find_chat_room, session_factory, room_id)
     if not chat_room:
-        await websocket.send_json({"error": "채팅방을 찾을 수 없습니다"})
+        await _send_error(websocket, codec, "채팅방을 찾을 수 없습니다")
         await websocket.close()
+        manager.disconnect(websocket, room_id)
         return
     
     user1_id = chat_room.user1_id
@@ -50,35 +78,39 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, db: Session = D
 
     try:
         while True:
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            try:
+                message_data = await codec.receive(websocket)
+            except ValueError:
+                await _send_error(websocket, codec, "잘못된 메시지 형식입니다")
+                continue
 
             sender_id = message_data.get("sender_id")
             content = message_data.get("content")
 
             if not sender_id or not content:
-                await websocket.send_json({"error": "sender_id and content are required"})
+                await _send_error(websocket, codec, "sender_id and content are required")
                 continue
 
             if sender_id not in [user1_id, user2_id]:
-                await websocket.send_json({"error": "이 채팅방의 참여자가 아닙니다"})
+                await _send_error(websocket, codec, "이 채팅방의 참여자가 아닙니다")
                 continue
 
             if connected_user_id is None:
                 connected_user_id = sender_id
-                manager.register_user(sender_id, room_id, websocket)
+                await manager.register_user(sender_id, room_id, websocket)
                 await _set_user_chatting(sender_id, room_id)
 
-            message_id = str(uuid.uuid4())
-
-            message_repository = MySQLChatMessageRepository(db)
-            save_message_use_case = SaveChatMessageUseCase(message_repository)
-            saved_message = save_message_use_case.execute(
-                message_id=message_id,
+            saved_message = ChatMessage(
+                id=str(uuid.uuid4()),
                 room_id=room_id,
                 sender_id=sender_id,
                 content=content
             )
+            # 저장은 write-behind 버퍼에 맡기고 바로 broadcast 한다 (버퍼가 가득 차면 여기서 대기)
+            await writer.write(saved_message)
+            # 상대방의 읽지 않은 수 증가 (Redis)
+            recipient_id = user2_id if sender_id == user1_id else user1_id
+            await unread_counter.increment(room_id, recipient_id, saved_message.id)
 
             broadcast_message = {
                 "id": saved_message.id,
@@ -87,10 +119,12 @@ async def websocket_endpoint(websocket: WebSocket, room_id: str, db: Session = D
                 "content": saved_message.content,
                 "created_at": saved_message.created_at.isoformat()
             }
-            
-            await manager.broadcast(json.dumps(broadcast_message), room_id)
+
+            # 메시지당 한 번만 인코딩하고, 모든 수신 소켓이 같은 프레임을 공유한다
+            await manager.broadcast(encode_json(broadcast_message), room_id)
 
     except WebSocketDisconnect:
         disconnected_user_id = manager.disconnect(websocket, room_id)
-        if disconnected_user_id:
-            await _clear_user_state(disconnected_user_id)
\ No newline at end of file
+        # 다른 탭/기기로 아직 연결되어 있으면 채팅 상태를 유지한다
+        if disconnected_user_id and not manager.is_user_connected(disconnected_user_id):
+            await _clear_user_state(disconnected_user_id)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.chat.domain.chat_message import ChatMessage
+
+
+@dataclass
+class ChatMessagePageDTO:
+    """채팅 기록 페이지 조회용 DTO (시간순 메시지 목록과 다음 페이지 커서 포함)"""
+    messages: list[ChatMessage] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    has_more: bool = False
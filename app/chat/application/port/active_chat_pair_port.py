@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+
+class ActiveChatPairPort(ABC):
+    """활성 채팅방에서 대화 중인 사용자 쌍 저장소 포트 인터페이스 (순서 무관)"""
+
+    @abstractmethod
+    async def add(self, user1_id: str, user2_id: str) -> None:
+        """두 사용자를 활성 채팅 쌍으로 기록한다"""
+        pass
+
+    @abstractmethod
+    async def remove(self, user1_id: str, user2_id: str) -> None:
+        """두 사용자의 활성 채팅 쌍 기록을 지운다 (나가기/차단)"""
+        pass
+
+    @abstractmethod
+    async def contains(self, user1_id: str, user2_id: str) -> bool | None:
+        """
+        두 사용자가 활성 채팅 쌍인지 확인한다.
+
+        Returns:
+            아직 MySQL로부터 초기화되지 않았으면(또는 초기화가 만료되었으면) None
+        """
+        pass
+
+    @abstractmethod
+    async def seed(self, pairs: list[tuple[str, str]]) -> None:
+        """MySQL의 활성 채팅방 목록으로 전체 쌍을 다시 채운다"""
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
 
 
 class ChatMessageRepositoryPort(ABC):
@@ -11,12 +12,39 @@ class ChatMessageRepositoryPort(ABC):
         """메시지를 저장한다"""
         pass
 
+    @abstractmethod
+    def save_all(self, messages: list[ChatMessage]) -> None:
+        """여러 메시지를 한 번의 트랜잭션으로 저장한다 (write-behind 배치용)"""
+        pass
+
     @abstractmethod
     def find_by_id(self, message_id: str) -> ChatMessage | None:
         """id로 메시지를 조회한다"""
         pass
 
+    @abstractmethod
+    def find_existing_ids(self, message_ids: list[str]) -> set[str]:
+        """주어진 id 중 이미 저장된 메시지의 id만 반환한다"""
+        pass
+
     @abstractmethod
     def find_by_room_id(self, room_id: str) -> list[ChatMessage]:
         """room_id로 해당 채팅방의 메시지 목록을 시간순으로 조회한다"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def find_page_by_room_id(
+        self,
+        room_id: str,
+        limit: int,
+        before: MessageCursor | None = None,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """
+        room_id의 메시지를 (created_at, id) 키셋 기준으로 최대 limit개 조회한다.
+
+        - before: 커서보다 이전 메시지 중 가장 최근 limit개 (없으면 최신 메시지부터)
+        - after: 커서보다 이후 메시지 중 가장 오래된 limit개
+        - 반환: 항상 시간순으로 정렬된 메시지 목록
+        """
+        pass
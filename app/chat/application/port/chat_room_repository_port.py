@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from app.chat.domain.chat_room import ChatRoom
 
@@ -11,6 +12,11 @@ class ChatRoomRepositoryPort(ABC):
         """채팅방을 저장한다"""
         pass
 
+    @abstractmethod
+    def update_last_read_at(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        """사용자의 마지막 읽은 시각만 갱신한다 (기존 값보다 이후인 경우에만)"""
+        pass
+
     @abstractmethod
     def find_by_id(self, room_id: str) -> ChatRoom | None:
         """id로 채팅방을 조회한다"""
@@ -29,4 +35,9 @@ class ChatRoomRepositoryPort(ABC):
     @abstractmethod
     def find_by_users_any_status(self, user1_id: str, user2_id: str) -> ChatRoom | None:
         """두 사용자 간의 채팅방을 조회한다 (순서 무관, 모든 상태)"""
+        pass
+
+    @abstractmethod
+    def find_active_user_pairs(self) -> list[tuple[str, str]]:
+        """활성 채팅방의 (user1_id, user2_id) 목록을 조회한다"""
         pass
\ No newline at end of file
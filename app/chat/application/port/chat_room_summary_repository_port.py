@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room_summary import ChatRoomSummary
+
+
+class ChatRoomSummaryRepositoryPort(ABC):
+    """채팅방 요약 프로젝션 저장소 포트 인터페이스"""
+
+    @abstractmethod
+    def save(self, summary: ChatRoomSummary) -> None:
+        """채팅방 요약을 저장한다 (insert 또는 update)"""
+        pass
+
+    @abstractmethod
+    def find_by_room_id(self, room_id: str) -> ChatRoomSummary | None:
+        """room_id로 채팅방 요약을 조회한다"""
+        pass
+
+    @abstractmethod
+    def find_by_room_ids(self, room_ids: list[str]) -> dict[str, ChatRoomSummary]:
+        """여러 채팅방의 요약을 한 번에 조회한다 (room_id -> 요약, 요약이 없는 방은 제외)"""
+        pass
+
+    @abstractmethod
+    def record_message(self, message: ChatMessage) -> bool:
+        """
+        새 메시지를 요약에 증분 반영한다 (최신 메시지 갱신 + 수신자 unread +1).
+
+        Returns:
+            요약이 존재해 반영되었으면 True, 아직 요약이 없으면 False
+            (요약이 없는 채팅방은 조회 시점에 메시지로부터 재구성된다)
+        """
+        pass
+
+    @abstractmethod
+    def record_messages(self, messages: list[ChatMessage]) -> None:
+        """메시지 배치를 요약에 증분 반영한다 (채팅방마다 한 번씩 갱신, 요약이 없는 방은 건너뛴다)"""
+        pass
+
+    @abstractmethod
+    def reset_unread(self, room_id: str, user_id: str) -> None:
+        """특정 사용자의 읽지 않은 메시지 수를 0으로 초기화한다"""
+        pass
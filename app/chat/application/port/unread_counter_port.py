@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.chat.domain.read_watermark import ReadWatermark
+
+
+class UnreadCounterPort(ABC):
+    """(채팅방, 사용자)별 읽지 않은 메시지 수 카운터와 읽음 워터마크 저장소 포트 인터페이스"""
+
+    @abstractmethod
+    async def increment(self, room_id: str, user_id: str, message_id: str) -> None:
+        """
+        user_id의 room_id 읽지 않은 메시지 수를 1 증가시킨다.
+        아직 초기화(seed)되지 않은 사용자면 메시지 id를 보류해 두고, 초기화 때 MySQL 요약이 세지 못한 것만 더한다.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_read(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        """읽지 않은 메시지 수를 0으로 만들고, MySQL에 반영할 읽음 워터마크를 기록한다"""
+        pass
+
+    @abstractmethod
+    async def get_room_counts(self, user_id: str) -> dict[str, int] | None:
+        """
+        사용자의 채팅방별 읽지 않은 메시지 수를 조회한다.
+
+        Returns:
+            room_id -> 읽지 않은 수 (카운터가 없는 방은 0),
+            아직 MySQL 요약으로부터 초기화되지 않은 사용자면 None
+        """
+        pass
+
+    @abstractmethod
+    async def get_pending_message_ids(self, user_id: str) -> list[str]:
+        """초기화 전에 들어와 아직 카운터에 더해지지 않은 메시지 id 목록을 조회한다"""
+        pass
+
+    @abstractmethod
+    async def seed(self, user_id: str, counts: dict[str, int], counted_message_ids: set[str] | None = None) -> None:
+        """
+        MySQL 요약에서 계산한 채팅방별 읽지 않은 수로 카운터를 초기화한다 (이미 있는 카운터는 유지).
+
+        Args:
+            counts: room_id -> MySQL 요약 기준 읽지 않은 수
+            counted_message_ids: 보류된 메시지 중 이미 MySQL 요약이 센 메시지 id.
+                나머지 보류 메시지(아직 버퍼에 있거나 초기화 도중 들어온 것)는 카운터에 더한다.
+        """
+        pass
+
+    @abstractmethod
+    async def pop_read_watermarks(self) -> list[ReadWatermark]:
+        """아직 MySQL에 반영되지 않은 읽음 워터마크를 꺼낸다 (꺼낸 항목은 저장소에서 제거된다)"""
+        pass
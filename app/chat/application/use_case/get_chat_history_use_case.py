@@ -1,13 +1,74 @@
 from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
+from app.chat.application.dto.chat_message_page_dto import ChatMessagePageDTO
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
 
 
 class GetChatHistoryUseCase:
     """채팅 기록 조회 유스케이스"""
 
+    DEFAULT_PAGE_SIZE = 50
+    MAX_PAGE_SIZE = 200
+
     def __init__(self, repository: ChatMessageRepositoryPort):
         self._repository = repository
 
     def execute(self, room_id: str) -> list[ChatMessage]:
         """채팅방의 메시지 기록을 시간순으로 조회한다"""
         return self._repository.find_by_room_id(room_id)
+
+    def execute_page(
+        self,
+        room_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+        after: str | None = None,
+    ) -> ChatMessagePageDTO:
+        """
+        채팅방의 메시지 기록을 커서 기반으로 한 페이지씩 조회한다.
+
+        Args:
+            room_id: 채팅방 ID
+            limit: 페이지 크기 (1 ~ MAX_PAGE_SIZE)
+            before: 이 커서보다 이전 메시지를 조회 (위로 스크롤)
+            after: 이 커서보다 이후 메시지를 조회 (새 메시지 따라잡기)
+
+        Returns:
+            시간순 메시지 목록과, 같은 방향으로 더 조회할 메시지가 있으면 다음 커서
+
+        Raises:
+            ValueError: limit 범위를 벗어나거나 커서가 유효하지 않은 경우
+        """
+        if not 1 <= limit <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"limit은 1에서 {self.MAX_PAGE_SIZE} 사이여야 합니다")
+        if before and after:
+            raise ValueError("before와 after는 동시에 지정할 수 없습니다")
+
+        before_cursor = MessageCursor.decode(before) if before else None
+        after_cursor = MessageCursor.decode(after) if after else None
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        messages = self._repository.find_page_by_room_id(
+            room_id,
+            limit + 1,
+            before=before_cursor,
+            after=after_cursor,
+        )
+
+        has_more = len(messages) > limit
+        if after_cursor is not None:
+            # 이후 방향: 가장 최근 메시지가 다음 커서
+            messages = messages[:limit]
+            boundary = messages[-1] if messages else None
+        else:
+            # 이전 방향: 가장 오래된 메시지가 다음 커서
+            messages = messages[-limit:]
+            boundary = messages[0] if messages else None
+
+        next_cursor = MessageCursor.of(boundary).encode() if has_more and boundary else None
+
+        return ChatMessagePageDTO(
+            messages=messages,
+            next_cursor=next_cursor,
+            has_more=has_more,
+        )
@@ -1,6 +1,9 @@
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
 from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
 from app.chat.application.dto.chat_room_with_preview_dto import ChatRoomWithPreviewDTO
+from app.chat.domain.chat_room import ChatRoom
+from app.chat.domain.chat_room_summary import ChatRoomSummary
 
 
 class GetMyChatRoomsUseCase:
@@ -9,39 +12,27 @@ class GetMyChatRoomsUseCase:
     def __init__(
         self,
         room_repository: ChatRoomRepositoryPort,
-        message_repository: ChatMessageRepositoryPort
+        message_repository: ChatMessageRepositoryPort,
+        summary_repository: ChatRoomSummaryRepositoryPort | None = None
     ):
         self._room_repository = room_repository
         self._message_repository = message_repository
+        self._summary_repository = summary_repository
 
     def execute(self, user_id: str) -> list[ChatRoomWithPreviewDTO]:
         """사용자가 참여한 채팅방 목록을 조회하고, 각 방의 최신 메시지와 읽지 않은 메시지 수를 포함한다"""
         rooms = self._room_repository.find_by_user_id(user_id)
 
+        # 요약 프로젝션을 한 번에 조회 (요약 저장소가 없으면 모든 방을 메시지로부터 계산)
+        summaries: dict[str, ChatRoomSummary] = {}
+        if self._summary_repository:
+            summaries = self._summary_repository.find_by_room_ids([room.id for room in rooms])
+
         room_previews = []
         for room in rooms:
-            # 각 채팅방의 모든 메시지를 조회
-            messages = self._message_repository.find_by_room_id(room.id)
-
-            # 최신 메시지 찾기 (마지막 메시지)
-            latest_message = messages[-1] if messages else None
-
-            # 마지막 읽은 시간 가져오기
-            last_read_at = room.get_last_read_at(user_id)
-
-            # 읽지 않은 메시지 수 계산 (마지막 읽은 시간 이후 상대방이 보낸 메시지)
-            if last_read_at is None:
-                # 한 번도 읽지 않은 경우: 모든 상대방 메시지
-                unread_count = sum(
-                    1 for msg in messages
-                    if msg.sender_id != user_id
-                )
-            else:
-                # 마지막 읽은 시간 이후의 상대방 메시지만
-                unread_count = sum(
-                    1 for msg in messages
-                    if msg.sender_id != user_id and msg.created_at > last_read_at
-                )
+            summary = summaries.get(room.id)
+            if summary is None:
+                summary = self._rebuild_summary(room)
 
             room_preview = ChatRoomWithPreviewDTO(
                 id=room.id,
@@ -49,9 +40,19 @@ class GetMyChatRoomsUseCase:
                 user2_id=room.user2_id,
                 created_at=room.created_at,
                 status=room.status,
-                latest_message=latest_message,
-                unread_count=unread_count
+                latest_message=summary.get_last_message(),
+                unread_count=summary.get_unread_count(user_id)
             )
             room_previews.append(room_preview)
 
         return room_previews
+
+    def _rebuild_summary(self, room: ChatRoom) -> ChatRoomSummary:
+        """요약이 없는 채팅방은 전체 메시지로부터 재구성하고, 가능하면 저장해 둔다"""
+        messages = self._message_repository.find_by_room_id(room.id)
+        summary = ChatRoomSummary.from_messages(room, messages)
+
+        if self._summary_repository:
+            self._summary_repository.save(summary)
+
+        return summary
@@ -0,0 +1,55 @@
+from starlette.concurrency import run_in_threadpool
+
+from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
+from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
+from app.chat.application.use_case.get_my_chat_rooms_use_case import GetMyChatRoomsUseCase
+
+
+class GetUnreadCountsUseCase:
+    """사용자의 읽지 않은 메시지 수 조회 유스케이스 (Redis 카운터 기반)"""
+
+    def __init__(
+        self,
+        unread_counter: UnreadCounterPort,
+        room_repository: ChatRoomRepositoryPort,
+        message_repository: ChatMessageRepositoryPort,
+        summary_repository: ChatRoomSummaryRepositoryPort | None = None
+    ):
+        self._unread_counter = unread_counter
+        self._message_repository = message_repository
+        # 카운터 초기화(seed)는 채팅방 목록 조회와 같은 요약 기반 계산을 사용한다
+        self._my_chat_rooms_use_case = GetMyChatRoomsUseCase(
+            room_repository, message_repository, summary_repository
+        )
+
+    async def execute(self, user_id: str) -> dict[str, int]:
+        """
+        채팅방별 읽지 않은 메시지 수를 조회한다.
+        카운터가 아직 초기화되지 않은 사용자는 채팅방 요약(MySQL)으로부터 한 번 초기화한다.
+        """
+        counts = await self._unread_counter.get_room_counts(user_id)
+        if counts is not None:
+            return counts
+
+        # 초기화 전에 들어온 메시지 중 MySQL에 이미 저장된 것(요약이 센 것)만 가려내,
+        # 아직 write-behind 버퍼에 있는 메시지는 카운터가 직접 센다
+        pending_message_ids = await self._unread_counter.get_pending_message_ids(user_id)
+        # 채팅방 요약 조회는 동기 SQLAlchemy이므로 스레드 풀에서 실행해 이벤트 루프를 막지 않는다
+        counts, counted_message_ids = await run_in_threadpool(
+            self._load_seed_snapshot, user_id, pending_message_ids
+        )
+        await self._unread_counter.seed(user_id, counts, counted_message_ids)
+        return await self._unread_counter.get_room_counts(user_id) or {}
+
+    def _load_seed_snapshot(self, user_id: str, pending_message_ids: list[str]) -> tuple[dict[str, int], set[str]]:
+        """요약 기준 채팅방별 읽지 않은 수와, 보류 메시지 중 이미 저장된 메시지 id를 같은 DB 세션에서 조회한다"""
+        room_previews = self._my_chat_rooms_use_case.execute(user_id)
+        counted_message_ids = self._message_repository.find_existing_ids(pending_message_ids)
+        return {preview.id: preview.unread_count for preview in room_previews}, counted_message_ids
+
+    async def execute_total(self, user_id: str) -> int:
+        """전체 읽지 않은 메시지 수(배지 수)를 조회한다"""
+        counts = await self.execute(user_id)
+        return sum(counts.values())
@@ -1,4 +1,5 @@
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.domain.chat_room import ChatRoom
 
 
 class LeaveChatRoomUseCase:
@@ -7,8 +8,8 @@ class LeaveChatRoomUseCase:
     def __init__(self, repository: ChatRoomRepositoryPort):
         self._repository = repository
 
-    def execute(self, room_id: str, user_id: str) -> None:
-        """사용자가 채팅방을 나간다"""
+    def execute(self, room_id: str, user_id: str) -> ChatRoom:
+        """사용자가 채팅방을 나가고, 나간 뒤의 채팅방을 반환한다"""
         # 채팅방 조회
         room = self._repository.find_by_id(room_id)
         if room is None:
@@ -19,3 +20,5 @@ class LeaveChatRoomUseCase:
 
         # 저장
         self._repository.save(room)
+
+        return room
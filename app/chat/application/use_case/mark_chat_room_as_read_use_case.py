@@ -1,15 +1,26 @@
 from datetime import datetime
 
+from starlette.concurrency import run_in_threadpool
+
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
 
 
 class MarkChatRoomAsReadUseCase:
     """채팅방 읽음 처리 유스케이스"""
 
-    def __init__(self, room_repository: ChatRoomRepositoryPort):
+    def __init__(
+        self,
+        room_repository: ChatRoomRepositoryPort,
+        summary_repository: ChatRoomSummaryRepositoryPort | None = None,
+        unread_counter: UnreadCounterPort | None = None
+    ):
         self._room_repository = room_repository
+        self._summary_repository = summary_repository
+        self._unread_counter = unread_counter
 
-    def execute(self, room_id: str, user_id: str) -> None:
+    async def execute(self, room_id: str, user_id: str) -> None:
         """
         특정 사용자가 채팅방의 메시지를 읽음 처리한다.
 
@@ -20,13 +31,24 @@ class MarkChatRoomAsReadUseCase:
         Raises:
             ValueError: 채팅방을 찾을 수 없거나 사용자가 참여자가 아닌 경우
         """
-        # 채팅방 조회
-        room = self._room_repository.find_by_id(room_id)
+        # 채팅방 조회 (동기 SQLAlchemy이므로 스레드 풀에서 실행해 이벤트 루프를 막지 않는다)
+        room = await run_in_threadpool(self._room_repository.find_by_id, room_id)
         if room is None:
             raise ValueError(f"채팅방을 찾을 수 없습니다: {room_id}")
 
-        # 읽음 처리
-        room.mark_read_by_user(user_id, datetime.now())
+        # 읽음 처리 (참여자 검증 포함)
+        read_at = datetime.now()
+        room.mark_read_by_user(user_id, read_at)
+
+        # 카운터 저장소가 있으면 카운터만 즉시 초기화하고,
+        # 채팅방 행의 워터마크는 ReadWatermarkFlusher가 MySQL에 지연 반영한다
+        if self._unread_counter:
+            await self._unread_counter.mark_read(room_id, user_id, read_at)
+            return
 
         # 저장
-        self._room_repository.save(room)
+        await run_in_threadpool(self._room_repository.save, room)
+
+        # 채팅방 요약의 읽지 않은 수 초기화
+        if self._summary_repository:
+            await run_in_threadpool(self._summary_repository.reset_unread, room_id, user_id)
@@ -0,0 +1,24 @@
+from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+from app.chat.domain.read_watermark import ReadWatermark
+
+
+class PersistReadWatermarksUseCase:
+    """Redis에 기록된 읽음 워터마크를 MySQL에 반영하는 유스케이스"""
+
+    def __init__(
+        self,
+        room_repository: ChatRoomRepositoryPort,
+        summary_repository: ChatRoomSummaryRepositoryPort | None = None
+    ):
+        self._room_repository = room_repository
+        self._summary_repository = summary_repository
+
+    def execute(self, watermarks: list[ReadWatermark]) -> None:
+        """채팅방의 마지막 읽은 시각을 갱신하고, 채팅방 요약의 읽지 않은 수를 초기화한다"""
+        for watermark in watermarks:
+            self._room_repository.update_last_read_at(
+                watermark.room_id, watermark.user_id, watermark.read_at
+            )
+            if self._summary_repository:
+                self._summary_repository.reset_unread(watermark.room_id, watermark.user_id)
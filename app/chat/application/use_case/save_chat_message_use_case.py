@@ -1,12 +1,18 @@
 from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
 from app.chat.domain.chat_message import ChatMessage
 
 
 class SaveChatMessageUseCase:
     """채팅 메시지 저장 유스케이스"""
 
-    def __init__(self, repository: ChatMessageRepositoryPort):
+    def __init__(
+        self,
+        repository: ChatMessageRepositoryPort,
+        summary_repository: ChatRoomSummaryRepositoryPort | None = None
+    ):
         self._repository = repository
+        self._summary_repository = summary_repository
 
     def execute(
         self,
@@ -27,4 +33,8 @@ class SaveChatMessageUseCase:
         # 저장
         self._repository.save(message)
 
-        return message
\ No newline at end of file
+        # 채팅방 요약(최신 메시지, 읽지 않은 수) 증분 갱신
+        if self._summary_repository:
+            self._summary_repository.record_message(message)
+
+        return message
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room import ChatRoom
+
+
+class ChatRoomSummary:
+    """채팅방 요약 프로젝션 (최신 메시지 미리보기 + 사용자별 읽지 않은 메시지 수)"""
+
+    PREVIEW_MAX_LENGTH = 200
+
+    def __init__(
+        self,
+        room_id: str,
+        user1_id: str,
+        user2_id: str,
+        last_message_id: str | None = None,
+        last_message_sender_id: str | None = None,
+        last_message_preview: str | None = None,
+        last_message_at: datetime | None = None,
+        user1_unread_count: int = 0,
+        user2_unread_count: int = 0,
+    ):
+        if not room_id:
+            raise ValueError("ChatRoomSummary room_id는 비어있을 수 없습니다")
+        self.room_id = room_id
+        self.user1_id = user1_id
+        self.user2_id = user2_id
+        self.last_message_id = last_message_id
+        self.last_message_sender_id = last_message_sender_id
+        self.last_message_preview = last_message_preview
+        self.last_message_at = last_message_at
+        self.user1_unread_count = user1_unread_count
+        self.user2_unread_count = user2_unread_count
+
+    @classmethod
+    def make_preview(cls, content: str) -> str:
+        """메시지 내용을 미리보기 길이로 자른다"""
+        return content[:cls.PREVIEW_MAX_LENGTH]
+
+    @classmethod
+    def from_messages(cls, room: ChatRoom, messages: list[ChatMessage]) -> "ChatRoomSummary":
+        """채팅방의 전체 메시지(시간순)로부터 요약을 재구성한다 (기존 채팅방 백필용)"""
+        summary = cls(room_id=room.id, user1_id=room.user1_id, user2_id=room.user2_id)
+
+        if messages:
+            summary._set_last_message(messages[-1])
+
+        for user_id in (room.user1_id, room.user2_id):
+            last_read_at = room.get_last_read_at(user_id)
+            unread_count = sum(
+                1 for msg in messages
+                if msg.sender_id != user_id and (last_read_at is None or msg.created_at > last_read_at)
+            )
+            summary._set_unread_count(user_id, unread_count)
+
+        return summary
+
+    def apply_message(self, message: ChatMessage) -> None:
+        """새 메시지를 반영한다: 최신 메시지를 갱신하고 수신자의 읽지 않은 수를 1 증가시킨다"""
+        if self.last_message_at is None or message.created_at >= self.last_message_at:
+            self._set_last_message(message)
+
+        if message.sender_id == self.user1_id:
+            self.user2_unread_count += 1
+        elif message.sender_id == self.user2_id:
+            self.user1_unread_count += 1
+
+    def mark_read(self, user_id: str) -> None:
+        """사용자의 읽지 않은 메시지 수를 초기화한다"""
+        self._set_unread_count(user_id, 0)
+
+    def get_unread_count(self, user_id: str) -> int:
+        """특정 사용자의 읽지 않은 메시지 수를 반환한다"""
+        if user_id == self.user1_id:
+            return self.user1_unread_count
+        elif user_id == self.user2_id:
+            return self.user2_unread_count
+        else:
+            raise ValueError(f"User {user_id} is not a participant of this chat room")
+
+    def get_last_message(self) -> ChatMessage | None:
+        """최신 메시지 미리보기를 ChatMessage로 반환한다"""
+        if self.last_message_id is None:
+            return None
+        return ChatMessage(
+            id=self.last_message_id,
+            room_id=self.room_id,
+            sender_id=self.last_message_sender_id,
+            content=self.last_message_preview,
+            created_at=self.last_message_at,
+        )
+
+    def _set_last_message(self, message: ChatMessage) -> None:
+        self.last_message_id = message.id
+        self.last_message_sender_id = message.sender_id
+        self.last_message_preview = self.make_preview(message.content)
+        self.last_message_at = message.created_at
+
+    def _set_unread_count(self, user_id: str, count: int) -> None:
+        if user_id == self.user1_id:
+            self.user1_unread_count = count
+        elif user_id == self.user2_id:
+            self.user2_unread_count = count
+        else:
+            raise ValueError(f"User {user_id} is not a participant of this chat room")
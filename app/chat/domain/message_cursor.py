@@ -0,0 +1,45 @@
+import base64
+import binascii
+from datetime import datetime
+
+from app.chat.domain.chat_message import ChatMessage
+
+
+class MessageCursor:
+    """채팅 메시지 키셋 페이지네이션 커서 (created_at, id)"""
+
+    def __init__(self, created_at: datetime, message_id: str):
+        if created_at is None:
+            raise ValueError("MessageCursor created_at은 비어있을 수 없습니다")
+        if not message_id:
+            raise ValueError("MessageCursor message_id는 비어있을 수 없습니다")
+        self.created_at = created_at
+        self.message_id = message_id
+
+    def encode(self) -> str:
+        """커서를 URL-safe 토큰 문자열로 변환한다"""
+        raw = f"{self.created_at.isoformat()}|{self.message_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "MessageCursor":
+        """토큰 문자열을 커서로 복원한다"""
+        if not token:
+            raise ValueError("커서 토큰이 비어있습니다")
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            created_at_str, message_id = raw.split("|", 1)
+            return cls(datetime.fromisoformat(created_at_str), message_id)
+        except (binascii.Error, UnicodeError, ValueError) as e:
+            raise ValueError(f"유효하지 않은 커서입니다: {token}") from e
+
+    @classmethod
+    def of(cls, message: ChatMessage) -> "MessageCursor":
+        """메시지의 위치를 가리키는 커서를 생성한다"""
+        return cls(message.created_at, message.id)
+
+    def __eq__(self, other):
+        if isinstance(other, MessageCursor):
+            return self.created_at == other.created_at and self.message_id == other.message_id
+        return False
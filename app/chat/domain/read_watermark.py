@@ -0,0 +1,20 @@
+from datetime import datetime
+
+
+class ReadWatermark:
+    """사용자가 채팅방을 마지막으로 읽은 시각 (Redis에 먼저 기록하고 MySQL에는 지연 반영)"""
+
+    def __init__(self, room_id: str, user_id: str, read_at: datetime):
+        self._validate(room_id, user_id, read_at)
+        self.room_id = room_id
+        self.user_id = user_id
+        self.read_at = read_at
+
+    def _validate(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        """ReadWatermark 값의 유효성을 검증한다"""
+        if not room_id:
+            raise ValueError("ReadWatermark room_id는 비어있을 수 없습니다")
+        if not user_id:
+            raise ValueError("ReadWatermark user_id는 비어있을 수 없습니다")
+        if read_at is None:
+            raise ValueError("ReadWatermark read_at은 비어있을 수 없습니다")
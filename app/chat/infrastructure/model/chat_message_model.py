@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from config.database import Base
 
@@ -7,6 +7,10 @@ class ChatMessageModel(Base):
     """채팅 메시지 ORM 모델"""
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # 채팅 기록 키셋 페이지네이션용 복합 인덱스 (room_id, created_at, id)
+        Index("ix_chat_messages_room_created_id", "room_id", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True)
     room_id = Column(String(36), ForeignKey("chat_rooms.id", ondelete="CASCADE"), nullable=False, index=True)
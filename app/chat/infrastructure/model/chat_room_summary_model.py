@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer
+from config.database import Base
+
+
+class ChatRoomSummaryModel(Base):
+    """채팅방 요약 프로젝션 ORM 모델"""
+
+    __tablename__ = "chat_room_summaries"
+
+    room_id = Column(String(36), ForeignKey("chat_rooms.id", ondelete="CASCADE"), primary_key=True)
+    user1_id = Column(String(255), nullable=False)
+    user2_id = Column(String(255), nullable=False)
+    last_message_id = Column(String(36), nullable=True)
+    last_message_sender_id = Column(String(255), nullable=True)
+    last_message_preview = Column(String(200), nullable=True)
+    last_message_at = Column(DateTime, nullable=True)
+    user1_unread_count = Column(Integer, nullable=False, default=0)
+    user2_unread_count = Column(Integer, nullable=False, default=0)
@@ -1,11 +1,15 @@
 from .mysql_chat_message_repository import MySQLChatMessageRepository
 from .mysql_chat_room_repository import MySQLChatRoomRepository
+from .mysql_chat_room_summary_repository import MySQLChatRoomSummaryRepository
 from .mysql_report_repository import MySQLReportRepository
 from .mysql_rating_repository import MySQLRatingRepository
+from .redis_unread_counter_repository import RedisUnreadCounterRepository
 
 __all__ = [
     "MySQLChatMessageRepository",
     "MySQLChatRoomRepository",
+    "MySQLChatRoomSummaryRepository",
     "MySQLReportRepository",
     "MySQLRatingRepository",
+    "RedisUnreadCounterRepository",
 ]
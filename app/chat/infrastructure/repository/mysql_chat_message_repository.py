@@ -1,7 +1,9 @@
+from sqlalchemy import and_, insert, or_
 from sqlalchemy.orm import Session
 
 from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
 from app.chat.infrastructure.model.chat_message_model import ChatMessageModel
 
 
@@ -23,6 +25,30 @@ class MySQLChatMessageRepository(ChatMessageRepositoryPort):
         self._db.add(message_model)
         self._db.commit()
 
+    def save_all(self, messages: list[ChatMessage], commit: bool = True) -> None:
+        """
+        multi-row INSERT 한 번과 커밋 한 번으로 메시지 배치를 저장한다.
+        commit=False면 커밋하지 않아 호출자가 다른 쓰기와 한 트랜잭션으로 묶을 수 있다.
+        """
+        if not messages:
+            return
+
+        self._db.execute(
+            insert(ChatMessageModel),
+            [
+                {
+                    "id": message.id,
+                    "room_id": message.room_id,
+                    "sender_id": message.sender_id,
+                    "content": message.content,
+                    "created_at": message.created_at,
+                }
+                for message in messages
+            ],
+        )
+        if commit:
+            self._db.commit()
+
     def find_by_id(self, message_id: str) -> ChatMessage | None:
         """id로 메시지를 조회한다"""
         message_model = self._db.query(ChatMessageModel).filter(
@@ -40,6 +66,16 @@ class MySQLChatMessageRepository(ChatMessageRepositoryPort):
             created_at=message_model.created_at,
         )
 
+    def find_existing_ids(self, message_ids: list[str]) -> set[str]:
+        """IN 조회 한 번으로 이미 저장된 메시지의 id만 반환한다"""
+        if not message_ids:
+            return set()
+
+        rows = self._db.query(ChatMessageModel.id).filter(
+            ChatMessageModel.id.in_(message_ids)
+        ).all()
+        return {row.id for row in rows}
+
     def find_by_room_id(self, room_id: str) -> list[ChatMessage]:
         """room_id로 해당 채팅방의 메시지 목록을 시간순으로 조회한다"""
         message_models = self._db.query(ChatMessageModel).filter(
@@ -55,4 +91,58 @@ class MySQLChatMessageRepository(ChatMessageRepositoryPort):
                 created_at=model.created_at,
             )
             for model in message_models
-        ]
\ No newline at end of file
+        ]
+
+    def find_page_by_room_id(
+        self,
+        room_id: str,
+        limit: int,
+        before: MessageCursor | None = None,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        """(room_id, created_at, id) 인덱스를 이용해 키셋 페이지를 조회한다"""
+        if before is not None and after is not None:
+            raise ValueError("before와 after는 동시에 지정할 수 없습니다")
+
+        query = self._db.query(ChatMessageModel).filter(
+            ChatMessageModel.room_id == room_id
+        )
+
+        if after is not None:
+            # 커서 이후 메시지: 오래된 순으로 limit개
+            query = query.filter(
+                or_(
+                    ChatMessageModel.created_at > after.created_at,
+                    and_(
+                        ChatMessageModel.created_at == after.created_at,
+                        ChatMessageModel.id > after.message_id,
+                    ),
+                )
+            ).order_by(ChatMessageModel.created_at.asc(), ChatMessageModel.id.asc())
+            message_models = query.limit(limit).all()
+        else:
+            # 커서 이전 메시지(또는 최신 메시지): 최신 순으로 limit개를 가져온 뒤 시간순으로 뒤집는다
+            if before is not None:
+                query = query.filter(
+                    or_(
+                        ChatMessageModel.created_at < before.created_at,
+                        and_(
+                            ChatMessageModel.created_at == before.created_at,
+                            ChatMessageModel.id < before.message_id,
+                        ),
+                    )
+                )
+            query = query.order_by(ChatMessageModel.created_at.desc(), ChatMessageModel.id.desc())
+            message_models = list(reversed(query.limit(limit).all()))
+
+        return [self._to_domain(model) for model in message_models]
+
+    def _to_domain(self, model: ChatMessageModel) -> ChatMessage:
+        """ORM 모델을 도메인 엔티티로 변환한다"""
+        return ChatMessage(
+            id=model.id,
+            room_id=model.room_id,
+            sender_id=model.sender_id,
+            content=model.content,
+            created_at=model.created_at,
+        )
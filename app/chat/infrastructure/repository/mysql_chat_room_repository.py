@@ -1,3 +1,6 @@
+from datetime import datetime
+
+from sqlalchemy import case, or_
 from sqlalchemy.orm import Session
 
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
@@ -25,6 +28,32 @@ class MySQLChatRoomRepository(ChatRoomRepositoryPort):
         self._db.merge(room_model)
         self._db.commit()
 
+    def update_last_read_at(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        """merge 없이 해당 사용자의 last_read_at 컬럼만 UPDATE 한다 (더 최근 시각일 때만)"""
+        model = ChatRoomModel
+        self._db.query(model).filter(model.id == room_id).update(
+            {
+                model.user1_last_read_at: case(
+                    (
+                        (model.user1_id == user_id) &
+                        or_(model.user1_last_read_at.is_(None), model.user1_last_read_at < read_at),
+                        read_at,
+                    ),
+                    else_=model.user1_last_read_at,
+                ),
+                model.user2_last_read_at: case(
+                    (
+                        (model.user2_id == user_id) &
+                        or_(model.user2_last_read_at.is_(None), model.user2_last_read_at < read_at),
+                        read_at,
+                    ),
+                    else_=model.user2_last_read_at,
+                ),
+            },
+            synchronize_session=False,
+        )
+        self._db.commit()
+
     def find_by_id(self, room_id: str) -> ChatRoom | None:
         """id로 채팅방을 조회한다"""
         room_model = self._db.query(ChatRoomModel).filter(
@@ -110,4 +139,11 @@ class MySQLChatRoomRepository(ChatRoomRepositoryPort):
             user1_last_read_at=room_model.user1_last_read_at,
             user2_last_read_at=room_model.user2_last_read_at,
             status=room_model.status,
-        )
\ No newline at end of file
+        )
+
+    def find_active_user_pairs(self) -> list[tuple[str, str]]:
+        """활성 채팅방의 (user1_id, user2_id) 목록을 조회한다"""
+        rows = self._db.query(ChatRoomModel.user1_id, ChatRoomModel.user2_id).filter(
+            ChatRoomModel.status == "active"
+        ).all()
+        return [(row.user1_id, row.user2_id) for row in rows]
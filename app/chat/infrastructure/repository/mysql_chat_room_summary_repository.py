@@ -0,0 +1,141 @@
+from sqlalchemy import case, or_
+from sqlalchemy.orm import Session
+
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room_summary import ChatRoomSummary
+from app.chat.infrastructure.model.chat_room_summary_model import ChatRoomSummaryModel
+
+
+class MySQLChatRoomSummaryRepository(ChatRoomSummaryRepositoryPort):
+    """MySQL 기반 채팅방 요약 저장소"""
+
+    def __init__(self, db_session: Session):
+        self._db = db_session
+
+    def save(self, summary: ChatRoomSummary) -> None:
+        """채팅방 요약을 저장한다 (insert 또는 update)"""
+        summary_model = ChatRoomSummaryModel(
+            room_id=summary.room_id,
+            user1_id=summary.user1_id,
+            user2_id=summary.user2_id,
+            last_message_id=summary.last_message_id,
+            last_message_sender_id=summary.last_message_sender_id,
+            last_message_preview=summary.last_message_preview,
+            last_message_at=summary.last_message_at,
+            user1_unread_count=summary.user1_unread_count,
+            user2_unread_count=summary.user2_unread_count,
+        )
+        self._db.merge(summary_model)
+        self._db.commit()
+
+    def find_by_room_id(self, room_id: str) -> ChatRoomSummary | None:
+        """room_id로 채팅방 요약을 조회한다"""
+        summary_model = self._db.query(ChatRoomSummaryModel).filter(
+            ChatRoomSummaryModel.room_id == room_id
+        ).first()
+
+        if summary_model is None:
+            return None
+
+        return self._to_domain(summary_model)
+
+    def find_by_room_ids(self, room_ids: list[str]) -> dict[str, ChatRoomSummary]:
+        """여러 채팅방의 요약을 PK IN 조회 한 번으로 가져온다"""
+        if not room_ids:
+            return {}
+
+        summary_models = self._db.query(ChatRoomSummaryModel).filter(
+            ChatRoomSummaryModel.room_id.in_(room_ids)
+        ).all()
+
+        return {model.room_id: self._to_domain(model) for model in summary_models}
+
+    def record_message(self, message: ChatMessage) -> bool:
+        """단일 UPDATE 문으로 최신 메시지와 수신자 unread 카운터를 원자적으로 갱신한다"""
+        updated = self._apply_messages(message.room_id, [message])
+        self._db.commit()
+        return updated > 0
+
+    def record_messages(self, messages: list[ChatMessage], commit: bool = True) -> None:
+        """
+        채팅방별로 배치를 모아 방마다 UPDATE 한 번, 전체 커밋 한 번으로 반영한다.
+        commit=False면 커밋하지 않아 호출자가 메시지 INSERT와 한 트랜잭션으로 묶을 수 있다.
+        """
+        if not messages:
+            return
+
+        messages_by_room: dict[str, list[ChatMessage]] = {}
+        for message in messages:
+            messages_by_room.setdefault(message.room_id, []).append(message)
+
+        for room_id, room_messages in messages_by_room.items():
+            self._apply_messages(room_id, room_messages)
+        if commit:
+            self._db.commit()
+
+    def _apply_messages(self, room_id: str, messages: list[ChatMessage]) -> int:
+        """한 채팅방의 메시지들을 UPDATE 한 번으로 반영하고 갱신된 행 수를 반환한다"""
+        model = ChatRoomSummaryModel
+        latest = max(messages, key=lambda m: m.created_at)
+        # 늦게 도착한 과거 메시지가 최신 메시지를 덮어쓰지 않도록 한다
+        is_newer = or_(model.last_message_at.is_(None), model.last_message_at <= latest.created_at)
+
+        sent_counts: dict[str, int] = {}
+        for message in messages:
+            sent_counts[message.sender_id] = sent_counts.get(message.sender_id, 0) + 1
+
+        # 상대방이 보낸 메시지 수만큼 unread를 증가시킨다
+        user1_increment = sum(
+            case((model.user2_id == sender_id, count), else_=0)
+            for sender_id, count in sent_counts.items()
+        )
+        user2_increment = sum(
+            case((model.user1_id == sender_id, count), else_=0)
+            for sender_id, count in sent_counts.items()
+        )
+
+        return self._db.query(model).filter(
+            model.room_id == room_id
+        ).update(
+            {
+                model.last_message_id: case((is_newer, latest.id), else_=model.last_message_id),
+                model.last_message_sender_id: case(
+                    (is_newer, latest.sender_id), else_=model.last_message_sender_id
+                ),
+                model.last_message_preview: case(
+                    (is_newer, ChatRoomSummary.make_preview(latest.content)),
+                    else_=model.last_message_preview,
+                ),
+                model.last_message_at: case((is_newer, latest.created_at), else_=model.last_message_at),
+                model.user1_unread_count: model.user1_unread_count + user1_increment,
+                model.user2_unread_count: model.user2_unread_count + user2_increment,
+            },
+            synchronize_session=False,
+        )
+
+    def reset_unread(self, room_id: str, user_id: str) -> None:
+        """특정 사용자의 읽지 않은 메시지 수를 0으로 초기화한다"""
+        model = ChatRoomSummaryModel
+        self._db.query(model).filter(model.room_id == room_id).update(
+            {
+                model.user1_unread_count: case((model.user1_id == user_id, 0), else_=model.user1_unread_count),
+                model.user2_unread_count: case((model.user2_id == user_id, 0), else_=model.user2_unread_count),
+            },
+            synchronize_session=False,
+        )
+        self._db.commit()
+
+    def _to_domain(self, model: ChatRoomSummaryModel) -> ChatRoomSummary:
+        """ORM 모델을 도메인 엔티티로 변환한다"""
+        return ChatRoomSummary(
+            room_id=model.room_id,
+            user1_id=model.user1_id,
+            user2_id=model.user2_id,
+            last_message_id=model.last_message_id,
+            last_message_sender_id=model.last_message_sender_id,
+            last_message_preview=model.last_message_preview,
+            last_message_at=model.last_message_at,
+            user1_unread_count=model.user1_unread_count or 0,
+            user2_unread_count=model.user2_unread_count or 0,
+        )
@@ -0,0 +1,71 @@
+import redis.asyncio as aioredis
+
+from app.chat.application.port.active_chat_pair_port import ActiveChatPairPort
+
+
+class RedisActiveChatPairRepository(ActiveChatPairPort):
+    """
+    Redis 기반 활성 채팅 쌍 저장소.
+
+    - chat:active_pairs: Set ("작은ID|큰ID"). 매칭 후보 필터링이 MySQL을 거치지 않고 SISMEMBER 한 번으로 끝난다.
+    - chat:active_pairs:seeded: 초기화 표시. 만료되면 다음 조회 때 MySQL로부터 다시 채워
+      생성/나가기/차단 갱신이 누락된 쌍이 있어도 오래 남지 않는다.
+    - chat:active_pairs:added / chat:active_pairs:removed: 마지막 초기화 이후 추가/제거된 쌍.
+      MySQL 스냅샷을 읽은 뒤 반영될 때까지 생긴 변경을 초기화가 덮어쓰지 않도록 함께 합친다.
+    """
+
+    PAIRS_KEY = "chat:active_pairs"
+    SEEDED_KEY = "chat:active_pairs:seeded"
+    ADDED_KEY = "chat:active_pairs:added"
+    REMOVED_KEY = "chat:active_pairs:removed"
+    REBUILD_KEY = "chat:active_pairs:rebuild"
+    RESEED_SECONDS = 3600
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+
+    @staticmethod
+    def _member(user1_id: str, user2_id: str) -> str:
+        return "|".join(sorted((user1_id, user2_id)))
+
+    async def add(self, user1_id: str, user2_id: str) -> None:
+        await self._record_change(self._member(user1_id, user2_id), added=True)
+
+    async def remove(self, user1_id: str, user2_id: str) -> None:
+        await self._record_change(self._member(user1_id, user2_id), added=False)
+
+    async def _record_change(self, member: str, added: bool) -> None:
+        # [1 RTT] 활성 쌍 집합과 함께, 진행 중인 초기화가 합칠 변경 기록도 갱신한다
+        record_key, cancel_key = (self.ADDED_KEY, self.REMOVED_KEY) if added else (self.REMOVED_KEY, self.ADDED_KEY)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if added:
+                pipe.sadd(self.PAIRS_KEY, member)
+            else:
+                pipe.srem(self.PAIRS_KEY, member)
+            pipe.sadd(record_key, member)
+            pipe.srem(cancel_key, member)
+            pipe.expire(record_key, self.RESEED_SECONDS)
+            await pipe.execute()
+
+    async def contains(self, user1_id: str, user2_id: str) -> bool | None:
+        # [1 RTT] 초기화 여부와 포함 여부를 함께 조회
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self.SEEDED_KEY)
+            pipe.sismember(self.PAIRS_KEY, self._member(user1_id, user2_id))
+            seeded, is_member = await pipe.execute()
+        if not seeded:
+            return None
+        return bool(is_member)
+
+    async def seed(self, pairs: list[tuple[str, str]]) -> None:
+        # 스냅샷을 임시 키에 채우고, 스냅샷 이후의 추가/제거를 합쳐 MULTI/EXEC 한 번에 교체한다.
+        # 조회 중인 요청이 비어 있는 집합을 보지 않고, 그 사이 생성된 채팅방 쌍도 사라지지 않는다.
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.REBUILD_KEY)
+            if pairs:
+                pipe.sadd(self.REBUILD_KEY, *{self._member(a, b) for a, b in pairs})
+            pipe.sunionstore(self.REBUILD_KEY, [self.REBUILD_KEY, self.ADDED_KEY])
+            pipe.sdiffstore(self.PAIRS_KEY, [self.REBUILD_KEY, self.REMOVED_KEY])
+            pipe.delete(self.REBUILD_KEY, self.ADDED_KEY, self.REMOVED_KEY)
+            pipe.set(self.SEEDED_KEY, 1, ex=self.RESEED_SECONDS)
+            await pipe.execute()
@@ -0,0 +1,131 @@
+from datetime import datetime
+
+import redis.asyncio as aioredis
+
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
+from app.chat.domain.read_watermark import ReadWatermark
+
+
+class RedisUnreadCounterRepository(UnreadCounterPort):
+    """
+    Redis 기반 읽지 않은 메시지 카운터.
+
+    - chat:unread:{user_id}: Hash (room_id -> 읽지 않은 수). 전체 배지 수는 HGETALL 한 번으로 계산한다.
+    - chat:unread_pending:{user_id}: Hash (message_id -> room_id). 초기화 전에 들어온 메시지를 보류해 둔다.
+    - chat:read_watermarks: Hash ("room_id|user_id" -> 읽은 시각). 주기적으로 꺼내 MySQL에 반영한다.
+    """
+
+    UNREAD_KEY_PREFIX = "chat:unread:"
+    PENDING_KEY_PREFIX = "chat:unread_pending:"
+    WATERMARK_KEY = "chat:read_watermarks"
+    # MySQL 요약으로부터 초기화되었음을 표시하는 필드
+    SEEDED_FIELD = "_seeded"
+    # 한 번도 초기화(목록/배지 조회)하지 않는 사용자의 보류 메시지가 쌓이지 않도록 둔 만료 시간
+    PENDING_TTL_SECONDS = 86400
+
+    # 초기화 전에는 메시지 id를 보류해 둔다: MySQL 요약이 이 메시지를 셌는지는 초기화 때에만 알 수 있다.
+    INCREMENT_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    return redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+end
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[4])
+return nil
+"""
+
+    # 초기화 전에 읽음 처리하면 그 방의 보류 메시지는 읽은 것이므로 버린다
+    MARK_READ_SCRIPT = """
+redis.call('HSET', KEYS[1], ARGV[2], 0)
+redis.call('HSET', KEYS[3], ARGV[3], ARGV[4])
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    local pending = redis.call('HGETALL', KEYS[2])
+    for i = 1, #pending, 2 do
+        if pending[i + 1] == ARGV[2] then
+            redis.call('HDEL', KEYS[2], pending[i])
+        end
+    end
+end
+"""
+
+    # 요약 값을 채우고(HSETNX), 보류 메시지 중 요약이 세지 않은 것을 더한 뒤 초기화를 표시한다.
+    # 초기화 전에 읽음 처리한 방은 요약 값을 쓰지 않으므로, 그 방의 보류 메시지(읽음 이후 메시지)는 모두 더한다.
+    SEED_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    return 0
+end
+local room_count = tonumber(ARGV[2])
+local seeded_rooms = {}
+for i = 3, 2 + room_count * 2, 2 do
+    if redis.call('HSETNX', KEYS[1], ARGV[i], ARGV[i + 1]) == 1 then
+        seeded_rooms[ARGV[i]] = true
+    end
+end
+local counted = {}
+for i = 3 + room_count * 2, #ARGV do
+    counted[ARGV[i]] = true
+end
+local pending = redis.call('HGETALL', KEYS[2])
+for i = 1, #pending, 2 do
+    local room_id = pending[i + 1]
+    if not (seeded_rooms[room_id] and counted[pending[i]]) then
+        redis.call('HINCRBY', KEYS[1], room_id, 1)
+    end
+end
+redis.call('DEL', KEYS[2])
+redis.call('HSET', KEYS[1], ARGV[1], 1)
+return 1
+"""
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+        self._increment_script = client.register_script(self.INCREMENT_SCRIPT)
+        self._mark_read_script = client.register_script(self.MARK_READ_SCRIPT)
+        self._seed_script = client.register_script(self.SEED_SCRIPT)
+
+    def _get_key(self, user_id: str) -> str:
+        return f"{self.UNREAD_KEY_PREFIX}{user_id}"
+
+    def _get_pending_key(self, user_id: str) -> str:
+        return f"{self.PENDING_KEY_PREFIX}{user_id}"
+
+    async def increment(self, room_id: str, user_id: str, message_id: str) -> None:
+        await self._increment_script(
+            keys=[self._get_key(user_id), self._get_pending_key(user_id)],
+            args=[self.SEEDED_FIELD, room_id, message_id, self.PENDING_TTL_SECONDS]
+        )
+
+    async def mark_read(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        await self._mark_read_script(
+            keys=[self._get_key(user_id), self._get_pending_key(user_id), self.WATERMARK_KEY],
+            args=[self.SEEDED_FIELD, room_id, f"{room_id}|{user_id}", read_at.isoformat()]
+        )
+
+    async def get_room_counts(self, user_id: str) -> dict[str, int] | None:
+        raw = await self.redis.hgetall(self._get_key(user_id))
+        counts = {field: int(value) for field, value in raw.items()}
+        if counts.pop(self.SEEDED_FIELD, None) is None:
+            return None
+        return counts
+
+    async def get_pending_message_ids(self, user_id: str) -> list[str]:
+        return await self.redis.hkeys(self._get_pending_key(user_id))
+
+    async def seed(self, user_id: str, counts: dict[str, int], counted_message_ids: set[str] | None = None) -> None:
+        args: list = [self.SEEDED_FIELD, len(counts)]
+        for room_id, count in counts.items():
+            args.extend([room_id, count])
+        args.extend(counted_message_ids or ())
+        await self._seed_script(keys=[self._get_key(user_id), self._get_pending_key(user_id)], args=args)
+
+    async def pop_read_watermarks(self) -> list[ReadWatermark]:
+        # MULTI/EXEC로 읽기와 삭제를 원자적으로 처리해 그 사이에 기록된 워터마크를 잃지 않는다
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(self.WATERMARK_KEY)
+            pipe.delete(self.WATERMARK_KEY)
+            raw, _ = await pipe.execute()
+
+        watermarks = []
+        for field, value in raw.items():
+            room_id, user_id = field.split("|", 1)
+            watermarks.append(ReadWatermark(room_id, user_id, datetime.fromisoformat(value)))
+        return watermarks
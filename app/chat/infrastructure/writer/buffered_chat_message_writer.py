@@ -0,0 +1,270 @@
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, List, Optional
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.infrastructure.repository.mysql_chat_message_repository import MySQLChatMessageRepository
+from app.chat.infrastructure.repository.mysql_chat_room_summary_repository import MySQLChatRoomSummaryRepository
+from app.chat.infrastructure.writer.redis_chat_message_dead_letter import RedisChatMessageDeadLetter
+from config.database import SessionLocal
+from config.redis import get_redis
+from config.settings import get_settings
+
+
+class ChatMessagePersistError(Exception):
+    """버퍼링된 메시지를 아직 저장하지 못하고 있음 (백그라운드에서 계속 재시도 중)"""
+
+
+def persist_chat_messages(session_factory: sessionmaker, messages: List[ChatMessage]) -> None:
+    """
+    메시지 배치를 multi-row INSERT 한 번과 채팅방 요약 갱신으로 저장한다.
+    두 쓰기를 한 트랜잭션으로 커밋해, 요약 갱신이 실패하면 INSERT도 롤백된다 (재시도 시 중복 키가 나지 않음).
+    """
+    with session_factory() as db:
+        MySQLChatMessageRepository(db).save_all(messages, commit=False)
+        MySQLChatRoomSummaryRepository(db).record_messages(messages, commit=False)
+        db.commit()
+
+
+class BufferedChatMessageWriter:
+    """
+    채팅 메시지 write-behind 버퍼.
+
+    - write(): 메시지를 bounded 큐에 넣는다. 큐가 가득 차면 자리가 날 때까지 대기한다 (backpressure).
+    - 백그라운드 flusher가 배치 크기 또는 flush 간격에 도달하면 persist를 스레드풀에서 실행한다.
+    - flush(): 호출 시점까지 write된 메시지가 모두 저장될 때까지 기다린다 (기록 조회 전 read-your-writes 보장).
+      저장이 MAX_RETRIES번 연속 실패하는 동안에는 기다리지 않고 ChatMessagePersistError를 던진다.
+    - close(): 남은 메시지를 모두 저장하고 flusher를 종료한다 (lifespan 종료 시).
+
+    저장 실패는 두 가지로 나눠 처리한다.
+    - 일시적 오류(연결 끊김, 타임아웃 등): 버리지 않고 성공할 때까지 백오프하며 재시도한다 (그동안 큐가 차면 write가 대기).
+    - 재시도해도 성공할 수 없는 오류(중복 키, FK 위반, 잘못된 값): 메시지를 하나씩 다시 저장해 보고,
+      그래도 실패하는 메시지만 dead letter 저장소로 옮긴다. 한 메시지 때문에 writer 전체가 멈추지 않는다.
+    """
+
+    # 저장 실패 시 재시도 간격 (초, 시도마다 늘어나며 최대 RETRY_BACKOFF_MAX_SECONDS)과
+    # flush가 실패로 보고하기 시작하는 연속 실패 횟수
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_SECONDS = 0.2
+    RETRY_BACKOFF_MAX_SECONDS = 5.0
+    # 재시도해도 같은 결과가 나오는 오류 (dead letter 대상)
+    NON_RETRYABLE_ERRORS = (IntegrityError, DataError, ValueError, TypeError)
+
+    def __init__(
+        self,
+        persist: Callable[[List[ChatMessage]], None],
+        max_batch_size: int = 200,
+        flush_interval_seconds: float = 0.05,
+        max_queue_size: int = 10000,
+        dead_letter: Optional[Callable[[List[ChatMessage], Exception], Awaitable[None]]] = None,
+    ):
+        self._persist = persist
+        self._dead_letter = dead_letter
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._persisted: Optional[asyncio.Condition] = None
+        self._enqueued_count = 0
+        self._persisted_count = 0
+        # 현재 배치가 MAX_RETRIES번 이상 연속 실패했으면 마지막 오류 (저장에 성공하면 None)
+        self._persist_error: Optional[Exception] = None
+
+        # 관측용 카운터
+        self.batches_written = 0
+        self.messages_written = 0
+        self.messages_dropped = 0
+        self.messages_dead_lettered = 0
+
+    @property
+    def pending_count(self) -> int:
+        """아직 저장되지 않은 메시지 수"""
+        return self._enqueued_count - self._persisted_count
+
+    async def write(self, message: ChatMessage) -> None:
+        """메시지를 버퍼에 넣는다 (큐가 가득 차면 대기)"""
+        self._ensure_started()
+        await self._queue.put(message)
+        self._enqueued_count += 1
+
+    async def flush(self) -> None:
+        """지금까지 write된 메시지가 모두 저장될 때까지 기다린다"""
+        if self._queue is None or self.pending_count == 0:
+            return
+
+        target = self._enqueued_count
+        self._flush_requested.set()
+        async with self._persisted:
+            await self._persisted.wait_for(
+                lambda: self._persisted_count >= target or self._persist_error is not None
+            )
+            if self._persisted_count < target:
+                raise ChatMessagePersistError(
+                    f"{self.pending_count} chat messages are not persisted yet"
+                ) from self._persist_error
+
+    async def close(self) -> None:
+        """남은 메시지를 저장하고 flusher를 종료한다"""
+        if self._flusher is None:
+            return
+
+        try:
+            await self.flush()
+        except ChatMessagePersistError as e:
+            # 종료 시점까지 저장하지 못한 메시지는 잃게 되므로 기록을 남긴다
+            self.messages_dropped += self.pending_count
+            print(f"[ChatMessageWriter] Closing with {self.pending_count} unsaved messages: {e.__cause__}")
+        self._flusher.cancel()
+        try:
+            await self._flusher
+        except asyncio.CancelledError:
+            pass
+        self._flusher = None
+        self._queue = None
+        print(f"[ChatMessageWriter] Closed ({self.messages_written} messages in {self.batches_written} batches)")
+
+    def _ensure_started(self) -> None:
+        if self._flusher is not None and not self._flusher.done():
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._flush_requested = asyncio.Event()
+            self._persisted = asyncio.Condition()
+        self._flusher = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect_batch()
+            await self._write_batch(batch)
+
+            async with self._persisted:
+                self._persisted_count += len(batch)
+                self._persisted.notify_all()
+
+    async def _collect_batch(self) -> List[ChatMessage]:
+        """첫 메시지를 기다린 뒤, 배치 크기/flush 간격/flush 요청 중 먼저 오는 시점까지 모은다"""
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval_seconds
+
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - loop.time()
+            if remaining <= 0 or self._flush_requested.is_set():
+                break
+
+            getter = asyncio.ensure_future(self._queue.get())
+            flush_waiter = asyncio.ensure_future(self._flush_requested.wait())
+            done, pending = await asyncio.wait(
+                {getter, flush_waiter},
+                timeout=remaining,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in pending:
+                future.cancel()
+            if getter in done:
+                batch.append(getter.result())
+
+        if self._queue.empty():
+            self._flush_requested.clear()
+        return batch
+
+    async def _write_batch(self, batch: List[ChatMessage]) -> None:
+        """
+        배치가 저장될 때까지 재시도한다 (이미 브로드캐스트된 메시지이므로 버리지 않는다).
+        재시도할 수 없는 오류면 메시지를 하나씩 저장하고, 실패하는 메시지만 dead letter로 옮긴다.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                await run_in_threadpool(self._persist, batch)
+            except self.NON_RETRYABLE_ERRORS as e:
+                print(f"[ChatMessageWriter] Cannot persist {len(batch)} messages: {e}")
+                if len(batch) > 1:
+                    for message in batch:
+                        await self._write_batch([message])
+                else:
+                    await self._move_to_dead_letter(batch, e)
+                self._persist_error = None
+                return
+            except Exception as e:
+                print(f"[ChatMessageWriter] Failed to persist {len(batch)} messages (attempt {attempt}): {e}")
+                if attempt >= self.MAX_RETRIES:
+                    # 기다리는 flush()에 실패를 알린다 (배치는 계속 재시도)
+                    async with self._persisted:
+                        self._persist_error = e
+                        self._persisted.notify_all()
+                await asyncio.sleep(
+                    min(self.RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1), self.RETRY_BACKOFF_MAX_SECONDS)
+                )
+                continue
+
+            self.batches_written += 1
+            self.messages_written += len(batch)
+            self._persist_error = None
+            return
+
+    async def _move_to_dead_letter(self, messages: List[ChatMessage], error: Exception) -> None:
+        """저장할 수 없는 메시지를 dead letter 저장소로 옮긴다 (저장소가 없거나 실패하면 로그로 남긴다)"""
+        if self._dead_letter:
+            try:
+                await self._dead_letter(messages, error)
+                self.messages_dead_lettered += len(messages)
+                return
+            except Exception as e:
+                print(f"[ChatMessageWriter] Failed to dead-letter {len(messages)} messages: {e}")
+        self.messages_dropped += len(messages)
+        for message in messages:
+            print(f"[ChatMessageWriter] Dropped message {message.id} in room {message.room_id}: {error}")
+
+
+def create_chat_message_writer(session_factory: sessionmaker) -> BufferedChatMessageWriter:
+    """설정값으로 session_factory에 저장하는 writer를 생성한다"""
+    settings = get_settings()
+    return BufferedChatMessageWriter(
+        partial(persist_chat_messages, session_factory),
+        max_batch_size=settings.CHAT_WRITE_BATCH_SIZE,
+        flush_interval_seconds=settings.CHAT_WRITE_FLUSH_INTERVAL_MS / 1000,
+        max_queue_size=settings.CHAT_WRITE_QUEUE_SIZE,
+        dead_letter=RedisChatMessageDeadLetter(get_redis()).push,
+    )
+
+
+# 싱글톤 인스턴스 (워커 프로세스마다 하나)
+chat_message_writer = create_chat_message_writer(SessionLocal)
+
+
+def get_chat_message_writer() -> BufferedChatMessageWriter:
+    """FastAPI dependency for the chat message writer"""
+    return chat_message_writer
+
+
+async def flush_pending_chat_messages(
+    writer: BufferedChatMessageWriter = Depends(get_chat_message_writer)
+) -> None:
+    """
+    FastAPI dependency: 이 워커에 버퍼링된 메시지를 저장한 뒤 조회하도록 한다.
+    (read-your-writes 보장은 워커 단위이며, 다른 워커의 버퍼는 flush 간격 내에 반영된다)
+    저장이 계속 실패하는 동안에는 빠진 기록을 돌려주지 않도록 503으로 응답한다.
+    """
+    try:
+        await writer.flush()
+    except ChatMessagePersistError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="채팅 메시지를 저장하는 중입니다. 잠시 후 다시 시도해주세요."
+        )
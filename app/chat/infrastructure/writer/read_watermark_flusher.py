@@ -0,0 +1,95 @@
+import asyncio
+from functools import partial
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
+from app.chat.application.use_case.persist_read_watermarks_use_case import PersistReadWatermarksUseCase
+from app.chat.domain.read_watermark import ReadWatermark
+from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
+from app.chat.infrastructure.repository.mysql_chat_room_summary_repository import MySQLChatRoomSummaryRepository
+from app.chat.infrastructure.repository.redis_unread_counter_repository import RedisUnreadCounterRepository
+from config.database import SessionLocal
+from config.redis import get_redis
+from config.settings import get_settings
+
+
+def persist_read_watermarks(session_factory: sessionmaker, watermarks: List[ReadWatermark]) -> None:
+    """짧은 세션으로 읽음 워터마크를 MySQL에 반영한다 (스레드풀에서 실행)"""
+    with session_factory() as db:
+        PersistReadWatermarksUseCase(
+            MySQLChatRoomRepository(db),
+            MySQLChatRoomSummaryRepository(db)
+        ).execute(watermarks)
+
+
+class ReadWatermarkFlusher:
+    """
+    읽음 워터마크 지연 반영기.
+    읽음 처리는 Redis 카운터만 갱신하고, 이 flusher가 주기적으로 워터마크를 모아 MySQL에 반영한다.
+    반영에 실패한 워터마크는 메모리에 보관했다가 다음 주기에 다시 시도한다.
+    """
+
+    def __init__(
+        self,
+        unread_counter: UnreadCounterPort,
+        persist: Callable[[List[ReadWatermark]], None],
+        interval_seconds: float = 5.0,
+    ):
+        self._unread_counter = unread_counter
+        self._persist = persist
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._retry: List[ReadWatermark] = []
+
+    def start(self) -> None:
+        """주기적 반영 태스크를 시작한다 (lifespan 시작 시)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> int:
+        """대기 중인 워터마크를 MySQL에 반영하고 반영한 개수를 반환한다"""
+        watermarks = self._retry + await self._unread_counter.pop_read_watermarks()
+        self._retry = []
+        if not watermarks:
+            return 0
+
+        try:
+            await run_in_threadpool(self._persist, watermarks)
+        except Exception as e:
+            print(f"[ReadWatermarkFlusher] Failed to persist {len(watermarks)} watermarks: {e}")
+            self._retry = watermarks
+            return 0
+        return len(watermarks)
+
+    async def close(self) -> None:
+        """태스크를 멈추고 남은 워터마크를 반영한다 (lifespan 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"[ReadWatermarkFlusher] Final flush failed: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"[ReadWatermarkFlusher] Flush error: {e}")
+
+
+# 싱글톤 인스턴스 (워커 프로세스마다 하나)
+read_watermark_flusher = ReadWatermarkFlusher(
+    RedisUnreadCounterRepository(get_redis()),
+    partial(persist_read_watermarks, SessionLocal),
+    interval_seconds=get_settings().CHAT_READ_WATERMARK_FLUSH_INTERVAL_SECONDS,
+)
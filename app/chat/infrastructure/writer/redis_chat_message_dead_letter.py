@@ -0,0 +1,37 @@
+from typing import List
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.chat.domain.chat_message import ChatMessage
+
+
+class RedisChatMessageDeadLetter:
+    """
+    저장할 수 없는 채팅 메시지(중복 키, 잘못된 값 등)를 보관하는 Redis 리스트.
+    - chat:dead_letter: List (메시지와 실패 사유 JSON). 운영자가 확인 후 수동으로 재처리한다.
+    """
+
+    DEAD_LETTER_KEY = "chat:dead_letter"
+    # 보관할 최대 항목 수 (오래된 것부터 잘린다)
+    MAX_ENTRIES = 10000
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+
+    async def push(self, messages: List[ChatMessage], error: Exception) -> None:
+        entries = [
+            orjson.dumps({
+                "id": message.id,
+                "room_id": message.room_id,
+                "sender_id": message.sender_id,
+                "content": message.content,
+                "created_at": message.created_at.isoformat(),
+                "error": f"{type(error).__name__}: {error}",
+            }).decode("utf-8")
+            for message in messages
+        ]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(self.DEAD_LETTER_KEY, *entries)
+            pipe.ltrim(self.DEAD_LETTER_KEY, -self.MAX_ENTRIES, -1)
+            await pipe.execute()
@@ -2,8 +2,17 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from app.router import setup_routers
-from config.database import engine, Base
+from config.database import engine, Base, SessionLocal
 from config.redis import redis_client
+from config.connection_manager import manager
+from config.settings import get_settings
+from app.chat.infrastructure.writer.buffered_chat_message_writer import chat_message_writer
+from app.chat.infrastructure.writer.read_watermark_flusher import read_watermark_flusher
+from app.match.adapter.output.persistence.match_queue_compactor import match_queue_compactor
+from app.match.adapter.input.worker.batch_matchmaker import batch_matchmaker
+from app.user.application.use_case.warm_up_block_cache_use_case import WarmUpBlockCacheUseCase
+from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from app.user.infrastructure.repository.redis_block_cache_repository import RedisBlockCacheRepository
 from fastapi.middleware.cors import CORSMiddleware
 
 
@@ -21,10 +30,33 @@ async def lifespan(_: FastAPI):
     await redis_client.ping()
     print("[+] Redis connected")
 
+    # 매칭용 차단 관계 캐시 적재 (이미 적재되어 있으면 건너뜀)
+    with SessionLocal() as db:
+        loaded = await WarmUpBlockCacheUseCase(
+            MySQLBlockRepository(db),
+            RedisBlockCacheRepository(redis_client)
+        ).execute()
+    print(f"[+] Block cache ready (loaded {loaded} relations)")
+
+    # 읽음 워터마크 지연 반영 시작
+    read_watermark_flusher.start()
+
+    # 매칭 대기열 유령 티켓 정리 시작
+    match_queue_compactor.start()
+
+    # 배치/하이브리드 매칭 모드면 주기적 매칭 워커 시작
+    if get_settings().MATCHMAKER_MODE in ("batch", "hybrid"):
+        batch_matchmaker.start()
+
     yield
 
     # Shutdown
     print("[-] Shutting down HexaCore AI Server...")
+    await manager.close()
+    await chat_message_writer.close()
+    await read_watermark_flusher.close()
+    await match_queue_compactor.close()
+    await batch_matchmaker.close()
     engine.dispose()
     await redis_client.aclose()
     print("[+] Database and Redis connections closed")
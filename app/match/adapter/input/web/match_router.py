@@ -10,15 +10,24 @@ from config.database import get_db
 # Dependency Imports
 from app.match.application.port.output.match_queue_port import MatchQueuePort
 from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.adapter.output.persistence.match_queue_compactor import MatchQueueCompactor, match_queue_compactor
 from app.match.application.port.output.chat_room_port import ChatRoomPort
 from app.match.adapter.output.chat.chat_client_adapter import ChatClientAdapter
+from app.chat.infrastructure.repository.redis_active_chat_pair_repository import RedisActiveChatPairRepository
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from app.user.application.port.block_cache_port import BlockCachePort
+from app.user.infrastructure.repository.redis_block_cache_repository import RedisBlockCacheRepository
 from app.match.application.port.output.match_state_port import MatchStatePort
 from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
 from app.match.application.port.output.match_notification_port import MatchNotificationPort
+from app.match.application.port.output.match_metrics_port import MatchMetricsPort
+from app.match.adapter.output.persistence.redis_match_metrics_adapter import RedisMatchMetricsAdapter
 from app.match.adapter.output.notification.websocket_match_notification_adapter import WebSocketMatchNotificationAdapter
+from app.match.application.port.output.match_notification_outbox_port import MatchNotificationOutboxPort
+from app.match.adapter.output.notification.redis_match_notification_outbox import RedisMatchNotificationOutbox
 from config.redis import get_redis
+from config.settings import get_settings
 from config.connection_manager import manager as connection_manager
 
 
@@ -29,31 +38,49 @@ match_router = APIRouter()
 def get_match_queue_port() -> MatchQueuePort:
     return RedisMatchQueueAdapter(get_redis())
 
+def get_match_queue_compactor() -> MatchQueueCompactor:
+    return match_queue_compactor
+
 def get_chat_room_port() -> ChatRoomPort:
-    return ChatClientAdapter()
+    return ChatClientAdapter(RedisActiveChatPairRepository(get_redis()))
 
 def get_block_repository(db: Session = Depends(get_db)) -> BlockRepositoryPort:
     return MySQLBlockRepository(db)
 
+def get_block_cache() -> BlockCachePort:
+    return RedisBlockCacheRepository(get_redis())
+
 def get_match_state_port() -> MatchStatePort:
     return RedisMatchStateAdapter(get_redis())
 
+def get_match_notification_outbox() -> MatchNotificationOutboxPort:
+    return RedisMatchNotificationOutbox(get_redis(), get_settings().MATCH_NOTIFICATION_OUTBOX_TTL_SECONDS)
+
 def get_match_notification_port() -> MatchNotificationPort:
-    return WebSocketMatchNotificationAdapter(connection_manager)
+    return WebSocketMatchNotificationAdapter(connection_manager, get_match_notification_outbox())
+
+def get_match_metrics_port() -> MatchMetricsPort:
+    return RedisMatchMetricsAdapter(get_redis())
 
 def get_match_use_case(
     match_queue_port: MatchQueuePort = Depends(get_match_queue_port),
     chat_room_port: ChatRoomPort = Depends(get_chat_room_port),
     block_repository: BlockRepositoryPort = Depends(get_block_repository),
     match_state_port: MatchStatePort = Depends(get_match_state_port),
-    match_notification_port: MatchNotificationPort = Depends(get_match_notification_port)
+    match_notification_port: MatchNotificationPort = Depends(get_match_notification_port),
+    block_cache: BlockCachePort = Depends(get_block_cache),
+    match_metrics_port: MatchMetricsPort = Depends(get_match_metrics_port)
 ) -> MatchUseCase:
     return MatchUseCase(
         match_queue_port=match_queue_port,
         chat_room_port=chat_room_port,
         block_repository=block_repository,
         match_state_port=match_state_port,
-        match_notification_port=match_notification_port
+        match_notification_port=match_notification_port,
+        block_cache=block_cache,
+        reactive=get_settings().MATCHMAKER_MODE != "batch",
+        match_metrics_port=match_metrics_port,
+        widen_every_seconds=get_settings().MATCH_LEVEL_WIDEN_SECONDS
     )
 
 
@@ -70,7 +97,8 @@ async def request_match(
         result = await usecase.request_match(
             user_id=request.user_id,
             mbti=mbti_enum,
-            level=request.level
+            level=request.level,
+            max_level=request.max_level
         )
         return result
     except ValueError as e:
@@ -109,4 +137,26 @@ async def get_queue_status(
             "waiting_count": count
         }
     except ValueError:
-        raise HTTPException(status_code=400, detail="유효하지 않은 MBTI입니다.")
\ No newline at end of file
+        raise HTTPException(status_code=400, detail="유효하지 않은 MBTI입니다.")
+
+
+@match_router.get("/queue-stats")
+async def get_queue_stats(
+    compactor: MatchQueueCompactor = Depends(get_match_queue_compactor)
+):
+    """
+    (모니터링용) MBTI 대기열별 유령 티켓 비율과 정리기 지표를 확인합니다.
+    """
+    await compactor.refresh_ghost_ratios()
+    return compactor.get_stats()
+
+
+@match_router.get("/wait-histogram")
+async def get_wait_histogram(
+    match_metrics_port: MatchMetricsPort = Depends(get_match_metrics_port)
+):
+    """
+    (모니터링용) 매칭 성사까지 걸린 대기 시간 히스토그램을 궁합 단계별로 확인합니다.
+    궁합 단계 자동 확장 주기(MATCH_LEVEL_WIDEN_SECONDS)를 조정할 때 참고합니다.
+    """
+    return await match_metrics_port.get_wait_histogram()
@@ -1,24 +1,52 @@
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+
+from app.match.adapter.input.web.match_router import get_match_notification_outbox
+from app.match.application.port.output.match_notification_outbox_port import MatchNotificationOutboxPort
 from config.connection_manager import manager
+from config.websocket_codec import encode_json, negotiate_codec
 
 match_websocket_router = APIRouter()
 
 
 @match_websocket_router.websocket("/ws/match/{user_id}")
-async def match_websocket_endpoint(websocket: WebSocket, user_id: str):
+async def match_websocket_endpoint(
+    websocket: WebSocket,
+    user_id: str,
+    outbox: MatchNotificationOutboxPort = Depends(get_match_notification_outbox)
+):
     """
     매칭 대기 중인 사용자가 연결하는 WebSocket 엔드포인트.
     매칭이 성사되면 이 연결을 통해 알림을 받습니다.
+    Sec-WebSocket-Protocol로 msgpack을 요청하면 알림을 MessagePack 바이너리 프레임으로 받습니다.
+
+    연결 직후 아직 확인(ack)하지 않은 알림을 다시 보내므로, 같은 알림을 두 번 받을 수 있습니다.
+    클라이언트는 notificationId로 중복을 거르고 {"type": "ack", "notificationId": ...}로 확인합니다.
     """
     # room_id는 "match_waiting"으로 설정 (매칭 대기용 가상 룸)
     room_id = f"match_waiting_{user_id}"
-    await manager.connect(websocket, room_id, user_id)
+    codec = negotiate_codec(websocket)
+    await manager.connect(websocket, room_id, user_id, codec=codec)
     print(f"[MatchWebSocket] User {user_id} connected for match notifications")
 
     try:
+        # 연결이 끊겨 있던 동안(또는 다른 워커에 연결되어 있던 동안) 놓친 알림 재전송
+        for notification_id, payload in await outbox.get_pending(user_id):
+            manager.send_to_connection(websocket, encode_json({**payload, "notificationId": notification_id}))
+
         while True:
-            # 클라이언트로부터 ping/pong 또는 연결 유지 메시지 수신
-            await websocket.receive_text()
+            # 클라이언트로부터 ping/pong, 연결 유지 또는 ack 메시지 수신
+            frame = await codec.receive_frame(websocket)
+            try:
+                message = codec.decode(frame)
+            except ValueError:
+                continue
+            if message.get("type") == "ack" and message.get("notificationId"):
+                # 잘못된 ack 하나 때문에 연결을 끊지 않는다 (ack 안 된 알림은 재연결 시 다시 전달된다)
+                try:
+                    await outbox.ack(user_id, [str(message["notificationId"])])
+                except Exception as e:
+                    print(f"[MatchWebSocket] Failed to ack notification for {user_id}: {e}")
     except WebSocketDisconnect:
-        manager.disconnect(websocket, room_id)
         print(f"[MatchWebSocket] User {user_id} disconnected from match notifications")
+    finally:
+        manager.disconnect(websocket, room_id)
@@ -1,6 +1,11 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 class MatchRequest(BaseModel):
     user_id: str
     mbti: str
-    level: int = Field(default=1, ge=1, le=4, description="1:천생연분, 2:좋음, 3:무난, 4:전체")
\ No newline at end of file
+    level: int = Field(default=1, ge=1, le=4, description="1:천생연분, 2:좋음, 3:무난, 4:전체")
+    max_level: Optional[int] = Field(
+        default=None, ge=1, le=4, description="오래 기다리면 서버가 넓혀도 되는 최대 단계 (없으면 level 고정)"
+    )
\ No newline at end of file
@@ -0,0 +1,97 @@
+import asyncio
+from typing import FrozenSet, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.match.adapter.input.web.match_router import (
+    get_block_cache,
+    get_chat_room_port,
+    get_match_metrics_port,
+    get_match_notification_port,
+    get_match_queue_port,
+    get_match_state_port,
+)
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from config.database import SessionLocal
+from config.settings import get_settings
+
+
+def create_batch_match_use_case(db: Session) -> MatchUseCase:
+    """배치 매칭 한 주기 동안 사용할 MatchUseCase를 만든다"""
+    return MatchUseCase(
+        match_queue_port=get_match_queue_port(),
+        chat_room_port=get_chat_room_port(),
+        block_repository=MySQLBlockRepository(db),
+        match_state_port=get_match_state_port(),
+        match_notification_port=get_match_notification_port(),
+        block_cache=get_block_cache(),
+        reactive=False,
+        match_metrics_port=get_match_metrics_port(),
+        widen_every_seconds=get_settings().MATCH_LEVEL_WIDEN_SECONDS,
+    )
+
+
+class BatchMatchmaker:
+    """
+    배치 매칭 워커 (MATCHMAKER_MODE=batch 또는 hybrid).
+    tick_seconds마다 전체 MBTI 대기열을 스냅샷해 최대 가중치로 짝짓고, 채팅방 생성과 양쪽 알림까지 처리한다.
+    """
+
+    # 이미 채팅 중인 쌍 기록의 최대 크기 (넘으면 비우고 다시 채운다)
+    MAX_KNOWN_PARTNERS = 10000
+
+    def __init__(self, tick_seconds: float = 1.0, limit_per_queue: int = 16):
+        self.tick_seconds = tick_seconds
+        self.limit_per_queue = limit_per_queue
+        self._task: Optional[asyncio.Task] = None
+        self._known_partners: Set[FrozenSet[str]] = set()
+
+        self.ticks = 0
+        self.matches_made = 0
+
+    def start(self) -> None:
+        """주기적 매칭 태스크를 시작한다 (lifespan 시작 시)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """매칭 태스크를 멈춘다 (lifespan 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def tick(self) -> int:
+        """배치 매칭을 한 번 수행하고 성사된 매칭 수를 반환한다"""
+        if len(self._known_partners) > self.MAX_KNOWN_PARTNERS:
+            self._known_partners.clear()
+
+        with SessionLocal() as db:
+            matched = await create_batch_match_use_case(db).match_waiting_users(
+                self.limit_per_queue, self._known_partners
+            )
+
+        self.ticks += 1
+        self.matches_made += matched
+        return matched
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.tick_seconds)
+            try:
+                matched = await self.tick()
+                if matched:
+                    print(f"[BatchMatchmaker] Matched {matched} pairs")
+            except Exception as e:
+                print(f"[BatchMatchmaker] Tick error: {e}")
+
+
+# 싱글톤 인스턴스 (배치 모드에서만 lifespan이 시작한다)
+batch_matchmaker = BatchMatchmaker(
+    tick_seconds=get_settings().MATCHMAKER_TICK_SECONDS,
+    limit_per_queue=get_settings().MATCHMAKER_BATCH_LIMIT_PER_QUEUE,
+)
@@ -2,9 +2,12 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+from starlette.concurrency import run_in_threadpool
+
 from config.database import get_db_session
 from app.match.application.port.output.chat_room_port import ChatRoomPort
 
+from app.chat.application.port.active_chat_pair_port import ActiveChatPairPort
 from app.chat.application.use_case.create_chat_room_use_case import CreateChatRoomUseCase
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
 
@@ -14,10 +17,15 @@ logger = logging.getLogger("match_adapter")
 class ChatClientAdapter(ChatRoomPort):
     """
     Match 도메인의 요청을 Chat 도메인의 유스케이스 호출로 변환하는 어댑터
+
+    MySQL 작업(동기 SQLAlchemy)은 스레드 풀에서 실행해 이벤트 루프를 막지 않는다.
+    active_pairs를 주면 후보 필터링(are_users_partners)은 Redis 집합만 조회한다.
     """
 
+    def __init__(self, active_pairs: Optional[ActiveChatPairPort] = None):
+        self.active_pairs = active_pairs
+
     async def create_chat_room(self, match_payload: Dict[str, Any]) -> Optional[str]:
-        db = None
         try:
             # 1. 데이터 파싱 (Match 규격 -> Chat 규격 변환)
             room_id = match_payload["roomId"]
@@ -34,20 +42,11 @@ class ChatClientAdapter(ChatRoomPort):
             timestamp_str = match_payload["timestamp"]
             timestamp = datetime.fromisoformat(timestamp_str)
 
-            # 2. Chat 도메인 컴포넌트 준비
-            # DB 세션 생성 (Modular Monolith 구조이므로 직접 DB 접근)
-            db = get_db_session()
-            chat_repo = MySQLChatRoomRepository(db)
-            chat_usecase = CreateChatRoomUseCase(chat_repo)
-
-            # 3. Chat 유스케이스 실행
+            # 2. Chat 유스케이스 실행 (스레드 풀)
             logger.info(f"[Chat Integration] Creating room {room_id} for {user1_id}, {user2_id}")
 
-            actual_room_id = chat_usecase.execute(
-                room_id=room_id,
-                user1_id=user1_id,
-                user2_id=user2_id,
-                timestamp=timestamp
+            actual_room_id = await run_in_threadpool(
+                self._create_chat_room, room_id, user1_id, user2_id, timestamp
             )
 
             if actual_room_id != room_id:
@@ -55,8 +54,6 @@ class ChatClientAdapter(ChatRoomPort):
             else:
                 logger.info(f"[Chat Integration] Successfully created room: {room_id}")
 
-            return actual_room_id
-
         except ValueError as ve:
             logger.error(f"[Chat Integration] Validation Error: {ve}")
             return None
@@ -64,28 +61,69 @@ class ChatClientAdapter(ChatRoomPort):
             logger.error(f"[Chat Integration] Failed to create chat room: {e}")
             # 필요 시 여기서 재시도 로직을 추가하거나, 에러를 상위로 전파할 수 있음
             return None
-        finally:
-            # 4. DB 세션 정리
-            if db:
-                db.close()
+
+        # 3. 활성 채팅 쌍 갱신 (새 방/재활용된 방 모두 active)
+        # 방은 이미 만들어졌으므로 Redis 실패는 기록만 하고 방 ID를 돌려준다
+        # (집합은 다음 재초기화 때 MySQL 기준으로 다시 채워진다)
+        if self.active_pairs:
+            try:
+                await self.active_pairs.add(user1_id, user2_id)
+            except Exception as e:
+                logger.error(f"[Chat Integration] Failed to record active pair for room {actual_room_id}: {e}")
+
+        return actual_room_id
+
     async def are_users_partners(self, user1_id: str, user2_id: str) -> bool:
         """
         두 유저가 현재 활성 채팅방에서 대화 중인지 확인.
         나간 방(left_by_user1, left_by_user2, closed, blocked)은 제외하여 재매칭 가능하도록 함.
         """
-        db = None
         try:
-            db = get_db_session()
-            chat_repo = MySQLChatRoomRepository(db)
-            existing_room = chat_repo.find_by_users(user1_id, user2_id)
-            # active 상태인 방만 중복으로 처리
-            if existing_room is None:
-                return False
-            return existing_room.status == "active"
+            if not self.active_pairs:
+                return await run_in_threadpool(self._find_active_room, user1_id, user2_id)
+
+            is_partner = await self.active_pairs.contains(user1_id, user2_id)
+            if is_partner is not None:
+                return is_partner
+
+            # 아직 초기화되지 않았으면 MySQL의 활성 채팅방 목록으로 한 번 채운다
+            pairs = await run_in_threadpool(self._find_active_user_pairs)
+            await self.active_pairs.seed(pairs)
+            return bool(await self.active_pairs.contains(user1_id, user2_id))
         except Exception as e:
             logger.error(f"[Chat Integration] Failed to check partnership for {user1_id}, {user2_id}: {e}")
             # 에러 발생 시 안전하게 처리 (매칭을 막지 않도록 False 반환)
             return False
+
+    @staticmethod
+    def _create_chat_room(room_id: str, user1_id: str, user2_id: str, timestamp: datetime) -> str:
+        # DB 세션 생성 (Modular Monolith 구조이므로 직접 DB 접근)
+        db = get_db_session()
+        try:
+            chat_repo = MySQLChatRoomRepository(db)
+            chat_usecase = CreateChatRoomUseCase(chat_repo)
+            return chat_usecase.execute(
+                room_id=room_id,
+                user1_id=user1_id,
+                user2_id=user2_id,
+                timestamp=timestamp
+            )
+        finally:
+            db.close()
+
+    @staticmethod
+    def _find_active_room(user1_id: str, user2_id: str) -> bool:
+        db = get_db_session()
+        try:
+            # active 상태인 방만 중복으로 처리
+            return MySQLChatRoomRepository(db).find_by_users(user1_id, user2_id) is not None
+        finally:
+            db.close()
+
+    @staticmethod
+    def _find_active_user_pairs() -> list[tuple[str, str]]:
+        db = get_db_session()
+        try:
+            return MySQLChatRoomRepository(db).find_active_user_pairs()
         finally:
-            if db:
-                db.close()
\ No newline at end of file
+            db.close()
@@ -0,0 +1,57 @@
+import re
+from typing import Any, Dict, List, Tuple
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.match.application.port.output.match_notification_outbox_port import MatchNotificationOutboxPort
+
+
+class RedisMatchNotificationOutbox(MatchNotificationOutboxPort):
+    """
+    유저별 Redis Stream에 매칭 알림을 쌓아 두는 아웃박스.
+    알림은 클라이언트가 ack 할 때까지 남아 있어, 알림 순간에 소켓이 다른 워커에 있거나
+    잠시 끊겨 있었어도 재연결 시 다시 전달할 수 있다.
+    """
+
+    # 유저별로 보관할 최대 알림 수 (근사치, XADD MAXLEN ~)
+    MAX_PENDING_PER_USER = 50
+
+    # 스트림 엔트리 ID 형식 (<ms>-<seq>). 클라이언트가 보낸 ID는 이 형식만 XDEL에 넘긴다
+    _STREAM_ID_PATTERN = re.compile(r"\d+-\d+")
+
+    def __init__(self, client: aioredis.Redis, ttl_seconds: int = 300):
+        self.redis = client
+        self.key_prefix = "match:outbox:"
+        # 마지막 알림 이후 이 시간이 지나도록 재연결하지 않으면 스트림을 지운다
+        self.ttl_seconds = ttl_seconds
+
+    def _get_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    async def append(self, user_id: str, payload: Dict[str, Any]) -> str:
+        key = self._get_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                key,
+                {"payload": orjson.dumps(payload).decode("utf-8")},
+                maxlen=self.MAX_PENDING_PER_USER,
+                approximate=True
+            )
+            pipe.expire(key, self.ttl_seconds)
+            notification_id, _ = await pipe.execute()
+        return notification_id
+
+    async def get_pending(self, user_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        entries = await self.redis.xrange(self._get_key(user_id))
+        return [(entry_id, orjson.loads(fields["payload"])) for entry_id, fields in entries]
+
+    async def ack(self, user_id: str, notification_ids: List[str]) -> int:
+        # 형식이 잘못된 ID는 XDEL이 ResponseError로 거부하므로 미리 걸러낸다
+        valid_ids = [
+            notification_id for notification_id in notification_ids
+            if self._STREAM_ID_PATTERN.fullmatch(notification_id)
+        ]
+        if not valid_ids:
+            return 0
+        return await self.redis.xdel(self._get_key(user_id), *valid_ids)
@@ -1,21 +1,32 @@
-import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from app.match.application.port.output.match_notification_outbox_port import MatchNotificationOutboxPort
 from app.match.application.port.output.match_notification_port import MatchNotificationPort
 from config.connection_manager import ConnectionManager
+from config.websocket_codec import encode_json
 
 
 class WebSocketMatchNotificationAdapter(MatchNotificationPort):
     """
     An adapter that sends match notifications via WebSocket.
+    With an outbox, each notification is stored first and tagged with a notificationId,
+    so it can be replayed when the user reconnects until the client acknowledges it.
     """
 
-    def __init__(self, connection_manager: ConnectionManager):
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        outbox: Optional[MatchNotificationOutboxPort] = None
+    ):
         self.connection_manager = connection_manager
+        self.outbox = outbox
 
     async def notify_match_success(self, user_id: str, payload: Dict[str, Any]):
         """
         Sends a JSON-serialized match success payload to a user.
         """
-        message = json.dumps(payload)
+        if self.outbox:
+            notification_id = await self.outbox.append(user_id, payload)
+            payload = {**payload, "notificationId": notification_id}
+        message = encode_json(payload)
         await self.connection_manager.send_to_user(user_id, message)
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.shared.vo.mbti import MBTI
+from config.redis import get_redis
+from config.settings import get_settings
+
+
+class MatchQueueCompactor:
+    """
+    매칭 대기열 유령 티켓 정리기.
+    매칭 취소는 Set에서만 유저를 지우므로, List에는 dequeue가 꺼낼 때까지 유령 티켓이 남는다.
+    이 정리기는 주기적으로 MBTI별 List를 구간 단위로 훑으며 유령 티켓을 제거한다.
+    한 번 실행할 때 budget_seconds만 쓰고, 남은 구간은 다음 실행에서 이어서 정리한다.
+    """
+
+    def __init__(
+        self,
+        queue: RedisMatchQueueAdapter,
+        interval_seconds: float = 30.0,
+        budget_seconds: float = 0.05,
+        chunk_size: int = 500,
+        mbti_list: Optional[List[str]] = None,
+    ):
+        self._queue = queue
+        self.interval_seconds = interval_seconds
+        self.budget_seconds = budget_seconds
+        self.chunk_size = chunk_size
+        self._mbti_list = mbti_list or MBTICompatibility.ALL_MBTI
+        self._task: Optional[asyncio.Task] = None
+
+        # 다음 실행에서 이어서 정리할 위치 (MBTI 순번, MBTI별 List 인덱스)
+        self._position = 0
+        self._cursors: Dict[str, int] = {}
+
+        self.runs = 0
+        self.tickets_removed = 0
+        # 마지막으로 조회한 MBTI별 유령 티켓 비율
+        self.ghost_ratios: Dict[str, float] = {}
+
+    def start(self) -> None:
+        """주기적 정리 태스크를 시작한다 (lifespan 시작 시)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """정리 태스크를 멈춘다 (lifespan 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self) -> int:
+        """
+        시간 예산 안에서 대기열을 구간 단위로 정리하고 제거한 유령 티켓 수를 반환한다.
+        예산이 작아도 최소 한 구간은 정리하며, 모든 대기열을 한 바퀴 다 돌면 예산이 남아도 멈춘다.
+        """
+        deadline = time.perf_counter() + self.budget_seconds
+        removed = 0
+        finished_queues = 0
+
+        while True:
+            mbti = self._mbti_list[self._position]
+            start = self._cursors.get(mbti, 0)
+            scanned, removed_now = await self._queue.compact(MBTI(mbti), start, self.chunk_size)
+            removed += removed_now
+
+            if scanned < self.chunk_size:
+                # List 끝까지 정리했으면 다음 MBTI로 넘어간다
+                self._cursors[mbti] = 0
+                self._position = (self._position + 1) % len(self._mbti_list)
+                finished_queues += 1
+            else:
+                # 제거된 만큼 뒤 티켓이 당겨지므로 남은 티켓 수만큼만 전진한다.
+                # 그 사이 dequeue로 앞쪽이 빠지면 일부 티켓을 건너뛸 수 있지만 다음 바퀴에서 다시 검사된다.
+                self._cursors[mbti] = start + scanned - removed_now
+
+            if finished_queues >= len(self._mbti_list) or time.perf_counter() >= deadline:
+                break
+
+        self.runs += 1
+        self.tickets_removed += removed
+        await self.refresh_ghost_ratios()
+        return removed
+
+    async def refresh_ghost_ratios(self) -> Dict[str, float]:
+        """MBTI별 유령 티켓 비율을 다시 조회한다"""
+        self.ghost_ratios = await self._queue.get_ghost_ratios(self._mbti_list)
+        return self.ghost_ratios
+
+    def get_stats(self) -> Dict[str, object]:
+        """정리기 지표 (실행 횟수, 누적 제거 수, MBTI별 유령 티켓 비율)"""
+        return {
+            "runs": self.runs,
+            "tickets_removed": self.tickets_removed,
+            "ghost_ratios": dict(self.ghost_ratios),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                removed = await self.run_once()
+                if removed:
+                    print(f"[MatchQueueCompactor] Removed {removed} ghost tickets")
+            except Exception as e:
+                print(f"[MatchQueueCompactor] Compaction error: {e}")
+
+
+# 싱글톤 인스턴스 (워커 프로세스마다 하나)
+match_queue_compactor = MatchQueueCompactor(
+    RedisMatchQueueAdapter(get_redis()),
+    interval_seconds=get_settings().MATCH_QUEUE_COMPACTION_INTERVAL_SECONDS,
+    budget_seconds=get_settings().MATCH_QUEUE_COMPACTION_BUDGET_MS / 1000,
+)
@@ -0,0 +1,49 @@
+from typing import Any, Dict, List, Tuple
+
+import redis.asyncio as aioredis
+
+from app.match.application.port.output.match_metrics_port import MatchMetricsPort
+from app.match.domain.wait_time_histogram import WaitTimeHistogram
+
+
+class RedisMatchMetricsAdapter(MatchMetricsPort):
+    """
+    매칭 대기 시간 히스토그램을 Redis Hash 하나에 누적한다 (모든 워커가 같은 히스토그램을 공유).
+    필드: "{단계}:{구간}" (구간별 횟수), "{단계}:count", "{단계}:sum_ms"
+    """
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+        self.histogram_key = "match:stats:wait_histogram"
+
+    async def record_match_waits(self, waits: List[Tuple[float, int]]) -> None:
+        if not waits:
+            return
+        # [1 RTT] 모든 HINCRBY를 파이프라인으로 한 번에 보낸다
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for wait_seconds, level in waits:
+                pipe.hincrby(self.histogram_key, f"{level}:{WaitTimeHistogram.bucket_for(wait_seconds)}", 1)
+                pipe.hincrby(self.histogram_key, f"{level}:count", 1)
+                pipe.hincrby(self.histogram_key, f"{level}:sum_ms", int(wait_seconds * 1000))
+            await pipe.execute()
+
+    async def get_wait_histogram(self) -> Dict[str, Any]:
+        raw = await self.redis.hgetall(self.histogram_key)
+
+        levels: Dict[str, Dict[str, Any]] = {}
+        for field, value in raw.items():
+            level, name = field.split(":", 1)
+            entry = levels.setdefault(level, {"counts": WaitTimeHistogram.empty_counts(), "count": 0, "sum_ms": 0})
+            if name in ("count", "sum_ms"):
+                entry[name] = int(value)
+            else:
+                entry["counts"][name] = int(value)
+
+        for entry in levels.values():
+            sum_ms = entry.pop("sum_ms")
+            entry["mean_seconds"] = round(sum_ms / entry["count"] / 1000, 3) if entry["count"] else 0.0
+
+        return {
+            "buckets": list(WaitTimeHistogram.bucket_labels()),
+            "levels": dict(sorted(levels.items())),
+        }
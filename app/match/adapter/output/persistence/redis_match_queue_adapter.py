@@ -9,9 +9,70 @@ from app.match.application.port.output.match_queue_port import MatchQueuePort
 
 
 class RedisMatchQueueAdapter(MatchQueuePort):
+    # 중복 체크 + 등록을 한 번의 왕복으로 원자적으로 처리한다.
+    # KEYS[1]=set, KEYS[2]=list / ARGV[1]=user_id, ARGV[2]=직렬화된 티켓
+    # 반환: 1(등록 성공), 0(이미 대기열에 있음)
+    ENQUEUE_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('RPUSH', KEYS[2], ARGV[2])
+return 1
+"""
+
+    # 유효한 티켓이 나올 때까지 LPOP + SREM 을 서버에서 반복한다 (유령 티켓 건너뛰기 포함).
+    # 한 번의 호출이 Redis를 오래 붙잡지 않도록 최대 ARGV[1]개까지만 건너뛴다.
+    # KEYS[1]=list, KEYS[2]=set / ARGV[1]=최대 건너뛸 개수
+    # 반환: {건너뛴 유령 티켓 수, 티켓 데이터(없으면 생략)}
+    DEQUEUE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local skipped = 0
+while skipped < limit do
+    local data = redis.call('LPOP', KEYS[1])
+    if not data then
+        return {skipped}
+    end
+    local user_id = cjson.decode(data)['user_id']
+    if redis.call('SREM', KEYS[2], user_id) == 1 then
+        return {skipped, data}
+    end
+    skipped = skipped + 1
+end
+return {skipped}
+"""
+
+    # 스크립트 한 번 실행에서 건너뛸 수 있는 유령 티켓 최대 개수
+    MAX_GHOSTS_PER_CALL = 1000
+
+    # List의 [start, start+count) 구간에서 Set에 없는 유저의 티켓(유령 티켓)을 제거한다.
+    # 유령 티켓을 표식으로 덮어쓴 뒤 LREM으로 한 번에 지우므로 구간 하나가 원자적으로 정리된다.
+    # KEYS[1]=list, KEYS[2]=set / ARGV[1]=start, ARGV[2]=count, ARGV[3]=표식
+    # 반환: {검사한 티켓 수, 제거한 티켓 수}
+    COMPACT_SCRIPT = """
+local start = tonumber(ARGV[1])
+local items = redis.call('LRANGE', KEYS[1], start, start + tonumber(ARGV[2]) - 1)
+local removed = 0
+for i, data in ipairs(items) do
+    local user_id = cjson.decode(data)['user_id']
+    if redis.call('SISMEMBER', KEYS[2], user_id) == 0 then
+        redis.call('LSET', KEYS[1], start + i - 1, ARGV[3])
+        removed = removed + 1
+    end
+end
+if removed > 0 then
+    redis.call('LREM', KEYS[1], removed, ARGV[3])
+end
+return {#items, removed}
+"""
+    _GHOST_MARKER = "__ghost__"
+
     def __init__(self, client: aioredis.Redis):
         self.redis = client
         self.key_prefix = "match:queue:"
+        # register_script는 EVALSHA로 실행하고, 서버에 스크립트가 없으면(NOSCRIPT) EVAL로 재시도한다
+        self._enqueue_script = client.register_script(self.ENQUEUE_SCRIPT)
+        self._dequeue_script = client.register_script(self.DEQUEUE_SCRIPT)
+        self._compact_script = client.register_script(self.COMPACT_SCRIPT)
 
     def _get_list_key(self, mbti: MBTI) -> str:
         # 순서 관리용 (List)
@@ -25,6 +86,8 @@ class RedisMatchQueueAdapter(MatchQueuePort):
         return json.dumps({
             "user_id": ticket.user_id,
             "mbti": ticket.mbti.value,
+            "level": ticket.level,
+            "max_level": ticket.max_level,
             "created_at": ticket.created_at.isoformat()
         })
 
@@ -32,7 +95,9 @@ class RedisMatchQueueAdapter(MatchQueuePort):
         raw = json.loads(data)
         ticket = MatchTicket(
             user_id=raw["user_id"],
-            mbti=MBTI(raw["mbti"])
+            mbti=MBTI(raw["mbti"]),
+            level=raw.get("level", 1),
+            max_level=raw.get("max_level")
         )
         if "created_at" in raw:
             ticket.created_at = datetime.fromisoformat(raw["created_at"])
@@ -42,46 +107,39 @@ class RedisMatchQueueAdapter(MatchQueuePort):
         list_key = self._get_list_key(ticket.mbti)
         set_key = self._get_set_key(ticket.mbti)
 
-        # 1. [O(1)] Set에 유저가 있는지 확인 (중복 체크)
-        # sismember: 있으면 1, 없으면 0 반환
-        if await self.redis.sismember(set_key, ticket.user_id):
+        # [1 RTT] SADD 결과로 중복을 판단하고 같은 스크립트 안에서 RPUSH 한다.
+        # 워커 간 SISMEMBER → SADD 사이의 경쟁이 없다.
+        added = await self._enqueue_script(
+            keys=[set_key, list_key],
+            args=[ticket.user_id, self._serialize(ticket)]
+        )
+        if not added:
             raise ValueError("이미 대기열에 등록된 유저입니다.")
 
-        # 2. [O(1)] 데이터 저장 (Set + List)
-        # 트랜잭션(Pipeline)을 사용하여 원자성 보장 권장
-        async with self.redis.pipeline() as pipe:
-            pipe.sadd(set_key, ticket.user_id)  # Set에 ID 등록
-            pipe.rpush(list_key, self._serialize(ticket))  # List에 티켓 등록
-            await pipe.execute()
-
         print(f"[Redis] Enqueued {ticket.user_id}")
 
     async def dequeue(self, mbti: MBTI) -> Optional[MatchTicket]:
         list_key = self._get_list_key(mbti)
         set_key = self._get_set_key(mbti)
 
-        # 유효한 유저가 나올 때까지 반복 (Lazy Removal 처리)
+        # 유령 티켓(취소된 유저)은 스크립트 안에서 버려진다 (Lazy Removal).
+        # 한 번에 MAX_GHOSTS_PER_CALL개를 넘게 건너뛴 경우에만 다시 호출한다.
         while True:
-            # 1. [O(1)] List에서 가장 오래된 티켓 꺼냄
-            data = await self.redis.lpop(list_key)
-
-            if not data:
-                return None  # 대기열이 비었음
-
-            ticket = self._deserialize(data)
+            result = await self._dequeue_script(
+                keys=[list_key, set_key],
+                args=[self.MAX_GHOSTS_PER_CALL]
+            )
+            skipped = int(result[0])
+            if skipped:
+                print(f"[Redis] Skipped {skipped} cancelled tickets (Ghost Tickets) in {mbti.value}")
 
-            # 2. [O(1)] 유효성 검사: Set에서 삭제 시도
-            # srem은 삭제에 성공하면 1, 없어서 못 지웠으면(이미 취소된 유저) 0을 반환
-            is_valid_user = await self.redis.srem(set_key, ticket.user_id)
-
-            if is_valid_user:
+            if len(result) > 1:
+                ticket = self._deserialize(result[1])
                 print(f"[Redis] Dequeued valid user: {ticket.user_id}")
                 return ticket
-            else:
-                # Set에 없다는 건, 중간에 cancel_match를 요청했던 유저라는 뜻.
-                # List에 남아있던 '유령 티켓'이므로 버리고(continue) 다음 사람을 뽑음.
-                print(f"[Redis] Skipped cancelled user (Ghost Ticket): {ticket.user_id}")
-                continue
+
+            if skipped < self.MAX_GHOSTS_PER_CALL:
+                return None  # 대기열이 비었음
 
     async def remove(self, user_id: str, mbti: MBTI) -> bool:
         """
@@ -132,3 +190,67 @@ class RedisMatchQueueAdapter(MatchQueuePort):
         """
         set_key = self._get_set_key(mbti)
         return await self.redis.sismember(set_key, user_id)
+
+    async def get_waiting_tickets(self, mbti_list: list[str], limit_per_queue: int) -> list[MatchTicket]:
+        """
+        MBTI별 대기열 앞쪽 limit_per_queue개 티켓 중 유효한(취소되지 않은) 티켓을 제거하지 않고 조회합니다.
+        [2 RTT] LRANGE 파이프라인 + SMISMEMBER 파이프라인
+        """
+        if not mbti_list:
+            return []
+
+        async with self.redis.pipeline() as pipe:
+            for mbti_str in mbti_list:
+                pipe.lrange(self._get_list_key(MBTI(mbti_str)), 0, limit_per_queue - 1)
+            raw_lists = await pipe.execute()
+
+        tickets_by_queue = [[self._deserialize(data) for data in raw] for raw in raw_lists]
+
+        async with self.redis.pipeline() as pipe:
+            for mbti_str, tickets in zip(mbti_list, tickets_by_queue):
+                if tickets:
+                    pipe.smismember(self._get_set_key(MBTI(mbti_str)), [t.user_id for t in tickets])
+            memberships = iter(await pipe.execute())
+
+        waiting = []
+        for tickets in tickets_by_queue:
+            if not tickets:
+                continue
+            seen = set()
+            for ticket, is_member in zip(tickets, next(memberships)):
+                # 유령 티켓과, 재등록으로 생긴 같은 유저의 중복 티켓은 제외
+                if is_member and ticket.user_id not in seen:
+                    seen.add(ticket.user_id)
+                    waiting.append(ticket)
+        return waiting
+
+    async def compact(self, mbti: MBTI, start: int, count: int) -> tuple[int, int]:
+        """
+        List의 start부터 count개 티켓 중 유령 티켓을 제거하고 (검사한 수, 제거한 수)를 반환합니다.
+        구간 단위로 나눠 호출하면 Redis를 오래 붙잡지 않고 List 전체를 점진적으로 정리할 수 있습니다.
+        """
+        scanned, removed = await self._compact_script(
+            keys=[self._get_list_key(mbti), self._get_set_key(mbti)],
+            args=[start, count, self._GHOST_MARKER]
+        )
+        return int(scanned), int(removed)
+
+    async def get_ghost_ratios(self, mbti_list: list[str]) -> dict[str, float]:
+        """
+        MBTI별 유령 티켓 비율 (List 길이 중 Set에 없는 티켓의 비율)을 Pipeline 한 번으로 조회합니다.
+        """
+        if not mbti_list:
+            return {}
+
+        async with self.redis.pipeline() as pipe:
+            for mbti_str in mbti_list:
+                mbti = MBTI(mbti_str)
+                pipe.llen(self._get_list_key(mbti))
+                pipe.scard(self._get_set_key(mbti))
+            sizes = await pipe.execute()
+
+        ratios = {}
+        for i, mbti_str in enumerate(mbti_list):
+            list_size, set_size = sizes[2 * i], sizes[2 * i + 1]
+            ratios[mbti_str] = max(0, list_size - set_size) / list_size if list_size else 0.0
+        return ratios
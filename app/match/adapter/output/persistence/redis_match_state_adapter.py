@@ -1,10 +1,12 @@
 import json
+import uuid
 import redis.asyncio as aioredis
-from typing import Optional
+from typing import Dict, List, Optional
 
 from app.match.application.port.output.match_state_port import (
     MatchStatePort,
     MatchState,
+    PairClaim,
     UserMatchState
 )
 
@@ -15,13 +17,84 @@ class RedisMatchStateAdapter(MatchStatePort):
     Uses Redis Hash for storing state data with optional TTL for matched state.
     """
 
+    # KEYS[1]: state key / ARGV[1]: QUEUED state JSON
+    # Sets QUEUED unless the user is CHATTING or MATCHED, in one round trip. Returns 1 if set.
+    SET_QUEUED_SCRIPT = """
+    local current = redis.call('GET', KEYS[1])
+    if current then
+        local state = cjson.decode(current)['state']
+        if state == 'chatting' or state == 'matched' then
+            return 0
+        end
+    end
+    redis.call('SET', KEYS[1], ARGV[1])
+    return 1
+    """
+
+    # KEYS[1]: state key / ARGV[1]: user_id, ARGV[2]: room_id
+    # Sets CHATTING while preserving mbti and partner_id of the current state, in one round trip.
+    SET_CHATTING_SCRIPT = """
+    local current = redis.call('GET', KEYS[1])
+    local mbti, partner_id = cjson.null, cjson.null
+    if current then
+        local decoded = cjson.decode(current)
+        mbti = decoded['mbti'] or cjson.null
+        partner_id = decoded['partner_id'] or cjson.null
+    end
+    redis.call('SET', KEYS[1], cjson.encode({
+        user_id = ARGV[1],
+        state = 'chatting',
+        mbti = mbti,
+        room_id = ARGV[2],
+        partner_id = partner_id
+    }))
+    return 1
+    """
+
+    # KEYS[1], KEYS[2]: state keys / KEYS[3], KEYS[4]: claim keys / ARGV[1]: token, ARGV[2]: lease (ms)
+    # Claims both users only if neither is claimed nor MATCHED.
+    # Returns 0 on success, otherwise the position (1 or 2) of the conflicting user.
+    CLAIM_PAIR_SCRIPT = """
+    for i = 1, 2 do
+        if redis.call('EXISTS', KEYS[i + 2]) == 1 then
+            return i
+        end
+        local current = redis.call('GET', KEYS[i])
+        if current and cjson.decode(current)['state'] == 'matched' then
+            return i
+        end
+    end
+    redis.call('SET', KEYS[3], ARGV[1], 'PX', ARGV[2])
+    redis.call('SET', KEYS[4], ARGV[1], 'PX', ARGV[2])
+    return 0
+    """
+
+    # KEYS: claim keys / ARGV[1]: token
+    # Deletes only the claims still held with token.
+    RELEASE_PAIR_SCRIPT = """
+    for _, key in ipairs(KEYS) do
+        if redis.call('GET', key) == ARGV[1] then
+            redis.call('DEL', key)
+        end
+    end
+    return 1
+    """
+
     def __init__(self, client: aioredis.Redis):
         self.redis = client
         self.key_prefix = "match:state:"
+        self.claim_key_prefix = "match:claim:"
+        self._set_queued_script = client.register_script(self.SET_QUEUED_SCRIPT)
+        self._set_chatting_script = client.register_script(self.SET_CHATTING_SCRIPT)
+        self._claim_pair_script = client.register_script(self.CLAIM_PAIR_SCRIPT)
+        self._release_pair_script = client.register_script(self.RELEASE_PAIR_SCRIPT)
 
     def _get_key(self, user_id: str) -> str:
         return f"{self.key_prefix}{user_id}"
 
+    def _get_claim_key(self, user_id: str) -> str:
+        return f"{self.claim_key_prefix}{user_id}"
+
     def _serialize(self, state: UserMatchState) -> str:
         return json.dumps({
             "user_id": state.user_id,
@@ -51,16 +124,23 @@ class RedisMatchStateAdapter(MatchStatePort):
 
         return self._deserialize(data)
 
+    async def get_states(self, user_ids: List[str]) -> Dict[str, Optional[UserMatchState]]:
+        """Get match states of several users in one MGET"""
+        if not user_ids:
+            return {}
+
+        values = await self.redis.mget([self._get_key(user_id) for user_id in user_ids])
+        return {
+            user_id: self._deserialize(data) if data else None
+            for user_id, data in zip(user_ids, values)
+        }
+
     async def set_queued(self, user_id: str, mbti: str) -> None:
         """
-        Mark user as queued for matching, unless they are already in a CHATTING state.
+        Mark user as queued for matching, unless they are already in a CHATTING or MATCHED state.
         A user can be in a queue while chatting.
+        MATCHED is kept because another worker may have matched the user right after enqueue.
         """
-        current_state = await self.get_state(user_id)
-        if current_state and current_state.state == MatchState.CHATTING:
-            print(f"[MatchState] User {user_id} is CHATTING, not downgrading state to QUEUED.")
-            return
-
         key = self._get_key(user_id)
         state = UserMatchState(
             user_id=user_id,
@@ -68,7 +148,10 @@ class RedisMatchStateAdapter(MatchStatePort):
             mbti=mbti
         )
         # No expiration for queued state - user stays in queue until cancel
-        await self.redis.set(key, self._serialize(state))
+        # The state check and the SET run atomically on the server (1 round trip)
+        if not await self._set_queued_script(keys=[key], args=[self._serialize(state)]):
+            print(f"[MatchState] User {user_id} is CHATTING or MATCHED, not downgrading state to QUEUED.")
+            return
         print(f"[MatchState] User {user_id} state: QUEUED")
 
     async def set_matched(
@@ -96,21 +179,63 @@ class RedisMatchStateAdapter(MatchStatePort):
         await self.redis.set(key, self._serialize(state), ex=expire_seconds)
         print(f"[MatchState] User {user_id} state: MATCHED (room: {room_id}, expires in {expire_seconds}s)")
 
-    async def set_chatting(self, user_id: str, room_id: str) -> None:
-        """Mark user as connected to chat - no expiration"""
-        # First get current state to preserve mbti and partner_id
-        current_state = await self.get_state(user_id)
+    async def set_matched_pair(
+        self,
+        user_id: str,
+        mbti: str,
+        partner_id: str,
+        partner_mbti: str,
+        room_id: str,
+        expire_seconds: int = 60
+    ) -> None:
+        """
+        Mark both matched users as MATCHED in one MULTI/EXEC round trip.
+        Either both states are written or neither is.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for me, my_mbti, partner in ((user_id, mbti, partner_id), (partner_id, partner_mbti, user_id)):
+                state = UserMatchState(
+                    user_id=me,
+                    state=MatchState.MATCHED,
+                    mbti=my_mbti,
+                    room_id=room_id,
+                    partner_id=partner
+                )
+                pipe.set(self._get_key(me), self._serialize(state), ex=expire_seconds)
+            await pipe.execute()
+        print(f"[MatchState] Users {user_id}, {partner_id} state: MATCHED (room: {room_id}, expires in {expire_seconds}s)")
 
-        key = self._get_key(user_id)
-        state = UserMatchState(
-            user_id=user_id,
-            state=MatchState.CHATTING,
-            mbti=current_state.mbti if current_state else None,
-            room_id=room_id,
-            partner_id=current_state.partner_id if current_state else None
+    async def claim_pair(self, user_id: str, partner_id: str, lease_seconds: int = 10) -> PairClaim:
+        """
+        Claim both users with a SET NX-style lease in one Lua call.
+        The lease expires after lease_seconds so a crashed request cannot lock users forever.
+        """
+        token = str(uuid.uuid4())
+        conflict = await self._claim_pair_script(
+            keys=[
+                self._get_key(user_id),
+                self._get_key(partner_id),
+                self._get_claim_key(user_id),
+                self._get_claim_key(partner_id),
+            ],
+            args=[token, int(lease_seconds * 1000)]
         )
+        if conflict:
+            return PairClaim(conflict_user_id=user_id if int(conflict) == 1 else partner_id)
+        return PairClaim(token=token)
+
+    async def release_pair(self, user_id: str, partner_id: str, token: str) -> None:
+        """Release both claims if they are still held with token"""
+        await self._release_pair_script(
+            keys=[self._get_claim_key(user_id), self._get_claim_key(partner_id)],
+            args=[token]
+        )
+
+    async def set_chatting(self, user_id: str, room_id: str) -> None:
+        """Mark user as connected to chat - no expiration"""
+        # mbti and partner_id of the current state are preserved on the server (1 round trip)
         # No expiration for chatting state - cleared on disconnect
-        await self.redis.set(key, self._serialize(state))
+        await self._set_chatting_script(keys=[self._get_key(user_id)], args=[user_id, room_id])
         print(f"[MatchState] User {user_id} state: CHATTING (room: {room_id})")
 
     async def clear_state(self, user_id: str) -> None:
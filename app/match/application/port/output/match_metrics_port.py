@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+
+class MatchMetricsPort(ABC):
+    """
+    매칭 지표(대기 시간 히스토그램)를 기록하는 출력 포트
+    """
+
+    @abstractmethod
+    async def record_match_waits(self, waits: List[Tuple[float, int]]) -> None:
+        """
+        매칭된 유저들의 (대기 시간(초), 매칭된 궁합 단계)를 히스토그램에 더한다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_wait_histogram(self) -> Dict[str, Any]:
+        """
+        궁합 단계별 대기 시간 히스토그램을 반환한다.
+        {"buckets": [...], "levels": {"1": {"counts": {...}, "count": n, "mean_seconds": x}, ...}}
+        """
+        pass
@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+
+class MatchNotificationOutboxPort(ABC):
+    """
+    An outbound port for durably storing match notifications until the user acknowledges them.
+    """
+
+    @abstractmethod
+    async def append(self, user_id: str, payload: Dict[str, Any]) -> str:
+        """
+        Stores a notification for a user.
+
+        Returns:
+            The notification ID the client uses to acknowledge it.
+        """
+        pass
+
+    @abstractmethod
+    async def get_pending(self, user_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Returns (notification ID, payload) pairs not yet acknowledged, oldest first."""
+        pass
+
+    @abstractmethod
+    async def ack(self, user_id: str, notification_ids: List[str]) -> int:
+        """Removes acknowledged notifications and returns how many were removed (unknown or malformed IDs are ignored)."""
+        pass
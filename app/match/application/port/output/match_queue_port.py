@@ -31,3 +31,10 @@ class MatchQueuePort(ABC):
     @abstractmethod
     async def is_user_in_queue(self, user_id: str, mbti: MBTI) -> bool:
         pass
+
+    @abstractmethod
+    async def get_waiting_tickets(self, mbti_list: List[str], limit_per_queue: int) -> List[MatchTicket]:
+        """
+        MBTI별 대기열 앞쪽(오래 기다린 순) 티켓을 제거하지 않고 조회합니다 (배치 매칭 스냅샷용).
+        """
+        pass
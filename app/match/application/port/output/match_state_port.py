@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from enum import Enum
 
 
@@ -28,6 +28,21 @@ class UserMatchState:
         self.partner_id = partner_id
 
 
+class PairClaim:
+    """
+    Result of claiming two users for a match.
+    token is set when both users were claimed; otherwise conflict_user_id is the user
+    who is already matched or being matched by another request.
+    """
+    def __init__(self, token: Optional[str] = None, conflict_user_id: Optional[str] = None):
+        self.token = token
+        self.conflict_user_id = conflict_user_id
+
+    @property
+    def acquired(self) -> bool:
+        return self.token is not None
+
+
 class MatchStatePort(ABC):
     """
     Port for tracking user match states
@@ -38,6 +53,11 @@ class MatchStatePort(ABC):
         """Get user's current match state"""
         pass
 
+    @abstractmethod
+    async def get_states(self, user_ids: List[str]) -> Dict[str, Optional[UserMatchState]]:
+        """Get match states of several users at once (None for idle users)"""
+        pass
+
     @abstractmethod
     async def set_queued(self, user_id: str, mbti: str) -> None:
         """Mark user as queued for matching"""
@@ -58,6 +78,32 @@ class MatchStatePort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def set_matched_pair(
+        self,
+        user_id: str,
+        mbti: str,
+        partner_id: str,
+        partner_mbti: str,
+        room_id: str,
+        expire_seconds: int = 60
+    ) -> None:
+        """Mark both matched users as matched at once"""
+        pass
+
+    @abstractmethod
+    async def claim_pair(self, user_id: str, partner_id: str, lease_seconds: int = 10) -> PairClaim:
+        """
+        Atomically claim both users for a match (all or nothing).
+        Fails if either user is MATCHED or already claimed by another request.
+        """
+        pass
+
+    @abstractmethod
+    async def release_pair(self, user_id: str, partner_id: str, token: str) -> None:
+        """Release both claims taken with token (claims taken by others are left untouched)"""
+        pass
+
     @abstractmethod
     async def set_chatting(self, user_id: str, room_id: str) -> None:
         """Mark user as connected to chat"""
@@ -0,0 +1,96 @@
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.max_weight_matching import max_weight_matching
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.user.application.port.block_cache_port import BlockCachePort
+from app.user.application.port.block_repository_port import BlockRepositoryPort
+
+
+class BatchMatchService:
+    """
+    대기 중인 티켓 전체를 한 번에 짝짓는 배치 매칭 알고리즘을 수행하는 애플리케이션 서비스.
+    두 유저가 모두 허용한 궁합 단계 안에서만 후보 간선을 만들고,
+    (궁합 점수 + 두 유저의 대기 시간) 합이 최대가 되도록 최대 가중치 매칭을 구한다.
+    """
+
+    # 궁합 단계별 점수 (1: 천생연분 ~ 4: 최악)
+    LEVEL_WEIGHTS = {1: 400, 2: 300, 3: 200, 4: 100}
+    # 대기 시간 가중치: 1초당 1점, 최대 300초까지 반영 (오래 기다린 유저를 먼저 짝짓는다)
+    WAIT_WEIGHT_PER_SECOND = 1
+    MAX_WAIT_SECONDS = 300
+
+    def __init__(
+        self,
+        block_repository: BlockRepositoryPort,
+        block_cache: Optional[BlockCachePort] = None,
+        widen_every_seconds: float = 0.0,
+    ):
+        self.block_repository = block_repository
+        self.block_cache = block_cache
+        # 대기 시간이 이만큼 지날 때마다 티켓의 허용 궁합 단계를 한 단계씩 넓힌다 (max_level까지, 0이면 넓히지 않음)
+        self.widen_every_seconds = widen_every_seconds
+
+    async def find_pairs(
+        self,
+        tickets: List[MatchTicket],
+        excluded_pairs: Optional[Set[FrozenSet[str]]] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[MatchTicket, MatchTicket]]:
+        """티켓들을 최대 가중치로 짝지은 (티켓, 티켓) 목록을 반환한다 (오래 기다린 쌍부터)"""
+        if len(tickets) < 2:
+            return []
+
+        now = now or datetime.now()
+        excluded_pairs = excluded_pairs or set()
+        blocked = await self._get_blocked(tickets)
+
+        # 모든 후보 쌍의 궁합 단계를 미리 계산된 16×16 행렬에서 한 번에 가져온다
+        levels = MBTICompatibility.get_pairwise_levels([t.mbti.value for t in tickets])
+        # 재등록 없이, 오래 기다린 티켓일수록 넓어진 단계까지 허용한다
+        allowed = [t.effective_level(now, self.widen_every_seconds) for t in tickets]
+
+        edges = []
+        for i, a in enumerate(tickets):
+            for j in range(i + 1, len(tickets)):
+                b = tickets[j]
+                if a.user_id == b.user_id or b.user_id in blocked.get(a.user_id, ()):
+                    continue
+                if frozenset((a.user_id, b.user_id)) in excluded_pairs:
+                    continue
+                level = levels[i][j]
+                if level > min(allowed[i], allowed[j]):
+                    continue
+                edges.append((i, j, self._weight(level, a, b, now)))
+
+        mate = max_weight_matching(edges)
+        pairs = [(tickets[i], tickets[j]) for i, j in enumerate(mate) if j > i]
+        pairs.sort(key=lambda pair: min(pair[0].created_at, pair[1].created_at))
+        return pairs
+
+    def _weight(self, level: int, a: MatchTicket, b: MatchTicket, now: datetime) -> int:
+        return self.LEVEL_WEIGHTS[level] + self._wait_weight(a, now) + self._wait_weight(b, now)
+
+    def _wait_weight(self, ticket: MatchTicket, now: datetime) -> int:
+        waited = min(self.MAX_WAIT_SECONDS, int(ticket.waited_seconds(now)))
+        return waited * self.WAIT_WEIGHT_PER_SECOND
+
+    async def _get_blocked(self, tickets: List[MatchTicket]) -> Dict[str, Set[str]]:
+        """유저별로, 스냅샷 안에서 어느 방향으로든 차단 관계가 있는 유저 id 집합"""
+        user_ids = [t.user_id for t in tickets]
+        blocked: Dict[str, Set[str]] = {}
+        for user_id in user_ids:
+            related = None
+            if self.block_cache:
+                # [1 RTT] Redis 차단 캐시
+                related = await self.block_cache.find_blocked_among(user_id, user_ids)
+            if related is None:
+                # 캐시가 없거나 아직 적재되지 않았으면 MySQL에서 양방향 조회
+                related = (
+                    set(self.block_repository.get_blocked_user_ids(user_id))
+                    | set(self.block_repository.get_blocker_ids(user_id))
+                )
+            if related:
+                blocked[user_id] = set(related)
+        return blocked
@@ -1,7 +1,9 @@
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 from app.match.domain.match_ticket import MatchTicket
 from app.match.domain.mbti_compatibility import MBTICompatibility
 from app.match.application.port.output.match_queue_port import MatchQueuePort
+from app.user.application.port.block_cache_port import BlockCachePort
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.shared.vo.mbti import MBTI
 
@@ -11,13 +13,22 @@ class MatchService:
     매칭 탐색 알고리즘을 수행하는 애플리케이션 서비스
     """
 
-    def __init__(self, match_queue_port: MatchQueuePort, block_repository: BlockRepositoryPort):
+    def __init__(
+        self,
+        match_queue_port: MatchQueuePort,
+        block_repository: BlockRepositoryPort,
+        block_cache: Optional[BlockCachePort] = None,
+        widen_every_seconds: float = 0.0,
+    ):
         self.match_queue = match_queue_port
         self.block_repository = block_repository
+        self.block_cache = block_cache
+        # 대기 중인 티켓의 허용 궁합 단계가 넓어지는 간격 (BatchMatchService와 같은 규칙)
+        self.widen_every_seconds = widen_every_seconds
 
     async def find_partner(self, my_ticket: MatchTicket, level: int = 1) -> Optional[MatchTicket]:
         # 1. 레벨에 맞는 타겟 MBTI 리스트 확보
-        target_mbti_values = [m.value for m in MBTICompatibility.get_targets(my_ticket.mbti.value, level)]
+        target_mbti_values = list(MBTICompatibility.get_target_values(my_ticket.mbti.value, level))
 
         if not target_mbti_values:
             return None
@@ -41,19 +52,75 @@ class MatchService:
                     break
 
                 # 차단 관계 확인
-                is_blocked_by_me = self.block_repository.find_by_blocker_and_blocked(
-                    blocker_id=my_ticket.user_id,
-                    blocked_user_id=partner_ticket.user_id
-                )
-                i_am_blocked = self.block_repository.find_by_blocker_and_blocked(
-                    blocker_id=partner_ticket.user_id,
-                    blocked_user_id=my_ticket.user_id
-                )
-
-                if not is_blocked_by_me and not i_am_blocked:
+                if not await self._is_blocked(my_ticket.user_id, partner_ticket.user_id):
                     # 차단되지 않은 유효한 파트너를 찾았으므로 반환
                     return partner_ticket
                 
                 # 차단된 유저인 경우, 이 파트너는 건너뛰고 큐의 다음 유저를 계속 탐색
         
-        return None
\ No newline at end of file
+        return None
+
+    async def find_candidates(
+        self, my_ticket: MatchTicket, level: int = 1, limit_per_queue: int = 16
+    ) -> List[MatchTicket]:
+        """
+        대기열에서 꺼내지 않고(peek) 나와 매칭할 수 있는 후보를 우선순위 순으로 반환한다.
+        - 대기자가 많은 MBTI 큐부터, 큐 안에서는 오래 기다린 순 (큐마다 앞쪽 limit_per_queue개만 본다)
+        - 후보 쪽도 이 궁합 단계를 허용해야 한다 (대기 시간만큼 넓어진 단계 기준)
+        - 차단 관계인 후보는 제외한다
+        후보를 실제로 가져가는 것은 호출자가 선점 후 remove로 한다 (건너뛴 후보의 순서는 그대로 유지된다).
+        """
+        target_mbti_values = list(MBTICompatibility.get_target_values(my_ticket.mbti.value, level))
+        if not target_mbti_values:
+            return []
+
+        sorted_targets = await self.match_queue.get_sorted_targets_by_size(target_mbti_values)
+        non_empty = [mbti_str for mbti_str, count in sorted_targets if count > 0]
+        if not non_empty:
+            return []
+
+        now = datetime.now()
+        candidates = [
+            ticket
+            for ticket in await self.match_queue.get_waiting_tickets(non_empty, limit_per_queue)
+            if ticket.user_id != my_ticket.user_id and self._accepts(ticket, my_ticket, now)
+        ]
+        blocked = await self._find_blocked_among(my_ticket.user_id, [t.user_id for t in candidates])
+        return [ticket for ticket in candidates if ticket.user_id not in blocked]
+
+    def _accepts(self, waiting_ticket: MatchTicket, partner_ticket: MatchTicket, now: datetime) -> bool:
+        """대기 중인 티켓이 지금(넓어진 단계 기준) 상대와의 궁합 단계를 허용하는지 확인한다"""
+        level = MBTICompatibility.get_level(waiting_ticket.mbti.value, partner_ticket.mbti.value)
+        return level <= waiting_ticket.effective_level(now, self.widen_every_seconds)
+
+    async def _find_blocked_among(self, user_id: str, candidate_ids: List[str]) -> set[str]:
+        """후보 중 user_id와 차단 관계인 유저 id (캐시가 있으면 한 번에 조회한다)"""
+        if not candidate_ids:
+            return set()
+        if self.block_cache:
+            blocked = await self.block_cache.find_blocked_among(user_id, candidate_ids)
+            if blocked is not None:
+                return blocked
+        return {
+            candidate_id for candidate_id in candidate_ids
+            if await self._is_blocked(user_id, candidate_id)
+        }
+
+    async def _is_blocked(self, user_id: str, partner_id: str) -> bool:
+        """두 유저 사이에 어느 방향으로든 차단 관계가 있는지 확인한다"""
+        if self.block_cache:
+            # [1 RTT] Redis 차단 캐시: SMISMEMBER 파이프라인
+            blocked = await self.block_cache.find_blocked_among(user_id, [partner_id])
+            if blocked is not None:
+                return partner_id in blocked
+
+        # 캐시가 없거나 아직 적재되지 않았으면 MySQL에서 양방향 조회
+        is_blocked_by_me = self.block_repository.find_by_blocker_and_blocked(
+            blocker_id=user_id,
+            blocked_user_id=partner_id
+        )
+        i_am_blocked = self.block_repository.find_by_blocker_and_blocked(
+            blocker_id=partner_id,
+            blocked_user_id=user_id
+        )
+        return bool(is_blocked_by_me or i_am_blocked)
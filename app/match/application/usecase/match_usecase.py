@@ -1,20 +1,30 @@
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import FrozenSet, Optional, Set
 
 from app.match.application.port.output.chat_room_port import ChatRoomPort
+from app.match.application.port.output.match_metrics_port import MatchMetricsPort
 from app.match.application.port.output.match_notification_port import MatchNotificationPort
+from app.match.application.service.batch_match_service import BatchMatchService
 from app.match.application.service.match_service import MatchService
+from app.match.domain.mbti_compatibility import MBTICompatibility
 from app.shared.vo.mbti import MBTI
 from app.match.domain.match_ticket import MatchTicket
 from app.match.application.port.output.match_queue_port import MatchQueuePort
-from app.match.application.port.output.match_state_port import MatchStatePort, MatchState
+from app.match.application.port.output.match_state_port import MatchStatePort, MatchState, PairClaim, UserMatchState
+from app.user.application.port.block_cache_port import BlockCachePort
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 
 
 class MatchUseCase:
     # How long to wait for user to connect to chat before match expires (seconds)
     MATCH_EXPIRE_SECONDS = 60
+    # How long a pair claim is held while the chat room is being created (seconds)
+    CLAIM_LEASE_SECONDS = 10
+    # How many waiting tickets per MBTI queue one request looks at (peeked, not popped)
+    CANDIDATES_PER_QUEUE = 8
+    # How many candidates one request may try before giving up and waiting in the queue
+    MAX_CANDIDATES_PER_REQUEST = 16
 
     def __init__(
         self,
@@ -23,16 +33,27 @@ class MatchUseCase:
         block_repository: BlockRepositoryPort,
         match_state_port: Optional[MatchStatePort] = None,
         match_notification_port: Optional[MatchNotificationPort] = None,
+        block_cache: Optional[BlockCachePort] = None,
+        reactive: bool = True,
+        match_metrics_port: Optional[MatchMetricsPort] = None,
+        widen_every_seconds: float = 0.0,
     ):
         self.match_queue = match_queue_port
-        self.match_service = MatchService(match_queue_port, block_repository)
+        self.match_service = MatchService(match_queue_port, block_repository, block_cache, widen_every_seconds)
+        self.batch_match_service = BatchMatchService(block_repository, block_cache, widen_every_seconds)
+        # False면 요청 시 바로 짝을 찾지 않고 대기열에만 등록한다 (배치 매칭 워커가 주기적으로 짝지음)
+        self.reactive = reactive
         self.chat_room_port = chat_room_port
         self.match_state = match_state_port
         self.match_notification_port = match_notification_port
+        self.match_metrics = match_metrics_port
 
-    async def request_match(self, user_id: str, mbti: MBTI, level: int = 1) -> dict:
+    async def request_match(self, user_id: str, mbti: MBTI, level: int = 1, max_level: Optional[int] = None) -> dict:
         """
         유저의 매칭 요청을 처리합니다 (Enqueue).
+        max_level을 주면 대기 시간이 길어질수록 서버가 허용 단계를 level에서 max_level까지 넓힙니다
+        (재요청할 필요가 없습니다). 배치 매칭은 대기 중인 티켓을 주기적으로 다시 평가할 때,
+        즉시 매칭은 새 요청이 대기 중인 티켓을 후보로 훑어볼 때 그 티켓의 넓어진 단계를 적용합니다.
         """
         # Check if user was just matched (waiting to connect to chat room)
         # Note: CHATTING state does NOT block new matches - users can have multiple chat rooms
@@ -40,16 +61,7 @@ class MatchUseCase:
             user_state = await self.match_state.get_state(user_id)
             if user_state and user_state.state == MatchState.MATCHED:
                 # User was just matched, should connect to that chat room first
-                return {
-                    "status": "already_matched",
-                    "message": "이미 매칭되었습니다. 채팅방에 입장해주세요.",
-                    "roomId": user_state.room_id,
-                    "my_mbti": mbti.value,
-                    "partner": {
-                        "user_id": user_state.partner_id,
-                        "mbti": None  # We don't store partner's MBTI in state
-                    }
-                }
+                return self._already_matched_payload(user_state, mbti)
 
         if await self.match_queue.is_user_in_queue(user_id, mbti):
             # 이미 대기열에 있는 유저가 다른 레벨로 재요청한 경우,
@@ -57,106 +69,77 @@ class MatchUseCase:
             await self.match_queue.remove(user_id, mbti)
 
         # 도메인 객체 생성
-        my_ticket = MatchTicket(user_id=user_id, mbti=mbti)
+        my_ticket = MatchTicket(user_id=user_id, mbti=mbti, level=level, max_level=max_level)
 
-        # 파트너 탐색 루프
+        # 파트너 탐색: 후보는 대기열에서 꺼내지 않고 훑어본 뒤(peek), 선점에 성공한 후보만 대기열에서 뺀다.
+        # 건너뛴 후보는 대기열의 제자리에 그대로 남으므로 순서가 바뀌거나 취소가 되살아나지 않는다.
         partner_ticket = None
-        while True:
-            # 대기열에서 다음 후보를 찾음
-            candidate_ticket = await self.match_service.find_partner(my_ticket, level)
-
-            # 더 이상 찾을 파트너가 없으면 루프 종료
-            if not candidate_ticket:
-                break
-
-            # 자기 자신과 매칭될 경우 스킵
-            if candidate_ticket.user_id == my_ticket.user_id:
-                continue
+        claim = None
+        candidates = []
+        if self.reactive:
+            candidates = await self.match_service.find_candidates(my_ticket, level, self.CANDIDATES_PER_QUEUE)
 
-            # 파트너가 매칭 가능한 상태인지 확인 (MATCHED 상태가 아니어야 함)
-            is_available = True
-            if self.match_state:
-                is_available = await self.match_state.is_available_for_match(candidate_ticket.user_id)
+        candidates = candidates[:self.MAX_CANDIDATES_PER_REQUEST]
 
-            if not is_available:
-                continue  # 다음 후보를 찾아서 계속
+        # 후보 전원의 매칭 상태를 MGET 한 번으로 조회해 MATCHED 상태인 후보를 미리 거른다
+        # (최종 판단은 선점 스크립트가 원자적으로 다시 한다)
+        if self.match_state and candidates:
+            states = await self.match_state.get_states([t.user_id for t in candidates])
+            candidates = [
+                t for t in candidates
+                if not (states.get(t.user_id) and states[t.user_id].state == MatchState.MATCHED)
+            ]
 
+        for candidate_ticket in candidates:
             # 이미 채팅중인 상대인지 확인
             if await self.chat_room_port.are_users_partners(my_ticket.user_id, candidate_ticket.user_id):
                 continue
 
+            # 다른 워커의 요청이 두 유저 중 한 명을 먼저 잡지 않았는지 원자적으로 확인하며 선점
+            claim = await self._claim_pair(my_ticket, candidate_ticket)
+            if claim and not claim.acquired:
+                if claim.conflict_user_id == my_ticket.user_id:
+                    # 요청자 본인을 다른 요청/배치가 잡고 있으면 본인도 대기열에 등록하고 그쪽 결과를 기다린다
+                    # (그쪽이 매칭에 성공하면 알림으로 받고, 실패하면 대기열에 남아 있다)
+                    break
+                # 후보가 다른 요청에서 매칭되는 중이면 그 요청에 맡기고 다음 후보를 본다
+                continue
+
+            # 선점한 후보를 대기열에서 뺀다 (그 사이 취소했거나 다른 요청이 가져갔으면 다음 후보)
+            if not await self.match_queue.remove(candidate_ticket.user_id, candidate_ticket.mbti):
+                await self._release_pair(my_ticket, candidate_ticket, claim)
+                claim = None
+                continue
+
             # 모든 검증을 통과했으므로, 이 후보를 파트너로 확정
             partner_ticket = candidate_ticket
             break
 
         if partner_ticket:
-            # 2. [MATCH-3] 매칭 성공 시 채팅방 데이터 생성
-            new_room_id = str(uuid.uuid4())
-            timestamp = datetime.now().isoformat()
-
-            chat_payload = {
-                "roomId": new_room_id,
-                "users": [
-                    {"userId": my_ticket.user_id, "mbti": my_ticket.mbti.value},
-                    {"userId": partner_ticket.user_id, "mbti": partner_ticket.mbti.value}
-                ],
-                "timestamp": timestamp
-            }
-
-            # 3. [MATCH-3] Chat 도메인으로 데이터 전송 (비동기 처리 가능)
-            # 기존 비활성 채팅방이 있으면 재활용, 없으면 새로 생성
-            room_id = await self.chat_room_port.create_chat_room(chat_payload)
+            # 2~4. 채팅방 생성 + 양쪽 매칭 상태 기록
+            try:
+                room_id = await self._open_room(my_ticket, partner_ticket)
+            finally:
+                await self._release_pair(my_ticket, partner_ticket, claim)
             if not room_id:
                 # 채팅방 생성 실패 시 대기열에 다시 등록
-                await self.match_queue.enqueue(my_ticket)
-                await self.match_queue.enqueue(partner_ticket)
+                await self._requeue(my_ticket, partner_ticket)
                 return {
                     "status": "error",
                     "message": "채팅방 생성에 실패했습니다. 다시 시도해주세요."
                 }
 
-            # 4. Set matched state for both users (with expiration)
-            if self.match_state:
-                await self.match_state.set_matched(
-                    user_id=my_ticket.user_id,
-                    mbti=my_ticket.mbti.value,
-                    room_id=room_id,
-                    partner_id=partner_ticket.user_id,
-                    expire_seconds=self.MATCH_EXPIRE_SECONDS
-                )
-                await self.match_state.set_matched(
-                    user_id=partner_ticket.user_id,
-                    mbti=partner_ticket.mbti.value,
-                    room_id=room_id,
-                    partner_id=my_ticket.user_id,
-                    expire_seconds=self.MATCH_EXPIRE_SECONDS
-                )
-            
+            await self._record_match_waits(my_ticket, partner_ticket)
+
             # 5. Notify partner via WebSocket
             if self.match_notification_port:
-                partner_payload = {
-                    "status": "matched",
-                    "message": "매칭이 성사되었습니다!",
-                    "roomId": room_id,
-                    "my_mbti": partner_ticket.mbti.value,
-                    "partner": {
-                        "user_id": my_ticket.user_id,
-                        "mbti": my_ticket.mbti.value
-                    }
-                }
-                await self.match_notification_port.notify_match_success(partner_ticket.user_id, partner_payload)
+                await self.match_notification_port.notify_match_success(
+                    partner_ticket.user_id,
+                    self._matched_payload(partner_ticket, my_ticket, room_id)
+                )
 
             # 6. Return response to the requester
-            return {
-                "status": "matched",
-                "message": "매칭이 성사되었습니다!",
-                "roomId": room_id,
-                "my_mbti": my_ticket.mbti.value,
-                "partner": {
-                    "user_id": partner_ticket.user_id,
-                    "mbti": partner_ticket.mbti.value
-                }
-            }
+            return self._matched_payload(my_ticket, partner_ticket, room_id)
 
         # 매칭 실패 시 대기열 등록
         try:
@@ -201,4 +184,161 @@ class MatchUseCase:
         """
         특정 MBTI 큐의 대기 인원을 조회합니다.
         """
-        return await self.match_queue.get_queue_size(mbti)
\ No newline at end of file
+        return await self.match_queue.get_queue_size(mbti)
+
+    async def match_waiting_users(
+        self,
+        limit_per_queue: int,
+        known_partners: Optional[Set[FrozenSet[str]]] = None,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        [배치 매칭] 16개 MBTI 대기열을 스냅샷해 전체를 한 번에 짝짓고, 채팅방을 만든 뒤 양쪽에 알립니다.
+        이미 채팅 중인 쌍은 known_partners에 기록해 다음 배치에서 제외합니다.
+
+        Returns:
+            성사된 매칭 수
+        """
+        known_partners = known_partners if known_partners is not None else set()
+        tickets = await self.match_queue.get_waiting_tickets(MBTICompatibility.ALL_MBTI, limit_per_queue)
+        pairs = await self.batch_match_service.find_pairs(tickets, excluded_pairs=known_partners, now=now)
+
+        # 짝지어진 유저 전원의 매칭 상태를 MGET 한 번으로 조회한다 (MATCHED 상태면 제외)
+        states = {}
+        if self.match_state and pairs:
+            states = await self.match_state.get_states([t.user_id for pair in pairs for t in pair])
+
+        matched = 0
+        for ticket_a, ticket_b in pairs:
+            if any(
+                states.get(t.user_id) and states[t.user_id].state == MatchState.MATCHED
+                for t in (ticket_a, ticket_b)
+            ):
+                continue
+
+            if await self.chat_room_port.are_users_partners(ticket_a.user_id, ticket_b.user_id):
+                known_partners.add(frozenset((ticket_a.user_id, ticket_b.user_id)))
+                continue
+
+            # 다른 워커가 두 유저 중 한 명이라도 잡고 있으면 이 쌍은 건너뛴다
+            claim = await self._claim_pair(ticket_a, ticket_b)
+            if claim and not claim.acquired:
+                continue
+
+            try:
+                # 스냅샷 이후 취소한 유저가 있으면, 먼저 꺼낸 쪽을 되돌려 놓는다
+                if not await self.match_queue.remove(ticket_a.user_id, ticket_a.mbti):
+                    continue
+                if not await self.match_queue.remove(ticket_b.user_id, ticket_b.mbti):
+                    await self._requeue(ticket_a)
+                    continue
+
+                room_id = await self._open_room(ticket_a, ticket_b)
+                if not room_id:
+                    await self._requeue(ticket_a, ticket_b)
+                    continue
+            finally:
+                await self._release_pair(ticket_a, ticket_b, claim)
+
+            await self._record_match_waits(ticket_a, ticket_b, now)
+
+            if self.match_notification_port:
+                await self.match_notification_port.notify_match_success(
+                    ticket_a.user_id, self._matched_payload(ticket_a, ticket_b, room_id)
+                )
+                await self.match_notification_port.notify_match_success(
+                    ticket_b.user_id, self._matched_payload(ticket_b, ticket_a, room_id)
+                )
+            matched += 1
+
+        return matched
+
+    async def _open_room(self, my_ticket: MatchTicket, partner_ticket: MatchTicket) -> Optional[str]:
+        """
+        [MATCH-3] 매칭된 두 유저의 채팅방을 만들고 양쪽을 MATCHED 상태로 기록합니다.
+        기존 비활성 채팅방이 있으면 재활용하며, 채팅방 생성에 실패하면 None을 반환합니다.
+        """
+        chat_payload = {
+            "roomId": str(uuid.uuid4()),
+            "users": [
+                {"userId": my_ticket.user_id, "mbti": my_ticket.mbti.value},
+                {"userId": partner_ticket.user_id, "mbti": partner_ticket.mbti.value}
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+
+        # Chat 도메인으로 데이터 전송
+        room_id = await self.chat_room_port.create_chat_room(chat_payload)
+        if not room_id:
+            return None
+
+        # Set matched state for both users in one round trip (with expiration)
+        if self.match_state:
+            await self.match_state.set_matched_pair(
+                user_id=my_ticket.user_id,
+                mbti=my_ticket.mbti.value,
+                partner_id=partner_ticket.user_id,
+                partner_mbti=partner_ticket.mbti.value,
+                room_id=room_id,
+                expire_seconds=self.MATCH_EXPIRE_SECONDS
+            )
+        return room_id
+
+    async def _record_match_waits(
+        self, my_ticket: MatchTicket, partner_ticket: MatchTicket, now: Optional[datetime] = None
+    ) -> None:
+        """두 유저가 매칭되기까지 기다린 시간을 매칭된 궁합 단계별 히스토그램에 기록합니다"""
+        if not self.match_metrics:
+            return
+        now = now or datetime.now()
+        level = MBTICompatibility.get_level(my_ticket.mbti.value, partner_ticket.mbti.value)
+        await self.match_metrics.record_match_waits([
+            (my_ticket.waited_seconds(now), level),
+            (partner_ticket.waited_seconds(now), level),
+        ])
+
+    async def _claim_pair(self, my_ticket: MatchTicket, partner_ticket: MatchTicket) -> Optional[PairClaim]:
+        """두 유저를 원자적으로 선점합니다 (매칭 상태 포트가 없으면 None)"""
+        if not self.match_state:
+            return None
+        return await self.match_state.claim_pair(
+            my_ticket.user_id, partner_ticket.user_id, self.CLAIM_LEASE_SECONDS
+        )
+
+    async def _release_pair(
+        self, my_ticket: MatchTicket, partner_ticket: MatchTicket, claim: Optional[PairClaim]
+    ) -> None:
+        if claim and claim.acquired:
+            await self.match_state.release_pair(my_ticket.user_id, partner_ticket.user_id, claim.token)
+
+    async def _requeue(self, *tickets: MatchTicket) -> None:
+        """매칭에 실패한 티켓을 대기열에 되돌립니다 (그 사이 다시 요청해 이미 대기 중이면 그대로 둠)"""
+        for ticket in tickets:
+            try:
+                await self.match_queue.enqueue(ticket)
+            except ValueError:
+                pass
+
+    def _already_matched_payload(self, user_state: Optional[UserMatchState], mbti: MBTI) -> dict:
+        return {
+            "status": "already_matched",
+            "message": "이미 매칭되었습니다. 채팅방에 입장해주세요.",
+            "roomId": user_state.room_id if user_state else None,
+            "my_mbti": mbti.value,
+            "partner": {
+                "user_id": user_state.partner_id if user_state else None,
+                "mbti": None  # We don't store partner's MBTI in state
+            }
+        }
+
+    def _matched_payload(self, my_ticket: MatchTicket, partner_ticket: MatchTicket, room_id: str) -> dict:
+        return {
+            "status": "matched",
+            "message": "매칭이 성사되었습니다!",
+            "roomId": room_id,
+            "my_mbti": my_ticket.mbti.value,
+            "partner": {
+                "user_id": partner_ticket.user_id,
+                "mbti": partner_ticket.mbti.value
+            }
+        }
@@ -1,14 +1,20 @@
 from datetime import datetime
+from typing import Optional
+
 from app.shared.vo.mbti import MBTI
 
 class MatchTicket:
     """
     매칭 대기열에 진입하는 유저의 대기표(Ticket) 엔티티
     """
-    def __init__(self, user_id: str, mbti: MBTI):
+    def __init__(self, user_id: str, mbti: MBTI, level: int = 1, max_level: Optional[int] = None):
         self._validate(user_id, mbti)
         self.user_id = user_id
         self.mbti = mbti
+        # 요청 시점에 허용하는 궁합 단계 (1: 천생연분만 ~ 4: 전체)
+        self.level = level
+        # 오래 기다리면 넓혀도 되는 최대 궁합 단계 (기본값: 넓히지 않음)
+        self.max_level = max(level, max_level) if max_level is not None else level
         self.created_at = datetime.now()
 
     def _validate(self, user_id: str, mbti: MBTI) -> None:
@@ -17,7 +23,20 @@ class MatchTicket:
         if mbti is None:
             raise ValueError("MBTI 정보는 필수입니다.")
 
+    def waited_seconds(self, now: datetime) -> float:
+        return max(0.0, (now - self.created_at).total_seconds())
+
+    def effective_level(self, now: datetime, widen_every_seconds: float) -> int:
+        """
+        대기 시간에 따라 넓어진 현재 허용 궁합 단계.
+        widen_every_seconds마다 한 단계씩 넓히며 max_level을 넘지 않는다 (0 이하면 넓히지 않음).
+        """
+        if widen_every_seconds <= 0 or self.max_level <= self.level:
+            return self.level
+        steps = int(self.waited_seconds(now) // widen_every_seconds)
+        return min(self.max_level, self.level + steps)
+
     def __eq__(self, other):
         if isinstance(other, MatchTicket):
             return self.user_id == other.user_id
-        return False
\ No newline at end of file
+        return False
@@ -1,4 +1,4 @@
-from typing import List, Dict, Set
+from typing import Dict, List, Sequence, Set, Tuple
 from app.shared.vo.mbti import MBTI
 
 
@@ -33,8 +33,113 @@ class MBTICompatibility:
         "S": ["ISFP", "ESFP", "ISTP", "ESTP", "ISFJ", "ESFJ", "ISTJ", "ESTJ"]
     }
 
+    # 궁합 단계 수 (1: 천생연분 ~ 4: 최악)
+    MAX_LEVEL = 4
+
+    # 아래 테이블은 모듈 로드 시 _compile()이 규칙으로부터 한 번만 만든다
+    # MBTI 문자열 -> ALL_MBTI 인덱스
+    _INDEX: Dict[str, int] = {}
+    # [내 인덱스][상대 인덱스] -> 궁합 단계 (양쪽 관점 중 더 나쁜 쪽)
+    LEVEL_MATRIX: Tuple[Tuple[int, ...], ...] = ()
+    # [내 인덱스][단계] -> 탐색 대상 비트마스크 (비트 j = ALL_MBTI[j])
+    _TARGET_MASKS: Tuple[Tuple[int, ...], ...] = ()
+    # (MBTI, 단계) -> 탐색 대상 MBTI 문자열 / 객체 튜플
+    _TARGET_VALUES: Dict[Tuple[str, int], Tuple[str, ...]] = {}
+    _TARGETS: Dict[Tuple[str, int], Tuple[MBTI, ...]] = {}
+
     @classmethod
     def get_targets(cls, my_mbti: str, level: int = 1) -> List[MBTI]:
+        targets = cls._TARGETS.get((my_mbti, cls._clamp_level(level)))
+        if targets is None:
+            return [MBTI(m) for m in cls._rule_targets(my_mbti, level)]
+        return list(targets)
+
+    @classmethod
+    def get_target_values(cls, my_mbti: str, level: int = 1) -> Tuple[str, ...]:
+        """get_targets와 같은 대상을 MBTI 문자열 튜플로 반환합니다 (객체 생성 없음)"""
+        values = cls._TARGET_VALUES.get((my_mbti, cls._clamp_level(level)))
+        if values is None:
+            return tuple(sorted(cls._rule_targets(my_mbti, level)))
+        return values
+
+    @classmethod
+    def is_target(cls, my_mbti: str, partner_mbti: str, level: int = 1) -> bool:
+        """내 관점에서 상대 MBTI가 해당 단계의 탐색 대상인지 비트마스크로 확인합니다"""
+        level = cls._clamp_level(level)
+        if level == 0:
+            return False
+        return bool(cls._TARGET_MASKS[cls._INDEX[my_mbti]][level] >> cls._INDEX[partner_mbti] & 1)
+
+    @classmethod
+    def get_level(cls, my_mbti: str, partner_mbti: str) -> int:
+        """
+        두 MBTI의 궁합 단계 (1: 천생연분 ~ 4: 최악)를 반환합니다.
+        양쪽 관점에서 상대가 처음 탐색 대상에 포함되는 단계 중 더 높은(나쁜) 쪽을 사용합니다.
+        """
+        return cls.LEVEL_MATRIX[cls._INDEX[my_mbti]][cls._INDEX[partner_mbti]]
+
+    @classmethod
+    def get_levels(cls, my_mbtis: Sequence[str], partner_mbtis: Sequence[str]) -> List[int]:
+        """두 MBTI 목록을 같은 위치끼리 짝지은 궁합 단계 목록을 한 번에 반환합니다"""
+        index, matrix = cls._INDEX, cls.LEVEL_MATRIX
+        return [matrix[index[a]][index[b]] for a, b in zip(my_mbtis, partner_mbtis)]
+
+    @classmethod
+    def get_pairwise_levels(cls, mbtis: Sequence[str]) -> List[Tuple[int, ...]]:
+        """
+        MBTI 목록의 모든 쌍에 대한 궁합 단계 표를 반환합니다 (result[i][j] = get_level(mbtis[i], mbtis[j])).
+        배치 매칭처럼 많은 후보 쌍을 한 번에 점수 매길 때 사용합니다.
+        """
+        indices = [cls._INDEX[m] for m in mbtis]
+        rows = {}
+        for i in set(indices):
+            row = cls.LEVEL_MATRIX[i]
+            rows[i] = tuple(row[j] for j in indices)
+        return [rows[i] for i in indices]
+
+    @classmethod
+    def _clamp_level(cls, level: int) -> int:
+        """규칙과 같게 4 이상은 4 (전체), 1 미만은 0 (대상 없음)으로 맞춥니다"""
+        if level >= cls.MAX_LEVEL:
+            return cls.MAX_LEVEL
+        return level if level >= 1 else 0
+
+    @classmethod
+    def _compile(cls) -> None:
+        """규칙(_rule_targets)을 한 번 평가해 단계 행렬, 비트마스크, 대상 튜플을 만듭니다"""
+        cls._INDEX = {m: i for i, m in enumerate(cls.ALL_MBTI)}
+        mbti_objects = {m: MBTI(m) for m in cls.ALL_MBTI}
+
+        masks = []
+        for my_mbti in cls.ALL_MBTI:
+            row = [0]
+            for level in range(1, cls.MAX_LEVEL + 1):
+                targets = cls._rule_targets(my_mbti, level)
+                row.append(sum(1 << cls._INDEX[m] for m in targets))
+
+                values = tuple(m for m in cls.ALL_MBTI if m in targets)
+                cls._TARGET_VALUES[(my_mbti, level)] = values
+                cls._TARGETS[(my_mbti, level)] = tuple(mbti_objects[m] for m in values)
+            cls._TARGET_VALUES[(my_mbti, 0)] = ()
+            cls._TARGETS[(my_mbti, 0)] = ()
+            masks.append(tuple(row))
+        cls._TARGET_MASKS = tuple(masks)
+
+        def first_level(i: int, j: int) -> int:
+            for level in range(1, cls.MAX_LEVEL):
+                if masks[i][level] >> j & 1:
+                    return level
+            return cls.MAX_LEVEL
+
+        size = len(cls.ALL_MBTI)
+        cls.LEVEL_MATRIX = tuple(
+            tuple(max(first_level(i, j), first_level(j, i)) for j in range(size))
+            for i in range(size)
+        )
+
+    @classmethod
+    def _rule_targets(cls, my_mbti: str, level: int = 1) -> Set[str]:
+        """궁합 규칙을 직접 평가해 탐색 대상 MBTI 집합을 구합니다 (_compile과 규칙 밖의 입력에만 사용)"""
         all_mbtis = set(cls.ALL_MBTI)
         best_matches = set(cls._BEST_MATCH.get(my_mbti, []))
         bad_and_avg_matches = cls._get_bad_and_average(my_mbti)
@@ -58,7 +163,7 @@ class MBTICompatibility:
         elif level >= 4:
             target_set.update(all_mbtis)
 
-        return [MBTI(m) for m in list(target_set)]
+        return target_set
 
     @classmethod
     def _get_average_only(cls, mbti: str) -> Set[str]:
@@ -76,4 +181,7 @@ class MBTICompatibility:
             bad_set.update(cls._BAD_GROUP["NF"])
             if mbti == "ISFP" and "ENFJ" in bad_set: bad_set.remove("ENFJ")
 
-        return bad_set.union(cls._get_average_only(mbti))
\ No newline at end of file
+        return bad_set.union(cls._get_average_only(mbti))
+
+
+MBTICompatibility._compile()
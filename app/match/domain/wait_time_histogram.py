@@ -0,0 +1,28 @@
+from typing import Dict, Tuple
+
+
+class WaitTimeHistogram:
+    """
+    매칭 성사까지 걸린 대기 시간 히스토그램의 구간 정의.
+    궁합 단계 넓히기 주기(MATCH_LEVEL_WIDEN_SECONDS)를 조정할 때 참고한다.
+    """
+
+    # 구간 상한 (초). 마지막 구간 "inf"는 그보다 오래 기다린 경우
+    BUCKET_UPPER_BOUNDS: Tuple[int, ...] = (5, 15, 30, 60, 120, 300)
+    OVERFLOW_BUCKET = "inf"
+
+    @classmethod
+    def bucket_labels(cls) -> Tuple[str, ...]:
+        return tuple(str(bound) for bound in cls.BUCKET_UPPER_BOUNDS) + (cls.OVERFLOW_BUCKET,)
+
+    @classmethod
+    def bucket_for(cls, wait_seconds: float) -> str:
+        """대기 시간이 속하는 구간 이름 (상한 이하인 첫 구간)"""
+        for bound in cls.BUCKET_UPPER_BOUNDS:
+            if wait_seconds <= bound:
+                return str(bound)
+        return cls.OVERFLOW_BUCKET
+
+    @classmethod
+    def empty_counts(cls) -> Dict[str, int]:
+        return {label: 0 for label in cls.bucket_labels()}
@@ -0,0 +1,52 @@
+"""
+완료된 MBTI 테스트 세션 일괄 재채점 CLI.
+
+    python -m app.mbti_test.adapter.input.cli.rescore_sessions --workers 4 --dry-run
+
+분석기(키워드 사전/규칙표)를 바꾼 뒤 과거 세션의 result_mbti/result_dimension_scores를 다시 계산하고,
+차원별 확신도 분포가 어떻게 바뀌는지 JSON으로 출력한다.
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.mbti_test.application.use_case.rescore_sessions_use_case import RescoreSessionsUseCase
+from app.mbti_test.infrastructure.repository.mysql_session_rescore_repository import (
+    MySQLSessionRescoreRepository,
+)
+from config.database import get_session_factory
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="완료된 MBTI 테스트 세션을 현재 분석기로 다시 채점합니다.")
+    parser.add_argument("--chunk-size", type=int, default=500, help="한 번에 읽고 쓰는 세션 수")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="채점 프로세스 수 (1이면 현재 프로세스에서 채점)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 리포트만 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> dict:
+    args = parse_args(argv)
+    repository = MySQLSessionRescoreRepository(get_session_factory())
+
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            report = RescoreSessionsUseCase(
+                repository, executor=executor, chunk_size=args.chunk_size, dry_run=args.dry_run
+            ).execute()
+    else:
+        report = RescoreSessionsUseCase(
+            repository, chunk_size=args.chunk_size, dry_run=args.dry_run
+        ).execute()
+
+    result = {"dry_run": args.dry_run, **report.to_dict()}
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
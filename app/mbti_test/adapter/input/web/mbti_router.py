@@ -1,4 +1,5 @@
 import uuid
+from functools import lru_cache
 from typing import Dict
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -11,12 +12,19 @@ from app.auth.adapter.input.web.auth_dependency import get_current_user_id
 from app.mbti_test.application.port.input.start_mbti_test_use_case import StartMBTITestCommand
 from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
 from app.mbti_test.application.use_case.start_mbti_test_service import StartMBTITestService
-from app.mbti_test.application.use_case.answer_question_service import AnswerQuestionService
+from app.mbti_test.application.use_case.async_answer_question_service import AsyncAnswerQuestionService
 from app.mbti_test.application.port.output.mbti_test_session_repository import MBTITestSessionRepositoryPort
-from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.application.port.ai_question_provider_port import (
+    AIQuestionProviderPort,
+    AsyncAIQuestionProviderPort,
+)
 from app.mbti_test.infrastructure.repository.mysql_mbti_test_session_repository import MySQLMBTITestSessionRepository
 from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
-from app.mbti_test.adapter.output.openai_ai_question_provider import create_openai_question_provider_from_settings
+from app.mbti_test.adapter.output.openai_ai_question_provider import (
+    create_async_openai_question_provider_from_settings,
+    create_openai_question_provider_from_settings,
+)
+from config.settings import get_settings
 from app.mbti_test.adapter.output.mysql_user_repository import MySQLUserRepository
 
 # 결과 조회용 DI + UseCase + Exceptions
@@ -55,6 +63,11 @@ def get_human_question_provider() -> HumanQuestionProvider:
 def get_ai_question_provider() -> AIQuestionProviderPort:
     return create_openai_question_provider_from_settings()
 
+@lru_cache
+def get_async_ai_question_provider() -> AsyncAIQuestionProviderPort:
+    # AsyncOpenAI 클라이언트(커넥션 풀)는 요청마다 만들지 않고 재사용
+    return create_async_openai_question_provider_from_settings()
+
 def get_calculate_final_mbti_usecase_mysql(
     db: Session = Depends(get_db),
 ) -> CalculateFinalMBTIUseCase:
@@ -236,16 +249,17 @@ async def answer_question(
     user_id: str = Depends(get_current_user_id),
     session_repository: MBTITestSessionRepositoryPort = Depends(get_session_repository),
     human_question_provider: HumanQuestionProvider = Depends(get_human_question_provider),
-    ai_question_provider: AIQuestionProviderPort = Depends(get_ai_question_provider),
+    ai_question_provider: AsyncAIQuestionProviderPort = Depends(get_async_ai_question_provider),
 ):
-    use_case = AnswerQuestionService(
+    use_case = AsyncAnswerQuestionService(
         session_repository=session_repository,
         human_question_provider=human_question_provider,
         ai_question_provider=ai_question_provider,
+        call_timeout_seconds=get_settings().OPENAI_CALL_TIMEOUT_SECONDS,
     )
     try:
         command = AnswerQuestionCommand(session_id=mbti_session_id, answer=request.content)
-        result = use_case.execute(command)
+        result = await use_case.execute(command)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -266,16 +280,17 @@ async def answer_question_chat(
     user_id: str = Depends(get_current_user_id),
     session_repository: MBTITestSessionRepositoryPort = Depends(get_session_repository),
     human_question_provider: HumanQuestionProvider = Depends(get_human_question_provider),
-    ai_question_provider: AIQuestionProviderPort = Depends(get_ai_question_provider),
+    ai_question_provider: AsyncAIQuestionProviderPort = Depends(get_async_ai_question_provider),
 ):
-    use_case = AnswerQuestionService(
+    use_case = AsyncAnswerQuestionService(
         session_repository=session_repository,
         human_question_provider=human_question_provider,
         ai_question_provider=ai_question_provider,
+        call_timeout_seconds=get_settings().OPENAI_CALL_TIMEOUT_SECONDS,
     )
     try:
         command = AnswerQuestionCommand(session_id=mbti_session_id, answer=request.content)
-        result = use_case.execute(command)
+        result = await use_case.execute(command)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -5,7 +5,10 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
-from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
+from app.mbti_test.application.port.ai_question_provider_port import (
+    AIQuestionProviderPort,
+    AsyncAIQuestionProviderPort,
+)
 from app.mbti_test.domain.models import (
     AIQuestion,
     AIQuestionResponse,
@@ -179,6 +182,94 @@ def _build_analysis_user_prompt(command: AnalyzeAnswerCommand) -> str:
     )
 
 
+def _question_request(command: GenerateAIQuestionCommand) -> Dict[str, Any]:
+    return {
+        "messages": [
+            {"role": "system", "content": _build_system_prompt()},
+            {"role": "user", "content": _build_user_prompt(command)},
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.7,
+    }
+
+
+def _parse_questions(content: str, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+    data = _parse_json_object(content)
+
+    turn = int(data.get("turn", command.turn))
+    raw_questions = data.get("questions", [])
+    questions: List[AIQuestion] = []
+    for q in raw_questions:
+        questions.append(
+            AIQuestion(
+                text=str(q.get("text", "")).strip(),
+                target_dimensions=list(q.get("target_dimensions", [])),
+            )
+        )
+
+    # 최소 방어: 질문 비어있으면 실패로 처리
+    if not questions or any(not q.text for q in questions):
+        raise ValueError("LLM returned invalid questions payload")
+
+    return AIQuestionResponse(turn=turn, questions=questions)
+
+
+def _analysis_request(command: AnalyzeAnswerCommand) -> Dict[str, Any]:
+    return {
+        "messages": [
+            {"role": "system", "content": _build_analysis_system_prompt()},
+            {"role": "user", "content": _build_analysis_user_prompt(command)},
+        ],
+        "response_format": {"type": "json_object"},
+        "temperature": 0.5,
+    }
+
+
+def _parse_analysis(content: str, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+    data = _parse_json_object(content)
+
+    allowed = {
+        "EI": {"E", "I"},
+        "SN": {"S", "N"},
+        "TF": {"T", "F"},
+        "JP": {"J", "P"},
+    }
+
+    dimension = data.get("dimension")
+    if dimension != command.target_dimension:
+        raise ValueError(f"dimension mismatch: {dimension} != {command.target_dimension}")
+
+    scores = data.get("scores", {})
+    keys = set(scores.keys())
+    expected_keys = allowed[command.target_dimension]
+    if keys != expected_keys:
+        raise ValueError(f"invalid score keys: {keys}, expected {expected_keys}")
+
+    # 0~10 정수 범위 체크 (합은 강제하지 않음)
+    norm_scores: Dict[str, int] = {}
+    for k in expected_keys:
+        v = scores.get(k, 0)
+        if not isinstance(v, int) or not (0 <= v <= 10):
+            raise ValueError(f"invalid score value for {k}: {v}")
+        norm_scores[k] = v
+
+    reasoning = data.get("reasoning", "")
+
+    side_a, side_b = tuple(expected_keys)
+    score_a = norm_scores.get(side_a, 0)
+    score_b = norm_scores.get(side_b, 0)
+    winning_side = side_a if score_a >= score_b else side_b
+    winning_score = score_a if score_a >= score_b else score_b
+
+    return AnalyzeAnswerResponse(
+        dimension=dimension,
+        scores=norm_scores,
+        side=winning_side,
+        score=winning_score,
+        reasoning=reasoning,
+    )
+
+
 @dataclass
 class OpenAIQuestionProvider(AIQuestionProviderPort):
     """
@@ -189,97 +280,33 @@ class OpenAIQuestionProvider(AIQuestionProviderPort):
     model: str
 
     def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
-        system_prompt = _build_system_prompt()
-        user_prompt = _build_user_prompt(command)
-
-        resp = self.openai_client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.7,
-        )
-
+        resp = self.openai_client.chat.completions.create(model=self.model, **_question_request(command))
         content = resp.choices[0].message.content  # openai python SDK 1.x 형태 가정
-        data = _parse_json_object(content)
-
-        turn = int(data.get("turn", command.turn))
-        raw_questions = data.get("questions", [])
-        questions: List[AIQuestion] = []
-        for q in raw_questions:
-            questions.append(
-                AIQuestion(
-                    text=str(q.get("text", "")).strip(),
-                    target_dimensions=list(q.get("target_dimensions", [])),
-                )
-            )
-
-        # 최소 방어: 질문 비어있으면 실패로 처리
-        if not questions or any(not q.text for q in questions):
-            raise ValueError("LLM returned invalid questions payload")
-
-        return AIQuestionResponse(turn=turn, questions=questions)
+        return _parse_questions(content, command)
 
     def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
         """AI를 사용하여 답변을 분석하고 MBTI 점수를 반환한다."""
-        system_prompt = _build_analysis_system_prompt()
-        user_prompt = _build_analysis_user_prompt(command)
-
-        resp = self.openai_client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.5,
-        )
-
+        resp = self.openai_client.chat.completions.create(model=self.model, **_analysis_request(command))
         content = resp.choices[0].message.content
-        data = _parse_json_object(content)
-
-        allowed = {
-            "EI": {"E", "I"},
-            "SN": {"S", "N"},
-            "TF": {"T", "F"},
-            "JP": {"J", "P"},
-        }
-
-        dimension = data.get("dimension")
-        if dimension != command.target_dimension:
-            raise ValueError(f"dimension mismatch: {dimension} != {command.target_dimension}")
-
-        scores = data.get("scores", {})
-        keys = set(scores.keys())
-        expected_keys = allowed[command.target_dimension]
-        if keys != expected_keys:
-            raise ValueError(f"invalid score keys: {keys}, expected {expected_keys}")
-
-        # 0~10 정수 범위 체크 (합은 강제하지 않음)
-        norm_scores: Dict[str, int] = {}
-        for k in expected_keys:
-            v = scores.get(k, 0)
-            if not isinstance(v, int) or not (0 <= v <= 10):
-                raise ValueError(f"invalid score value for {k}: {v}")
-            norm_scores[k] = v
-
-        reasoning = data.get("reasoning", "")
-
-        side_a, side_b = tuple(expected_keys)
-        score_a = norm_scores.get(side_a, 0)
-        score_b = norm_scores.get(side_b, 0)
-        winning_side = side_a if score_a >= score_b else side_b
-        winning_score = score_a if score_a >= score_b else score_b
-
-        return AnalyzeAnswerResponse(
-            dimension=dimension,
-            scores=norm_scores,
-            side=winning_side,
-            score=winning_score,
-            reasoning=reasoning,
-        )
+        return _parse_analysis(content, command)
+
+
+@dataclass
+class AsyncOpenAIQuestionProvider(AsyncAIQuestionProviderPort):
+    """
+    OpenAIQuestionProvider의 비동기 버전. openai.AsyncOpenAI 클라이언트를 주입받는다.
+    프롬프트/응답 검증은 동기 버전과 같다.
+    """
+    openai_client: Any
+    model: str
+
+    async def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        resp = await self.openai_client.chat.completions.create(model=self.model, **_question_request(command))
+        return _parse_questions(resp.choices[0].message.content, command)
+
+    async def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        resp = await self.openai_client.chat.completions.create(model=self.model, **_analysis_request(command))
+        return _parse_analysis(resp.choices[0].message.content, command)
 
 
 # (선택) settings.py 기반 클라이언트 팩토리: 기존 프로젝트 스타일에 맞게 라우터에서 사용
@@ -292,3 +319,13 @@ def create_openai_question_provider_from_settings() -> OpenAIQuestionProvider:
     model = getattr(settings, "OPENAI_MODEL", None) or "gpt-4o-mini"
     client = OpenAI(api_key=api_key)
     return OpenAIQuestionProvider(openai_client=client, model=model)
+
+
+def create_async_openai_question_provider_from_settings() -> AsyncOpenAIQuestionProvider:
+    from config.settings import get_settings
+    from openai import AsyncOpenAI
+
+    settings = get_settings()
+    model = getattr(settings, "OPENAI_MODEL", None) or "gpt-4o-mini"
+    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return AsyncOpenAIQuestionProvider(openai_client=client, model=model)
@@ -28,3 +28,15 @@ class AIQuestionProviderPort(ABC):
         - 해당 차원의 양쪽 점수를 계산
         """
         raise NotImplementedError
+
+
+class AsyncAIQuestionProviderPort(ABC):
+    """AIQuestionProviderPort의 비동기 버전 (LLM 호출 동안 이벤트 루프를 막지 않는다)"""
+
+    @abstractmethod
+    async def generate_questions(self, command: GenerateAIQuestionCommand) -> AIQuestionResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def analyze_answer(self, command: AnalyzeAnswerCommand) -> AnalyzeAnswerResponse:
+        raise NotImplementedError
@@ -23,4 +23,9 @@ class AnswerQuestionResponse(BaseModel):
 class AnswerQuestionUseCase(ABC):
     @abstractmethod
     def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
-        pass
\ No newline at end of file
+        pass
+
+class AsyncAnswerQuestionUseCase(ABC):
+    @abstractmethod
+    async def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
+        pass
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from app.mbti_test.domain.mbti_result import MBTIResult
+
+
+@dataclass(frozen=True)
+class StoredSessionResult:
+    """재채점 대상 세션: 저장된 턴 기록(answers)과 현재 저장된 결과 (결과가 없으면 None)"""
+    session_id: str
+    answers: List[dict]
+    result: Optional[MBTIResult] = None
+
+
+class SessionRescoreRepositoryPort(ABC):
+    """
+    완료된 MBTI 테스트 세션을 오프라인으로 다시 채점하기 위한 포트.
+    세션 전체를 메모리에 올리지 않도록 청크 단위로 읽고, 결과는 한 번에 묶어서 쓴다.
+    """
+
+    @abstractmethod
+    def iter_completed_sessions(self, chunk_size: int) -> Iterator[List[StoredSessionResult]]:
+        """COMPLETED 세션을 최대 chunk_size개씩 묶어 차례로 돌려준다."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def bulk_update_results(self, results: Dict[str, MBTIResult]) -> None:
+        """session_id별 결과(result_mbti/result_dimension_scores)를 한 번에 갱신한다."""
+        raise NotImplementedError
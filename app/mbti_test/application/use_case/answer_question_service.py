@@ -1,5 +1,5 @@
 import uuid
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 
 from app.mbti_test.application.port.input.answer_question_use_case import (
     AnswerQuestionCommand,
@@ -9,17 +9,22 @@ from app.mbti_test.application.port.input.answer_question_use_case import (
 from app.mbti_test.application.port.output.mbti_test_session_repository import MBTITestSessionRepositoryPort
 from app.mbti_test.application.port.ai_question_provider_port import AIQuestionProviderPort
 from app.mbti_test.domain.analyzer import (
-    run_analysis,
-    calculate_partial_mbti,
+    add_scores,
     analyze_single_answer,
     get_dimension_for_question,
+    partial_mbti_from_scores,
+    run_analysis_from_scores,
+    score_answer,
 )
 from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
 from app.mbti_test.domain.mbti_message import MBTIMessage, MessageRole, MessageSource
 from app.mbti_test.domain.mbti_test_session import TestStatus, Turn
 from app.mbti_test.domain.models import (
+    AIQuestion,
+    AIQuestionResponse,
     GenerateAIQuestionCommand,
     AnalyzeAnswerCommand,
+    AnalyzeAnswerResponse,
     ChatMessage,
     MessageRole as ModelMessageRole,
 )
@@ -29,18 +34,25 @@ HUMAN_QUESTION_COUNT = 12
 TOTAL_QUESTION_COUNT = 24
 
 
-class AnswerQuestionService(AnswerQuestionUseCase):
+def _normalize_question(text: str) -> str:
+    return " ".join(text.split()).strip().lower()
+
+
+class BaseAnswerQuestionService:
+    """
+    답변 처리 단계 모음. 동기(AnswerQuestionService)/비동기(AsyncAnswerQuestionService) 흐름이 공유한다.
+    AI 호출(답변 분석, 다음 질문 생성)만 흐름마다 다르게 실행한다.
+    """
+
     def __init__(
         self,
         session_repository: MBTITestSessionRepositoryPort,
         human_question_provider: HumanQuestionProvider,
-        ai_question_provider: AIQuestionProviderPort,
     ):
         self._session_repository = session_repository
         self._human_question_provider = human_question_provider
-        self._ai_question_provider = ai_question_provider
 
-    def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
+    def _load_session(self, command: AnswerQuestionCommand):
         # 1. Find session
         session = self._session_repository.find_by_id(uuid.UUID(command.session_id))
         if not session:
@@ -53,64 +65,66 @@ class AnswerQuestionService(AnswerQuestionUseCase):
         )
         # current_question_index도 turns 기반으로 복원
         session.current_question_index = len(session.turns)
+        return session
 
+    def _complete_greeting(self, session) -> AnswerQuestionResponse:
         # 2. 인사 응답 처리 (greeting 후 첫 답변)
-        if not session.greeting_completed:
-            # 인사에 대한 응답은 저장 안 함 (무시)
-            session.greeting_completed = True
+        # 인사에 대한 응답은 저장 안 함 (무시)
+        session.greeting_completed = True
 
-            # 첫 번째 질문 반환 (index 0)
-            first_question = self._human_question_provider.get_question_from_list(
-                0, session.selected_human_questions
-            )
+        # 첫 번째 질문 반환 (index 0)
+        first_question = self._human_question_provider.get_question_from_list(
+            0, session.selected_human_questions
+        )
 
-            # pending_question에 저장 (다음 답변 시 Turn으로 저장됨)
-            if first_question:
-                session.pending_question = first_question.content
+        # pending_question에 저장 (다음 답변 시 Turn으로 저장됨)
+        if first_question:
+            session.pending_question = first_question.content
 
-            self._session_repository.save(session)
+        self._session_repository.save(session)
 
-            return AnswerQuestionResponse(
-                question_number=1,  # 1번 질문
-                total_questions=TOTAL_QUESTION_COUNT,
-                next_question=first_question,
-                is_completed=False,
-            )
+        return AnswerQuestionResponse(
+            question_number=1,  # 1번 질문
+            total_questions=TOTAL_QUESTION_COUNT,
+            next_question=first_question,
+            is_completed=False,
+        )
 
-        # 3. 정상 답변 처리 - Turn 생성 및 저장
-        current_index = session.current_question_index
-        print(f"[DEBUG] Question {current_index + 1}: {session.pending_question}")
-        print(f"[DEBUG] Answer: {command.answer}")
+    @staticmethod
+    def _analyze_human_answer(current_index: int, answer: str) -> Tuple[str, Dict[str, int], str, int]:
+        # Human phase: 키워드 기반 분석
+        dimension = get_dimension_for_question(current_index)
+        analysis = analyze_single_answer(answer, dimension)
+        return dimension, analysis["scores"], analysis["side"], analysis["score"]
 
-        # 답변 분석: Human(0-11) vs AI(12-23)
-        if current_index < HUMAN_QUESTION_COUNT:
-            # Human phase: 키워드 기반 분석
-            dimension = get_dimension_for_question(current_index)
-            analysis = analyze_single_answer(command.answer, dimension)
-            scores = analysis["scores"]
-            side = analysis["side"]
-            score = analysis["score"]
-        else:
-            # AI phase: AI 기반 분석 (맥락 포함)
-            history = self._build_chat_history(session)
-            target_dim = (session.pending_question_dimension or "SN").replace("/", "")
-            analyze_command = AnalyzeAnswerCommand(
-                question=session.pending_question or "",
-                answer=command.answer,
-                history=history,
-                target_dimension=target_dim,
-            )
-            ai_analysis = self._ai_question_provider.analyze_answer(analyze_command)
-            dimension = ai_analysis.dimension or analyze_command.target_dimension
-            scores = ai_analysis.scores
-            side = ai_analysis.side
-            score = ai_analysis.score
+    def _build_analyze_command(self, session, answer: str) -> AnalyzeAnswerCommand:
+        # AI phase: AI 기반 분석 (맥락 포함)
+        return AnalyzeAnswerCommand(
+            question=session.pending_question or "",
+            answer=answer,
+            history=self._build_chat_history(session),
+            target_dimension=(session.pending_question_dimension or "SN").replace("/", ""),
+        )
+
+    @staticmethod
+    def _from_ai_analysis(
+        ai_analysis: AnalyzeAnswerResponse, analyze_command: AnalyzeAnswerCommand
+    ) -> Tuple[str, Dict[str, int], str, int]:
+        dimension = ai_analysis.dimension or analyze_command.target_dimension
+        return dimension, ai_analysis.scores, ai_analysis.side, ai_analysis.score
+
+    def _record_turn(self, session, answer: str, dimension: str, scores: dict, side: str, score: int):
+        """
+        Turn을 추가하고 누적 점수를 갱신한다.
+        Returns: (analysis_result, partial_analysis_result)
+        """
+        current_index = session.current_question_index
 
         # Turn 생성
         turn = Turn(
             turn_number=current_index + 1,  # 1-based
             question=session.pending_question or "",
-            answer=command.answer,
+            answer=answer,
             dimension=dimension,
             scores=scores,
             side=side,
@@ -121,12 +135,13 @@ class AnswerQuestionService(AnswerQuestionUseCase):
 
         current_index = session.current_question_index
         analysis_result = None
-        partial_analysis_result = None
 
-        # 4. 사람 질문(12개) 완료 시 분석 실행
+        # 누적 점수에 이번 턴의 몫만 더한다 (Human phase 키워드 분석 / AI phase 턴 점수)
+        partial_scores = self._accumulate_partial_scores(session)
+
+        # 4. 사람 질문(12개) 완료 시 분석 실행 (이 시점의 누적 점수는 Human phase 답변만의 점수)
         if current_index == HUMAN_QUESTION_COUNT:
-            answers = [t.answer for t in session.turns]
-            mbti, scores, confidence = run_analysis(answers)
+            mbti, scores, confidence = run_analysis_from_scores(dict(partial_scores), HUMAN_QUESTION_COUNT)
 
             analysis_result = {
                 "mbti": mbti,
@@ -136,93 +151,87 @@ class AnswerQuestionService(AnswerQuestionUseCase):
             session.human_test_result = analysis_result
 
         # 5. 매 질문마다 부분 MBTI 분석 (Human phase 답변 기반 + AI phase 점수 누적)
-        human_answers = [t.answer for t in session.turns[:HUMAN_QUESTION_COUNT]]
-        partial_analysis_result = calculate_partial_mbti(human_answers)
-
-        # AI phase의 점수도 누적 (turn에 저장된 scores 사용)
-        if current_index > HUMAN_QUESTION_COUNT:
-            for turn in session.turns[HUMAN_QUESTION_COUNT:]:
-                for side, score_val in turn.scores.items():
-                    if side in partial_analysis_result["scores"]:
-                        partial_analysis_result["scores"][side] += score_val
+        human_answer_count = min(current_index, HUMAN_QUESTION_COUNT)
+        partial_analysis_result = {
+            "mbti": partial_mbti_from_scores(partial_scores, human_answer_count),
+            "scores": dict(partial_scores),
+        }
 
         print(f"Partial MBTI Analysis for question {current_index}: {partial_analysis_result}")
+        return analysis_result, partial_analysis_result
 
-        # 6. 전체 완료 체크
-        if current_index >= TOTAL_QUESTION_COUNT:
-            session.status = TestStatus.COMPLETED
-            session.pending_question = None
-            self._session_repository.save(session)
-            return AnswerQuestionResponse(
-                question_number=current_index,
-                total_questions=TOTAL_QUESTION_COUNT,
-                next_question=MBTIMessage(
-                    role=MessageRole.ASSISTANT, content="", source=MessageSource.AI
-                ),
-                is_completed=True,
-                analysis_result=analysis_result,
-                partial_analysis_result=partial_analysis_result,
-            )
-
-        # 7. 다음 질문 가져오기
-        if current_index < HUMAN_QUESTION_COUNT:
-            # Human phase (questions 0-11) - 세션에 저장된 랜덤 선택 질문 사용
-            next_question = self._human_question_provider.get_question_from_list(
-                current_index, session.selected_human_questions
-            )
-        else:
-            # AI phase (questions 12-23)
-            def _normalize_question(text: str) -> str:
-                return " ".join(text.split()).strip().lower()
-
-            history = self._build_chat_history(session)
-            ai_turn = current_index - HUMAN_QUESTION_COUNT + 1  # 1-12 for AI
-
-            ai_command = GenerateAIQuestionCommand(
-                session_id=command.session_id,
-                turn=ai_turn,
-                history=history,
-                question_mode="normal",
-            )
-
-            recent_questions = {_normalize_question(t.question) for t in session.turns[-6:]}
-
-            picked_question = None
-            last_ai_response = None
-            for _ in range(3):
-                ai_response = self._ai_question_provider.generate_questions(ai_command)
-                last_ai_response = ai_response
-                if not ai_response.questions:
-                    continue
+    def _complete_session(self, session, analysis_result, partial_analysis_result) -> AnswerQuestionResponse:
+        # 6. 전체 완료
+        session.status = TestStatus.COMPLETED
+        session.pending_question = None
+        self._session_repository.save(session)
+        return AnswerQuestionResponse(
+            question_number=session.current_question_index,
+            total_questions=TOTAL_QUESTION_COUNT,
+            next_question=MBTIMessage(
+                role=MessageRole.ASSISTANT, content="", source=MessageSource.AI
+            ),
+            is_completed=True,
+            analysis_result=analysis_result,
+            partial_analysis_result=partial_analysis_result,
+        )
 
-                for candidate in ai_response.questions:
-                    if _normalize_question(candidate.text) not in recent_questions:
-                        picked_question = candidate
-                        break
+    def _next_human_question(self, session, index: int) -> MBTIMessage:
+        # Human phase (questions 0-11) - 세션에 저장된 랜덤 선택 질문 사용
+        return self._human_question_provider.get_question_from_list(
+            index, session.selected_human_questions
+        )
 
-                if picked_question:
-                    break
+    def _build_generate_command(
+        self, session_id: str, turns: List[Turn], index: int
+    ) -> Tuple[GenerateAIQuestionCommand, Set[str]]:
+        """
+        AI phase (questions 12-23) 다음 질문 생성 요청과 중복 검사용 최근 질문 집합.
+        turns는 이번 답변까지 포함한 턴 기록이다.
+        """
+        ai_command = GenerateAIQuestionCommand(
+            session_id=session_id,
+            turn=index - HUMAN_QUESTION_COUNT + 1,  # 1-12 for AI
+            history=self._history_from_turns(turns),
+            question_mode="normal",
+        )
+        recent_questions = {_normalize_question(t.question) for t in turns[-6:]}
+        return ai_command, recent_questions
+
+    @staticmethod
+    def _pick_question(ai_response: AIQuestionResponse, recent_questions: Set[str]) -> Optional[AIQuestion]:
+        for candidate in ai_response.questions:
+            if _normalize_question(candidate.text) not in recent_questions:
+                return candidate
+        return None
+
+    @staticmethod
+    def _apply_ai_question(
+        session, picked_question: Optional[AIQuestion], last_ai_response: Optional[AIQuestionResponse]
+    ) -> MBTIMessage:
+        if picked_question:
+            raw_dim = (picked_question.target_dimensions or [None])[0]
+            session.pending_question_dimension = raw_dim.replace("/", "") if raw_dim else None
+            return MBTIMessage(
+                role=MessageRole.ASSISTANT,
+                content=picked_question.text,
+                source=MessageSource.AI,
+            )
 
-            if picked_question:
-                next_question = MBTIMessage(
-                    role=MessageRole.ASSISTANT,
-                    content=picked_question.text,
-                    source=MessageSource.AI,
-                )
-                raw_dim = (picked_question.target_dimensions or [None])[0]
-                session.pending_question_dimension = raw_dim.replace("/", "") if raw_dim else None
-            else:
-                # Fallback if AI fails or only duplicates returned
-                fallback_text = "다음 질문입니다: 당신의 성격을 한 단어로 표현한다면?"
-                if last_ai_response and last_ai_response.questions:
-                    fallback_text = last_ai_response.questions[0].text or fallback_text
+        # Fallback if AI fails or only duplicates returned
+        fallback_text = "다음 질문입니다: 당신의 성격을 한 단어로 표현한다면?"
+        if last_ai_response and last_ai_response.questions:
+            fallback_text = last_ai_response.questions[0].text or fallback_text
 
-                next_question = MBTIMessage(
-                    role=MessageRole.ASSISTANT,
-                    content=fallback_text,
-                    source=MessageSource.AI,
-                )
+        return MBTIMessage(
+            role=MessageRole.ASSISTANT,
+            content=fallback_text,
+            source=MessageSource.AI,
+        )
 
+    def _respond(
+        self, session, next_question: Optional[MBTIMessage], analysis_result, partial_analysis_result
+    ) -> AnswerQuestionResponse:
         # 8. pending_question에 저장 (다음 답변 시 Turn으로 저장됨)
         if next_question:
             session.pending_question = next_question.content
@@ -230,7 +239,7 @@ class AnswerQuestionService(AnswerQuestionUseCase):
         self._session_repository.save(session)
 
         return AnswerQuestionResponse(
-            question_number=current_index + 1,  # 1-based for display
+            question_number=session.current_question_index + 1,  # 1-based for display
             total_questions=TOTAL_QUESTION_COUNT,
             next_question=next_question,
             is_completed=False,
@@ -238,12 +247,34 @@ class AnswerQuestionService(AnswerQuestionUseCase):
             partial_analysis_result=partial_analysis_result,
         )
 
+    def _accumulate_partial_scores(self, session) -> Dict[str, float]:
+        """
+        방금 추가된 턴의 점수만 세션의 누적 점수에 더한다.
+        누적 점수가 없는 세션(이 필드 도입 전 세션)은 턴 기록 전체로 한 번 다시 계산한다.
+        """
+        if session.partial_scores is None:
+            session.partial_scores = {k: 0 for k in "EISNTFJP"}
+            new_turns = enumerate(session.turns)
+        else:
+            new_turns = [(len(session.turns) - 1, session.turns[-1])]
+
+        for index, turn in new_turns:
+            if index < HUMAN_QUESTION_COUNT:
+                add_scores(session.partial_scores, score_answer(turn.answer))
+            else:
+                add_scores(session.partial_scores, turn.scores)
+        return session.partial_scores
+
     def _build_chat_history(self, session) -> List[ChatMessage]:
         """Build chat history from session for AI context"""
+        return self._history_from_turns(session.turns)
+
+    @staticmethod
+    def _history_from_turns(turns: List[Turn]) -> List[ChatMessage]:
         history = []
 
         # Build from turns
-        for turn in session.turns:
+        for turn in turns:
             history.append(ChatMessage(
                 role=ModelMessageRole.ASSISTANT,
                 content=turn.question,
@@ -254,3 +285,56 @@ class AnswerQuestionService(AnswerQuestionUseCase):
             ))
 
         return history
+
+
+class AnswerQuestionService(BaseAnswerQuestionService, AnswerQuestionUseCase):
+    def __init__(
+        self,
+        session_repository: MBTITestSessionRepositoryPort,
+        human_question_provider: HumanQuestionProvider,
+        ai_question_provider: AIQuestionProviderPort,
+    ):
+        super().__init__(session_repository, human_question_provider)
+        self._ai_question_provider = ai_question_provider
+
+    def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
+        session = self._load_session(command)
+        if not session.greeting_completed:
+            return self._complete_greeting(session)
+
+        # 3. 정상 답변 처리 - 답변 분석: Human(0-11) vs AI(12-23)
+        current_index = session.current_question_index
+        print(f"[DEBUG] Question {current_index + 1}: {session.pending_question}")
+        print(f"[DEBUG] Answer: {command.answer}")
+
+        if current_index < HUMAN_QUESTION_COUNT:
+            analysis = self._analyze_human_answer(current_index, command.answer)
+        else:
+            analyze_command = self._build_analyze_command(session, command.answer)
+            ai_analysis = self._ai_question_provider.analyze_answer(analyze_command)
+            analysis = self._from_ai_analysis(ai_analysis, analyze_command)
+
+        analysis_result, partial_analysis_result = self._record_turn(session, command.answer, *analysis)
+
+        # 6. 전체 완료 체크
+        current_index = session.current_question_index
+        if current_index >= TOTAL_QUESTION_COUNT:
+            return self._complete_session(session, analysis_result, partial_analysis_result)
+
+        # 7. 다음 질문 가져오기
+        if current_index < HUMAN_QUESTION_COUNT:
+            next_question = self._next_human_question(session, current_index)
+        else:
+            ai_command, recent_questions = self._build_generate_command(
+                command.session_id, session.turns, current_index
+            )
+            picked_question = None
+            last_ai_response = None
+            for _ in range(3):
+                last_ai_response = self._ai_question_provider.generate_questions(ai_command)
+                picked_question = self._pick_question(last_ai_response, recent_questions)
+                if picked_question:
+                    break
+            next_question = self._apply_ai_question(session, picked_question, last_ai_response)
+
+        return self._respond(session, next_question, analysis_result, partial_analysis_result)
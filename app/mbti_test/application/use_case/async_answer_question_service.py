@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+
+from app.mbti_test.application.port.ai_question_provider_port import AsyncAIQuestionProviderPort
+from app.mbti_test.application.port.input.answer_question_use_case import (
+    AnswerQuestionCommand,
+    AnswerQuestionResponse,
+    AsyncAnswerQuestionUseCase,
+)
+from app.mbti_test.application.port.output.mbti_test_session_repository import MBTITestSessionRepositoryPort
+from app.mbti_test.application.use_case.answer_question_service import (
+    HUMAN_QUESTION_COUNT,
+    TOTAL_QUESTION_COUNT,
+    BaseAnswerQuestionService,
+)
+from app.mbti_test.domain.analyzer import analyze_single_answer
+from app.mbti_test.domain.mbti_test_session import Turn
+from app.mbti_test.domain.models import AIQuestion, AIQuestionResponse
+from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
+
+logger = logging.getLogger("mbti_test")
+
+
+class AsyncAnswerQuestionService(BaseAnswerQuestionService, AsyncAnswerQuestionUseCase):
+    """
+    AnswerQuestionService의 비동기 버전.
+    - AI phase의 답변 분석과 다음 질문 생성은 서로의 결과를 쓰지 않으므로 동시에 실행한다.
+    - AI 호출은 한 번마다 call_timeout_seconds 안에 끝나야 한다. 시간을 넘기면
+      답변 분석은 키워드 분석으로, 다음 질문은 (재시도가 모두 실패하면) 기본 질문으로 대신한다.
+    - 세션 저장소(동기 SQLAlchemy) 호출은 별도 스레드에서 실행한다.
+    """
+
+    def __init__(
+        self,
+        session_repository: MBTITestSessionRepositoryPort,
+        human_question_provider: HumanQuestionProvider,
+        ai_question_provider: AsyncAIQuestionProviderPort,
+        call_timeout_seconds: float = 10.0,
+    ):
+        super().__init__(session_repository, human_question_provider)
+        self._ai_question_provider = ai_question_provider
+        self._call_timeout_seconds = call_timeout_seconds
+
+    async def execute(self, command: AnswerQuestionCommand) -> AnswerQuestionResponse:
+        session = await asyncio.to_thread(self._load_session, command)
+        if not session.greeting_completed:
+            return await asyncio.to_thread(self._complete_greeting, session)
+
+        # 3. 답변 분석과 (AI phase라면) 다음 질문 생성을 동시에 실행
+        current_index = session.current_question_index
+        next_index = current_index + 1
+        question_task = None
+        if HUMAN_QUESTION_COUNT <= next_index < TOTAL_QUESTION_COUNT:
+            question_task = asyncio.create_task(self._generate_question(session, command, next_index))
+
+        try:
+            analysis = await self._analyze(session, command.answer, current_index)
+            picked_question, last_ai_response = await question_task if question_task else (None, None)
+        except BaseException:
+            if question_task:
+                question_task.cancel()
+            raise
+
+        analysis_result, partial_analysis_result = self._record_turn(session, command.answer, *analysis)
+
+        # 6. 전체 완료 체크
+        if session.current_question_index >= TOTAL_QUESTION_COUNT:
+            return await asyncio.to_thread(
+                self._complete_session, session, analysis_result, partial_analysis_result
+            )
+
+        # 7. 다음 질문
+        if question_task:
+            next_question = self._apply_ai_question(session, picked_question, last_ai_response)
+        else:
+            next_question = self._next_human_question(session, session.current_question_index)
+
+        return await asyncio.to_thread(
+            self._respond, session, next_question, analysis_result, partial_analysis_result
+        )
+
+    async def _analyze(self, session, answer: str, current_index: int) -> Tuple[str, Dict[str, int], str, int]:
+        if current_index < HUMAN_QUESTION_COUNT:
+            return self._analyze_human_answer(current_index, answer)
+
+        analyze_command = self._build_analyze_command(session, answer)
+        try:
+            ai_analysis = await asyncio.wait_for(
+                self._ai_question_provider.analyze_answer(analyze_command), self._call_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"[MBTI] AI answer analysis timed out for session {session.id}, using keyword analysis")
+            dimension = analyze_command.target_dimension
+            analysis = analyze_single_answer(answer, dimension)
+            return dimension, analysis["scores"], analysis["side"], analysis["score"]
+        return self._from_ai_analysis(ai_analysis, analyze_command)
+
+    async def _generate_question(
+        self, session, command: AnswerQuestionCommand, next_index: int
+    ) -> Tuple[Optional[AIQuestion], Optional[AIQuestionResponse]]:
+        # 히스토리에는 이번 답변까지 들어가야 하므로, 아직 추가하지 않은 턴을 붙여서 요청을 만든다
+        answered = Turn(
+            turn_number=next_index,
+            question=session.pending_question or "",
+            answer=command.answer,
+            dimension="",
+            scores={},
+            side="",
+            score=0,
+        )
+        ai_command, recent_questions = self._build_generate_command(
+            command.session_id, session.turns + [answered], next_index
+        )
+
+        last_ai_response = None
+        for _ in range(3):
+            try:
+                ai_response = await asyncio.wait_for(
+                    self._ai_question_provider.generate_questions(ai_command), self._call_timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"[MBTI] AI question generation timed out for session {session.id}")
+                continue
+            last_ai_response = ai_response
+            picked_question = self._pick_question(ai_response, recent_questions)
+            if picked_question:
+                return picked_question, last_ai_response
+        return None, last_ai_response
@@ -18,6 +18,63 @@ DIM_SIDES: dict[str, tuple[str, str]] = {
 }
 
 
+def calculate_mbti_result(answers: list[dict]) -> MBTIResult:
+    """
+    답변 목록({"dimension","side","score"})을 차원별로 합산해 최종 MBTI와 차원별 비중(퍼센트)을 계산한다.
+    - 온라인 결과 계산(CalculateFinalMBTIUseCase)과 오프라인 재채점이 같은 규칙을 쓰도록 분리.
+    """
+    # c) 점수 합산 (잘못된 dimension/side는 skip)
+    scores: dict[str, int] = {}
+    for dim, (a, b) in DIM_SIDES.items():
+        scores[a] = 0
+        scores[b] = 0
+
+    for ans in answers:
+        # 기대 형태: {"dimension":"EI","side":"E","score":1}
+        dim = ans.get("dimension")
+        side = ans.get("side")
+        score_raw = ans.get("score", 1)
+
+        if dim not in DIM_SIDES:
+            continue
+
+        a, b = DIM_SIDES[dim]
+        if side not in (a, b):
+            continue
+
+        try:
+            score = int(score_raw)
+        except (TypeError, ValueError):
+            continue
+
+        scores[side] += score
+
+    # d) 퍼센트 변환 + 4글자 결정
+    dimension_scores: dict[str, int] = {}
+    letters: list[str] = []
+
+    for dim, (a, b) in DIM_SIDES.items():
+        sa = scores.get(a, 0)
+        sb = scores.get(b, 0)
+        total = sa + sb
+
+        if total == 0:
+            pa, pb = 50, 50
+        else:
+            pa = round(sa * 100 / total)
+            pb = 100 - pa
+
+        dimension_scores[a] = pa
+        dimension_scores[b] = pb
+        letters.append(a if pa >= pb else b)
+
+    # e) 결과 생성
+    return MBTIResult(
+        mbti="".join(letters),
+        dimension_scores=dimension_scores,
+    )
+
+
 class CalculateFinalMBTIUseCase:
     """
     MBTI-4: 12개 답변 누적 세션을 기반으로 최종 MBTI 결과를 계산하고 저장한다.
@@ -46,56 +103,8 @@ class CalculateFinalMBTIUseCase:
                 f"need {self._required_answers} answers, got {len(session.answers)}"
             )
 
-        # c) 점수 합산 (잘못된 dimension/side는 skip)
-        scores: dict[str, int] = {}
-        for dim, (a, b) in DIM_SIDES.items():
-            scores[a] = 0
-            scores[b] = 0
-
-        for ans in session.answers:
-            # 기대 형태: {"dimension":"EI","side":"E","score":1}
-            dim = ans.get("dimension")
-            side = ans.get("side")
-            score_raw = ans.get("score", 1)
-
-            if dim not in DIM_SIDES:
-                continue
-
-            a, b = DIM_SIDES[dim]
-            if side not in (a, b):
-                continue
-
-            try:
-                score = int(score_raw)
-            except (TypeError, ValueError):
-                continue
-
-            scores[side] += score
-
-        # d) 퍼센트 변환 + 4글자 결정
-        dimension_scores: dict[str, int] = {}
-        letters: list[str] = []
-
-        for dim, (a, b) in DIM_SIDES.items():
-            sa = scores.get(a, 0)
-            sb = scores.get(b, 0)
-            total = sa + sb
-
-            if total == 0:
-                pa, pb = 50, 50
-            else:
-                pa = round(sa * 100 / total)
-                pb = 100 - pa
-
-            dimension_scores[a] = pa
-            dimension_scores[b] = pb
-            letters.append(a if pa >= pb else b)
-
-        # e) 결과 생성
-        result = MBTIResult(
-            mbti="".join(letters),
-            dimension_scores=dimension_scores,
-        )
+        # c~e) 점수 합산 → 퍼센트 변환 + 4글자 결정
+        result = calculate_mbti_result(session.answers)
 
         # f) 세션 결과 저장 + COMPLETED 처리
         self._session_repo.save_result_and_complete(session_id, result)
@@ -0,0 +1,159 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.mbti_test.application.port.output.session_rescore_repository_port import (
+    SessionRescoreRepositoryPort,
+    StoredSessionResult,
+)
+from app.mbti_test.application.use_case.calculate_final_mbti_usecase import (
+    DIM_SIDES,
+    calculate_mbti_result,
+)
+from app.mbti_test.domain.analyzer import analyze_single_answer, get_dimension_for_question
+from app.mbti_test.domain.mbti_result import MBTIResult
+
+
+HUMAN_QUESTION_COUNT = 12
+
+# 확신도(|양쪽 퍼센트 차이|, 0~100) 분포 구간: 0-20, 20-40, 40-60, 60-80, 80-100
+CONFIDENCE_BUCKETS = ("0-20", "20-40", "40-60", "60-80", "80-100")
+
+
+def rescore_answers(answers: List[dict]) -> MBTIResult:
+    """
+    저장된 턴 기록으로 결과를 다시 계산한다.
+    - Human phase(앞 12턴)는 현재 키워드/규칙 분석기로 side/score를 다시 매긴다.
+    - AI phase 턴은 다시 호출할 수 없으므로 저장된 side/score를 그대로 쓴다.
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 둔다 (pickle 가능).
+    """
+    rescored = []
+    for index, ans in enumerate(answers):
+        if index < HUMAN_QUESTION_COUNT:
+            text = ans.get("answer")
+            if text is None:
+                text = ans.get("content", "")
+            dimension = get_dimension_for_question(index)
+            analysis = analyze_single_answer(text or "", dimension)
+            ans = {**ans, "dimension": dimension, "side": analysis["side"], "score": analysis["score"]}
+        rescored.append(ans)
+    return calculate_mbti_result(rescored)
+
+
+def dimension_confidence(result: MBTIResult) -> Dict[str, int]:
+    """차원별 확신도: 두 성향 퍼센트의 차이 (50:50이면 0, 100:0이면 100)"""
+    scores = result.dimension_scores
+    return {dim: abs(scores.get(a, 50) - scores.get(b, 50)) for dim, (a, b) in DIM_SIDES.items()}
+
+
+def _bucket(confidence: int) -> str:
+    return CONFIDENCE_BUCKETS[min(confidence // 20, len(CONFIDENCE_BUCKETS) - 1)]
+
+
+@dataclass
+class DimensionShift:
+    """한 차원의 재채점 전/후 확신도 분포와 글자가 바뀐 세션 수"""
+    before: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CONFIDENCE_BUCKETS, 0))
+    after: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CONFIDENCE_BUCKETS, 0))
+    before_total: int = 0
+    after_total: int = 0
+    before_count: int = 0
+    after_count: int = 0
+    flipped: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "before": dict(self.before),
+            "after": dict(self.after),
+            "mean_before": round(self.before_total / self.before_count, 2) if self.before_count else None,
+            "mean_after": round(self.after_total / self.after_count, 2) if self.after_count else None,
+            "flipped": self.flipped,
+        }
+
+
+@dataclass
+class RescoreReport:
+    """재채점 결과 요약 (dry_run이면 updated는 '갱신 대상' 세션 수)"""
+    scanned: int = 0
+    updated: int = 0
+    mbti_changed: int = 0
+    dimensions: Dict[str, DimensionShift] = field(
+        default_factory=lambda: {dim: DimensionShift() for dim in DIM_SIDES}
+    )
+
+    def record(self, before: Optional[MBTIResult], after: MBTIResult) -> None:
+        self.scanned += 1
+        after_confidence = dimension_confidence(after)
+        before_confidence = dimension_confidence(before) if before else None
+
+        for index, (dim, shift) in enumerate(self.dimensions.items()):
+            shift.after[_bucket(after_confidence[dim])] += 1
+            shift.after_total += after_confidence[dim]
+            shift.after_count += 1
+            if before_confidence is None:
+                continue
+            shift.before[_bucket(before_confidence[dim])] += 1
+            shift.before_total += before_confidence[dim]
+            shift.before_count += 1
+            if before.mbti[index:index + 1] != after.mbti[index:index + 1]:
+                shift.flipped += 1
+
+        if before is None or before.mbti != after.mbti:
+            self.mbti_changed += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "scanned": self.scanned,
+            "updated": self.updated,
+            "mbti_changed": self.mbti_changed,
+            "dimensions": {dim: shift.to_dict() for dim, shift in self.dimensions.items()},
+        }
+
+
+class RescoreSessionsUseCase:
+    """
+    완료된 세션을 현재 분석기로 다시 채점해 result_mbti/result_dimension_scores를 갱신한다.
+    - 세션은 청크 단위로 읽고, 청크마다 채점(executor가 있으면 병렬) 후 바뀐 결과만 묶어서 쓴다.
+    - dry_run이면 쓰지 않고 분포 변화 리포트만 만든다.
+    """
+
+    def __init__(
+        self,
+        repository: SessionRescoreRepositoryPort,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 500,
+        dry_run: bool = False,
+    ):
+        self.repository = repository
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.dry_run = dry_run
+
+    def execute(self) -> RescoreReport:
+        report = RescoreReport()
+        for chunk in self.repository.iter_completed_sessions(self.chunk_size):
+            changed: Dict[str, MBTIResult] = {}
+            for session, result in zip(chunk, self._rescore(chunk)):
+                report.record(session.result, result)
+                if not _same_result(session.result, result):
+                    changed[session.session_id] = result
+
+            if changed and not self.dry_run:
+                self.repository.bulk_update_results(changed)
+            report.updated += len(changed)
+        return report
+
+    def _rescore(self, chunk: List[StoredSessionResult]) -> List[MBTIResult]:
+        answers = [session.answers for session in chunk]
+        if self.executor is None:
+            return list(map(rescore_answers, answers))
+        # 세션 하나는 가벼우므로 여러 개씩 묶어 프로세스 간 왕복을 줄인다
+        return list(self.executor.map(rescore_answers, answers, chunksize=32))
+
+
+def _same_result(before: Optional[MBTIResult], after: MBTIResult) -> bool:
+    return (
+        before is not None
+        and before.mbti == after.mbti
+        and before.dimension_scores == after.dimension_scores
+    )
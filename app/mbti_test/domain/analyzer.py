@@ -1,4 +1,5 @@
-import re
+from app.mbti_test.domain.keyword_automaton import KeywordAutomaton
+from app.mbti_test.domain.rule_table import Rule, RuleSet
 
 # ==========================================================
 # 1. 데이터 영역 (키워드 사전)
@@ -203,6 +204,27 @@ DICTIONARY = {
     }
 }
 
+
+
+def _compile_dictionary(dictionary: dict):
+    """키워드를 오토마톤 하나로 묶고, 키워드 번호마다 점수를 줄 (차원, 성향, 가중치) 목록을 만든다"""
+    hits_by_word = {}
+    for dim_key, traits in dictionary.items():
+        for trait, keyword_list in traits.items():
+            for k in keyword_list:
+                hits_by_word.setdefault(k["word"], []).append((dim_key, trait, k["w"]))
+    return KeywordAutomaton(hits_by_word), tuple(tuple(hits) for hits in hits_by_word.values())
+
+
+# import 시 한 번만 컴파일 (답변마다 키워드 수백 개를 각각 `in`으로 훑지 않도록)
+_KEYWORD_AUTOMATON, _KEYWORD_HITS = _compile_dictionary(DICTIONARY)
+
+
+def find_keyword_hits(text: str) -> list:
+    """text에 들어 있는 DICTIONARY 키워드의 (차원, 성향, 가중치) 목록 (키워드마다 `in` 검사한 것과 같음)"""
+    return [hit for word_id in _KEYWORD_AUTOMATON.find(text) for hit in _KEYWORD_HITS[word_id]]
+
+
 DESCRIPTIONS = {
     "ISTP": {"title": "만능 재주꾼", "traits": ["#냉철함", "#해결사"], "desc": "사고 현장에서도 수리비부터 계산할 쿨한 해결사군요!"},
     "ENFP": {"title": "재기발랄한 활동가", "traits": ["#에너지", "#인싸"], "desc": "세상을 즐거움으로 채우는 당신은 자유로운 영혼입니다!"},
@@ -224,188 +246,200 @@ def get_dimension_for_question(question_index: int) -> str:
 # 2. 로직 영역 (정밀 필터링 및 가중치 누적 강화)
 # ==========================================================
 
+# 정밀 언어 분석 규칙표 (말투/부호/어미). 해당 차원을 분석할 때만 적용한다
+LINGUISTIC_RULES = (
+    # --- [EI] 에너지 방향성 ---
+    # E: 활기찬 부호
+    Rule("ei_lively_marks", r"!|~", "E", 1, "EI"),
+    Rule("ei_laughter", r"ㅋㅋ|ㅎㅎ", "E", 1, "EI"),
+    # I: 마침표/존댓말로 끝맺음
+    Rule("ei_calm_ending", r"(?:\.|요)$", "I", 1, "EI"),
+    # [추가] 소극적/부정적 표현은 I일 확률 높음
+    Rule("ei_negative", r"없|안|못|아무", "I", 1, "EI"),
+
+    # --- [SN] 인식 방식 ---
+    # [S] 숫자와 단위 = 현실 감각 (예: "3개", "10분", "만원")
+    Rule("sn_numbers_units", r"[0-9]+|일|월|년|개|번|시|분|원", "S", 2, "SN"),
+    # [S] 과거 시제/완료형 = 직접 경험한 사실 (예: "먹었어", "갔다왔어")
+    Rule("sn_past_tense", r"았|었|했|봤|갔|왔", "S", 1.5, "SN"),
+    # [N] 비유적 표현 (예: "마치 구름 같아") - 비유는 N의 강력한 신호
+    Rule("sn_metaphor", r"마치|~처럼|~같이|~양|듯한", "N", 3, "SN"),
+    # [N] 불확실/추측/미래 시제 (예: "일 것 같아", "아마도")
+    Rule("sn_speculation", r"것 같|을까|겠지|지도|아마|혹시", "N", 2, "SN"),
+    # [N] 모호한 수식어 (예: "뭔가 느낌이")
+    Rule("sn_vague", r"뭔가|약간|묘한|이상한|그런", "N", 1, "SN"),
+
+    # --- [TF] 판단 근거 ---
+    # [T] 의문문과 인과관계 (따지는 말투)
+    Rule("tf_question", r"\?", "T", 1.5, "TF"),
+    Rule("tf_why_question", r"왜[\s\S]*\?|\?[\s\S]*왜", "T", 2, "TF"),  # "왜?" 콤보는 강력한 T
+    # [T] 논리적 접속사
+    Rule("tf_logical_conjunction", r"근데|하지만|그래서|그러니까|결국|즉", "T", 1.5, "TF"),
+    # [T] 단정적/건조한 어미 (예: "~다.", "~함.", "~임.")
+    Rule("tf_assertive_ending", r"(다|함|임|지|까)(\.|!|$)", "T", 1, "TF"),
+    # [F] 감탄사와 이모티콘 (풍부한 리액션)
+    Rule("tf_exclamation", r"!|♥|♡", "F", 1.5, "TF"),
+    Rule("tf_emoticon", r"[ㅠㅜㅎㅋ]{2,}", "F", 2, "TF"),  # 2글자 이상 연속 (ㅠㅠ, ㅋㅋ)
+    # [F] 공감/부드러운 어미 (예: "~구나", "~네요")
+    Rule("tf_soft_ending", r"구나|네요|아요|어요|죠|잖아요", "F", 1.5, "TF"),
+    # [F] 길게 끄는 말투 (예: "아~~~", "진짜...")
+    Rule("tf_lingering", r"~|\.\.|[아어으]{2,}", "F", 1.5, "TF"),
+
+    # --- [JP] 생활 양식 ---
+    Rule("jp_planning", r"해야|할게|하자|필수|꼭|계획", "J", 2, "JP"),
+    Rule("jp_going_with_flow", r"글쎄|아마|몰라|일단|그냥|봐서", "P", 2, "JP"),
+)
+
+# 전차원 교차 분석용 패턴 규칙표 (부분 MBTI 누적 점수에 사용, 걸리면 '감지됨')
+PATTERN_RULES = (
+    # [SN]
+    Rule("sn_imagination", r"만약에|~라면|상상|미래|혹시|가정|세계관", "N", 3, "SN", detects=True),
+    # [S] 오감(시각,미각 등)을 나타내는 표현 + 현실 인식
+    Rule("sn_senses_reality", r"맛있|배고파|색깔|냄새|소리|보여|들려|아파|추워|더워|현실|당장|팩트|실제", "S", 3, "SN", detects=True),
+    # [TF] T: 원인 분석 및 해결책 제시
+    Rule("tf_cause_solution", r"왜|이유|원인|논리|따져|생각해|해결|방법", "T", 4, "TF", detects=True),
+    # [TF] F: 감정 이입 및 리액션
+    Rule("tf_empathy", r"속상|서운|어떡해|마음|괜찮|좋겠|대박|헐|진짜|기쁨|행복", "F", 4, "TF", detects=True),
+    # [JP]
+    Rule("jp_schedule", r"계획|미리|체크|일정", "J", 3, "JP", detects=True),
+    Rule("jp_later", r"봐서|그때|일단|그냥", "P", 3, "JP", detects=True),
+)
+
+# 단일 답변(질문 차원) 분석용 패턴 규칙표 (걸리면 '감지됨')
+SINGLE_ANSWER_PATTERN_RULES = (
+    Rule("single_sn_imagination", r"만약에|~라면|상상|미래|혹시", "N", 3, "SN", detects=True),
+    Rule("single_sn_reality", r"현실|당장|팩트|실제", "S", 3, "SN", detects=True),
+    Rule("single_tf_logic", r"왜|이유|논리|따져", "T", 4, "TF", detects=True),
+    Rule("single_tf_empathy", r"속상|서운|어떡해|마음", "F", 4, "TF", detects=True),
+    Rule("single_jp_schedule", r"계획|체크|리스트|시간", "J", 3, "JP", detects=True),
+    Rule("single_jp_later", r"봐서|그때|일단|그냥", "P", 3, "JP", detects=True),
+)
+
+DIMENSIONS = ("EI", "SN", "TF", "JP")
+
+# 규칙은 import 시 한 번만 컴파일되고, 여기서는 함께 평가할 묶음만 만든다
+_LINGUISTIC_RULESETS = {
+    dim: RuleSet(r for r in LINGUISTIC_RULES if r.dimension == dim) for dim in DIMENSIONS
+}
+# 부분 MBTI: 패턴 규칙 + 전차원 정밀 분석 규칙
+_ANSWER_RULESET = RuleSet(PATTERN_RULES + LINGUISTIC_RULES)
+# 단일 답변: 그 차원의 패턴 규칙 + 정밀 분석 규칙
+_SINGLE_ANSWER_RULESETS = {
+    dim: RuleSet(r for r in SINGLE_ANSWER_PATTERN_RULES + LINGUISTIC_RULES if r.dimension == dim)
+    for dim in DIMENSIONS
+}
+
+
+def _apply_length_rules(ans: str, dim: str, scores: dict):
+    """[EI] 문장 길이 규칙 (정규식이 아닌 글자 수 기준)"""
+    if dim != "EI":
+        return
+    ans_len = len(ans.replace(" ", ""))  # 공백 제외 글자 수로 변경 (더 정확함)
+    # E: 긴 문장
+    if ans_len > 30: scores["E"] += 2  # 기준 40 -> 30으로 완화
+    # I: 짧은 문장 ("아무 스케줄 없이 푹 쉬는 하루" -> 공백 제외 12글자 -> 이제 걸림!)
+    if ans_len < 15: scores["I"] += 2
+
+
+def _apply_rules(hits: list, scores: dict) -> bool:
+    """걸린 규칙의 가중치를 더하고, '감지됨' 규칙이 있었는지 반환한다"""
+    is_detected = False
+    for rule in hits:
+        scores[rule.trait] += rule.weight
+        is_detected = is_detected or rule.detects
+    return is_detected
+
+
 def analyze_linguistic_detail(ans: str, dim: str, scores: dict):
     """
     [정밀 언어 분석 필터] - 기준 완화 및 로직 강화 버전
     """
     if not isinstance(ans, str) or not ans: return
 
-    ans_len = len(ans.replace(" ", ""))  # 공백 제외 글자 수로 변경 (더 정확함)
-    clean_ans = ans.strip()
-
-    # --- [EI] 에너지 방향성 ---
-    if dim == "EI":
-        # E: 긴 문장, 활기찬 부호
-        if ans_len > 30: scores["E"] += 2  # 기준 40 -> 30으로 완화
-        if "!" in clean_ans or "~" in clean_ans: scores["E"] += 1
-        if "ㅋㅋ" in clean_ans or "ㅎㅎ" in clean_ans: scores["E"] += 1
-
-        # I: 짧은 문장, '없'는 부정어, 쉼
-        # "아무 스케줄 없이 푹 쉬는 하루" -> 공백 제외 12글자 -> 이제 걸림!
-        if ans_len < 15: scores["I"] += 2
-        if clean_ans.endswith(".") or clean_ans.endswith("요"): scores["I"] += 1
-
-        # [추가] 소극적/부정적 표현은 I일 확률 높음
-        if re.search(r"없|안|못|아무", clean_ans): scores["I"] += 1
-
-    # --- [SN] 인식 방식 (들여쓰기 수정 완료) ---
-    if dim == "SN":
-        # 1. [S] 숫자와 단위 = 현실 감각
-        # 예: "3개", "10분", "만원"
-        if re.search(r"[0-9]+|일|월|년|개|번|시|분|원", clean_ans):
-            scores["S"] += 2
-
-        # 2. [S] 과거 시제/완료형 = 직접 경험한 사실
-        # 예: "먹었어", "갔다왔어", "봤어" -> 경험 기반(S)
-        if re.search(r"았|었|했|봤|갔|왔", clean_ans):
-            scores["S"] += 1.5
-
-        # 3. [N] 비유적 표현 (직유/은유)
-        # 예: "마치 구름 같아", "그림처럼 예뻐"
-        if re.search(r"마치|~처럼|~같이|~양|듯한", clean_ans):
-            scores["N"] += 3  # 비유는 N의 강력한 신호
-
-        # 4. [N] 불확실/추측/미래 시제
-        # 예: "일 것 같아", "아마도", "그러지 않을까?"
-        if re.search(r"것 같|을까|겠지|지도|아마|혹시", clean_ans):
-            scores["N"] += 2
-
-        # 5. [N] 모호한 수식어
-        # 예: "뭔가 느낌이", "약간 그런 거"
-        if re.search(r"뭔가|약간|묘한|이상한|그런", clean_ans):
-            scores["N"] += 1
-
-    # --- [TF] 판단 근거 (들여쓰기 수정 완료) ---
-    if dim == "TF":
-        # 1. [T] 의문문과 인과관계 (따지는 말투)
-        # 예: "왜?", "그래서?", "근데 그게 맞아?"
-        if "?" in clean_ans:
-            scores["T"] += 1.5
-        if "왜" in clean_ans and "?" in clean_ans:  # "왜?" 콤보는 강력한 T
-            scores["T"] += 2
-
-        # 2. [T] 논리적 접속사
-        # 예: "근데", "하지만", "그러니까", "결국"
-        if re.search(r"근데|하지만|그래서|그러니까|결국|즉", clean_ans):
-            scores["T"] += 1.5
-
-        # 3. [T] 단정적/건조한 어미
-        # 예: "~다.", "~함.", "~임.", "~지."
-        if re.search(r"(다|함|임|지|까)(\.|!|$)", clean_ans):
-            scores["T"] += 1
-
-        # 4. [F] 감탄사와 이모티콘 (풍부한 리액션)
-        # 예: "!", "ㅠㅠ", "ㅎㅎㅎ", "♥"
-        if re.search(r"!|♥|♡", clean_ans):
-            scores["F"] += 1.5
-        if re.search(r"[ㅠㅜㅎㅋ]{2,}", clean_ans):  # 2글자 이상 연속 (ㅠㅠ, ㅋㅋ)
-            scores["F"] += 2
-
-        # 5. [F] 공감/부드러운 어미
-        # 예: "~구나", "~네요", "~가요", "~잖아요"
-        if re.search(r"구나|네요|아요|어요|죠|잖아요", clean_ans):
-            scores["F"] += 1.5
-
-        # 6. [F] 길게 끄는 말투 (감정의 여운)
-        # 예: "아~~~", "진짜...", "그렇구나..."
-        if re.search(r"~|\.\.|[아어으]{2,}", clean_ans):  # 모음 길게(아아아)
-            scores["F"] += 1.5
-
-    # --- [JP] 생활 양식 (들여쓰기 수정 완료) ---
-    if dim == "JP":
-        if re.search(r"해야|할게|하자|필수|꼭|계획", clean_ans): scores["J"] += 2
-        if re.search(r"글쎄|아마|몰라|일단|그냥|봐서", clean_ans): scores["P"] += 2
+    _apply_length_rules(ans, dim, scores)
+    _apply_rules(_LINGUISTIC_RULESETS[dim].hits(ans.strip()), scores)
 
 
 # ==========================================================
 # [수정] 3. 분석 로직 (미감지 시 N+1 보정 추가)
 # ==========================================================
 
-def calculate_partial_mbti(answers: list):
+def score_answer(ans) -> dict:
+    """
+    답변 하나가 8개 성향 점수에 더하는 양.
+    다른 답변과 무관하므로 세션은 새 턴의 몫만 누적 점수에 더하면 된다.
+    """
     scores = {k: 0 for k in "EISNTFJP"}
 
-    for i, ans in enumerate(answers):
-        target_dim = get_dimension_for_question(i)
-
-        # 안전한 문자열 처리
-        if not isinstance(ans, str) or not ans: continue
+    # 안전한 문자열 처리
+    if not isinstance(ans, str) or not ans: return scores
+
+    # [플래그] 이번 답변이 키워드나 패턴에 걸렸는지 확인
+    is_detected = False
+
+    # 1. 전차원 교차 분석 (Dictionary Scanning)
+    for _, trait, weight in find_keyword_hits(ans):
+        scores[trait] += weight
+        is_detected = True  # 감지됨!
+
+    # 2. 정규식 패턴 분석 (Regex Scanning) + 4. 정밀 언어 분석 (규칙표로 함께 평가)
+    # (N+1을 받았더라도, 말투에서 I나 P가 감지될 수 있으므로 정밀 분석은 계속 수행)
+    if _apply_rules(_ANSWER_RULESET.hits(ans.strip()), scores):
+        is_detected = True
+    for dim in DIMENSIONS:
+        _apply_length_rules(ans, dim, scores)
+
+    # =======================================================
+    # [NEW] 3. 최후의 보루: 아무것도 안 잡혔으면 N(추상) +1
+    # =======================================================
+    if not is_detected:
+        # "뭔가 감지가 안 되는 묘한 답변 -> 추상적(N)일 확률 높음"
+        scores["N"] += 1
 
-        # [플래그] 이번 답변이 키워드나 패턴에 걸렸는지 확인
-        is_detected = False
+    return scores
 
-        # 1. 전차원 교차 분석 (Dictionary Scanning)
-        for dim_key, traits in DICTIONARY.items():
-            for trait, keyword_list in traits.items():
-                for k in keyword_list:
-                    if k["word"] in ans:
-                        scores[trait] += k["w"]
-                        is_detected = True  # 감지됨!
 
-        # 2. 정규식 패턴 분석 (Regex Scanning)
-        # [SN]
-        if re.search(r"만약에|~라면|상상|미래|혹시|가정|세계관", ans):
-            scores["N"] += 3;
-            is_detected = True
-        # [S] 오감(시각,미각 등)을 나타내는 표현 + 현실 인식
-        if re.search(r"맛있|배고파|색깔|냄새|소리|보여|들려|아파|추워|더워|현실|당장|팩트|실제", ans):
-            scores["S"] += 3;
-            is_detected = True
+def add_scores(total: dict, delta: dict) -> dict:
+    """total에 있는 성향 점수에만 delta를 더한다 (total을 갱신해 반환)"""
+    for trait, value in delta.items():
+        if trait in total:
+            total[trait] += value
+    return total
 
-        # [TF]
-        # T: 원인 분석 및 해결책 제시
-        if re.search(r"왜|이유|원인|논리|따져|생각해|해결|방법", ans):
-            scores["T"] += 4;
-            is_detected = True
-        # F: 감정 이입 및 리액션
-        if re.search(r"속상|서운|어떡해|마음|괜찮|좋겠|대박|헐|진짜|기쁨|행복", ans):
-            scores["F"] += 4;
-            is_detected = True
-
-        # [JP]
-        if re.search(r"계획|미리|체크|일정", ans):
-            scores["J"] += 3;
-            is_detected = True
-        if re.search(r"봐서|그때|일단|그냥", ans):
-            scores["P"] += 3;
-            is_detected = True
 
-        # =======================================================
-        # [NEW] 3. 최후의 보루: 아무것도 안 잡혔으면 N(추상) +1
-        # =======================================================
-        if not is_detected:
-            # "뭔가 감지가 안 되는 묘한 답변 -> 추상적(N)일 확률 높음"
-            scores["N"] += 1
-
-        # 4. 정밀 언어 분석 (보정은 보정대로 계속 수행)
-        # (N+1을 받았더라도, 말투에서 I나 P가 감지될 수 있으므로 수행)
-        analyze_linguistic_detail(ans, "EI", scores)
-        analyze_linguistic_detail(ans, "SN", scores)
-        analyze_linguistic_detail(ans, "TF", scores)
-        analyze_linguistic_detail(ans, "JP", scores)
-
-    # 결과 문자열 계산 (기존과 동일)
+def partial_mbti_from_scores(scores: dict, answer_count: int) -> str:
+    """누적 점수로 부분 MBTI를 만든다 (답변이 아직 부족한 차원은 X)"""
     partial_mbti = ""
-    if answers:
-        if len(answers) >= 3:
+    if answer_count:
+        if answer_count >= 3:
             partial_mbti += ("E" if scores["E"] >= scores["I"] else "I")
         else:
             partial_mbti += "X"
-        if len(answers) >= 6:
+        if answer_count >= 6:
             partial_mbti += ("S" if scores["S"] >= scores["N"] else "N")
         else:
             partial_mbti += "X"
-        if len(answers) >= 9:
+        if answer_count >= 9:
             partial_mbti += ("T" if scores["T"] >= scores["F"] else "F")
         else:
             partial_mbti += "X"
-        if len(answers) >= 12:
+        if answer_count >= 12:
             partial_mbti += ("J" if scores["J"] >= scores["P"] else "P")
         else:
             partial_mbti += "X"
     else:
         partial_mbti = "XXXX"
 
-    return {"mbti": partial_mbti, "scores": scores}
+    return partial_mbti
+
+
+def calculate_partial_mbti(answers: list):
+    scores = {k: 0 for k in "EISNTFJP"}
+
+    for ans in answers:
+        add_scores(scores, score_answer(ans))
+
+    return {"mbti": partial_mbti_from_scores(scores, len(answers)), "scores": scores}
 
 
 # [수정됨] 중복 정의 제거하고 하나로 합침
@@ -415,32 +449,22 @@ def analyze_single_answer(answer: str, dimension: str) -> dict:
     is_detected = False  # 감지 플래그
 
     # 1. 키워드
-    if dimension in DICTIONARY:
-        for trait, keywords in DICTIONARY[dimension].items():
-            for k in keywords:
-                if k["word"] in answer:
-                    scores[trait] += k["w"]
-                    is_detected = True
-
-    # 2. 정규식 패턴 (N+1 보정을 위해 감지 여부 체크)
-    if dimension == "SN":
-        if re.search(r"만약에|~라면|상상|미래|혹시", answer): scores["N"] += 3; is_detected = True
-        if re.search(r"현실|당장|팩트|실제", answer): scores["S"] += 3; is_detected = True
-    if dimension == "TF":
-        if re.search(r"왜|이유|논리|따져", answer): scores["T"] += 4; is_detected = True
-        if re.search(r"속상|서운|어떡해|마음", answer): scores["F"] += 4; is_detected = True
-    if dimension == "JP":
-        if re.search(r"계획|체크|리스트|시간", answer): scores["J"] += 3; is_detected = True
-        if re.search(r"봐서|그때|일단|그냥", answer): scores["P"] += 3; is_detected = True
+    for dim_key, trait, weight in find_keyword_hits(answer):
+        if dim_key == dimension:
+            scores[trait] += weight
+            is_detected = True
+
+    # 2. 정규식 패턴 + 4. 정밀 언어 분석 (규칙표로 함께 평가, 패턴 규칙이 걸리면 감지됨)
+    if isinstance(answer, str) and answer and dimension in _SINGLE_ANSWER_RULESETS:
+        if _apply_rules(_SINGLE_ANSWER_RULESETS[dimension].hits(answer.strip()), scores):
+            is_detected = True
+        _apply_length_rules(answer, dimension, scores)
 
     # 3. [최후의 보루] 미감지 시 N+1 (SN 차원 질문이 아니더라도 N 점수 부여)
     # 단일 차원 분석이므로 'N'이 있는 dimension(SN)일 때만 적용하는 것이 논리적임
     if not is_detected and "N" in scores:
         scores["N"] += 1
 
-    # 4. [중요] 정밀 언어 분석 (무조건 실행하여 1~2점 누적)
-    analyze_linguistic_detail(answer, dimension, scores)
-
     # 점수 계산
     trait1, trait2 = tuple(dimension)
     score1 = scores.get(trait1, 0)
@@ -455,10 +479,13 @@ def analyze_single_answer(answer: str, dimension: str) -> dict:
 def run_analysis(answers: list):
     """전체 분석 실행"""
     result = calculate_partial_mbti(answers)
-    scores = result["scores"]
+    return run_analysis_from_scores(result["scores"], len(answers))
+
 
+def run_analysis_from_scores(scores: dict, answer_count: int):
+    """이미 누적된 점수로 전체 분석 결과(MBTI, 점수, 확신도)를 계산한다"""
     # MBTI 결과 (X 제거)
-    res_mbti = result["mbti"].replace("X", "")
+    res_mbti = partial_mbti_from_scores(scores, answer_count).replace("X", "")
 
     # 만약 답변 부족으로 X가 있다면 강제로 계산
     if len(res_mbti) < 4:
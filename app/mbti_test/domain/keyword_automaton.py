@@ -0,0 +1,64 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """
+    여러 키워드를 답변 한 번 훑기로 모두 찾는 Aho–Corasick 오토마톤.
+
+    `word in text`를 키워드마다 반복하는 것과 같은 결과(겹치거나 다른 키워드에 포함된 키워드도 모두 포함,
+    여러 번 나와도 한 번)를 텍스트 길이에 비례하는 시간에 낸다.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words: Tuple[str, ...] = tuple(words)
+        # 상태별 전이, 실패 링크, 그 상태에서 끝나는 키워드 번호 (실패 링크 쪽 키워드까지 합친 것)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        outputs: List[List[int]] = [[]]
+        for word_id, word in enumerate(self.words):
+            if not word:
+                raise ValueError("빈 키워드는 사용할 수 없습니다")
+            state = 0
+            for ch in word:
+                next_state = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][ch] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(word_id)
+
+        # BFS로 실패 링크를 잇고, 실패 링크 쪽에서 끝나는 키워드를 미리 합쳐 둔다
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._output = [tuple(dict.fromkeys(ids)) for ids in outputs]
+
+    def find(self, text: str) -> Set[int]:
+        """text에 들어 있는 키워드 번호 집합 (self.words 기준)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0) if state else root.get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
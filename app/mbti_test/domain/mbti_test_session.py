@@ -42,6 +42,7 @@ class MBTITestSession:
     human_test_result: Dict | None = None  # 사람 기반 테스트 결과
     pending_question: Optional[str] = None  # 다음 턴에 저장될 질문 (아직 답변 안 받음)
     pending_question_dimension: Optional[str] = None  # 다음 턴 질문의 타깃 차원(EI/SN/TF/JP)
+    partial_scores: Optional[Dict[str, float]] = None  # 지금까지 턴의 8개 성향 누적 점수 (None이면 턴 기록으로 재계산)
 
     @property
     def questions(self) -> List[str]:
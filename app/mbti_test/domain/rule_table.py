@@ -0,0 +1,38 @@
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class Rule:
+    """정규식 하나가 걸리면 trait에 weight를 더하는 분석 규칙 (정규식은 만들 때 한 번만 컴파일)"""
+    name: str
+    pattern: str
+    trait: str
+    weight: float
+    dimension: str  # 이 규칙이 속한 차원 ("EI", "SN", "TF", "JP")
+    detects: bool = False  # True면 걸렸을 때 '감지됨'으로 보아 N+1 보정을 하지 않는다
+    regex: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "regex", re.compile(self.pattern))
+
+    def search(self, text: str) -> bool:
+        return self.regex.search(text) is not None
+
+
+class RuleSet:
+    """
+    함께 평가할 규칙 묶음. 걸린 규칙을 규칙표 순서대로 돌려준다.
+
+    규칙마다 미리 컴파일된 정규식으로 검사한다. 모든 규칙을 named group 교대(alternation) 하나로
+    합치면 겹치는 규칙을 놓치지 않으려고 위치마다 lookahead를 걸어야 해서, CPython re에서는
+    오히려 느렸다 (답변당 약 3배).
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules: Tuple[Rule, ...] = tuple(rules)
+        self._searches = tuple((rule, rule.regex.search) for rule in self.rules)
+
+    def hits(self, text: str) -> List[Rule]:
+        return [rule for rule, search in self._searches if search(text)]
@@ -48,6 +48,9 @@ class MBTITestSessionModel(Base):
     pending_question: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     pending_question_dimension: Mapped[str | None] = mapped_column(String(8), nullable=True)
 
+    # 부분 MBTI 계산용 8개 성향 누적 점수 (NULL이면 다음 답변 때 턴 기록으로 다시 계산)
+    partial_scores: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=_utcnow
     )
@@ -45,6 +45,7 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
                 greeting_completed=session.greeting_completed,
                 pending_question=session.pending_question,
                 pending_question_dimension=session.pending_question_dimension,
+                partial_scores=session.partial_scores,
             )
             self.db.add(model)
         else:
@@ -53,6 +54,7 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
             model.greeting_completed = session.greeting_completed
             model.pending_question = session.pending_question
             model.pending_question_dimension = session.pending_question_dimension
+            model.partial_scores = session.partial_scores
 
         self.db.commit()
         self.db.refresh(model)
@@ -115,6 +117,7 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
             current_question_index=len(turns),
             pending_question=model.pending_question,
             pending_question_dimension=model.pending_question_dimension,
+            partial_scores=model.partial_scores,
         )
 
 
@@ -169,6 +172,7 @@ class MySQLMBTITestSessionRepository(MBTITestSessionRepositoryPort):
             current_question_index=len(turns),
             pending_question=model.pending_question,
             pending_question_dimension=model.pending_question_dimension,
+            partial_scores=model.partial_scores,
         )
 
 
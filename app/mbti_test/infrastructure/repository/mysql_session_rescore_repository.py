@@ -0,0 +1,79 @@
+from typing import Dict, Iterator, List
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.mbti_test.application.port.output.session_rescore_repository_port import (
+    SessionRescoreRepositoryPort,
+    StoredSessionResult,
+)
+from app.mbti_test.domain.mbti_result import MBTIResult
+from app.mbti_test.infrastructure.mbti_test_models import MBTITestSessionModel
+
+
+class MySQLSessionRescoreRepository(SessionRescoreRepositoryPort):
+    """
+    재채점용 MySQL 레포지토리.
+    - 읽기는 서버 측 커서(stream_results)로 chunk_size씩 가져와 테이블 전체를 메모리에 올리지 않는다.
+    - 스트리밍 중인 연결에는 다른 쿼리를 보낼 수 없으므로, 쓰기는 별도 세션(연결)에서 한다.
+    """
+
+    def __init__(self, session_factory: sessionmaker):
+        self.session_factory = session_factory
+
+    def iter_completed_sessions(self, chunk_size: int) -> Iterator[List[StoredSessionResult]]:
+        db = self.session_factory()
+        try:
+            stmt = (
+                select(
+                    MBTITestSessionModel.id,
+                    MBTITestSessionModel.answers,
+                    MBTITestSessionModel.result_mbti,
+                    MBTITestSessionModel.result_dimension_scores,
+                    MBTITestSessionModel.result_timestamp,
+                )
+                .where(MBTITestSessionModel.status == "COMPLETED")
+                .order_by(MBTITestSessionModel.id)
+                .execution_options(stream_results=True, yield_per=chunk_size)
+            )
+            for rows in db.execute(stmt).partitions():
+                yield [self._to_stored(row) for row in rows]
+        finally:
+            db.close()
+
+    def bulk_update_results(self, results: Dict[str, MBTIResult]) -> None:
+        if not results:
+            return
+        db = self.session_factory()
+        try:
+            # 기본키가 포함된 파라미터 목록 → executemany 한 번으로 갱신 (result_timestamp는 유지)
+            db.execute(
+                update(MBTITestSessionModel),
+                [
+                    {
+                        "id": session_id,
+                        "result_mbti": result.mbti,
+                        "result_dimension_scores": result.dimension_scores,
+                    }
+                    for session_id, result in results.items()
+                ],
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _to_stored(row) -> StoredSessionResult:
+        result = None
+        if row.result_mbti:
+            kwargs = {"timestamp": row.result_timestamp} if row.result_timestamp else {}
+            result = MBTIResult(
+                mbti=row.result_mbti,
+                dimension_scores=row.result_dimension_scores or {},
+                **kwargs,
+            )
+        return StoredSessionResult(
+            session_id=row.id,
+            answers=list(row.answers or []),
+            result=result,
+        )
@@ -17,6 +17,7 @@ from app.chat.adapter.input.web.chat_websocket_router import chat_websocket_rout
 from app.chat.adapter.input.web.chat_router import chat_router
 from app.chat.infrastructure.model.chat_room_model import ChatRoomModel  # noqa: F401
 from app.chat.infrastructure.model.chat_message_model import ChatMessageModel  # noqa: F401
+from app.chat.infrastructure.model.chat_room_summary_model import ChatRoomSummaryModel  # noqa: F401
 from app.community.adapter.input.web.topic_router import topic_router
 from app.community.adapter.input.web.post_router import post_router
 from app.community.adapter.input.web.balance_game_router import balance_game_router
@@ -7,6 +7,7 @@ from app.auth.adapter.input.web.auth_dependency import get_current_user_id
 from app.user.application.port.user_repository_port import UserRepositoryPort
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
+from app.chat.application.port.active_chat_pair_port import ActiveChatPairPort
 from app.user.application.use_case.block_user_use_case import BlockUserUseCase, BlockUserUseCaseImpl
 from app.chat.application.use_case.deactivate_chat_room_use_case import DeactivateChatRoomUseCase
 from app.user.domain.user import User
@@ -14,8 +15,12 @@ from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
 from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
 from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from app.user.infrastructure.repository.redis_block_cache_repository import RedisBlockCacheRepository
+from app.user.application.port.block_cache_port import BlockCachePort
 from app.chat.infrastructure.repository.mysql_chat_room_repository import MySQLChatRoomRepository
+from app.chat.infrastructure.repository.redis_active_chat_pair_repository import RedisActiveChatPairRepository
 from config.database import get_db
+from config.redis import get_redis
 
 user_router = APIRouter()
 
@@ -28,10 +33,18 @@ def get_block_repository(db: Session = Depends(get_db)) -> BlockRepositoryPort:
     return MySQLBlockRepository(db)
 
 
+def get_block_cache() -> BlockCachePort:
+    return RedisBlockCacheRepository(get_redis())
+
+
 def get_chat_room_repository(db: Session = Depends(get_db)) -> ChatRoomRepositoryPort:
     return MySQLChatRoomRepository(db)
 
 
+def get_active_chat_pairs() -> ActiveChatPairPort:
+    return RedisActiveChatPairRepository(get_redis())
+
+
 def get_deactivate_chat_room_use_case(
     chat_room_repo: ChatRoomRepositoryPort = Depends(get_chat_room_repository)
 ) -> DeactivateChatRoomUseCase:
@@ -41,12 +54,16 @@ def get_deactivate_chat_room_use_case(
 def get_block_user_use_case(
     block_repo: BlockRepositoryPort = Depends(get_block_repository),
     user_repo: UserRepositoryPort = Depends(get_user_repository),
-    deactivate_use_case: DeactivateChatRoomUseCase = Depends(get_deactivate_chat_room_use_case)
+    deactivate_use_case: DeactivateChatRoomUseCase = Depends(get_deactivate_chat_room_use_case),
+    block_cache: BlockCachePort = Depends(get_block_cache),
+    active_chat_pairs: ActiveChatPairPort = Depends(get_active_chat_pairs)
 ) -> BlockUserUseCase:
     return BlockUserUseCaseImpl(
         block_repository=block_repo,
         user_repository=user_repo,
-        deactivate_chat_room_use_case=deactivate_use_case
+        deactivate_chat_room_use_case=deactivate_use_case,
+        block_cache=block_cache,
+        active_chat_pairs=active_chat_pairs
     )
 
 
@@ -56,7 +73,7 @@ class UpdateProfileRequest(BaseModel):
 
 
 @user_router.post("/{blocked_user_id}/block", status_code=status.HTTP_204_NO_CONTENT)
-def block_user(
+async def block_user(
     blocked_user_id: str,
     blocker_id: str = Depends(get_current_user_id),
     use_case: BlockUserUseCase = Depends(get_block_user_use_case)
@@ -70,7 +87,7 @@ def block_user(
 
     try:
         # The use case expects UUID objects
-        use_case.block(blocker_id=uuid.UUID(blocker_id), blocked_id=uuid.UUID(blocked_user_id))
+        await use_case.block(blocker_id=uuid.UUID(blocker_id), blocked_id=uuid.UUID(blocked_user_id))
     except ValueError as e:
         # This could be a user not found error from the use case
         raise HTTPException(
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+
+
+class BlockCachePort(ABC):
+    """매칭용 차단 관계 캐시 포트 (인터페이스). 유저별 차단한/나를 차단한 유저 id 집합을 보관한다"""
+
+    @abstractmethod
+    async def add_block(self, blocker_id: str, blocked_id: str) -> None:
+        """차단 관계를 캐시에 추가한다"""
+        pass
+
+    @abstractmethod
+    async def find_blocked_among(self, user_id: str, candidate_ids: list[str]) -> set[str] | None:
+        """
+        후보 중 user_id와 어느 방향으로든 차단 관계가 있는 유저 id를 조회한다.
+
+        Returns:
+            차단 관계가 있는 후보 id 집합, 캐시가 아직 준비되지 않았으면 None
+        """
+        pass
+
+    @abstractmethod
+    async def is_ready(self) -> bool:
+        """캐시가 blocks 테이블로부터 적재되었는지 확인한다"""
+        pass
+
+    @abstractmethod
+    async def begin_rebuild(self) -> bool:
+        """
+        재적재를 시작한다: 준비 표시를 내리고 캐시를 비운다.
+        다른 워커가 이미 재적재 중이면 아무것도 하지 않고 False를 반환한다.
+        """
+        pass
+
+    @abstractmethod
+    async def load(self, pairs: list[tuple[str, str]]) -> None:
+        """(blocker_id, blocked_id) 목록을 캐시에 적재한다"""
+        pass
+
+    @abstractmethod
+    async def finish_rebuild(self) -> None:
+        """재적재를 마치고 캐시를 준비 상태로 표시한다"""
+        pass
@@ -34,3 +34,8 @@ class BlockRepositoryPort(ABC):
     def get_blocker_ids(self, blocked_user_id: str) -> list[str]:
         """나를 차단한 유저 id 목록을 조회한다"""
         pass
+
+    @abstractmethod
+    def find_all_pairs(self) -> list[tuple[str, str]]:
+        """모든 차단 관계를 (blocker_id, blocked_id) 목록으로 조회한다 (차단 캐시 적재용)"""
+        pass
@@ -1,15 +1,20 @@
 import uuid
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from starlette.concurrency import run_in_threadpool
+
+from app.user.application.port.block_cache_port import BlockCachePort
 from app.user.application.port.block_repository_port import BlockRepositoryPort
 from app.user.application.port.user_repository_port import UserRepositoryPort
+from app.chat.application.port.active_chat_pair_port import ActiveChatPairPort
 from app.chat.application.use_case.deactivate_chat_room_use_case import DeactivateChatRoomUseCase
 from app.user.domain.block import Block
 
 
 class BlockUserUseCase(ABC):
     @abstractmethod
-    def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
+    async def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
         pass
 
 
@@ -18,13 +23,30 @@ class BlockUserUseCaseImpl(BlockUserUseCase):
         self,
         block_repository: BlockRepositoryPort,
         user_repository: UserRepositoryPort,
-        deactivate_chat_room_use_case: DeactivateChatRoomUseCase
+        deactivate_chat_room_use_case: DeactivateChatRoomUseCase,
+        block_cache: Optional[BlockCachePort] = None,
+        active_chat_pairs: Optional[ActiveChatPairPort] = None
     ):
         self.block_repository = block_repository
         self.user_repository = user_repository
         self.deactivate_chat_room_use_case = deactivate_chat_room_use_case
+        self.block_cache = block_cache
+        self.active_chat_pairs = active_chat_pairs
+
+    async def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
+        # MySQL 작업(동기 SQLAlchemy)은 스레드 풀에서 실행해 이벤트 루프를 막지 않는다
+        created = await run_in_threadpool(self._save_block, blocker_id, blocked_id)
+        if not created:
+            return
 
-    def block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> None:
+        # Keep the matchmaking block cache in sync (MySQL first, so a rebuild never misses this block)
+        if self.block_cache:
+            await self.block_cache.add_block(str(blocker_id), str(blocked_id))
+        if self.active_chat_pairs:
+            await self.active_chat_pairs.remove(str(blocker_id), str(blocked_id))
+
+    def _save_block(self, blocker_id: uuid.UUID, blocked_id: uuid.UUID) -> bool:
+        """차단을 저장하고 두 유저의 채팅방을 비활성화한다 (이미 차단했으면 False)"""
         blocker = self.user_repository.find_by_id(str(blocker_id))
         blocked = self.user_repository.find_by_id(str(blocked_id))
 
@@ -36,10 +58,11 @@ class BlockUserUseCaseImpl(BlockUserUseCase):
         )
 
         if existing_block:
-            return
+            return False
 
         new_block = Block(blocker_id=blocker_id, blocked_id=blocked_id)
         self.block_repository.save(new_block)
 
         # Deactivate chat room between the two users
         self.deactivate_chat_room_use_case.execute(user1_id=blocker_id, user2_id=blocked_id)
+        return True
@@ -0,0 +1,27 @@
+from app.user.application.port.block_cache_port import BlockCachePort
+from app.user.application.port.block_repository_port import BlockRepositoryPort
+
+
+class WarmUpBlockCacheUseCase:
+    """blocks 테이블로부터 매칭용 차단 관계 캐시를 적재한다 (서버 시작 시 또는 수동 재적재)"""
+
+    def __init__(self, block_repository: BlockRepositoryPort, block_cache: BlockCachePort):
+        self.block_repository = block_repository
+        self.block_cache = block_cache
+
+    async def execute(self, force: bool = False) -> int:
+        """
+        캐시를 적재하고 적재한 차단 관계 수를 반환한다.
+        이미 준비된 캐시는 force가 아니면 그대로 두고, 다른 워커가 적재 중이면 건너뛴다.
+        """
+        if not force and await self.block_cache.is_ready():
+            return 0
+
+        if not await self.block_cache.begin_rebuild():
+            return 0
+
+        # 캐시를 비운 뒤에 MySQL을 읽어야, 그 사이 생긴 차단이 MySQL 조회나 add_block 중 한쪽에는 반영된다
+        pairs = self.block_repository.find_all_pairs()
+        await self.block_cache.load(pairs)
+        await self.block_cache.finish_rebuild()
+        return len(pairs)
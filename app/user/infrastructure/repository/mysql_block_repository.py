@@ -46,6 +46,11 @@ class MySQLBlockRepository(BlockRepositoryPort):
         results = self._db.query(BlockModel.blocker_id).filter(BlockModel.blocked_id == blocked_user_id).all()
         return [str(result[0]) for result in results]
 
+    def find_all_pairs(self) -> list[tuple[str, str]]:
+        """모든 차단 관계를 (blocker_id, blocked_id) 목록으로 조회한다"""
+        results = self._db.query(BlockModel.blocker_id, BlockModel.blocked_id).yield_per(1000)
+        return [(str(blocker_id), str(blocked_id)) for blocker_id, blocked_id in results]
+
     def _to_domain(self, model: BlockModel) -> Block:
         return Block(
             id=model.id,
@@ -0,0 +1,86 @@
+import redis.asyncio as aioredis
+
+from app.user.application.port.block_cache_port import BlockCachePort
+
+
+class RedisBlockCacheRepository(BlockCachePort):
+    """
+    Redis 기반 차단 관계 캐시.
+
+    - block:blocked:{user_id}: Set (user_id가 차단한 유저 id)
+    - block:blocked_by:{user_id}: Set (user_id를 차단한 유저 id)
+    - block:ready: blocks 테이블로부터 적재가 끝났음을 표시하는 키 (없으면 매칭은 MySQL 조회로 동작한다)
+
+    후보 검사는 두 Set에 대한 SMISMEMBER를 한 파이프라인으로 보내 한 번의 왕복으로 끝난다.
+    """
+
+    BLOCKED_KEY_PREFIX = "block:blocked:"
+    BLOCKED_BY_KEY_PREFIX = "block:blocked_by:"
+    READY_KEY = "block:ready"
+    # 여러 워커가 동시에 재적재하지 않도록 잡는 잠금 (재적재가 중단되면 만료된다)
+    REBUILD_LOCK_KEY = "block:rebuild_lock"
+    REBUILD_LOCK_SECONDS = 300
+    # 재적재 시 한 파이프라인에 담는 관계 수
+    REBUILD_BATCH_SIZE = 1000
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+
+    def _blocked_key(self, user_id: str) -> str:
+        return f"{self.BLOCKED_KEY_PREFIX}{user_id}"
+
+    def _blocked_by_key(self, user_id: str) -> str:
+        return f"{self.BLOCKED_BY_KEY_PREFIX}{user_id}"
+
+    async def add_block(self, blocker_id: str, blocked_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(self._blocked_key(blocker_id), blocked_id)
+            pipe.sadd(self._blocked_by_key(blocked_id), blocker_id)
+            await pipe.execute()
+
+    async def find_blocked_among(self, user_id: str, candidate_ids: list[str]) -> set[str] | None:
+        if not candidate_ids:
+            return set() if await self.is_ready() else None
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self.READY_KEY)
+            pipe.smismember(self._blocked_key(user_id), candidate_ids)
+            pipe.smismember(self._blocked_by_key(user_id), candidate_ids)
+            ready, blocked, blocked_by = await pipe.execute()
+
+        if not ready:
+            return None
+        return {
+            candidate_id
+            for candidate_id, is_blocked, is_blocked_by in zip(candidate_ids, blocked, blocked_by)
+            if is_blocked or is_blocked_by
+        }
+
+    async def is_ready(self) -> bool:
+        return bool(await self.redis.exists(self.READY_KEY))
+
+    async def begin_rebuild(self) -> bool:
+        if not await self.redis.set(self.REBUILD_LOCK_KEY, 1, nx=True, ex=self.REBUILD_LOCK_SECONDS):
+            return False
+
+        # 재적재 중에는 준비 표시를 내려 매칭이 MySQL 조회로 동작하게 한다
+        await self.redis.delete(self.READY_KEY)
+        for prefix in (self.BLOCKED_KEY_PREFIX, self.BLOCKED_BY_KEY_PREFIX):
+            keys = [key async for key in self.redis.scan_iter(match=f"{prefix}*", count=self.REBUILD_BATCH_SIZE)]
+            for i in range(0, len(keys), self.REBUILD_BATCH_SIZE):
+                await self.redis.delete(*keys[i:i + self.REBUILD_BATCH_SIZE])
+        return True
+
+    async def load(self, pairs: list[tuple[str, str]]) -> None:
+        for i in range(0, len(pairs), self.REBUILD_BATCH_SIZE):
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for blocker_id, blocked_id in pairs[i:i + self.REBUILD_BATCH_SIZE]:
+                    pipe.sadd(self._blocked_key(blocker_id), blocked_id)
+                    pipe.sadd(self._blocked_by_key(blocked_id), blocker_id)
+                await pipe.execute()
+
+    async def finish_rebuild(self) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self.READY_KEY, 1)
+            pipe.delete(self.REBUILD_LOCK_KEY)
+            await pipe.execute()
@@ -1,68 +1,346 @@
-from fastapi import WebSocket
-from typing import Dict, List, Optional, Tuple
+import asyncio
+from fastapi import WebSocket, status
+from typing import Callable, Dict, Optional, Set
+
+from config.message_broker import MessageBroker, InMemoryMessageBroker, create_message_broker
+from config.settings import get_settings
+from config.websocket_codec import Frame, JSON_CODEC, WebSocketCodec
+
+
+class ConnectionWriter:
+    """
+    소켓별 bounded 송신 큐와 전용 writer 태스크.
+    enqueue는 대기하지 않으므로 느린 소켓이 같은 방의 다른 소켓이나 송신자의 수신 루프를 막지 않는다.
+    큐가 가득 차면 프레임을 버리고, 연속으로 max_dropped_frames개를 버리면 느린 소비자로 보고 연결을 닫는다.
+    """
+
+    # 느린 소비자 연결을 닫을 때 close 프레임 전송을 기다리는 최대 시간 (초)
+    CLOSE_TIMEOUT_SECONDS = 1.0
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue_size: int,
+        max_dropped_frames: int,
+        on_sent: Callable[[], None],
+        on_dropped: Callable[[], None],
+        on_evicted: Callable[[], None],
+        codec: WebSocketCodec = JSON_CODEC,
+    ):
+        self.websocket = websocket
+        self.codec = codec
+        self.max_dropped_frames = max_dropped_frames
+        self.consecutive_drops = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._on_sent = on_sent
+        self._on_dropped = on_dropped
+        self._on_evicted = on_evicted
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._run())
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def enqueue(self, message: Frame) -> None:
+        """인코딩된 프레임을 송신 큐에 넣는다 (대기하지 않음)"""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is not self._loop:
+            # 소켓을 소유한 이벤트 루프가 아닌 곳(다른 스레드 등)에서 호출된 경우
+            self._loop.call_soon_threadsafe(self._enqueue, message)
+            return
+        self._enqueue(message)
+
+    def stop(self) -> None:
+        """연결 종료 시 writer 태스크를 정리한다 (남은 프레임은 버린다)"""
+        self.closed = True
+        if not self._task.done():
+            self._task.cancel()
+
+    def _enqueue(self, message: Frame) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(message)
+            self.consecutive_drops = 0
+        except asyncio.QueueFull:
+            self.consecutive_drops += 1
+            self._on_dropped()
+            if self.consecutive_drops >= self.max_dropped_frames:
+                self._evict(f"{self.consecutive_drops} consecutive frames dropped")
+
+    async def _run(self) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                await self.codec.send(self.websocket, message)
+            except Exception as e:
+                self._evict(f"send failed: {e}")
+                return
+            self._on_sent()
+
+    def _evict(self, reason: str) -> None:
+        if self.closed:
+            return
+        print(f"[ConnectionManager] Evicting slow consumer ({reason})")
+        self.closed = True
+        self._on_evicted()
+        self._loop.create_task(self._close_socket())
+
+    async def _close_socket(self) -> None:
+        if not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+        try:
+            await asyncio.wait_for(
+                self.websocket.close(code=status.WS_1013_TRY_AGAIN_LATER),
+                timeout=self.CLOSE_TIMEOUT_SECONDS
+            )
+        except Exception:
+            # 이미 끊긴 소켓이거나 close 프레임조차 보낼 수 없는 경우
+            pass
 
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-        # Track user_id -> (room_id, websocket) mapping for cleanup
-        self.user_connections: Dict[str, Tuple[str, WebSocket]] = {}
+    """
+    WebSocket 연결 관리자.
+    소켓은 워커 로컬 dict에 보관하고, broadcast/send_to_user는 브로커 채널로 발행한다.
+    각 워커는 로컬 소켓이 있는 room/user 채널만 구독하여 수신한 메시지를 로컬 소켓에 전달한다.
+    로컬 전달은 소켓별 송신 큐(ConnectionWriter)에 넣기만 하므로 느린 소켓이 전달을 막지 않는다.
+
+    - active_connections: room_id -> 소켓 집합
+    - user_connections: user_id -> 소켓 집합 (한 사용자가 여러 기기/탭으로 연결 가능)
+    - 소켓 -> room_id / user_id 역인덱스로 connect/disconnect를 연결 수와 무관하게 O(1)로 처리한다
+    """
+
+    ROOM_CHANNEL_PREFIX = "ws:room:"
+    USER_CHANNEL_PREFIX = "ws:user:"
+
+    def __init__(
+        self,
+        broker: Optional[MessageBroker] = None,
+        send_queue_size: int = 256,
+        max_dropped_frames: int = 64,
+    ):
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.user_connections: Dict[str, Set[WebSocket]] = {}
+        # 역인덱스: websocket -> room_id / user_id
+        self._connection_rooms: Dict[WebSocket, str] = {}
+        self._connection_users: Dict[WebSocket, str] = {}
+        self.broker = broker or InMemoryMessageBroker()
+        self.send_queue_size = send_queue_size
+        self.max_dropped_frames = max_dropped_frames
+        self._writers: Dict[WebSocket, ConnectionWriter] = {}
+        # 관측용 카운터
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.evicted_connections = 0
+        # 구독 해제처럼 동기 경로에서 띄운 태스크가 GC되지 않도록 보관
+        self._background_tasks: Set[asyncio.Task] = set()
 
-    async def connect(self, websocket: WebSocket, room_id: str, user_id: Optional[str] = None):
-        await websocket.accept()
+    async def connect(
+        self,
+        websocket: WebSocket,
+        room_id: str,
+        user_id: Optional[str] = None,
+        codec: WebSocketCodec = JSON_CODEC,
+    ):
+        await websocket.accept(subprotocol=codec.subprotocol)
+        self._writers[websocket] = ConnectionWriter(
+            websocket,
+            max_queue_size=self.send_queue_size,
+            max_dropped_frames=self.max_dropped_frames,
+            on_sent=self._count_sent,
+            on_dropped=self._count_dropped,
+            on_evicted=self._count_evicted,
+            codec=codec,
+        )
+        self._connection_rooms[websocket] = room_id
         if room_id not in self.active_connections:
-            self.active_connections[room_id] = []
-        self.active_connections[room_id].append(websocket)
+            self.active_connections[room_id] = set()
+            await self.broker.subscribe(self._room_channel(room_id), self._dispatch)
+        self.active_connections[room_id].add(websocket)
 
         # Track user connection if user_id provided
         if user_id:
-            self.user_connections[user_id] = (room_id, websocket)
+            await self._track_user(user_id, websocket)
             print(f"[ConnectionManager] User {user_id} connected to room {room_id}")
 
-    def disconnect(self, websocket: WebSocket, room_id: str) -> Optional[str]:
+    def disconnect(self, websocket: WebSocket, room_id: Optional[str] = None) -> Optional[str]:
         """
         Disconnect websocket and return user_id if found.
+        room_id는 하위 호환용이며, 실제 방은 역인덱스에서 찾는다.
         """
-        if room_id in self.active_connections:
-            if websocket in self.active_connections[room_id]:
-                self.active_connections[room_id].remove(websocket)
-
-        # Find and remove user from user_connections
-        disconnected_user_id = None
-        for user_id, (tracked_room_id, tracked_ws) in list(self.user_connections.items()):
-            if tracked_ws == websocket and tracked_room_id == room_id:
-                disconnected_user_id = user_id
-                del self.user_connections[user_id]
-                print(f"[ConnectionManager] User {user_id} disconnected from room {room_id}")
-                break
+        writer = self._writers.pop(websocket, None)
+        if writer is not None:
+            writer.stop()
+
+        tracked_room_id = self._connection_rooms.pop(websocket, None)
+        if tracked_room_id is not None:
+            self._discard(self.active_connections, tracked_room_id, websocket, self._room_channel(tracked_room_id))
+
+        disconnected_user_id = self._connection_users.pop(websocket, None)
+        if disconnected_user_id is not None:
+            self._discard(
+                self.user_connections, disconnected_user_id, websocket, self._user_channel(disconnected_user_id)
+            )
+            print(f"[ConnectionManager] User {disconnected_user_id} disconnected from room {tracked_room_id}")
 
         return disconnected_user_id
 
-    def register_user(self, user_id: str, room_id: str, websocket: WebSocket):
+    async def register_user(self, user_id: str, room_id: str, websocket: WebSocket):
         """Register user_id with their websocket connection"""
-        self.user_connections[user_id] = (room_id, websocket)
+        await self._track_user(user_id, websocket)
         print(f"[ConnectionManager] Registered user {user_id} to room {room_id}")
 
+    def is_user_connected(self, user_id: str) -> bool:
+        """사용자가 이 워커에 하나 이상의 소켓으로 연결되어 있는지 확인한다"""
+        return bool(self.user_connections.get(user_id))
+
     def get_user_room(self, user_id: str) -> Optional[str]:
-        """Get room_id for a user"""
-        if user_id in self.user_connections:
-            return self.user_connections[user_id][0]
+        """Get room_id for a user (이 워커에 연결된 사용자만 조회 가능, 여러 소켓이면 그중 하나의 방)"""
+        for websocket in self.user_connections.get(user_id, ()):
+            return self._connection_rooms.get(websocket)
         return None
 
     async def broadcast(self, message: str, room_id: str):
-        if room_id in self.active_connections:
-            for connection in self.active_connections[room_id]:
-                await connection.send_text(message)
+        """
+        방 채널로 발행한다. 방에 소켓을 가진 모든 워커가 로컬 소켓으로 전달한다.
+        message는 encode_json으로 한 번 인코딩된 JSON 문자열이다.
+        """
+        await self.broker.publish(self._room_channel(room_id), message)
 
     async def send_to_user(self, user_id: str, message: str):
-        """Send a message to a specific user."""
-        if user_id in self.user_connections:
-            _room_id, websocket = self.user_connections[user_id]
-            await websocket.send_text(message)
-            print(f"[ConnectionManager] Sent message to user {user_id}")
-        else:
+        """Send a message to a specific user (다른 워커에 연결된 사용자 포함)."""
+        receivers = await self.broker.publish(self._user_channel(user_id), message)
+        if not receivers:
             print(f"[ConnectionManager] User {user_id} not found for sending message.")
 
+    def send_to_connection(self, websocket: WebSocket, message: str) -> None:
+        """이 워커의 특정 소켓 하나에만 보낸다 (재연결 시 밀린 알림 재전송 등)"""
+        self._send(websocket, message, {})
+
+    def queue_depth(self) -> int:
+        """이 워커의 모든 소켓 송신 큐에 쌓인 프레임 수"""
+        return sum(writer.queue_depth for writer in self._writers.values())
+
+    def get_stats(self) -> Dict[str, int]:
+        """송신 큐 관측 지표"""
+        depths = [writer.queue_depth for writer in self._writers.values()]
+        return {
+            "connections": len(self._writers),
+            "queue_depth": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "evicted_connections": self.evicted_connections,
+        }
+
+    async def close(self) -> None:
+        """송신 태스크와 브로커 연결을 정리한다 (애플리케이션 종료 시)"""
+        for writer in self._writers.values():
+            writer.stop()
+        self._writers.clear()
+        self.active_connections.clear()
+        self.user_connections.clear()
+        self._connection_rooms.clear()
+        self._connection_users.clear()
+        await self.broker.close()
+
+    async def _track_user(self, user_id: str, websocket: WebSocket) -> None:
+        previous_user_id = self._connection_users.get(websocket)
+        if previous_user_id == user_id:
+            return
+        if previous_user_id is not None:
+            self._discard(self.user_connections, previous_user_id, websocket, self._user_channel(previous_user_id))
+
+        self._connection_users[websocket] = user_id
+        if user_id not in self.user_connections:
+            self.user_connections[user_id] = set()
+            await self.broker.subscribe(self._user_channel(user_id), self._dispatch)
+        self.user_connections[user_id].add(websocket)
+
+    def _discard(self, index: Dict[str, Set[WebSocket]], key: str, websocket: WebSocket, channel: str) -> None:
+        """인덱스에서 소켓을 제거하고, 비게 된 항목은 정리한 뒤 채널 구독 해제를 예약한다"""
+        sockets = index.get(key)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del index[key]
+            self._spawn(self._release_channel(channel))
+
+    async def _release_channel(self, channel: str) -> None:
+        """로컬 소켓이 다시 생기지 않았을 때만 채널 구독을 해제한다"""
+        if self._has_local_sockets(channel):
+            return
+        await self.broker.unsubscribe(channel, self._dispatch)
+
+    def _has_local_sockets(self, channel: str) -> bool:
+        if channel.startswith(self.ROOM_CHANNEL_PREFIX):
+            return bool(self.active_connections.get(channel[len(self.ROOM_CHANNEL_PREFIX):]))
+        if channel.startswith(self.USER_CHANNEL_PREFIX):
+            return bool(self.user_connections.get(channel[len(self.USER_CHANNEL_PREFIX):]))
+        return False
+
+    async def _dispatch(self, channel: str, message: str) -> None:
+        """브로커에서 수신한 메시지를 이 워커의 로컬 소켓으로 전달한다"""
+        # 같은 메시지는 코덱마다 한 번만 인코딩해 모든 소켓이 같은 프레임을 공유한다
+        frames: Dict[WebSocketCodec, Frame] = {}
+        if channel.startswith(self.ROOM_CHANNEL_PREFIX):
+            room_id = channel[len(self.ROOM_CHANNEL_PREFIX):]
+            for connection in self.active_connections.get(room_id, ()):
+                self._send(connection, message, frames)
+        elif channel.startswith(self.USER_CHANNEL_PREFIX):
+            user_id = channel[len(self.USER_CHANNEL_PREFIX):]
+            connections = self.user_connections.get(user_id, ())
+            for connection in connections:
+                self._send(connection, message, frames)
+            if connections:
+                print(f"[ConnectionManager] Sent message to user {user_id} ({len(connections)} sockets)")
+
+    def _send(self, websocket: WebSocket, message: str, frames: Dict[WebSocketCodec, Frame]) -> None:
+        writer = self._writers.get(websocket)
+        if writer is None:
+            return
+        frame = frames.get(writer.codec)
+        if frame is None:
+            frame = frames[writer.codec] = writer.codec.from_json(message)
+        writer.enqueue(frame)
+
+    def _count_sent(self) -> None:
+        self.frames_sent += 1
+
+    def _count_dropped(self) -> None:
+        self.frames_dropped += 1
+
+    def _count_evicted(self) -> None:
+        self.evicted_connections += 1
+
+    def _room_channel(self, room_id: str) -> str:
+        return f"{self.ROOM_CHANNEL_PREFIX}{room_id}"
+
+    def _user_channel(self, user_id: str) -> str:
+        return f"{self.USER_CHANNEL_PREFIX}{user_id}"
+
+    def _spawn(self, coro) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            # 이벤트 루프 밖에서 호출된 경우 (테스트 등) 구독 해제는 생략한다
+            coro.close()
+            return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
 
 # 싱글톤 인스턴스
-manager = ConnectionManager()
+_settings = get_settings()
+manager = ConnectionManager(
+    create_message_broker(_settings.WS_BROKER_BACKEND),
+    send_queue_size=_settings.WS_SEND_QUEUE_SIZE,
+    max_dropped_frames=_settings.WS_SLOW_CONSUMER_MAX_DROPS,
+)
@@ -23,6 +23,14 @@ def get_db_session():
     return SessionLocal()
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    FastAPI dependency for a session factory.
+    WebSocket처럼 오래 유지되는 연결은 세션을 점유하지 않고, 작업마다 짧게 세션을 열고 닫는다.
+    """
+    return SessionLocal
+
+
 def get_db():
     """FastAPI dependency for database session"""
     db = SessionLocal()
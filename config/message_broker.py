@@ -0,0 +1,156 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import redis.asyncio as aioredis
+
+# (channel, message) 를 받아 로컬 소켓으로 전달하는 핸들러
+MessageHandler = Callable[[str, str], Awaitable[None]]
+
+
+class MessageBroker(ABC):
+    """
+    WebSocket 메시지 fan-out용 pub/sub 브로커 인터페이스.
+    각 워커는 로컬 소켓이 있는 채널만 구독하고, publish된 메시지를 로컬 소켓으로 전달한다.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> int:
+        """채널에 메시지를 발행하고, 메시지를 받은 구독자 수를 반환한다"""
+        pass
+
+    @abstractmethod
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        """채널을 구독한다"""
+        pass
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str, handler: MessageHandler) -> None:
+        """채널 구독을 해제한다"""
+        pass
+
+    async def close(self) -> None:
+        """브로커 리소스를 정리한다"""
+        pass
+
+
+class InMemoryMessageBroker(MessageBroker):
+    """
+    단일 프로세스용 브로커. publish 시 같은 프로세스의 구독자에게 즉시 전달한다.
+    하나의 인스턴스를 여러 ConnectionManager가 공유하면 멀티 워커 fan-out을 흉내낼 수 있다.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, Set[MessageHandler]] = {}
+
+    async def publish(self, channel: str, message: str) -> int:
+        handlers = list(self._handlers.get(channel, ()))
+        for handler in handlers:
+            await handler(channel, message)
+        return len(handlers)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        self._handlers.setdefault(channel, set()).add(handler)
+
+    async def unsubscribe(self, channel: str, handler: MessageHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers is None:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self._handlers[channel]
+
+
+class RedisMessageBroker(MessageBroker):
+    """
+    Redis pub/sub 기반 브로커.
+    워커마다 하나의 pub/sub 연결을 유지하며, 로컬 구독자가 생긴 채널만 SUBSCRIBE 한다.
+    백그라운드 리스너 태스크가 수신한 메시지를 해당 채널의 핸들러로 전달한다.
+    """
+
+    # 리스너가 메시지를 기다리는 최대 시간 (초)
+    POLL_TIMEOUT_SECONDS = 1.0
+
+    def __init__(self, client: aioredis.Redis):
+        self.redis = client
+        self._pubsub = None
+        self._handlers: Dict[str, Set[MessageHandler]] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self.redis.publish(channel, message)
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        handlers = self._handlers.setdefault(channel, set())
+        is_new_channel = not handlers
+        handlers.add(handler)
+
+        if is_new_channel:
+            if self._pubsub is None:
+                self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(channel)
+            self._ensure_listener()
+
+    async def unsubscribe(self, channel: str, handler: MessageHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers is None:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self._handlers[channel]
+            if self._pubsub is not None:
+                await self._pubsub.unsubscribe(channel)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+        self._handlers.clear()
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self.POLL_TIMEOUT_SECONDS
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[RedisMessageBroker] Listener error: {e}")
+                await asyncio.sleep(self.POLL_TIMEOUT_SECONDS)
+                continue
+
+            if message is None or message.get("type") != "message":
+                continue
+
+            channel = message["channel"]
+            data = message["data"]
+            for handler in list(self._handlers.get(channel, ())):
+                try:
+                    await handler(channel, data)
+                except Exception as e:
+                    print(f"[RedisMessageBroker] Handler error on {channel}: {e}")
+
+
+def create_message_broker(backend: str) -> MessageBroker:
+    """설정값에 맞는 브로커를 생성한다 ("memory" 또는 "redis")"""
+    if backend == "redis":
+        from config.redis import get_redis
+        return RedisMessageBroker(get_redis())
+    if backend == "memory":
+        return InMemoryMessageBroker()
+    raise ValueError(f"지원하지 않는 WebSocket 브로커입니다: {backend}")
@@ -18,8 +18,41 @@ class Settings(BaseSettings):
     # Redis URL (필수)
     REDIS_URL: str
 
+    # WebSocket fan-out 브로커 ("memory": 단일 워커, "redis": 멀티 워커 Redis pub/sub)
+    WS_BROKER_BACKEND: str = "memory"
+
+    # WebSocket 소켓별 송신 큐 (high-water mark: 큐 길이, 연속 드롭 프레임 수를 넘으면 연결 종료)
+    WS_SEND_QUEUE_SIZE: int = 256
+    WS_SLOW_CONSUMER_MAX_DROPS: int = 64
+
+    # 채팅 메시지 write-behind 배치 설정
+    CHAT_WRITE_BATCH_SIZE: int = 200
+    CHAT_WRITE_FLUSH_INTERVAL_MS: int = 50
+    CHAT_WRITE_QUEUE_SIZE: int = 10000
+
+    # Redis에 기록된 읽음 워터마크를 MySQL에 반영하는 주기 (초)
+    CHAT_READ_WATERMARK_FLUSH_INTERVAL_SECONDS: float = 5.0
+
+    # 매칭 대기열 유령 티켓 정리 주기 (초)와 한 번 실행의 시간 예산 (ms)
+    MATCH_QUEUE_COMPACTION_INTERVAL_SECONDS: float = 30.0
+    MATCH_QUEUE_COMPACTION_BUDGET_MS: int = 50
+
+    # 매칭 방식 ("reactive": 요청 시 즉시 탐색, "batch": 주기적으로 전체 대기열을 한 번에 짝지음,
+    #           "hybrid": 요청 시 즉시 탐색 + 남은 대기열을 주기적으로 다시 짝지음)
+    MATCHMAKER_MODE: str = "reactive"
+    # 배치 매칭 주기 (초)와 한 번에 스냅샷할 MBTI 대기열별 최대 티켓 수
+    MATCHMAKER_TICK_SECONDS: float = 1.0
+    MATCHMAKER_BATCH_LIMIT_PER_QUEUE: int = 16
+    # 대기 중인 티켓의 허용 궁합 단계를 한 단계씩 넓히는 주기 (초, 요청한 max_level까지, 0이면 넓히지 않음)
+    MATCH_LEVEL_WIDEN_SECONDS: float = 15.0
+
+    # 매칭 알림 아웃박스: 재연결하지 않은 유저의 미확인 알림 보관 시간 (초)
+    MATCH_NOTIFICATION_OUTBOX_TTL_SECONDS: int = 300
+
     # OpenAI Settings (필수)
     OPENAI_API_KEY: str
+    # 답변 처리 중 OpenAI 호출 한 번의 제한 시간 (초, 답변 분석/다음 질문 생성 각각)
+    OPENAI_CALL_TIMEOUT_SECONDS: float = 10.0
 
     # Environment
     ENV: str = "development"  # "development" or "production"
@@ -0,0 +1,119 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+
+import msgpack
+import orjson
+from fastapi import WebSocket
+
+Frame = Union[str, bytes]
+
+
+def encode_json(payload: Dict[str, Any]) -> str:
+    """
+    브로드캐스트 페이로드를 JSON 문자열로 한 번만 인코딩한다.
+    브로커는 이 문자열을 그대로 실어 나르고, 각 워커는 코덱별로 한 번씩만 변환한다.
+    """
+    return orjson.dumps(payload).decode("utf-8")
+
+
+class WebSocketCodec(ABC):
+    """WebSocket 프레임 인코딩 방식 (subprotocol 협상 결과)"""
+
+    # accept 시 응답할 subprotocol 이름 (None이면 기본 JSON 텍스트 프로토콜)
+    subprotocol: Optional[str] = None
+
+    @abstractmethod
+    async def receive_frame(self, websocket: WebSocket) -> Frame:
+        """인코딩된 프레임 하나를 수신한다"""
+        pass
+
+    @abstractmethod
+    def decode(self, frame: Frame) -> Dict[str, Any]:
+        """수신한 프레임을 dict로 디코딩한다 (형식이 잘못되면 ValueError)"""
+        pass
+
+    @abstractmethod
+    def encode(self, payload: Dict[str, Any]) -> Frame:
+        """dict를 이 코덱의 프레임으로 인코딩한다"""
+        pass
+
+    @abstractmethod
+    def from_json(self, message: str) -> Frame:
+        """encode_json으로 인코딩된 브로드캐스트 메시지를 이 코덱의 프레임으로 변환한다"""
+        pass
+
+    @abstractmethod
+    async def send(self, websocket: WebSocket, frame: Frame) -> None:
+        """인코딩된 프레임을 전송한다"""
+        pass
+
+    async def receive(self, websocket: WebSocket) -> Dict[str, Any]:
+        """프레임 하나를 수신해 디코딩한다"""
+        return self.decode(await self.receive_frame(websocket))
+
+
+class JsonCodec(WebSocketCodec):
+    """기본 JSON 텍스트 프로토콜"""
+
+    async def receive_frame(self, websocket: WebSocket) -> Frame:
+        return await websocket.receive_text()
+
+    def decode(self, frame: Frame) -> Dict[str, Any]:
+        payload = orjson.loads(frame)
+        if not isinstance(payload, dict):
+            raise ValueError("메시지는 JSON 객체여야 합니다")
+        return payload
+
+    def encode(self, payload: Dict[str, Any]) -> Frame:
+        return encode_json(payload)
+
+    def from_json(self, message: str) -> Frame:
+        return message
+
+    async def send(self, websocket: WebSocket, frame: Frame) -> None:
+        await websocket.send_text(frame)
+
+
+class MessagePackCodec(WebSocketCodec):
+    """MessagePack 바이너리 프로토콜 (모바일 클라이언트용, Sec-WebSocket-Protocol: msgpack)"""
+
+    subprotocol = "msgpack"
+
+    async def receive_frame(self, websocket: WebSocket) -> Frame:
+        return await websocket.receive_bytes()
+
+    def decode(self, frame: Frame) -> Dict[str, Any]:
+        try:
+            payload = msgpack.unpackb(frame, raw=False)
+        except (msgpack.UnpackException, ValueError) as e:
+            raise ValueError(f"유효하지 않은 MessagePack 메시지입니다: {e}") from e
+        if not isinstance(payload, dict):
+            raise ValueError("메시지는 MessagePack map이어야 합니다")
+        return payload
+
+    def encode(self, payload: Dict[str, Any]) -> Frame:
+        return msgpack.packb(payload, use_bin_type=True)
+
+    def from_json(self, message: str) -> Frame:
+        return msgpack.packb(orjson.loads(message), use_bin_type=True)
+
+    async def send(self, websocket: WebSocket, frame: Frame) -> None:
+        await websocket.send_bytes(frame)
+
+
+JSON_CODEC = JsonCodec()
+MESSAGEPACK_CODEC = MessagePackCodec()
+
+# 클라이언트가 요청할 수 있는 subprotocol
+_CODECS_BY_SUBPROTOCOL: Dict[str, WebSocketCodec] = {
+    MESSAGEPACK_CODEC.subprotocol: MESSAGEPACK_CODEC,
+}
+
+
+def negotiate_codec(websocket: WebSocket) -> WebSocketCodec:
+    """클라이언트가 요청한 subprotocol 중 지원하는 첫 번째 코덱을 고른다 (없으면 JSON)"""
+    for subprotocol in websocket.scope.get("subprotocols", []):
+        codec = _CODECS_BY_SUBPROTOCOL.get(subprotocol)
+        if codec is not None:
+            return codec
+    return JSON_CODEC
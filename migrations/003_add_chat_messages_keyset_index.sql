@@ -0,0 +1,6 @@
+-- Add composite keyset index for paginated chat history
+-- Migration: 003_add_chat_messages_keyset_index
+-- Date: 2026-10-18
+
+CREATE INDEX ix_chat_messages_room_created_id
+ON chat_messages (room_id, created_at, id);
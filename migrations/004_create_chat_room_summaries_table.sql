@@ -0,0 +1,17 @@
+-- Create denormalized chat room summary projection
+-- Migration: 004_create_chat_room_summaries_table
+-- Date: 2026-10-18
+-- Existing rooms are backfilled lazily on the first /chat/rooms/my request.
+
+CREATE TABLE chat_room_summaries (
+    room_id VARCHAR(36) PRIMARY KEY,
+    user1_id VARCHAR(255) NOT NULL,
+    user2_id VARCHAR(255) NOT NULL,
+    last_message_id VARCHAR(36) NULL,
+    last_message_sender_id VARCHAR(255) NULL,
+    last_message_preview VARCHAR(200) NULL,
+    last_message_at DATETIME NULL,
+    user1_unread_count INTEGER NOT NULL DEFAULT 0,
+    user2_unread_count INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (room_id) REFERENCES chat_rooms(id) ON DELETE CASCADE
+);
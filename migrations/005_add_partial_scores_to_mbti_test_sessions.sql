@@ -0,0 +1,7 @@
+-- Add running partial MBTI scores to mbti_test_sessions table
+-- Migration: 005_add_partial_scores_to_mbti_test_sessions
+-- Date: 2026-10-18
+-- Existing sessions keep NULL and are rebuilt from their turns on the next answer.
+
+ALTER TABLE mbti_test_sessions
+ADD COLUMN partial_scores JSON NULL;
@@ -0,0 +1,276 @@
+"""
+채팅 WebSocket 부하 테스트 하네스.
+
+chat_websocket_router를 실제 uvicorn 서버로 띄우고, N개 방 × 2 클라이언트가 지정한 속도로 메시지를 보내
+처리량과 종단 간(송신 → 상대방 수신) 전달 지연 p50/p95/p99를 측정한다.
+외부 의존성 없이 돌도록 저장소는 메모리(in-memory SQLite, tests/chat/fixtures의 Fake 저장소)를,
+Redis는 로컬 대역(tests/config/fixtures/fake_redis)을 사용한다.
+
+CLI:
+    python -m tests.benchmark.chat_websocket_load --rooms 50 --rate 10 --duration 5
+
+pytest:
+    pytest -m benchmark tests/benchmark
+"""
+import argparse
+import asyncio
+import socket
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import orjson
+import uvicorn
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from websockets.asyncio.client import connect
+
+import app.router  # noqa: F401  (모든 ORM 모델 등록)
+from app.chat.adapter.input.web import chat_websocket_router as chat_websocket_module
+from app.chat.adapter.input.web.chat_router import get_unread_counter
+from app.chat.adapter.input.web.chat_websocket_router import chat_websocket_router
+from app.chat.infrastructure.model.chat_room_model import ChatRoomModel
+from app.chat.infrastructure.writer.buffered_chat_message_writer import (
+    BufferedChatMessageWriter,
+    get_chat_message_writer,
+)
+from app.user.infrastructure.model.user_model import UserModel
+from config.connection_manager import ConnectionManager
+from config.database import Base, get_session_factory
+from config.message_broker import RedisMessageBroker
+from tests.chat.fixtures.fake_chat_message_repository import FakeChatMessageRepository
+from tests.chat.fixtures.fake_chat_room_summary_repository import FakeChatRoomSummaryRepository
+from tests.chat.fixtures.fake_unread_counter import FakeUnreadCounter
+from tests.config.fixtures.fake_redis import FakeRedisServer
+
+
+@dataclass
+class LoadTestConfig:
+    """부하 테스트 설정"""
+    rooms: int = 20
+    # 클라이언트 하나가 초당 보내는 메시지 수
+    rate: float = 10.0
+    duration: float = 3.0
+    # 송신이 끝난 뒤 남은 메시지 전달을 기다리는 최대 시간 (초)
+    drain_timeout: float = 10.0
+
+
+@dataclass
+class LoadTestReport:
+    """부하 테스트 결과"""
+    config: LoadTestConfig
+    sent: int
+    delivered: int
+    elapsed: float
+    latencies_ms: list[float] = field(repr=False)
+    persisted: int = 0
+    write_batches: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """초당 상대방에게 전달된 메시지 수"""
+        return self.delivered / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> str:
+        return (
+            f"rooms={self.config.rooms} clients={self.config.rooms * 2} rate={self.config.rate}/s/client "
+            f"duration={self.config.duration}s\n"
+            f"sent={self.sent} delivered={self.delivered} persisted={self.persisted} "
+            f"(write batches={self.write_batches})\n"
+            f"throughput={self.throughput:.1f} msg/s "
+            f"p50={self.percentile(50):.2f}ms p95={self.percentile(95):.2f}ms p99={self.percentile(99):.2f}ms"
+        )
+
+
+class InMemoryChatStore:
+    """채팅방 조회용 in-memory SQLite와 메시지/요약 Fake 저장소"""
+
+    def __init__(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        self.engine = engine
+        self.session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        self.messages = FakeChatMessageRepository()
+        self.summaries = FakeChatRoomSummaryRepository()
+        self.persisted = 0
+
+    def create_rooms(self, count: int) -> list[tuple[str, str, str]]:
+        rooms = []
+        with self.session_factory() as db:
+            for i in range(count):
+                room_id, user1_id, user2_id = f"load-room-{i}", f"load-a-{i}", f"load-b-{i}"
+                db.add(UserModel(id=user1_id, email=f"{user1_id}@load.test"))
+                db.add(UserModel(id=user2_id, email=f"{user2_id}@load.test"))
+                db.add(ChatRoomModel(id=room_id, user1_id=user1_id, user2_id=user2_id, created_at=datetime.now()))
+                rooms.append((room_id, user1_id, user2_id))
+            db.commit()
+        return rooms
+
+    def persist(self, messages) -> None:
+        self.messages.save_all(messages)
+        self.summaries.record_messages(messages)
+        self.persisted += len(messages)
+
+
+def build_app(store: InMemoryChatStore, writer: BufferedChatMessageWriter) -> FastAPI:
+    """in-memory 저장소에 연결된 채팅 WebSocket 앱을 만든다"""
+    app = FastAPI()
+    app.include_router(chat_websocket_router)
+    app.dependency_overrides[get_session_factory] = lambda: store.session_factory
+    app.dependency_overrides[get_chat_message_writer] = lambda: writer
+    unread_counter = FakeUnreadCounter()
+    app.dependency_overrides[get_unread_counter] = lambda: unread_counter
+    return app
+
+
+@contextmanager
+def redis_stand_in(server: FakeRedisServer):
+    """라우터가 쓰는 ConnectionManager와 Redis 클라이언트를 로컬 Redis 대역으로 바꾼다"""
+    original_manager = chat_websocket_module.manager
+    original_get_redis = chat_websocket_module.get_redis
+    chat_websocket_module.manager = ConnectionManager(RedisMessageBroker(server.client()))
+    chat_websocket_module.get_redis = server.client
+    try:
+        yield chat_websocket_module.manager
+    finally:
+        chat_websocket_module.manager = original_manager
+        chat_websocket_module.get_redis = original_get_redis
+
+
+class LoadClient:
+    """채팅방에 연결해 일정한 속도로 메시지를 보내고, 상대방 메시지의 전달 지연을 기록하는 클라이언트"""
+
+    def __init__(self, url: str, user_id: str, partner_id: str):
+        self.url = url
+        self.user_id = user_id
+        self.partner_id = partner_id
+        self.sent = 0
+        self.latencies_ms: list[float] = []
+        self._websocket = None
+
+    async def connect(self) -> None:
+        self._websocket = await connect(self.url, max_queue=None)
+
+    async def send_loop(self, rate: float, duration: float) -> None:
+        interval = 1.0 / rate
+        started = time.perf_counter()
+        next_send = started
+        while next_send - started < duration:
+            content = f"{self.user_id}|{self.sent}|{time.perf_counter()}"
+            await self._websocket.send(orjson.dumps({"sender_id": self.user_id, "content": content}).decode())
+            self.sent += 1
+            # 절대 시각 기준으로 다음 송신을 예약해 지연이 누적되지 않도록 한다
+            next_send += interval
+            await asyncio.sleep(max(0.0, next_send - time.perf_counter()))
+
+    async def receive_loop(self) -> None:
+        """송신과 동시에 수신하며 상대방 메시지의 전달 지연을 기록한다 (취소될 때까지)"""
+        while True:
+            frame = orjson.loads(await self._websocket.recv())
+            if frame.get("sender_id") != self.partner_id:
+                continue
+            sent_at = float(frame["content"].rsplit("|", 1)[1])
+            self.latencies_ms.append((time.perf_counter() - sent_at) * 1000)
+
+    async def close(self) -> None:
+        if self._websocket is not None:
+            await self._websocket.close()
+
+
+async def run_load_test(config: LoadTestConfig) -> LoadTestReport:
+    """서버를 띄우고 부하를 건 뒤 결과를 반환한다"""
+    store = InMemoryChatStore()
+    rooms = store.create_rooms(config.rooms)
+    writer = BufferedChatMessageWriter(store.persist)
+    app = build_app(store, writer)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off", ws_max_queue=1024))
+
+    with redis_stand_in(FakeRedisServer()) as manager:
+        server_task = asyncio.create_task(server.serve(sockets=[sock]))
+        while not server.started:
+            await asyncio.sleep(0.01)
+
+        clients = []
+        for room_id, user1_id, user2_id in rooms:
+            url = f"ws://127.0.0.1:{port}/ws/chat/{room_id}"
+            clients.append(LoadClient(url, user1_id, user2_id))
+            clients.append(LoadClient(url, user2_id, user1_id))
+        try:
+            await asyncio.gather(*(client.connect() for client in clients))
+
+            receivers = [asyncio.create_task(client.receive_loop()) for client in clients]
+            started = time.perf_counter()
+            await asyncio.gather(*(client.send_loop(config.rate, config.duration) for client in clients))
+
+            # 송신이 끝난 뒤 남은 메시지가 모두 전달될 때까지 기다린다
+            sent_by = {client.user_id: client.sent for client in clients}
+            deadline = time.perf_counter() + config.drain_timeout
+            while any(len(client.latencies_ms) < sent_by[client.partner_id] for client in clients):
+                if time.perf_counter() > deadline:
+                    print("[LoadTest] Timed out waiting for remaining deliveries")
+                    break
+                await asyncio.sleep(0.01)
+            elapsed = time.perf_counter() - started
+            for receiver in receivers:
+                receiver.cancel()
+            await asyncio.gather(*receivers, return_exceptions=True)
+            await writer.flush()
+        finally:
+            await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+            await writer.close()
+            await manager.close()
+            server.should_exit = True
+            await server_task
+            store.engine.dispose()
+
+    return LoadTestReport(
+        config=config,
+        sent=sum(client.sent for client in clients),
+        delivered=sum(len(client.latencies_ms) for client in clients),
+        elapsed=elapsed,
+        latencies_ms=[latency for client in clients for latency in client.latencies_ms],
+        persisted=store.persisted,
+        write_batches=writer.batches_written,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="채팅 WebSocket 부하 테스트")
+    parser.add_argument("--rooms", type=int, default=LoadTestConfig.rooms, help="채팅방 수 (방마다 클라이언트 2개)")
+    parser.add_argument("--rate", type=float, default=LoadTestConfig.rate, help="클라이언트당 초당 메시지 수")
+    parser.add_argument("--duration", type=float, default=LoadTestConfig.duration, help="송신 시간 (초)")
+    parser.add_argument(
+        "--drain-timeout", type=float, default=LoadTestConfig.drain_timeout, help="남은 메시지 전달 대기 시간 (초)"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(LoadTestConfig(
+        rooms=args.rooms,
+        rate=args.rate,
+        duration=args.duration,
+        drain_timeout=args.drain_timeout,
+    )))
+    print(report.summary())
+
+
+if __name__ == "__main__":
+    main()
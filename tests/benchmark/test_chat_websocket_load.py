@@ -0,0 +1,23 @@
+import pytest
+
+from tests.benchmark.chat_websocket_load import LoadTestConfig, run_load_test
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+
+async def test_chat_websocket_load(capsys):
+    """N개 방 × 2 클라이언트 부하에서 모든 메시지가 상대방에게 전달되고 저장된다"""
+    # Given
+    config = LoadTestConfig(rooms=20, rate=10, duration=2)
+
+    # When
+    report = await run_load_test(config)
+
+    with capsys.disabled():
+        print(f"\n[benchmark] {report.summary()}")
+
+    # Then
+    assert report.sent > 0
+    assert report.delivered == report.sent
+    assert report.persisted == report.sent
+    assert report.percentile(50) <= report.percentile(95) <= report.percentile(99)
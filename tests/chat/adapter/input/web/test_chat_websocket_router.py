@@ -1,12 +1,84 @@
 
+import msgpack
 import pytest
+from contextlib import ExitStack
 from datetime import datetime
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from starlette.websockets import WebSocketDisconnect
 
+import app.router  # noqa: F401  (모든 ORM 모델 등록)
+from app.chat.adapter.input.web import chat_websocket_router as chat_websocket_module
+from app.chat.adapter.input.web.chat_router import get_unread_counter
+from app.chat.adapter.input.web.chat_websocket_router import chat_websocket_router
 from app.user.infrastructure.model.user_model import UserModel
 from app.chat.infrastructure.model.chat_message_model import ChatMessageModel
 from app.chat.infrastructure.model.chat_room_model import ChatRoomModel
+from app.chat.infrastructure.writer.buffered_chat_message_writer import (
+    create_chat_message_writer,
+    get_chat_message_writer,
+)
+from config.database import Base, get_session_factory
+from tests.chat.fixtures.fake_unread_counter import FakeUnreadCounter
+
+# 세션을 소켓 수명 동안 점유하면 이 풀 크기를 넘는 동시 소켓은 pool_timeout 안에 실패한다
+POOL_SIZE = 2
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """작은 커넥션 풀을 가진 테스트용 DB"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'chat.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=2,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(session_factory):
+    db = session_factory()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def writer(session_factory):
+    return create_chat_message_writer(session_factory)
+
+
+@pytest.fixture
+def unread_counter():
+    return FakeUnreadCounter()
+
+
+@pytest.fixture
+def client(session_factory, writer, unread_counter, monkeypatch):
+    async def _noop(*args, **kwargs):
+        return None
+
+    # 매칭 상태(Redis) 갱신은 이 테스트의 관심사가 아니므로 대체한다
+    monkeypatch.setattr(chat_websocket_module, "_set_user_chatting", _noop)
+    monkeypatch.setattr(chat_websocket_module, "_clear_user_state", _noop)
+
+    test_app = FastAPI()
+    test_app.include_router(chat_websocket_router)
+    test_app.dependency_overrides[get_session_factory] = lambda: session_factory
+    test_app.dependency_overrides[get_chat_message_writer] = lambda: writer
+    test_app.dependency_overrides[get_unread_counter] = lambda: unread_counter
+    with TestClient(test_app) as test_client:
+        yield test_client
+        test_client.portal.call(writer.close)
+
 
 def _create_test_users(db_session, *user_ids):
     """Helper to create user models for tests."""
@@ -58,7 +130,56 @@ def test_send_and_receive_message(client: TestClient, db_session):
         assert received["content"] == "Hello, WebSocket!"
         assert received["sender_id"] == user1_id
 
-def test_message_saved_to_database(client: TestClient, db_session):
+def test_message_increments_recipient_unread_counter(client: TestClient, db_session, unread_counter):
+    """메시지를 보내면 상대방의 읽지 않은 수가 증가한다"""
+    room_id = "test_room_unread"
+    user1_id = "user1_unread"
+    user2_id = "user2_unread"
+    _create_test_room(db_session, room_id, user1_id, user2_id)
+
+    client.portal.call(unread_counter.seed, user2_id, {})
+    client.portal.call(unread_counter.seed, user1_id, {})
+
+    with client.websocket_connect(f"/ws/chat/{room_id}") as websocket:
+        for content in ("하나", "둘"):
+            websocket.send_json({"sender_id": user1_id, "content": content})
+            websocket.receive_json()
+
+    assert client.portal.call(unread_counter.get_room_counts, user2_id) == {room_id: 2}
+    assert client.portal.call(unread_counter.get_room_counts, user1_id) == {}
+
+
+def test_msgpack_subprotocol_round_trip(client: TestClient, db_session):
+    """msgpack subprotocol을 요청하면 바이너리 프레임으로 주고받는다"""
+    room_id = "test_room_msgpack"
+    user1_id = "user1_msgpack"
+    user2_id = "user2_msgpack"
+    _create_test_room(db_session, room_id, user1_id, user2_id)
+
+    with client.websocket_connect(f"/ws/chat/{room_id}", subprotocols=["msgpack"]) as websocket:
+        assert websocket.accepted_subprotocol == "msgpack"
+        websocket.send_bytes(msgpack.packb({"sender_id": user1_id, "content": "바이너리 안녕"}))
+        received = msgpack.unpackb(websocket.receive_bytes())
+        assert received["content"] == "바이너리 안녕"
+        assert received["sender_id"] == user1_id
+
+
+def test_malformed_frame_returns_error_and_keeps_connection(client: TestClient, db_session):
+    """잘못된 형식의 프레임은 에러로 응답하고 연결은 유지한다"""
+    room_id = "test_room_malformed"
+    user1_id = "user1_malformed"
+    user2_id = "user2_malformed"
+    _create_test_room(db_session, room_id, user1_id, user2_id)
+
+    with client.websocket_connect(f"/ws/chat/{room_id}") as websocket:
+        websocket.send_text("not json")
+        assert "error" in websocket.receive_json()
+
+        websocket.send_json({"sender_id": user1_id, "content": "still here"})
+        assert websocket.receive_json()["content"] == "still here"
+
+
+def test_message_saved_to_database(client: TestClient, db_session, writer):
     """Verify that messages sent via WebSocket are saved to the DB."""
     room_id = "test_room_db"
     sender_id = "user123_db"
@@ -75,8 +196,42 @@ def test_message_saved_to_database(client: TestClient, db_session):
         # We need to receive the message for the send operation to complete
         websocket.receive_json()
 
-    # The dependency override on the client ensures this query uses the same session
+    # 메시지는 write-behind 버퍼를 거쳐 저장되므로 flush 후 조회한다
+    client.portal.call(writer.flush)
     saved_message = db_session.query(ChatMessageModel).filter_by(room_id=room_id, sender_id=sender_id, content=content).one_or_none()
     assert saved_message is not None
     assert saved_message.sender_id == sender_id
     assert saved_message.content == content
+
+
+def test_concurrent_sockets_exceed_pool_size(client: TestClient, db_session, writer):
+    """소켓이 세션을 점유하지 않으므로 풀 크기보다 훨씬 많은 소켓이 동시에 메시지를 주고받을 수 있다"""
+    socket_count = 64
+    room_ids = [f"test_room_pool_{i}" for i in range(socket_count // 2)]
+    for i, room_id in enumerate(room_ids):
+        _create_test_room(db_session, room_id, f"pool_a_{i}", f"pool_b_{i}")
+
+    with ExitStack() as stack:
+        # 방마다 두 개의 소켓을 모두 연결해 둔 상태에서
+        sockets = []
+        for i, room_id in enumerate(room_ids):
+            for sender_id in (f"pool_a_{i}", f"pool_b_{i}"):
+                websocket = stack.enter_context(client.websocket_connect(f"/ws/chat/{room_id}"))
+                sockets.append((room_id, sender_id, websocket))
+        assert len(sockets) > POOL_SIZE * 30
+
+        # 모든 소켓이 메시지를 보내면
+        for room_id, sender_id, websocket in sockets:
+            websocket.send_json({"sender_id": sender_id, "content": f"hi from {sender_id}"})
+
+        # 각 소켓은 같은 방의 두 메시지(자신 + 상대)를 모두 받는다
+        for i, (room_id, sender_id, websocket) in enumerate(sockets):
+            received = {websocket.receive_json()["sender_id"] for _ in range(2)}
+            room_index = i // 2
+            assert received == {f"pool_a_{room_index}", f"pool_b_{room_index}"}
+
+    client.portal.call(writer.flush)
+    saved_count = db_session.query(ChatMessageModel).filter(
+        ChatMessageModel.room_id.in_(room_ids)
+    ).count()
+    assert saved_count == socket_count
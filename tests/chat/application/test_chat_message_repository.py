@@ -2,6 +2,7 @@ import pytest
 from datetime import datetime, timedelta
 
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
 from tests.chat.fixtures.fake_chat_message_repository import FakeChatMessageRepository
 
 
@@ -111,4 +112,76 @@ def test_find_messages_by_room_id_returns_empty_list_for_no_messages(repository)
     messages = repository.find_by_room_id("room-with-no-messages")
 
     # Then: 빈 리스트를 반환한다
-    assert messages == []
\ No newline at end of file
+    assert messages == []
+
+def test_save_all_saves_every_message(repository):
+    """save_all로 여러 메시지를 한 번에 저장할 수 있다"""
+    # Given: 여러 채팅방의 메시지 배치
+    messages = [
+        ChatMessage(id="msg-1", room_id="room-A", sender_id="user1", content="첫 번째"),
+        ChatMessage(id="msg-2", room_id="room-A", sender_id="user2", content="두 번째"),
+        ChatMessage(id="msg-3", room_id="room-B", sender_id="user1", content="다른 방"),
+    ]
+
+    # When: 배치로 저장하면
+    repository.save_all(messages)
+
+    # Then: 모든 메시지를 조회할 수 있다
+    assert [m.id for m in repository.find_by_room_id("room-A")] == ["msg-1", "msg-2"]
+    assert repository.find_by_id("msg-3") is not None
+
+
+def _save_room_messages(repository, room_id: str, count: int) -> list[ChatMessage]:
+    """시간 간격을 두고 count개의 메시지를 저장한다"""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    messages = [
+        ChatMessage(
+            id=f"msg-{i:03d}",
+            room_id=room_id,
+            sender_id="user1",
+            content=f"메시지 {i}",
+            created_at=base + timedelta(seconds=i)
+        )
+        for i in range(count)
+    ]
+    for message in messages:
+        repository.save(message)
+    return messages
+
+
+def test_find_page_by_room_id_returns_latest_messages_in_order(repository):
+    """커서 없이 조회하면 가장 최근 limit개의 메시지를 시간순으로 반환한다"""
+    _save_room_messages(repository, "room-A", 10)
+
+    messages = repository.find_page_by_room_id("room-A", 3)
+
+    assert [m.id for m in messages] == ["msg-007", "msg-008", "msg-009"]
+
+
+def test_find_page_by_room_id_before_cursor(repository):
+    """before 커서를 주면 커서 이전의 메시지만 반환한다"""
+    saved = _save_room_messages(repository, "room-A", 10)
+
+    messages = repository.find_page_by_room_id("room-A", 3, before=MessageCursor.of(saved[5]))
+
+    assert [m.id for m in messages] == ["msg-002", "msg-003", "msg-004"]
+
+
+def test_find_page_by_room_id_after_cursor(repository):
+    """after 커서를 주면 커서 이후의 메시지만 반환한다"""
+    saved = _save_room_messages(repository, "room-A", 10)
+
+    messages = repository.find_page_by_room_id("room-A", 3, after=MessageCursor.of(saved[5]))
+
+    assert [m.id for m in messages] == ["msg-006", "msg-007", "msg-008"]
+
+
+def test_find_page_by_room_id_breaks_created_at_ties_by_id(repository):
+    """created_at이 같은 메시지는 id 순서로 커서를 넘어간다"""
+    same_time = datetime(2025, 1, 1, 12, 0, 0)
+    for message_id in ["msg-a", "msg-b", "msg-c"]:
+        repository.save(ChatMessage(id=message_id, room_id="room-A", sender_id="user1", content="동시", created_at=same_time))
+
+    messages = repository.find_page_by_room_id("room-A", 10, before=MessageCursor(same_time, "msg-c"))
+
+    assert [m.id for m in messages] == ["msg-a", "msg-b"]
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
 from app.chat.application.use_case.get_chat_history_use_case import GetChatHistoryUseCase
 from tests.chat.fixtures.fake_chat_message_repository import FakeChatMessageRepository
 
@@ -98,3 +99,77 @@ class TestGetChatHistoryUseCase:
         assert len(messages) == 1
         assert messages[0].id == "msg-1"
         assert messages[0].room_id == "room-1"
+
+
+class TestGetChatHistoryPageUseCase:
+    """GetChatHistoryUseCase 커서 페이지 조회 테스트"""
+
+    def _setup_messages(self, count: int) -> FakeChatMessageRepository:
+        repository = FakeChatMessageRepository()
+        base = datetime(2025, 1, 1, 12, 0, 0)
+        for i in range(count):
+            repository.save(ChatMessage(
+                id=f"msg-{i:03d}",
+                room_id="room-1",
+                sender_id="user-1",
+                content=f"Message {i}",
+                created_at=base + timedelta(seconds=i)
+            ))
+        return repository
+
+    def test_first_page_returns_latest_messages_with_next_cursor(self):
+        """첫 페이지는 최신 메시지를 시간순으로 반환하고 다음 커서를 포함한다"""
+        # Given: 5개의 메시지
+        use_case = GetChatHistoryUseCase(self._setup_messages(5))
+
+        # When: 2개씩 조회한다
+        page = use_case.execute_page("room-1", limit=2)
+
+        # Then: 최신 2개가 시간순으로 반환되고 다음 페이지가 있다
+        assert [m.id for m in page.messages] == ["msg-003", "msg-004"]
+        assert page.has_more is True
+        assert page.next_cursor is not None
+
+    def test_scroll_back_with_next_cursor_until_exhausted(self):
+        """next_cursor로 계속 이전 페이지를 조회하면 모든 메시지를 중복 없이 순회한다"""
+        # Given: 5개의 메시지
+        use_case = GetChatHistoryUseCase(self._setup_messages(5))
+
+        # When: next_cursor가 없을 때까지 이전 페이지를 조회한다
+        pages = [use_case.execute_page("room-1", limit=2)]
+        while pages[-1].next_cursor:
+            pages.append(use_case.execute_page("room-1", limit=2, before=pages[-1].next_cursor))
+
+        # Then: 3 페이지에 걸쳐 모든 메시지가 반환된다
+        assert [[m.id for m in p.messages] for p in pages] == [
+            ["msg-003", "msg-004"],
+            ["msg-001", "msg-002"],
+            ["msg-000"],
+        ]
+        assert pages[-1].has_more is False
+
+    def test_after_cursor_returns_newer_messages(self):
+        """after 커서로 조회하면 커서 이후의 메시지를 반환한다"""
+        # Given: 5개의 메시지와 두 번째 메시지를 가리키는 커서
+        repository = self._setup_messages(5)
+        use_case = GetChatHistoryUseCase(repository)
+        cursor = MessageCursor.of(repository.find_by_id("msg-001")).encode()
+
+        # When: after 커서로 2개를 조회한다
+        page = use_case.execute_page("room-1", limit=2, after=cursor)
+
+        # Then: 커서 이후 2개가 반환되고 다음 커서는 마지막 메시지를 가리킨다
+        assert [m.id for m in page.messages] == ["msg-002", "msg-003"]
+        assert page.has_more is True
+        assert MessageCursor.decode(page.next_cursor).message_id == "msg-003"
+
+    def test_invalid_arguments_raise_value_error(self):
+        """잘못된 limit, 커서, before/after 동시 지정은 ValueError가 발생한다"""
+        use_case = GetChatHistoryUseCase(self._setup_messages(1))
+
+        with pytest.raises(ValueError):
+            use_case.execute_page("room-1", limit=0)
+        with pytest.raises(ValueError):
+            use_case.execute_page("room-1", limit=10, before="invalid")
+        with pytest.raises(ValueError):
+            use_case.execute_page("room-1", limit=10, before="a", after="b")
@@ -3,9 +3,13 @@ import pytest
 
 from app.chat.domain.chat_room import ChatRoom
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room_summary import ChatRoomSummary
 from app.chat.application.use_case.get_my_chat_rooms_use_case import GetMyChatRoomsUseCase
+from app.chat.application.use_case.mark_chat_room_as_read_use_case import MarkChatRoomAsReadUseCase
+from app.chat.application.use_case.save_chat_message_use_case import SaveChatMessageUseCase
 from tests.chat.fixtures.fake_chat_room_repository import FakeChatRoomRepository
 from tests.chat.fixtures.fake_chat_message_repository import FakeChatMessageRepository
+from tests.chat.fixtures.fake_chat_room_summary_repository import FakeChatRoomSummaryRepository
 
 
 class TestGetMyChatRoomsUseCase:
@@ -167,3 +171,66 @@ class TestGetMyChatRoomsUseCase:
 
         # Then: 빈 리스트가 반환된다
         assert rooms == []
+
+
+class TestGetMyChatRoomsWithSummaryUseCase:
+    """요약 프로젝션을 사용하는 GetMyChatRoomsUseCase 테스트"""
+
+    def _setup(self):
+        room_repository = FakeChatRoomRepository()
+        message_repository = FakeChatMessageRepository()
+        summary_repository = FakeChatRoomSummaryRepository()
+        room_repository.save(ChatRoom(id="room-1", user1_id="user-1", user2_id="user-2"))
+        return room_repository, message_repository, summary_repository
+
+    def test_room_without_summary_is_rebuilt_from_messages_and_saved(self):
+        """요약이 없는 기존 채팅방은 메시지로부터 재구성되어 저장된다"""
+        # Given: 요약 없이 메시지만 있는 채팅방
+        room_repository, message_repository, summary_repository = self._setup()
+        message_repository.save(ChatMessage(id="msg-1", room_id="room-1", sender_id="user-2", content="안녕"))
+        use_case = GetMyChatRoomsUseCase(room_repository, message_repository, summary_repository)
+
+        # When: 채팅방 목록을 조회한다
+        rooms = use_case.execute("user-1")
+
+        # Then: 메시지 기반으로 계산되고, 요약이 백필된다
+        assert rooms[0].latest_message.id == "msg-1"
+        assert rooms[0].unread_count == 1
+        assert summary_repository.find_by_room_id("room-1") is not None
+
+    def test_room_list_is_served_from_summary_without_scanning_messages(self):
+        """요약이 있으면 메시지 저장소를 조회하지 않고 요약으로 응답한다"""
+        # Given: 메시지 저장과 함께 요약이 증분 갱신된 채팅방
+        room_repository, message_repository, summary_repository = self._setup()
+        summary_repository.save(ChatRoomSummary(room_id="room-1", user1_id="user-1", user2_id="user-2"))
+        save_use_case = SaveChatMessageUseCase(message_repository, summary_repository)
+        save_use_case.execute(message_id="msg-1", room_id="room-1", sender_id="user-2", content="첫 메시지")
+        save_use_case.execute(message_id="msg-2", room_id="room-1", sender_id="user-2", content="두 번째")
+
+        message_repository.find_by_room_id = lambda room_id: pytest.fail("메시지 전체 조회가 발생하면 안 됩니다")
+        use_case = GetMyChatRoomsUseCase(room_repository, message_repository, summary_repository)
+
+        # When: 채팅방 목록을 조회한다
+        rooms = use_case.execute("user-1")
+
+        # Then: 요약의 최신 메시지와 unread가 반환된다
+        assert rooms[0].latest_message.id == "msg-2"
+        assert rooms[0].latest_message.content == "두 번째"
+        assert rooms[0].unread_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mark_as_read_resets_summary_unread(self):
+        """읽음 처리하면 요약의 unread가 초기화된다"""
+        # Given: user-1에게 읽지 않은 메시지가 있는 채팅방
+        room_repository, message_repository, summary_repository = self._setup()
+        summary_repository.save(ChatRoomSummary(room_id="room-1", user1_id="user-1", user2_id="user-2"))
+        SaveChatMessageUseCase(message_repository, summary_repository).execute(
+            message_id="msg-1", room_id="room-1", sender_id="user-2", content="안녕"
+        )
+
+        # When: user-1이 읽음 처리한다
+        await MarkChatRoomAsReadUseCase(room_repository, summary_repository).execute("room-1", "user-1")
+
+        # Then: unread가 0이 된다
+        rooms = GetMyChatRoomsUseCase(room_repository, message_repository, summary_repository).execute("user-1")
+        assert rooms[0].unread_count == 0
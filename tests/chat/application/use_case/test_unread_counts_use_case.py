@@ -0,0 +1,143 @@
+import threading
+
+import pytest
+from datetime import datetime, timedelta
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room import ChatRoom
+from app.chat.domain.read_watermark import ReadWatermark
+from app.chat.application.use_case.get_unread_counts_use_case import GetUnreadCountsUseCase
+from app.chat.application.use_case.mark_chat_room_as_read_use_case import MarkChatRoomAsReadUseCase
+from app.chat.application.use_case.persist_read_watermarks_use_case import PersistReadWatermarksUseCase
+from tests.chat.fixtures.fake_chat_message_repository import FakeChatMessageRepository
+from tests.chat.fixtures.fake_chat_room_repository import FakeChatRoomRepository
+from tests.chat.fixtures.fake_chat_room_summary_repository import FakeChatRoomSummaryRepository
+from tests.chat.fixtures.fake_unread_counter import FakeUnreadCounter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def room_repository():
+    repository = FakeChatRoomRepository()
+    repository.save(ChatRoom(id="room-1", user1_id="user-1", user2_id="user-2"))
+    repository.save(ChatRoom(id="room-2", user1_id="user-1", user2_id="user-3"))
+    return repository
+
+
+@pytest.fixture
+def message_repository():
+    repository = FakeChatMessageRepository()
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    repository.save(ChatMessage(id="msg-1", room_id="room-1", sender_id="user-2", content="안녕", created_at=base))
+    repository.save(ChatMessage(
+        id="msg-2", room_id="room-2", sender_id="user-3", content="반가워", created_at=base + timedelta(seconds=1)
+    ))
+    repository.save(ChatMessage(
+        id="msg-3", room_id="room-2", sender_id="user-3", content="뭐해?", created_at=base + timedelta(seconds=2)
+    ))
+    return repository
+
+
+@pytest.fixture
+def unread_counter():
+    return FakeUnreadCounter()
+
+
+def _use_case(unread_counter, room_repository, message_repository):
+    return GetUnreadCountsUseCase(
+        unread_counter, room_repository, message_repository, FakeChatRoomSummaryRepository()
+    )
+
+
+async def test_first_lookup_seeds_counters_from_messages(unread_counter, room_repository, message_repository):
+    """카운터가 없는 사용자는 최초 조회 시 MySQL 데이터로부터 초기화된다"""
+    # When
+    total = await _use_case(unread_counter, room_repository, message_repository).execute_total("user-1")
+
+    # Then
+    assert total == 3
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 1, "room-2": 2}
+
+
+async def test_seeded_counters_are_read_without_mysql(unread_counter, room_repository, message_repository):
+    """초기화된 이후에는 Redis 카운터만으로 배지 수를 계산한다"""
+    # Given: 카운터가 초기화된 뒤 새 메시지가 들어왔다
+    use_case = _use_case(unread_counter, room_repository, message_repository)
+    await use_case.execute("user-1")
+    await unread_counter.increment("room-1", "user-1", "msg-4")
+    room_repository.find_by_user_id = lambda user_id: pytest.fail("채팅방 조회가 발생하면 안 됩니다")
+
+    # When
+    total = await use_case.execute_total("user-1")
+
+    # Then
+    assert total == 4
+
+
+async def test_seed_and_mark_read_query_mysql_off_the_event_loop(unread_counter, room_repository, message_repository):
+    """초기화와 읽음 처리의 MySQL 조회는 이벤트 루프 스레드가 아닌 스레드 풀에서 실행된다"""
+    # Given
+    loop_thread = threading.get_ident()
+    query_threads = []
+    find_by_user_id, find_by_id = room_repository.find_by_user_id, room_repository.find_by_id
+    room_repository.find_by_user_id = lambda user_id: query_threads.append(threading.get_ident()) or find_by_user_id(user_id)
+    room_repository.find_by_id = lambda room_id: query_threads.append(threading.get_ident()) or find_by_id(room_id)
+
+    # When
+    await _use_case(unread_counter, room_repository, message_repository).execute("user-1")
+    await MarkChatRoomAsReadUseCase(room_repository, unread_counter=unread_counter).execute("room-2", "user-1")
+
+    # Then
+    assert len(query_threads) == 2
+    assert loop_thread not in query_threads
+
+
+async def test_increment_before_seed_is_counted_once(unread_counter, room_repository, message_repository):
+    """초기화 전에 들어온 메시지는 이미 저장되었으면 요약으로, 아직 버퍼에 있으면 카운터로 한 번만 센다"""
+    # Given: room-2의 저장된 메시지(msg-3)와 아직 저장되지 않은 메시지(msg-4)가 초기화 전에 들어왔다
+    await unread_counter.increment("room-2", "user-1", "msg-3")
+    await unread_counter.increment("room-2", "user-1", "msg-4")
+
+    # When
+    total = await _use_case(unread_counter, room_repository, message_repository).execute_total("user-1")
+
+    # Then
+    assert total == 4
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 1, "room-2": 3}
+
+
+async def test_mark_read_resets_counter_and_defers_room_write(unread_counter, room_repository, message_repository):
+    """카운터 저장소가 있으면 읽음 처리는 카운터만 초기화하고 채팅방 행은 저장하지 않는다"""
+    # Given
+    await _use_case(unread_counter, room_repository, message_repository).execute("user-1")
+    room_repository.save = lambda room: pytest.fail("읽음 처리 시 채팅방을 저장하면 안 됩니다")
+
+    # When
+    await MarkChatRoomAsReadUseCase(room_repository, unread_counter=unread_counter).execute("room-2", "user-1")
+
+    # Then
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 1, "room-2": 0}
+    watermarks = await unread_counter.pop_read_watermarks()
+    assert [(w.room_id, w.user_id) for w in watermarks] == [("room-2", "user-1")]
+
+
+async def test_mark_read_rejects_non_participant(unread_counter, room_repository):
+    """참여자가 아니면 읽음 처리할 수 없다"""
+    with pytest.raises(ValueError):
+        await MarkChatRoomAsReadUseCase(room_repository, unread_counter=unread_counter).execute("room-1", "user-9")
+
+
+async def test_persist_read_watermarks_only_moves_forward(room_repository):
+    """워터마크는 기존 값보다 이후인 경우에만 MySQL에 반영된다"""
+    # Given
+    later = datetime(2025, 1, 2, 12, 0, 0)
+    earlier = datetime(2025, 1, 1, 12, 0, 0)
+    use_case = PersistReadWatermarksUseCase(room_repository)
+
+    # When
+    use_case.execute([ReadWatermark("room-1", "user-1", later)])
+    use_case.execute([ReadWatermark("room-1", "user-1", earlier)])
+
+    # Then
+    assert room_repository.find_by_id("room-1").user1_last_read_at == later
@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime, timedelta
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room import ChatRoom
+from app.chat.domain.chat_room_summary import ChatRoomSummary
+
+
+def _message(message_id: str, sender_id: str, created_at: datetime, content: str = "hi") -> ChatMessage:
+    return ChatMessage(id=message_id, room_id="room-1", sender_id=sender_id, content=content, created_at=created_at)
+
+
+def test_apply_message_updates_last_message_and_recipient_unread():
+    """새 메시지를 반영하면 최신 메시지가 갱신되고 수신자의 unread만 증가한다"""
+    # Given: 빈 요약
+    summary = ChatRoomSummary(room_id="room-1", user1_id="user-1", user2_id="user-2")
+    now = datetime.now()
+
+    # When: user-1이 2개, user-2가 1개의 메시지를 보내면
+    summary.apply_message(_message("msg-1", "user-1", now))
+    summary.apply_message(_message("msg-2", "user-1", now + timedelta(seconds=1)))
+    summary.apply_message(_message("msg-3", "user-2", now + timedelta(seconds=2), "마지막"))
+
+    # Then: 최신 메시지는 msg-3, user-2의 unread는 2, user-1의 unread는 1
+    assert summary.get_last_message().id == "msg-3"
+    assert summary.get_last_message().content == "마지막"
+    assert summary.get_unread_count("user-2") == 2
+    assert summary.get_unread_count("user-1") == 1
+
+
+def test_apply_older_message_does_not_replace_last_message():
+    """늦게 도착한 과거 메시지는 최신 메시지를 덮어쓰지 않는다"""
+    summary = ChatRoomSummary(room_id="room-1", user1_id="user-1", user2_id="user-2")
+    now = datetime.now()
+
+    summary.apply_message(_message("msg-new", "user-1", now))
+    summary.apply_message(_message("msg-old", "user-1", now - timedelta(seconds=5)))
+
+    assert summary.last_message_id == "msg-new"
+    assert summary.get_unread_count("user-2") == 2
+
+
+def test_mark_read_resets_only_reader_unread():
+    """읽음 처리하면 해당 사용자의 unread만 0이 된다"""
+    summary = ChatRoomSummary(
+        room_id="room-1", user1_id="user-1", user2_id="user-2",
+        user1_unread_count=3, user2_unread_count=4
+    )
+
+    summary.mark_read("user-1")
+
+    assert summary.get_unread_count("user-1") == 0
+    assert summary.get_unread_count("user-2") == 4
+
+
+def test_preview_is_truncated():
+    """최신 메시지 미리보기는 최대 길이로 잘린다"""
+    summary = ChatRoomSummary(room_id="room-1", user1_id="user-1", user2_id="user-2")
+
+    summary.apply_message(_message("msg-1", "user-1", datetime.now(), "가" * 500))
+
+    assert len(summary.last_message_preview) == ChatRoomSummary.PREVIEW_MAX_LENGTH
+
+
+def test_from_messages_matches_last_read_watermarks():
+    """전체 메시지로부터 재구성하면 마지막 읽은 시간 이후 상대 메시지만 unread로 센다"""
+    # Given: user-1은 msg-2까지 읽었고 user-2는 한 번도 읽지 않은 채팅방
+    now = datetime.now()
+    room = ChatRoom(id="room-1", user1_id="user-1", user2_id="user-2", user1_last_read_at=now - timedelta(minutes=5))
+    messages = [
+        _message("msg-1", "user-2", now - timedelta(minutes=10)),
+        _message("msg-2", "user-2", now - timedelta(minutes=6)),
+        _message("msg-3", "user-2", now - timedelta(minutes=1)),
+        _message("msg-4", "user-1", now),
+    ]
+
+    # When: 요약을 재구성하면
+    summary = ChatRoomSummary.from_messages(room, messages)
+
+    # Then
+    assert summary.last_message_id == "msg-4"
+    assert summary.get_unread_count("user-1") == 1
+    assert summary.get_unread_count("user-2") == 1
+
+
+def test_get_unread_count_for_non_participant_raises():
+    """참여자가 아닌 사용자의 unread를 조회하면 에러가 발생한다"""
+    summary = ChatRoomSummary(room_id="room-1", user1_id="user-1", user2_id="user-2")
+
+    with pytest.raises(ValueError):
+        summary.get_unread_count("user-3")
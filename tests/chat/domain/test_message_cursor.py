@@ -0,0 +1,40 @@
+import pytest
+from datetime import datetime
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
+
+
+def test_message_cursor_encode_and_decode_roundtrip():
+    """커서를 토큰으로 인코딩한 뒤 다시 디코딩하면 같은 커서가 된다"""
+    # Given: 메시지 위치를 가리키는 커서
+    cursor = MessageCursor(datetime(2025, 1, 1, 12, 30, 15, 123456), "msg-123")
+
+    # When: 인코딩 후 디코딩하면
+    token = cursor.encode()
+    decoded = MessageCursor.decode(token)
+
+    # Then: 원래 커서와 같다
+    assert decoded == cursor
+    assert "=" not in token
+
+
+def test_message_cursor_of_message():
+    """메시지로부터 커서를 생성할 수 있다"""
+    # Given: 메시지
+    created_at = datetime.now()
+    message = ChatMessage(id="msg-1", room_id="room-1", sender_id="user-1", content="hi", created_at=created_at)
+
+    # When: 커서를 생성하면
+    cursor = MessageCursor.of(message)
+
+    # Then: 메시지의 created_at과 id를 가리킨다
+    assert cursor.created_at == created_at
+    assert cursor.message_id == "msg-1"
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "!!!", "bm8tc2VwYXJhdG9y"])
+def test_message_cursor_decode_invalid_token_raises(token):
+    """유효하지 않은 토큰을 디코딩하면 ValueError가 발생한다"""
+    with pytest.raises(ValueError):
+        MessageCursor.decode(token)
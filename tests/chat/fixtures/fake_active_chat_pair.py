@@ -0,0 +1,24 @@
+from app.chat.application.port.active_chat_pair_port import ActiveChatPairPort
+
+
+class FakeActiveChatPair(ActiveChatPairPort):
+    """테스트용 Fake 활성 채팅 쌍 저장소"""
+
+    def __init__(self, seeded: bool = True):
+        self._pairs: set[frozenset[str]] = set()
+        self._seeded = seeded
+
+    async def add(self, user1_id: str, user2_id: str) -> None:
+        self._pairs.add(frozenset((user1_id, user2_id)))
+
+    async def remove(self, user1_id: str, user2_id: str) -> None:
+        self._pairs.discard(frozenset((user1_id, user2_id)))
+
+    async def contains(self, user1_id: str, user2_id: str) -> bool | None:
+        if not self._seeded:
+            return None
+        return frozenset((user1_id, user2_id)) in self._pairs
+
+    async def seed(self, pairs: list[tuple[str, str]]) -> None:
+        self._pairs = {frozenset(pair) for pair in pairs}
+        self._seeded = True
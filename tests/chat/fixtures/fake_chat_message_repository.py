@@ -1,5 +1,6 @@
 from app.chat.application.port.chat_message_repository_port import ChatMessageRepositoryPort
 from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.message_cursor import MessageCursor
 
 
 class FakeChatMessageRepository(ChatMessageRepositoryPort):
@@ -11,13 +12,45 @@ class FakeChatMessageRepository(ChatMessageRepositoryPort):
     def save(self, message: ChatMessage) -> None:
         self._messages[message.id] = message
 
+    def save_all(self, messages: list[ChatMessage]) -> None:
+        for message in messages:
+            self._messages[message.id] = message
+
     def find_by_id(self, message_id: str) -> ChatMessage | None:
         return self._messages.get(message_id)
 
+    def find_existing_ids(self, message_ids: list[str]) -> set[str]:
+        return {message_id for message_id in message_ids if message_id in self._messages}
+
     def find_by_room_id(self, room_id: str) -> list[ChatMessage]:
         messages = [
             msg for msg in self._messages.values()
             if msg.room_id == room_id
         ]
         # created_at 순으로 정렬
-        return sorted(messages, key=lambda m: m.created_at)
\ No newline at end of file
+        return sorted(messages, key=lambda m: m.created_at)
+
+    def find_page_by_room_id(
+        self,
+        room_id: str,
+        limit: int,
+        before: MessageCursor | None = None,
+        after: MessageCursor | None = None,
+    ) -> list[ChatMessage]:
+        if before is not None and after is not None:
+            raise ValueError("before와 after는 동시에 지정할 수 없습니다")
+
+        # (created_at, id) 키셋 순으로 정렬
+        messages = sorted(
+            (msg for msg in self._messages.values() if msg.room_id == room_id),
+            key=lambda m: (m.created_at, m.id)
+        )
+
+        if after is not None:
+            key = (after.created_at, after.message_id)
+            return [m for m in messages if (m.created_at, m.id) > key][:limit]
+
+        if before is not None:
+            key = (before.created_at, before.message_id)
+            messages = [m for m in messages if (m.created_at, m.id) < key]
+        return messages[-limit:] if limit > 0 else []
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from app.chat.application.port.chat_room_repository_port import ChatRoomRepositoryPort
 from app.chat.domain.chat_room import ChatRoom
 
@@ -11,6 +13,14 @@ class FakeChatRoomRepository(ChatRoomRepositoryPort):
     def save(self, room: ChatRoom) -> None:
         self._rooms[room.id] = room
 
+    def update_last_read_at(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        room = self._rooms.get(room_id)
+        if room is None or user_id not in (room.user1_id, room.user2_id):
+            return
+        last_read_at = room.get_last_read_at(user_id)
+        if last_read_at is None or last_read_at < read_at:
+            room.mark_read_by_user(user_id, read_at)
+
     def find_by_id(self, room_id: str) -> ChatRoom | None:
         return self._rooms.get(room_id)
 
@@ -35,4 +45,10 @@ class FakeChatRoomRepository(ChatRoomRepositoryPort):
             if (room.user1_id == user1_id and room.user2_id == user2_id) or \
                (room.user1_id == user2_id and room.user2_id == user1_id):
                 return room
-        return None
\ No newline at end of file
+        return None
+
+    def find_active_user_pairs(self) -> list[tuple[str, str]]:
+        return [
+            (room.user1_id, room.user2_id)
+            for room in self._rooms.values() if room.status == "active"
+        ]
@@ -0,0 +1,39 @@
+from app.chat.application.port.chat_room_summary_repository_port import ChatRoomSummaryRepositoryPort
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.domain.chat_room_summary import ChatRoomSummary
+
+
+class FakeChatRoomSummaryRepository(ChatRoomSummaryRepositoryPort):
+    """테스트용 Fake ChatRoomSummary 저장소"""
+
+    def __init__(self):
+        self._summaries: dict[str, ChatRoomSummary] = {}
+
+    def save(self, summary: ChatRoomSummary) -> None:
+        self._summaries[summary.room_id] = summary
+
+    def find_by_room_id(self, room_id: str) -> ChatRoomSummary | None:
+        return self._summaries.get(room_id)
+
+    def find_by_room_ids(self, room_ids: list[str]) -> dict[str, ChatRoomSummary]:
+        return {
+            room_id: self._summaries[room_id]
+            for room_id in room_ids
+            if room_id in self._summaries
+        }
+
+    def record_message(self, message: ChatMessage) -> bool:
+        summary = self._summaries.get(message.room_id)
+        if summary is None:
+            return False
+        summary.apply_message(message)
+        return True
+
+    def record_messages(self, messages: list[ChatMessage]) -> None:
+        for message in messages:
+            self.record_message(message)
+
+    def reset_unread(self, room_id: str, user_id: str) -> None:
+        summary = self._summaries.get(room_id)
+        if summary is not None:
+            summary.mark_read(user_id)
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from app.chat.application.port.unread_counter_port import UnreadCounterPort
+from app.chat.domain.read_watermark import ReadWatermark
+
+
+class FakeUnreadCounter(UnreadCounterPort):
+    """테스트용 Fake 읽지 않은 메시지 카운터"""
+
+    def __init__(self):
+        self._counts: dict[str, dict[str, int]] = {}
+        self._seeded: set[str] = set()
+        self._pending: dict[str, dict[str, str]] = {}
+        self._watermarks: dict[tuple[str, str], datetime] = {}
+
+    async def increment(self, room_id: str, user_id: str, message_id: str) -> None:
+        # 초기화 전에는 메시지 id를 보류해 두고, seed가 MySQL 요약이 세지 않은 것만 더한다
+        if user_id not in self._seeded:
+            self._pending.setdefault(user_id, {})[message_id] = room_id
+            return
+        counts = self._counts.setdefault(user_id, {})
+        counts[room_id] = counts.get(room_id, 0) + 1
+
+    async def mark_read(self, room_id: str, user_id: str, read_at: datetime) -> None:
+        self._counts.setdefault(user_id, {})[room_id] = 0
+        self._watermarks[(room_id, user_id)] = read_at
+        if user_id not in self._seeded:
+            pending = self._pending.get(user_id, {})
+            for message_id in [m for m, r in pending.items() if r == room_id]:
+                del pending[message_id]
+
+    async def get_room_counts(self, user_id: str) -> dict[str, int] | None:
+        if user_id not in self._seeded:
+            return None
+        return dict(self._counts.get(user_id, {}))
+
+    async def get_pending_message_ids(self, user_id: str) -> list[str]:
+        return list(self._pending.get(user_id, {}))
+
+    async def seed(self, user_id: str, counts: dict[str, int], counted_message_ids: set[str] | None = None) -> None:
+        if user_id in self._seeded:
+            return
+        user_counts = self._counts.setdefault(user_id, {})
+        seeded_rooms = set()
+        for room_id, count in counts.items():
+            if room_id not in user_counts:
+                user_counts[room_id] = count
+                seeded_rooms.add(room_id)
+        for message_id, room_id in self._pending.pop(user_id, {}).items():
+            if room_id in seeded_rooms and message_id in (counted_message_ids or set()):
+                continue
+            user_counts[room_id] = user_counts.get(room_id, 0) + 1
+        self._seeded.add(user_id)
+
+    async def pop_read_watermarks(self) -> list[ReadWatermark]:
+        watermarks = [
+            ReadWatermark(room_id, user_id, read_at)
+            for (room_id, user_id), read_at in self._watermarks.items()
+        ]
+        self._watermarks.clear()
+        return watermarks
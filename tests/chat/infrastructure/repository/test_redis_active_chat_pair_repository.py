@@ -0,0 +1,91 @@
+import os
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.chat.infrastructure.repository.redis_active_chat_pair_repository import RedisActiveChatPairRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def active_pairs():
+    client = aioredis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        decode_responses=True
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    repository = RedisActiveChatPairRepository(client)
+    repository.PAIRS_KEY = "test:chat:active_pairs"
+    repository.SEEDED_KEY = "test:chat:active_pairs:seeded"
+    repository.ADDED_KEY = "test:chat:active_pairs:added"
+    repository.REMOVED_KEY = "test:chat:active_pairs:removed"
+    repository.REBUILD_KEY = "test:chat:active_pairs:rebuild"
+    yield repository
+    await client.delete(
+        repository.PAIRS_KEY, repository.SEEDED_KEY,
+        repository.ADDED_KEY, repository.REMOVED_KEY, repository.REBUILD_KEY
+    )
+    await client.aclose()
+
+
+async def test_contains_is_none_until_seeded(active_pairs):
+    """초기화 전에는 None, 초기화 후에는 순서와 무관하게 포함 여부를 반환한다"""
+    # Given
+    before = await active_pairs.contains("user-a", "user-b")
+
+    # When
+    await active_pairs.seed([("user-b", "user-a")])
+
+    # Then
+    assert before is None
+    assert await active_pairs.contains("user-a", "user-b") is True
+    assert await active_pairs.contains("user-a", "user-c") is False
+    assert 0 < await active_pairs.redis.ttl(active_pairs.SEEDED_KEY) <= active_pairs.RESEED_SECONDS
+
+
+async def test_add_and_remove_keep_pairs_current(active_pairs):
+    """생성 시 추가되고, 나가기/차단 시 제거된다"""
+    # Given
+    await active_pairs.seed([("user-a", "user-b")])
+
+    # When
+    await active_pairs.add("user-c", "user-a")
+    await active_pairs.remove("user-b", "user-a")
+
+    # Then
+    assert await active_pairs.contains("user-a", "user-c") is True
+    assert await active_pairs.contains("user-a", "user-b") is False
+
+
+async def test_seed_replaces_stale_pairs(active_pairs):
+    """다시 초기화하면 MySQL에 없는 쌍(나가기/차단 갱신이 누락된 쌍)은 사라진다"""
+    # Given
+    await active_pairs.seed([("user-a", "user-stale")])
+
+    # When
+    await active_pairs.seed([])
+
+    # Then
+    assert await active_pairs.contains("user-a", "user-stale") is False
+
+
+async def test_seed_keeps_changes_made_after_snapshot(active_pairs):
+    """MySQL 스냅샷을 읽은 뒤 반영 전까지 생성/제거된 쌍은 초기화가 덮어쓰지 않는다"""
+    # Given: 스냅샷에는 a-b만 있고, 그 뒤 a-c 채팅방이 생성되고 a-b 채팅방은 나갔다
+    snapshot = [("user-a", "user-b")]
+    await active_pairs.add("user-a", "user-c")
+    await active_pairs.remove("user-a", "user-b")
+
+    # When
+    await active_pairs.seed(snapshot)
+
+    # Then
+    assert await active_pairs.contains("user-a", "user-c") is True
+    assert await active_pairs.contains("user-a", "user-b") is False
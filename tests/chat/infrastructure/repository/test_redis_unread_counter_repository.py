@@ -0,0 +1,86 @@
+import os
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.chat.infrastructure.repository.redis_unread_counter_repository import RedisUnreadCounterRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def unread_counter():
+    client = aioredis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        decode_responses=True
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    repository = RedisUnreadCounterRepository(client)
+    repository.UNREAD_KEY_PREFIX = "test:chat:unread:"
+    repository.PENDING_KEY_PREFIX = "test:chat:unread_pending:"
+    repository.WATERMARK_KEY = "test:chat:read_watermarks"
+    yield repository
+    await client.delete(
+        repository._get_key("user-1"), repository._get_pending_key("user-1"), repository.WATERMARK_KEY
+    )
+    await client.aclose()
+
+
+async def test_increment_before_seed_already_saved_is_not_counted_twice(unread_counter):
+    """초기화 전에 온 메시지가 이미 MySQL에 저장되어 요약이 셌다면 카운터에 다시 더하지 않는다"""
+    # Given: 초기화 전에 메시지가 도착했고, MySQL 요약은 그 메시지까지 3개로 센다
+    await unread_counter.increment("room-1", "user-1", "msg-3")
+
+    # When
+    await unread_counter.seed("user-1", {"room-1": 3}, {"msg-3"})
+
+    # Then
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 3}
+
+
+async def test_increment_before_seed_not_yet_saved_is_counted(unread_counter):
+    """초기화 전에 온 메시지가 아직 write-behind 버퍼에 있어 요약이 세지 못했다면 카운터가 센다"""
+    # Given
+    await unread_counter.increment("room-1", "user-1", "msg-4")
+    assert await unread_counter.get_pending_message_ids("user-1") == ["msg-4"]
+
+    # When: MySQL 요약은 msg-4를 모르는 채 3개로 센다
+    await unread_counter.seed("user-1", {"room-1": 3}, set())
+
+    # Then
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 4}
+    assert await unread_counter.get_pending_message_ids("user-1") == []
+
+
+async def test_increment_after_seed_adds_to_seeded_count(unread_counter):
+    """초기화 이후의 메시지는 요약 값 위에 더해진다"""
+    # Given
+    await unread_counter.seed("user-1", {"room-1": 3})
+
+    # When
+    await unread_counter.increment("room-1", "user-1", "msg-4")
+    await unread_counter.increment("room-2", "user-1", "msg-5")
+
+    # Then
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 4, "room-2": 1}
+
+
+async def test_read_before_seed_counts_later_messages(unread_counter):
+    """초기화 전에 읽음 처리한 방은 (아직 MySQL에 반영 안 된) 읽음 이후 메시지만 센다"""
+    # Given: 읽음 워터마크가 MySQL에 반영되기 전이라 요약은 여전히 5개로 센다
+    await unread_counter.increment("room-1", "user-1", "msg-4")
+    await unread_counter.mark_read("room-1", "user-1", datetime(2025, 1, 1, 12, 0, 0))
+    await unread_counter.increment("room-1", "user-1", "msg-5")
+
+    # When: 읽음 이후 메시지 msg-5는 이미 저장되어 요약에도 포함되어 있다
+    await unread_counter.seed("user-1", {"room-1": 5}, {"msg-4", "msg-5"})
+
+    # Then
+    assert await unread_counter.get_room_counts("user-1") == {"room-1": 1}
@@ -0,0 +1,243 @@
+import asyncio
+from functools import partial
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import sessionmaker
+
+import app.router  # noqa: F401  (모든 ORM 모델 등록)
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.infrastructure.model.chat_message_model import ChatMessageModel
+from app.chat.infrastructure.repository.mysql_chat_room_summary_repository import MySQLChatRoomSummaryRepository
+from app.chat.infrastructure.writer.buffered_chat_message_writer import (
+    BufferedChatMessageWriter,
+    ChatMessagePersistError,
+    persist_chat_messages,
+)
+from config.database import Base
+
+pytestmark = pytest.mark.asyncio
+
+
+def _message(index: int) -> ChatMessage:
+    return ChatMessage(
+        id=f"msg-{index}",
+        room_id="room-1",
+        sender_id="user-1",
+        content=f"message {index}"
+    )
+
+
+class RecordingPersist:
+    """배치 단위 저장 호출을 기록하는 persist 함수"""
+
+    def __init__(self, fail_times: int = 0, rejected_ids: tuple[str, ...] = ()):
+        self.batches: list[list[str]] = []
+        self.fail_times = fail_times
+        self.rejected_ids = rejected_ids
+
+    def __call__(self, messages: list[ChatMessage]) -> None:
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("db unavailable")
+        if any(message.id in self.rejected_ids for message in messages):
+            raise IntegrityError("INSERT INTO chat_messages", {}, Exception("Duplicate entry"))
+        self.batches.append([message.id for message in messages])
+
+    @property
+    def saved_ids(self) -> list[str]:
+        return [message_id for batch in self.batches for message_id in batch]
+
+
+async def test_writes_are_persisted_in_batches():
+    """연속으로 들어온 메시지는 배치 크기 단위로 묶여 저장된다"""
+    # Given
+    persist = RecordingPersist()
+    writer = BufferedChatMessageWriter(persist, max_batch_size=10, flush_interval_seconds=0.5)
+
+    # When
+    for i in range(25):
+        await writer.write(_message(i))
+    await writer.flush()
+
+    # Then
+    assert persist.saved_ids == [f"msg-{i}" for i in range(25)]
+    assert len(persist.batches) < 25
+    assert all(len(batch) <= 10 for batch in persist.batches)
+    assert writer.pending_count == 0
+    await writer.close()
+
+
+async def test_partial_batch_is_persisted_after_flush_interval():
+    """배치 크기에 못 미쳐도 flush 간격이 지나면 저장된다"""
+    # Given
+    persist = RecordingPersist()
+    writer = BufferedChatMessageWriter(persist, max_batch_size=100, flush_interval_seconds=0.01)
+
+    # When
+    await writer.write(_message(1))
+    await asyncio.sleep(0.2)
+
+    # Then
+    assert persist.batches == [["msg-1"]]
+    await writer.close()
+
+
+async def test_flush_waits_for_pending_messages():
+    """flush는 긴 flush 간격을 기다리지 않고 버퍼의 메시지를 즉시 저장한다"""
+    # Given
+    persist = RecordingPersist()
+    writer = BufferedChatMessageWriter(persist, max_batch_size=100, flush_interval_seconds=60)
+    await writer.write(_message(1))
+    await writer.write(_message(2))
+
+    # When
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    # Then
+    assert persist.saved_ids == ["msg-1", "msg-2"]
+    await writer.close()
+
+
+async def test_write_blocks_when_queue_is_full():
+    """큐가 가득 차면 write는 flusher가 자리를 비울 때까지 대기한다 (backpressure)"""
+    # Given: 저장이 막혀 있는 writer
+    release = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    saved = []
+
+    def blocking_persist(messages):
+        asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+        saved.extend(messages)
+
+    writer = BufferedChatMessageWriter(blocking_persist, max_batch_size=1, max_queue_size=2)
+    await writer.write(_message(0))
+    await asyncio.sleep(0.05)  # flusher가 첫 메시지를 꺼내 저장 중
+    await writer.write(_message(1))
+    await writer.write(_message(2))
+
+    # When
+    blocked_write = asyncio.create_task(writer.write(_message(3)))
+    await asyncio.sleep(0.05)
+
+    # Then
+    assert not blocked_write.done()
+    release.set()
+    await asyncio.wait_for(blocked_write, timeout=1)
+    await writer.close()
+    assert [message.id for message in saved] == ["msg-0", "msg-1", "msg-2", "msg-3"]
+
+
+async def test_failed_batch_is_retried():
+    """저장이 일시적으로 실패하면 재시도한다"""
+    # Given
+    persist = RecordingPersist(fail_times=1)
+    writer = BufferedChatMessageWriter(persist, flush_interval_seconds=0.01)
+    writer.RETRY_BACKOFF_SECONDS = 0
+
+    # When
+    await writer.write(_message(1))
+    await writer.flush()
+
+    # Then
+    assert persist.saved_ids == ["msg-1"]
+    assert writer.messages_dropped == 0
+    await writer.close()
+
+
+async def test_persistent_failure_is_reported_and_batch_is_kept():
+    """저장이 계속 실패하면 flush는 실패를 알리고, 배치는 저장된 것으로 세지 않고 성공할 때까지 재시도한다"""
+    # Given
+    persist = RecordingPersist(fail_times=6)
+    writer = BufferedChatMessageWriter(persist, flush_interval_seconds=0.01)
+    writer.MAX_RETRIES = 2
+    writer.RETRY_BACKOFF_SECONDS = writer.RETRY_BACKOFF_MAX_SECONDS = 0.01
+
+    # When
+    await writer.write(_message(1))
+    with pytest.raises(ChatMessagePersistError):
+        await writer.flush()
+    pending_while_failing = writer.pending_count
+
+    while True:
+        try:
+            await writer.flush()
+            break
+        except ChatMessagePersistError:
+            await asyncio.sleep(0.01)
+
+    # Then
+    assert pending_while_failing == 1
+    assert persist.saved_ids == ["msg-1"]
+    assert writer.pending_count == 0
+    assert writer.messages_dropped == 0
+    await writer.close()
+
+
+async def test_close_persists_remaining_messages():
+    """close는 남은 메시지를 저장한 뒤 종료한다"""
+    # Given
+    persist = RecordingPersist()
+    writer = BufferedChatMessageWriter(persist, max_batch_size=100, flush_interval_seconds=60)
+    await writer.write(_message(1))
+
+    # When
+    await writer.close()
+
+    # Then
+    assert persist.saved_ids == ["msg-1"]
+    assert writer.pending_count == 0
+
+
+async def test_unpersistable_message_is_dead_lettered_and_rest_of_batch_is_saved():
+    """재시도해도 성공할 수 없는 메시지만 dead letter로 옮기고, 같은 배치의 나머지와 이후 메시지는 저장한다"""
+    # Given
+    persist = RecordingPersist(rejected_ids=("msg-2",))
+    dead_letters = []
+
+    async def dead_letter(messages, error):
+        dead_letters.append(([message.id for message in messages], type(error)))
+
+    writer = BufferedChatMessageWriter(
+        persist, max_batch_size=10, flush_interval_seconds=60, dead_letter=dead_letter
+    )
+    for i in range(1, 4):
+        await writer.write(_message(i))
+
+    # When
+    await asyncio.wait_for(writer.flush(), timeout=1)
+    await writer.write(_message(4))
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    # Then
+    assert persist.saved_ids == ["msg-1", "msg-3", "msg-4"]
+    assert dead_letters == [(["msg-2"], IntegrityError)]
+    assert (writer.messages_dead_lettered, writer.messages_dropped, writer.pending_count) == (1, 0, 0)
+    await writer.close()
+
+
+async def test_persist_rolls_back_messages_when_summary_update_fails(tmp_path, monkeypatch):
+    """요약 갱신이 실패하면 메시지 INSERT도 롤백되어, 재시도가 중복 키 없이 성공한다"""
+    # Given
+    engine = create_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    record_messages = MySQLChatRoomSummaryRepository.record_messages
+
+    def failing_record_messages(self, messages, commit=True):
+        raise OperationalError("UPDATE chat_room_summaries", {}, Exception("lock wait timeout"))
+
+    monkeypatch.setattr(MySQLChatRoomSummaryRepository, "record_messages", failing_record_messages)
+    messages = [_message(1), _message(2)]
+    with pytest.raises(OperationalError):
+        persist_chat_messages(session_factory, messages)
+
+    # When
+    monkeypatch.setattr(MySQLChatRoomSummaryRepository, "record_messages", record_messages)
+    persist_chat_messages(session_factory, messages)
+
+    # Then
+    with session_factory() as db:
+        assert db.query(ChatMessageModel).count() == 2
+    engine.dispose()
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+import pytest
+
+from app.chat.domain.read_watermark import ReadWatermark
+from app.chat.infrastructure.writer.read_watermark_flusher import ReadWatermarkFlusher
+from tests.chat.fixtures.fake_unread_counter import FakeUnreadCounter
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingPersist:
+    def __init__(self, fail_times: int = 0):
+        self.calls: list[list[ReadWatermark]] = []
+        self.fail_times = fail_times
+
+    def __call__(self, watermarks: list[ReadWatermark]) -> None:
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("db unavailable")
+        self.calls.append(watermarks)
+
+
+async def test_flush_persists_pending_watermarks_in_one_batch():
+    """대기 중인 워터마크를 한 번에 MySQL에 반영한다"""
+    # Given
+    counter = FakeUnreadCounter()
+    read_at = datetime(2025, 1, 1, 12, 0, 0)
+    await counter.mark_read("room-1", "user-1", read_at)
+    await counter.mark_read("room-2", "user-1", read_at)
+    persist = RecordingPersist()
+    flusher = ReadWatermarkFlusher(counter, persist)
+
+    # When
+    flushed = await flusher.flush()
+
+    # Then
+    assert flushed == 2
+    assert len(persist.calls) == 1
+    assert await flusher.flush() == 0
+
+
+async def test_failed_flush_is_retried_on_next_tick():
+    """반영에 실패한 워터마크는 다음 flush에서 다시 시도한다"""
+    # Given
+    counter = FakeUnreadCounter()
+    await counter.mark_read("room-1", "user-1", datetime(2025, 1, 1, 12, 0, 0))
+    persist = RecordingPersist(fail_times=1)
+    flusher = ReadWatermarkFlusher(counter, persist)
+
+    # When
+    first = await flusher.flush()
+    second = await flusher.flush()
+
+    # Then
+    assert (first, second) == (0, 1)
+    assert [w.room_id for w in persist.calls[0]] == ["room-1"]
+
+
+async def test_close_flushes_remaining_watermarks():
+    """종료 시 남은 워터마크를 반영한다"""
+    counter = FakeUnreadCounter()
+    persist = RecordingPersist()
+    flusher = ReadWatermarkFlusher(counter, persist, interval_seconds=60)
+    flusher.start()
+    await counter.mark_read("room-1", "user-1", datetime(2025, 1, 1, 12, 0, 0))
+
+    await flusher.close()
+
+    assert len(persist.calls) == 1
@@ -0,0 +1,50 @@
+import json
+import os
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+from sqlalchemy.exc import IntegrityError
+
+from app.chat.domain.chat_message import ChatMessage
+from app.chat.infrastructure.writer.redis_chat_message_dead_letter import RedisChatMessageDeadLetter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def dead_letter():
+    client = aioredis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        decode_responses=True
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    repository = RedisChatMessageDeadLetter(client)
+    repository.DEAD_LETTER_KEY = "test:chat:dead_letter"
+    repository.MAX_ENTRIES = 2
+    yield repository
+    await client.delete(repository.DEAD_LETTER_KEY)
+    await client.aclose()
+
+
+async def test_push_keeps_message_and_error_up_to_max_entries(dead_letter):
+    """메시지와 실패 사유를 보관하고, 최대 개수를 넘으면 오래된 항목부터 잘린다"""
+    # Given
+    messages = [
+        ChatMessage(id=f"msg-{i}", room_id="room-1", sender_id="user-1", content=f"message {i}")
+        for i in range(3)
+    ]
+
+    # When
+    await dead_letter.push(messages, IntegrityError("INSERT", {}, Exception("Duplicate entry")))
+
+    # Then
+    entries = [json.loads(raw) for raw in await dead_letter.redis.lrange(dead_letter.DEAD_LETTER_KEY, 0, -1)]
+    assert [entry["id"] for entry in entries] == ["msg-1", "msg-2"]
+    assert entries[0]["content"] == "message 1"
+    assert entries[0]["error"].startswith("IntegrityError")
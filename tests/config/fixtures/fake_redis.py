@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
+
+
+class FakeRedisPubSub:
+    def __init__(self, server: "FakeRedisServer"):
+        self._server = server
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.channels: set[str] = set()
+
+    async def subscribe(self, channel: str):
+        self.channels.add(channel)
+        self._server.pubsubs.add(self)
+
+    async def unsubscribe(self, channel: str):
+        self.channels.discard(channel)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0):
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        self._server.pubsubs.discard(self)
+
+
+class FakeRedisScript:
+    """
+    register_script 대역. Lua를 실행할 수 없으므로 등록된 스크립트 본문별로 같은 동작을 파이썬으로 흉내 낸다.
+    (부하 테스트 경로에서 쓰는 매칭 상태 스크립트만 지원)
+    """
+
+    def __init__(self, client: "FakeRedisClient", script: str):
+        self._client = client
+        self._run = {
+            RedisMatchStateAdapter.SET_QUEUED_SCRIPT: self._set_queued,
+            RedisMatchStateAdapter.SET_CHATTING_SCRIPT: self._set_chatting,
+        }.get(script)
+
+    async def __call__(self, keys=(), args=()):
+        if self._run is None:
+            raise NotImplementedError("FakeRedisClient does not emulate this script")
+        return self._run(self._client._server.values, list(keys), list(args))
+
+    @staticmethod
+    def _set_queued(values: dict, keys: list, args: list) -> int:
+        current = values.get(keys[0])
+        if current and json.loads(current)["state"] in ("chatting", "matched"):
+            return 0
+        values[keys[0]] = args[0]
+        return 1
+
+    @staticmethod
+    def _set_chatting(values: dict, keys: list, args: list) -> int:
+        current = json.loads(values[keys[0]]) if keys[0] in values else {}
+        values[keys[0]] = json.dumps({
+            "user_id": args[0],
+            "state": "chatting",
+            "mbti": current.get("mbti"),
+            "room_id": args[1],
+            "partner_id": current.get("partner_id"),
+        })
+        return 1
+
+
+class FakeRedisServer:
+    """여러 워커가 공유하는 로컬 Redis 대역 (pub/sub + 문자열 키)"""
+
+    def __init__(self):
+        self.pubsubs: set[FakeRedisPubSub] = set()
+        self.values: dict[str, str] = {}
+
+    def client(self) -> "FakeRedisClient":
+        return FakeRedisClient(self)
+
+
+class FakeRedisClient:
+    def __init__(self, server: FakeRedisServer):
+        self._server = server
+
+    def register_script(self, script: str) -> FakeRedisScript:
+        return FakeRedisScript(self, script)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakeRedisPubSub:
+        return FakeRedisPubSub(self._server)
+
+    async def publish(self, channel: str, message: str) -> int:
+        receivers = [p for p in self._server.pubsubs if channel in p.channels]
+        for pubsub in receivers:
+            pubsub._queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+    async def get(self, key: str):
+        return self._server.values.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None):
+        self._server.values[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._server.values.pop(key, None) is not None)
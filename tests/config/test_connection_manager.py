@@ -0,0 +1,286 @@
+import asyncio
+import msgpack
+import pytest
+
+from config.connection_manager import ConnectionManager
+from config.message_broker import InMemoryMessageBroker, RedisMessageBroker
+from config.websocket_codec import MESSAGEPACK_CODEC, encode_json
+from tests.config.fixtures.fake_redis import FakeRedisServer
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeWebSocket:
+    """send_text로 받은 메시지를 기록하는 테스트용 WebSocket"""
+
+    def __init__(self):
+        self.accepted = False
+        self.closed_code: int | None = None
+        self.sent: list[str] = []
+
+    async def accept(self, subprotocol: str | None = None):
+        self.accepted = True
+        self.subprotocol = subprotocol
+
+    async def send_text(self, message: str):
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+
+class StalledWebSocket(FakeWebSocket):
+    """send_text가 release 전까지 끝나지 않는 느린 소켓"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def send_text(self, message: str):
+        await self.release.wait()
+        self.sent.append(message)
+
+
+async def _drain_send_queues():
+    """소켓별 writer 태스크가 큐에 쌓인 프레임을 보낼 때까지 이벤트 루프를 양보한다"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_broadcast_reaches_sockets_on_other_workers():
+    """같은 브로커를 공유하는 다른 워커의 소켓에도 broadcast가 전달된다"""
+    # Given: 두 워커(ConnectionManager)가 하나의 브로커를 공유하고, 같은 방의 소켓이 각 워커에 있다
+    broker = InMemoryMessageBroker()
+    worker_a, worker_b = ConnectionManager(broker), ConnectionManager(broker)
+    ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+    await worker_a.connect(ws_a, "room-1")
+    await worker_b.connect(ws_b, "room-1")
+
+    # When: 워커 A에서 broadcast 한다
+    await worker_a.broadcast("hello", "room-1")
+    await _drain_send_queues()
+
+    # Then: 두 소켓 모두 메시지를 받는다
+    assert ws_a.sent == ["hello"]
+    assert ws_b.sent == ["hello"]
+
+
+async def test_send_to_user_reaches_user_on_other_worker():
+    """다른 워커에 연결된 사용자에게도 send_to_user가 전달된다"""
+    broker = InMemoryMessageBroker()
+    worker_a, worker_b = ConnectionManager(broker), ConnectionManager(broker)
+    ws_user = FakeWebSocket()
+    await worker_b.connect(ws_user, "match_waiting_user-1", "user-1")
+
+    await worker_a.send_to_user("user-1", "matched")
+    await _drain_send_queues()
+
+    assert ws_user.sent == ["matched"]
+
+
+async def test_disconnect_unsubscribes_when_last_local_socket_leaves():
+    """워커의 마지막 로컬 소켓이 나가면 채널 구독을 해제하고 빈 방을 정리한다"""
+    broker = InMemoryMessageBroker()
+    manager = ConnectionManager(broker)
+    ws = FakeWebSocket()
+    await manager.connect(ws, "room-1", "user-1")
+
+    assert manager.disconnect(ws, "room-1") == "user-1"
+    await asyncio.sleep(0)
+
+    assert "room-1" not in manager.active_connections
+    assert await broker.publish("ws:room:room-1", "x") == 0
+    assert await broker.publish("ws:user:user-1", "x") == 0
+
+
+async def test_reconnect_before_unsubscribe_keeps_subscription():
+    """구독 해제 전에 다시 연결하면 구독이 유지된다"""
+    broker = InMemoryMessageBroker()
+    manager = ConnectionManager(broker)
+    first, second = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(first, "room-1")
+
+    manager.disconnect(first, "room-1")
+    await manager.connect(second, "room-1")
+    await asyncio.sleep(0)
+
+    await manager.broadcast("still here", "room-1")
+    await _drain_send_queues()
+    assert second.sent == ["still here"]
+
+
+async def test_redis_broker_fans_out_between_workers():
+    """Redis 브로커를 쓰는 두 워커 간에 room 메시지가 전달된다"""
+    # Given: 같은 Redis를 바라보는 두 워커
+    server = FakeRedisServer()
+    worker_a = ConnectionManager(RedisMessageBroker(server.client()))
+    worker_b = ConnectionManager(RedisMessageBroker(server.client()))
+    ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+    await worker_a.connect(ws_a, "room-1")
+    await worker_b.connect(ws_b, "room-1")
+
+    try:
+        # When: 워커 A에서 broadcast 한다
+        await worker_a.broadcast("hi", "room-1")
+        for _ in range(10):
+            if ws_a.sent and ws_b.sent:
+                break
+            await asyncio.sleep(0.01)
+
+        # Then: 두 워커의 소켓 모두 받는다
+        assert ws_a.sent == ["hi"]
+        assert ws_b.sent == ["hi"]
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+async def test_slow_socket_does_not_block_broadcast_to_others():
+    """한 소켓의 전송이 멈춰도 broadcast는 대기하지 않고 다른 소켓에 전달된다"""
+    # Given: 같은 방에 전송이 멈춘 소켓과 정상 소켓이 있다
+    manager = ConnectionManager(InMemoryMessageBroker())
+    stalled, healthy = StalledWebSocket(), FakeWebSocket()
+    await manager.connect(stalled, "room-1")
+    await manager.connect(healthy, "room-1")
+
+    # When: 여러 메시지를 broadcast 한다
+    for i in range(3):
+        await asyncio.wait_for(manager.broadcast(f"m{i}", "room-1"), timeout=0.1)
+    await _drain_send_queues()
+
+    # Then: 정상 소켓은 모두 받고, 멈춘 소켓의 프레임은 큐에 남아 있다
+    assert healthy.sent == ["m0", "m1", "m2"]
+    assert stalled.sent == []
+    assert manager.queue_depth() == 2  # 첫 프레임은 전송 중
+
+    stalled.release.set()
+    await _drain_send_queues()
+    assert stalled.sent == ["m0", "m1", "m2"]
+    assert manager.get_stats()["frames_sent"] == 6
+
+
+async def test_frames_are_dropped_when_send_queue_is_full():
+    """송신 큐가 가득 차면 프레임을 버리고 드롭 수를 센다"""
+    # Given: 송신 큐 크기가 2인 매니저와 멈춘 소켓
+    manager = ConnectionManager(InMemoryMessageBroker(), send_queue_size=2, max_dropped_frames=100)
+    stalled = StalledWebSocket()
+    await manager.connect(stalled, "room-1")
+
+    # When: 첫 프레임 전송이 멈춘 상태에서 5개를 더 보낸다
+    await manager.broadcast("first", "room-1")
+    await _drain_send_queues()
+    for i in range(5):
+        await manager.broadcast(f"m{i}", "room-1")
+
+    # Then: 큐에 들어간 2개 외에는 드롭된다
+    stats = manager.get_stats()
+    assert stats["queue_depth"] == 2
+    assert stats["frames_dropped"] == 3
+    assert stats["evicted_connections"] == 0
+    assert stalled.closed_code is None
+
+
+async def test_slow_consumer_is_closed_after_too_many_dropped_frames():
+    """연속 드롭이 한도를 넘으면 느린 소비자의 연결을 닫고 더 이상 전달하지 않는다"""
+    # Given: 송신 큐 1, 연속 드롭 한도 3
+    manager = ConnectionManager(InMemoryMessageBroker(), send_queue_size=1, max_dropped_frames=3)
+    stalled, healthy = StalledWebSocket(), FakeWebSocket()
+    await manager.connect(stalled, "room-1")
+    await manager.connect(healthy, "room-1")
+
+    # When: 멈춘 소켓의 큐가 넘치도록 보낸다
+    for i in range(10):
+        await manager.broadcast(f"m{i}", "room-1")
+        await _drain_send_queues()
+
+    # Then: 멈춘 소켓은 1013(Try Again Later)으로 닫히고, 정상 소켓은 모두 받는다
+    stats = manager.get_stats()
+    assert stalled.closed_code == 1013
+    assert stats["evicted_connections"] == 1
+    assert stats["frames_dropped"] == 3
+    assert healthy.sent == [f"m{i}" for i in range(10)]
+
+
+async def test_send_to_user_reaches_every_device_of_user():
+    """한 사용자가 여러 소켓(탭/기기)으로 연결되어 있으면 모두에게 전달된다"""
+    # Given: 같은 사용자가 두 개의 소켓으로 연결되어 있다
+    manager = ConnectionManager(InMemoryMessageBroker())
+    first_tab, second_tab = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(first_tab, "room-1", "user-1")
+    await manager.connect(second_tab, "room-2", "user-1")
+
+    # When
+    await manager.send_to_user("user-1", "matched")
+    await _drain_send_queues()
+
+    # Then: 두 번째 연결이 첫 번째를 덮어쓰지 않는다
+    assert first_tab.sent == ["matched"]
+    assert second_tab.sent == ["matched"]
+
+
+async def test_disconnect_keeps_user_until_last_device_leaves():
+    """사용자의 마지막 소켓이 끊길 때까지 사용자 연결과 구독이 유지된다"""
+    broker = InMemoryMessageBroker()
+    manager = ConnectionManager(broker)
+    first_tab, second_tab = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(first_tab, "room-1", "user-1")
+    await manager.connect(second_tab, "room-1", "user-1")
+
+    assert manager.disconnect(first_tab, "room-1") == "user-1"
+    await asyncio.sleep(0)
+    assert manager.is_user_connected("user-1")
+    assert manager.active_connections["room-1"] == {second_tab}
+    assert await broker.publish("ws:user:user-1", "x") == 1
+
+    assert manager.disconnect(second_tab, "room-1") == "user-1"
+    await asyncio.sleep(0)
+    assert not manager.is_user_connected("user-1")
+    assert manager.active_connections == {}
+    assert manager.user_connections == {}
+
+
+async def test_register_user_moves_socket_between_users():
+    """이미 다른 사용자로 등록된 소켓을 재등록하면 이전 사용자에서 제거된다"""
+    manager = ConnectionManager(InMemoryMessageBroker())
+    ws = FakeWebSocket()
+    await manager.connect(ws, "room-1", "user-1")
+
+    await manager.register_user("user-2", "room-1", ws)
+
+    assert "user-1" not in manager.user_connections
+    assert manager.get_user_room("user-2") == "room-1"
+    assert manager.disconnect(ws, "room-1") == "user-2"
+
+
+class BinaryWebSocket(FakeWebSocket):
+    """send_bytes로 받은 프레임을 기록하는 msgpack 클라이언트 소켓"""
+
+    def __init__(self):
+        super().__init__()
+        self.sent_bytes: list[bytes] = []
+
+    async def send_bytes(self, data: bytes):
+        self.sent_bytes.append(data)
+
+
+async def test_broadcast_encodes_once_per_codec():
+    """같은 방의 소켓들은 코덱별로 한 번 인코딩된 같은 프레임 객체를 받는다"""
+    # Given: JSON 소켓 2개와 msgpack 소켓 2개가 같은 방에 있다
+    manager = ConnectionManager(InMemoryMessageBroker())
+    text_sockets = [FakeWebSocket(), FakeWebSocket()]
+    binary_sockets = [BinaryWebSocket(), BinaryWebSocket()]
+    for ws in text_sockets:
+        await manager.connect(ws, "room-1")
+    for ws in binary_sockets:
+        await manager.connect(ws, "room-1", codec=MESSAGEPACK_CODEC)
+
+    # When
+    await manager.broadcast(encode_json({"content": "hi"}), "room-1")
+    await _drain_send_queues()
+
+    # Then: msgpack 소켓은 subprotocol로 accept되고, 같은 bytes 객체를 공유한다
+    assert binary_sockets[0].subprotocol == "msgpack"
+    assert msgpack.unpackb(binary_sockets[0].sent_bytes[0]) == {"content": "hi"}
+    assert binary_sockets[0].sent_bytes[0] is binary_sockets[1].sent_bytes[0]
+    assert text_sockets[0].sent == ['{"content":"hi"}']
+    assert text_sockets[0].sent[0] is text_sockets[1].sent[0]
@@ -0,0 +1,50 @@
+import time
+
+import pytest
+
+from config.connection_manager import ConnectionManager
+from config.message_broker import InMemoryMessageBroker
+from tests.config.test_connection_manager import FakeWebSocket
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+# 측정용 연결/해제 횟수
+SAMPLE_SIZE = 1000
+
+
+async def _fill(manager: ConnectionManager, count: int) -> list[FakeWebSocket]:
+    """방마다 두 소켓씩 count개의 소켓을 연결해 둔다"""
+    sockets = []
+    for i in range(count):
+        ws = FakeWebSocket()
+        await manager.connect(ws, f"room-{i // 2}", f"user-{i}")
+        sockets.append(ws)
+    return sockets
+
+
+async def _connect_disconnect_cost(manager: ConnectionManager) -> float:
+    """이미 추적 중인 소켓 수와 상관없이, SAMPLE_SIZE개의 connect + disconnect 평균 시간(초)"""
+    sockets = [FakeWebSocket() for _ in range(SAMPLE_SIZE)]
+    started = time.perf_counter()
+    for i, ws in enumerate(sockets):
+        await manager.connect(ws, f"bench-room-{i // 2}", f"bench-user-{i}")
+    for i, ws in enumerate(sockets):
+        manager.disconnect(ws, f"bench-room-{i // 2}")
+    return (time.perf_counter() - started) / SAMPLE_SIZE
+
+
+async def test_connect_disconnect_cost_is_flat_at_100k_sockets(capsys):
+    """추적 중인 소켓이 1천 개일 때와 10만 개일 때 connect/disconnect 비용이 같은 수준이다"""
+    costs = {}
+    for tracked in (1_000, 100_000):
+        manager = ConnectionManager(InMemoryMessageBroker())
+        await _fill(manager, tracked)
+        costs[tracked] = await _connect_disconnect_cost(manager)
+        await manager.close()
+
+    with capsys.disabled():
+        for tracked, cost in costs.items():
+            print(f"\n[benchmark] {tracked:>7} tracked sockets: {cost * 1e6:.1f} us per connect+disconnect")
+
+    # 선형 탐색이면 100배 차이가 나야 하므로, 측정 잡음을 감안해 3배 이내면 평탄한 것으로 본다
+    assert costs[100_000] < costs[1_000] * 3
@@ -0,0 +1,59 @@
+import msgpack
+import pytest
+
+from config.websocket_codec import (
+    JSON_CODEC,
+    MESSAGEPACK_CODEC,
+    encode_json,
+    negotiate_codec,
+)
+
+
+class ScopeOnlyWebSocket:
+    def __init__(self, subprotocols: list[str]):
+        self.scope = {"subprotocols": subprotocols}
+
+
+def test_negotiate_defaults_to_json():
+    """subprotocol을 요청하지 않으면 JSON 텍스트 프로토콜을 사용한다"""
+    assert negotiate_codec(ScopeOnlyWebSocket([])) is JSON_CODEC
+    assert negotiate_codec(ScopeOnlyWebSocket(["unknown"])) is JSON_CODEC
+
+
+def test_negotiate_msgpack_subprotocol():
+    """msgpack subprotocol을 요청하면 MessagePack 코덱을 사용한다"""
+    codec = negotiate_codec(ScopeOnlyWebSocket(["unknown", "msgpack"]))
+
+    assert codec is MESSAGEPACK_CODEC
+    assert codec.subprotocol == "msgpack"
+
+
+def test_json_broadcast_message_is_reused_as_frame():
+    """JSON 소켓은 한 번 인코딩된 브로드캐스트 문자열을 그대로 프레임으로 쓴다"""
+    message = encode_json({"content": "안녕하세요", "sender_id": "user-1"})
+
+    assert JSON_CODEC.from_json(message) is message
+    assert JSON_CODEC.decode(message) == {"content": "안녕하세요", "sender_id": "user-1"}
+
+
+def test_msgpack_frame_round_trip():
+    """MessagePack 프레임은 같은 페이로드로 디코딩되고 JSON보다 작다"""
+    payload = {"id": "msg-1", "room_id": "room-1", "sender_id": "user-1", "content": "hi", "created_at": "2025-01-01T12:00:00"}
+
+    frame = MESSAGEPACK_CODEC.from_json(encode_json(payload))
+
+    assert isinstance(frame, bytes)
+    assert MESSAGEPACK_CODEC.decode(frame) == payload
+    assert len(frame) < len(encode_json(payload).encode("utf-8"))
+
+
+@pytest.mark.parametrize("codec, frame", [
+    (JSON_CODEC, "not json"),
+    (JSON_CODEC, "[1, 2]"),
+    (MESSAGEPACK_CODEC, b"\xc1"),
+    (MESSAGEPACK_CODEC, msgpack.packb([1, 2])),
+])
+def test_decode_rejects_malformed_frames(codec, frame):
+    """형식이 잘못된 프레임은 ValueError로 거부한다"""
+    with pytest.raises(ValueError):
+        codec.decode(frame)
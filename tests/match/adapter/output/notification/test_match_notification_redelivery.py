@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from redis.exceptions import ResponseError
+from starlette.testclient import TestClient
+
+from app.match.adapter.input.web.match_router import get_match_notification_outbox
+from app.match.adapter.input.web.match_websocket_router import match_websocket_router
+from app.match.adapter.output.notification.websocket_match_notification_adapter import WebSocketMatchNotificationAdapter
+from config.connection_manager import manager as connection_manager
+from tests.match.fixtures.fake_match_notification_outbox import FakeMatchNotificationOutbox
+
+
+@pytest.fixture
+def outbox():
+    return FakeMatchNotificationOutbox()
+
+
+@pytest.fixture
+def client(outbox):
+    connection_manager.user_connections.clear()
+    connection_manager.active_connections.clear()
+    app = FastAPI()
+    app.include_router(match_websocket_router)
+    app.dependency_overrides[get_match_notification_outbox] = lambda: outbox
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_notification_missed_while_disconnected_is_replayed_on_connect(client, outbox):
+    """
+    [아웃박스] 알림 순간 소켓이 없던 유저는 연결 직후 밀린 알림을 받고, ack 하면 다시 받지 않는다.
+    """
+    # Given: 유저가 연결되어 있지 않을 때 매칭 알림이 발생
+    adapter = WebSocketMatchNotificationAdapter(connection_manager, outbox)
+    payload = {"status": "matched", "roomId": "room-1"}
+    await adapter.notify_match_success("user-a", payload)
+
+    # When: 유저가 연결하고 받은 알림을 ack
+    with client.websocket_connect("/ws/match/user-a") as ws:
+        replayed = json.loads(ws.receive_text())
+        ws.send_text(json.dumps({"type": "ack", "notificationId": replayed["notificationId"]}))
+
+    # Then
+    assert replayed == {**payload, "notificationId": "1-0"}
+    assert await outbox.get_pending("user-a") == []
+
+
+@pytest.mark.asyncio
+async def test_connected_user_receives_notification_with_id_and_keeps_it_until_ack(client, outbox):
+    """
+    [아웃박스] 연결된 유저는 알림을 바로 받고, ack 하기 전까지 알림은 아웃박스에 남는다.
+    """
+    # Given
+    adapter = WebSocketMatchNotificationAdapter(connection_manager, outbox)
+
+    with client.websocket_connect("/ws/match/user-a") as ws:
+        # When
+        await adapter.notify_match_success("user-a", {"status": "matched", "roomId": "room-1"})
+        received = json.loads(ws.receive_text())
+
+        # Then
+        assert received["roomId"] == "room-1"
+        assert [notification_id for notification_id, _ in await outbox.get_pending("user-a")] == [
+            received["notificationId"]
+        ]
+
+    # 재연결하면 ack 하지 않은 알림을 다시 받는다
+    with client.websocket_connect("/ws/match/user-a") as ws:
+        assert json.loads(ws.receive_text()) == received
+
+
+
+class StrictAckOutbox(FakeMatchNotificationOutbox):
+    """Redis처럼 스트림 ID 형식이 아닌 ID를 ack 하면 ResponseError를 내는 아웃박스"""
+
+    async def ack(self, user_id, notification_ids):
+        if any("-" not in notification_id for notification_id in notification_ids):
+            raise ResponseError("Invalid stream ID specified as stream command argument")
+        return await super().ack(user_id, notification_ids)
+
+
+@pytest.mark.asyncio
+async def test_failed_ack_keeps_connection_and_disconnect_cleans_up():
+    """
+    [아웃박스] ack 처리 중 Redis 에러가 나도 연결은 계속 ack를 받고, 연결이 끊기면 등록된 소켓이 정리된다.
+    """
+    # Given
+    outbox = StrictAckOutbox()
+    notification_id = await outbox.append("user-a", {"status": "matched", "roomId": "room-1"})
+    connection_manager.user_connections.clear()
+    connection_manager.active_connections.clear()
+    app = FastAPI()
+    app.include_router(match_websocket_router)
+    app.dependency_overrides[get_match_notification_outbox] = lambda: outbox
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/match/user-a") as ws:
+            ws.receive_text()
+
+            # When: 잘못된 ID로 ack 한 뒤 올바른 ID로 다시 ack
+            ws.send_text(json.dumps({"type": "ack", "notificationId": "garbage"}))
+            ws.send_text(json.dumps({"type": "ack", "notificationId": notification_id}))
+            acked = client.portal.call(_wait_until_acked, outbox, "user-a")
+
+    # Then
+    assert acked
+    assert "match_waiting_user-a" not in connection_manager.active_connections
+    assert "user-a" not in connection_manager.user_connections
+
+
+async def _wait_until_acked(outbox, user_id):
+    for _ in range(50):
+        if not await outbox.get_pending(user_id):
+            return True
+        await asyncio.sleep(0.01)
+    return False
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.match.adapter.output.notification.redis_match_notification_outbox import RedisMatchNotificationOutbox
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def outbox():
+    client = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"), decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    outbox = RedisMatchNotificationOutbox(client, ttl_seconds=60)
+    outbox.key_prefix = "test:match:outbox:"
+    yield outbox
+    keys = [key async for key in client.scan_iter("test:match:outbox:*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+async def test_pending_notifications_are_kept_in_order_until_acked(outbox):
+    """알림은 ack 될 때까지 순서대로 남아 있고, ack 한 알림만 지워진다"""
+    # Given
+    first_id = await outbox.append("user-a", {"status": "matched", "roomId": "room-1"})
+    second_id = await outbox.append("user-a", {"status": "matched", "roomId": "room-2"})
+    await outbox.append("user-b", {"status": "matched", "roomId": "room-3"})
+
+    # When
+    pending = await outbox.get_pending("user-a")
+    removed = await outbox.ack("user-a", [first_id, "0-1"])
+
+    # Then
+    assert pending == [
+        (first_id, {"status": "matched", "roomId": "room-1"}),
+        (second_id, {"status": "matched", "roomId": "room-2"}),
+    ]
+    assert removed == 1
+    assert await outbox.get_pending("user-a") == [(second_id, {"status": "matched", "roomId": "room-2"})]
+    assert len(await outbox.get_pending("user-b")) == 1
+
+
+async def test_malformed_notification_ids_are_ignored_on_ack(outbox):
+    """클라이언트가 보낸 ID가 스트림 ID 형식이 아니면 에러 없이 무시하고 나머지만 ack 한다"""
+    # Given
+    notification_id = await outbox.append("user-a", {"status": "matched", "roomId": "room-1"})
+
+    # When
+    removed = await outbox.ack("user-a", ["not-an-id", "abc", notification_id])
+
+    # Then
+    assert removed == 1
+    assert await outbox.get_pending("user-a") == []
+
+
+async def test_outbox_expires_when_user_never_reconnects(outbox):
+    """마지막 알림 이후 TTL이 지나면 스트림이 사라지도록 만료 시간이 걸린다"""
+    # When
+    await outbox.append("user-a", {"status": "matched"})
+
+    # Then
+    assert 0 < await outbox.redis.ttl(outbox._get_key("user-a")) <= 60
@@ -1,7 +1,8 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from app.match.adapter.output.chat.chat_client_adapter import ChatClientAdapter
+from tests.chat.fixtures.fake_active_chat_pair import FakeActiveChatPair
 
 
 @pytest.mark.asyncio
@@ -49,4 +50,100 @@ async def test_chat_adapter_calls_usecase_correctly():
         assert isinstance(call_args["timestamp"], datetime)
 
         # DB 세션이 닫혔는지 확인
-        mock_db.close.assert_called_once()
\ No newline at end of file
+        mock_db.close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_are_users_partners_uses_active_pairs_without_db():
+    """
+    활성 채팅 쌍 저장소가 초기화되어 있으면 MySQL 세션을 열지 않고 판단한다
+    """
+    # Given
+    active_pairs = FakeActiveChatPair()
+    await active_pairs.add("user_b", "user_a")
+    adapter = ChatClientAdapter(active_pairs)
+
+    with patch("app.match.adapter.output.chat.chat_client_adapter.get_db_session") as mock_get_db:
+        # When
+        partners = await adapter.are_users_partners("user_a", "user_b")
+        strangers = await adapter.are_users_partners("user_a", "user_c")
+
+        # Then
+        assert (partners, strangers) == (True, False)
+        mock_get_db.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_are_users_partners_seeds_active_pairs_once():
+    """
+    활성 채팅 쌍 저장소가 비어 있으면 MySQL의 활성 채팅방 목록으로 한 번 채운 뒤 판단한다
+    """
+    # Given
+    active_pairs = FakeActiveChatPair(seeded=False)
+    adapter = ChatClientAdapter(active_pairs)
+
+    with patch("app.match.adapter.output.chat.chat_client_adapter.get_db_session"), \
+            patch("app.match.adapter.output.chat.chat_client_adapter.MySQLChatRoomRepository") as mock_repo_cls:
+        mock_repo_cls.return_value.find_active_user_pairs.return_value = [("user_a", "user_b")]
+
+        # When
+        first = await adapter.are_users_partners("user_b", "user_a")
+        second = await adapter.are_users_partners("user_a", "user_c")
+
+        # Then
+        assert (first, second) == (True, False)
+        mock_repo_cls.return_value.find_active_user_pairs.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_chat_room_records_active_pair():
+    """
+    채팅방을 만들면 두 유저가 활성 채팅 쌍으로 기록된다
+    """
+    # Given
+    active_pairs = FakeActiveChatPair()
+    adapter = ChatClientAdapter(active_pairs)
+    payload = {
+        "roomId": "room_123",
+        "users": [{"userId": "user_a", "mbti": "INFP"}, {"userId": "user_b", "mbti": "ENFJ"}],
+        "timestamp": datetime.now().isoformat()
+    }
+
+    with patch("app.match.adapter.output.chat.chat_client_adapter.get_db_session"), \
+            patch("app.match.adapter.output.chat.chat_client_adapter.MySQLChatRoomRepository"), \
+            patch("app.match.adapter.output.chat.chat_client_adapter.CreateChatRoomUseCase") as mock_usecase_cls:
+        mock_usecase_cls.return_value.execute.return_value = "room_123"
+
+        # When
+        result = await adapter.create_chat_room(payload)
+
+    # Then
+    assert result == "room_123"
+    assert await active_pairs.contains("user_b", "user_a")
+
+
+@pytest.mark.asyncio
+async def test_create_chat_room_returns_room_id_when_active_pair_update_fails():
+    """
+    채팅방은 만들어졌는데 활성 채팅 쌍 기록(Redis)이 실패해도 방 ID를 돌려준다
+    """
+    # Given
+    active_pairs = FakeActiveChatPair()
+    active_pairs.add = AsyncMock(side_effect=ConnectionError("redis down"))
+    adapter = ChatClientAdapter(active_pairs)
+    payload = {
+        "roomId": "room_123",
+        "users": [{"userId": "user_a", "mbti": "INFP"}, {"userId": "user_b", "mbti": "ENFJ"}],
+        "timestamp": datetime.now().isoformat()
+    }
+
+    with patch("app.match.adapter.output.chat.chat_client_adapter.get_db_session"), \
+            patch("app.match.adapter.output.chat.chat_client_adapter.MySQLChatRoomRepository"), \
+            patch("app.match.adapter.output.chat.chat_client_adapter.CreateChatRoomUseCase") as mock_usecase_cls:
+        mock_usecase_cls.return_value.execute.return_value = "room_old"
+
+        # When
+        result = await adapter.create_chat_room(payload)
+
+    # Then
+    assert result == "room_old"
+    active_pairs.add.assert_awaited_once_with("user_a", "user_b")
@@ -0,0 +1,91 @@
+import pytest
+
+from app.match.adapter.output.persistence.match_queue_compactor import MatchQueueCompactor
+from tests.match.fixtures.fake_compactable_match_queue import FakeCompactableMatchQueue
+
+pytestmark = pytest.mark.asyncio
+
+
+def _queue_with_ghosts(mbti: str, size: int, cancel_every: int) -> FakeCompactableMatchQueue:
+    """size명 중 cancel_every번째마다 취소된(유령) 티켓을 가진 대기열"""
+    queue = FakeCompactableMatchQueue()
+    for i in range(size):
+        queue.enqueue(f"{mbti}-{i}", mbti)
+        if i % cancel_every == 0:
+            queue.cancel(f"{mbti}-{i}", mbti)
+    return queue
+
+
+async def test_run_once_removes_ghost_tickets_and_keeps_order():
+    """유령 티켓만 제거되고 유효한 티켓의 순서는 유지된다"""
+    # Given
+    queue = _queue_with_ghosts("INFP", size=30, cancel_every=3)
+    compactor = MatchQueueCompactor(queue, budget_seconds=10, chunk_size=7, mbti_list=["INFP"])
+
+    # When
+    removed = await compactor.run_once()
+
+    # Then
+    assert removed == 10
+    assert queue.lists["INFP"] == [f"INFP-{i}" for i in range(30) if i % 3 != 0]
+    assert compactor.tickets_removed == 10
+
+
+async def test_run_once_is_incremental_within_budget():
+    """예산이 없으면 한 번에 한 구간만 정리하고, 다음 실행에서 이어서 정리한다"""
+    # Given
+    queue = _queue_with_ghosts("INFP", size=20, cancel_every=2)
+    compactor = MatchQueueCompactor(queue, budget_seconds=0, chunk_size=5, mbti_list=["INFP"])
+
+    # When: 첫 실행은 첫 구간(5개)만 정리한다
+    first = await compactor.run_once()
+
+    # Then
+    assert first == 3
+    assert queue.compact_calls == 1
+    assert len(queue.lists["INFP"]) == 17
+
+    # When: 나머지는 이어지는 실행들에서 정리된다
+    while len(queue.lists["INFP"]) > 10:
+        await compactor.run_once()
+
+    # Then
+    assert queue.lists["INFP"] == [f"INFP-{i}" for i in range(20) if i % 2 != 0]
+    assert compactor.tickets_removed == 10
+
+
+async def test_run_once_moves_to_next_mbti_after_finishing_a_list():
+    """한 대기열을 끝까지 정리하면 다음 MBTI 대기열로 넘어간다"""
+    # Given
+    queue = FakeCompactableMatchQueue()
+    for mbti in ("INFP", "ENFJ"):
+        for i in range(4):
+            queue.enqueue(f"{mbti}-{i}", mbti)
+            if i % 2 == 0:
+                queue.cancel(f"{mbti}-{i}", mbti)
+    compactor = MatchQueueCompactor(queue, budget_seconds=10, chunk_size=10, mbti_list=["INFP", "ENFJ"])
+
+    # When
+    removed = await compactor.run_once()
+
+    # Then
+    assert removed == 4
+    assert queue.lists == {"INFP": ["INFP-1", "INFP-3"], "ENFJ": ["ENFJ-1", "ENFJ-3"]}
+
+
+async def test_stats_expose_ghost_ratio_per_mbti():
+    """MBTI별 유령 티켓 비율을 지표로 노출한다"""
+    # Given
+    queue = _queue_with_ghosts("INFP", size=8, cancel_every=2)
+    compactor = MatchQueueCompactor(queue, budget_seconds=10, chunk_size=10, mbti_list=["INFP", "ENFJ"])
+
+    # When
+    before = await compactor.refresh_ghost_ratios()
+    await compactor.run_once()
+    stats = compactor.get_stats()
+
+    # Then
+    assert before == {"INFP": 0.5, "ENFJ": 0.0}
+    assert stats["ghost_ratios"] == {"INFP": 0.0, "ENFJ": 0.0}
+    assert stats["runs"] == 1
+    assert stats["tickets_removed"] == 4
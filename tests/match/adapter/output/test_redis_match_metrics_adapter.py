@@ -0,0 +1,54 @@
+import os
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.match.adapter.output.persistence.redis_match_metrics_adapter import RedisMatchMetricsAdapter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def metrics_adapter():
+    client = aioredis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        decode_responses=True
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    adapter = RedisMatchMetricsAdapter(client)
+    adapter.histogram_key = "test:match:stats:wait_histogram"
+    yield adapter
+    await client.delete(adapter.histogram_key)
+    await client.aclose()
+
+
+async def test_record_match_waits_accumulates_per_level(metrics_adapter):
+    """대기 시간이 궁합 단계별 구간에 누적되고, 평균 대기 시간도 함께 계산된다"""
+    # When
+    await metrics_adapter.record_match_waits([(3.0, 1), (20.0, 1)])
+    await metrics_adapter.record_match_waits([(400.0, 3)])
+
+    # Then
+    histogram = await metrics_adapter.get_wait_histogram()
+    assert histogram["buckets"][-1] == "inf"
+    level_1 = histogram["levels"]["1"]
+    assert (level_1["counts"]["5"], level_1["counts"]["30"], level_1["counts"]["15"]) == (1, 1, 0)
+    assert (level_1["count"], level_1["mean_seconds"]) == (2, 11.5)
+    assert histogram["levels"]["3"]["counts"]["inf"] == 1
+    assert "2" not in histogram["levels"]
+
+
+async def test_empty_histogram(metrics_adapter):
+    """기록이 없으면 구간 목록만 있고 단계별 데이터는 비어 있다"""
+    # When
+    histogram = await metrics_adapter.get_wait_histogram()
+
+    # Then
+    assert histogram["levels"] == {}
+    assert len(histogram["buckets"]) == 7
@@ -0,0 +1,130 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+# 대기열에 남겨둘 유령 티켓(취소된 유저) 수와 유효한 티켓 수
+GHOST_TICKETS = 5_000
+VALID_TICKETS = 500
+
+MBTI_UNDER_TEST = MBTI("INFP")
+
+
+class ClientSideMatchQueueAdapter(RedisMatchQueueAdapter):
+    """비교 기준: Lua 스크립트 도입 전의 클라이언트 측 구현 (티켓마다 LPOP → SREM 왕복)"""
+
+    async def enqueue(self, ticket: MatchTicket) -> None:
+        list_key = self._get_list_key(ticket.mbti)
+        set_key = self._get_set_key(ticket.mbti)
+        if await self.redis.sismember(set_key, ticket.user_id):
+            raise ValueError("이미 대기열에 등록된 유저입니다.")
+        async with self.redis.pipeline() as pipe:
+            pipe.sadd(set_key, ticket.user_id)
+            pipe.rpush(list_key, self._serialize(ticket))
+            await pipe.execute()
+
+    async def dequeue(self, mbti: MBTI) -> Optional[MatchTicket]:
+        list_key = self._get_list_key(mbti)
+        set_key = self._get_set_key(mbti)
+        while True:
+            data = await self.redis.lpop(list_key)
+            if not data:
+                return None
+            ticket = self._deserialize(data)
+            if await self.redis.srem(set_key, ticket.user_id):
+                return ticket
+
+
+@pytest_asyncio.fixture
+async def redis_client():
+    client = aioredis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        decode_responses=True
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    key_prefix = "bench:match:queue:"
+    yield client, key_prefix
+    keys = [key async for key in client.scan_iter(f"{key_prefix}*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+async def _fill_with_ghosts(adapter: RedisMatchQueueAdapter) -> None:
+    """유효한 티켓마다 앞쪽에 유령 티켓을 고르게 섞어 넣는다"""
+    ghosts_per_ticket = GHOST_TICKETS // VALID_TICKETS
+    for i in range(VALID_TICKETS):
+        for j in range(ghosts_per_ticket):
+            ghost_id = f"ghost-{i}-{j}"
+            await adapter.enqueue(MatchTicket(user_id=ghost_id, mbti=MBTI_UNDER_TEST))
+            await adapter.remove(ghost_id, MBTI_UNDER_TEST)
+        await adapter.enqueue(MatchTicket(user_id=f"user-{i}", mbti=MBTI_UNDER_TEST))
+
+
+async def _drain(adapter: RedisMatchQueueAdapter) -> tuple[list[str], float]:
+    """대기열이 빌 때까지 dequeue 하고 (꺼낸 유저 목록, 초당 dequeue 수)를 반환한다"""
+    user_ids = []
+    started = time.perf_counter()
+    while (ticket := await adapter.dequeue(MBTI_UNDER_TEST)) is not None:
+        user_ids.append(ticket.user_id)
+    elapsed = time.perf_counter() - started
+    return user_ids, len(user_ids) / elapsed
+
+
+async def test_lua_dequeue_outperforms_client_side_loop_with_ghost_tickets(redis_client, capsys):
+    """유령 티켓이 가득한 대기열에서 Lua dequeue가 같은 순서로 더 많은 ops/sec를 낸다"""
+    client, key_prefix = redis_client
+    results = {}
+
+    for name, adapter_class in (("client-side", ClientSideMatchQueueAdapter), ("lua", RedisMatchQueueAdapter)):
+        # Given
+        adapter = adapter_class(client)
+        adapter.key_prefix = f"{key_prefix}{name}:"
+        await _fill_with_ghosts(adapter)
+
+        # When
+        results[name] = await _drain(adapter)
+
+    with capsys.disabled():
+        for name, (user_ids, ops) in results.items():
+            print(f"\n[benchmark] dequeue {name}: {ops:,.0f} ops/s "
+                  f"({len(user_ids)} tickets, {GHOST_TICKETS} ghosts)")
+
+    # Then
+    expected = [f"user-{i}" for i in range(VALID_TICKETS)]
+    assert results["client-side"][0] == expected
+    assert results["lua"][0] == expected
+    assert results["lua"][1] > results["client-side"][1]
+
+
+async def test_lua_enqueue_rejects_duplicates_atomically(redis_client):
+    """동시에 같은 유저를 등록해도 한 번만 대기열에 들어간다"""
+    # Given
+    client, key_prefix = redis_client
+    adapter = RedisMatchQueueAdapter(client)
+    adapter.key_prefix = f"{key_prefix}dup:"
+
+    # When
+    results = await asyncio.gather(
+        *(adapter.enqueue(MatchTicket(user_id="user-dup", mbti=MBTI_UNDER_TEST)) for _ in range(20)),
+        return_exceptions=True
+    )
+
+    # Then
+    assert sum(1 for r in results if r is None) == 1
+    assert await client.llen(adapter._get_list_key(MBTI_UNDER_TEST)) == 1
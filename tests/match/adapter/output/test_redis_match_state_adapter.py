@@ -0,0 +1,129 @@
+import os
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
+from app.match.application.port.output.match_state_port import MatchState
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def state_adapter():
+    client = aioredis.from_url(
+        os.getenv("REDIS_URL", "redis://localhost:6379"),
+        decode_responses=True
+    )
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    adapter = RedisMatchStateAdapter(client)
+    adapter.key_prefix = "test:match:state:"
+    adapter.claim_key_prefix = "test:match:claim:"
+    yield adapter
+    keys = [key async for key in client.scan_iter("test:match:*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+async def test_set_matched_pair_writes_both_states(state_adapter):
+    """한 번의 트랜잭션으로 두 유저 모두 MATCHED 상태와 만료 시간이 기록된다"""
+    # When
+    await state_adapter.set_matched_pair("user-a", "INFP", "user-b", "ENFJ", room_id="room-1", expire_seconds=30)
+
+    # Then
+    states = await state_adapter.get_states(["user-a", "user-b", "user-idle"])
+    assert states["user-a"].state == MatchState.MATCHED
+    assert (states["user-a"].mbti, states["user-a"].partner_id) == ("INFP", "user-b")
+    assert (states["user-b"].mbti, states["user-b"].partner_id) == ("ENFJ", "user-a")
+    assert states["user-a"].room_id == states["user-b"].room_id == "room-1"
+    assert states["user-idle"] is None
+    assert 0 < await state_adapter.redis.ttl(state_adapter._get_key("user-b")) <= 30
+
+
+async def test_set_queued_does_not_downgrade_chatting_user(state_adapter):
+    """CHATTING 상태인 유저는 QUEUED로 바뀌지 않고, 그 외에는 QUEUED가 된다"""
+    # Given
+    await state_adapter.set_chatting("user-chatting", "room-1")
+
+    # When
+    await state_adapter.set_queued("user-chatting", "INFP")
+    await state_adapter.set_queued("user-idle", "ENFJ")
+
+    # Then
+    assert (await state_adapter.get_state("user-chatting")).state == MatchState.CHATTING
+    idle_state = await state_adapter.get_state("user-idle")
+    assert (idle_state.state, idle_state.mbti) == (MatchState.QUEUED, "ENFJ")
+
+
+async def test_set_chatting_preserves_mbti_and_partner(state_adapter):
+    """CHATTING으로 바뀌어도 기존 상태의 MBTI와 파트너가 유지되고 만료되지 않는다"""
+    # Given
+    await state_adapter.set_matched_pair("user-a", "INFP", "user-b", "ENFJ", room_id="room-1")
+
+    # When
+    await state_adapter.set_chatting("user-a", "room-1")
+    await state_adapter.set_chatting("user-new", "room-2")
+
+    # Then
+    state = await state_adapter.get_state("user-a")
+    assert (state.state, state.mbti, state.partner_id, state.room_id) == (
+        MatchState.CHATTING, "INFP", "user-b", "room-1"
+    )
+    assert await state_adapter.redis.ttl(state_adapter._get_key("user-a")) == -1
+    new_state = await state_adapter.get_state("user-new")
+    assert (new_state.state, new_state.mbti, new_state.partner_id) == (MatchState.CHATTING, None, None)
+    assert await state_adapter.is_available_for_match("user-a")
+
+
+async def test_claim_pair_is_all_or_nothing(state_adapter):
+    """한 명이라도 선점되었거나 MATCHED 상태면 선점에 실패하고, 아무도 새로 잡히지 않는다"""
+    # Given
+    first = await state_adapter.claim_pair("user-a", "user-b")
+    await state_adapter.set_matched_pair("user-x", "INFP", "user-y", "ENFJ", room_id="room-1")
+
+    # When
+    conflict_claimed = await state_adapter.claim_pair("user-c", "user-b")
+    conflict_matched = await state_adapter.claim_pair("user-c", "user-x")
+    free = await state_adapter.claim_pair("user-c", "user-d")
+
+    # Then
+    assert first.acquired
+    assert (conflict_claimed.acquired, conflict_claimed.conflict_user_id) == (False, "user-b")
+    assert (conflict_matched.acquired, conflict_matched.conflict_user_id) == (False, "user-x")
+    assert free.acquired
+    assert 0 < await state_adapter.redis.pttl(state_adapter._get_claim_key("user-a")) <= 10_000
+
+
+async def test_release_pair_only_releases_own_claims(state_adapter):
+    """다른 토큰으로는 선점을 풀 수 없고, 자신의 토큰으로 풀면 다시 선점할 수 있다"""
+    # Given
+    claim = await state_adapter.claim_pair("user-a", "user-b")
+
+    # When
+    await state_adapter.release_pair("user-a", "user-b", token="someone-else")
+    still_claimed = await state_adapter.claim_pair("user-a", "user-c")
+    await state_adapter.release_pair("user-a", "user-b", token=claim.token)
+    reclaimed = await state_adapter.claim_pair("user-a", "user-c")
+
+    # Then
+    assert not still_claimed.acquired
+    assert reclaimed.acquired
+
+
+async def test_set_queued_does_not_downgrade_matched_user(state_adapter):
+    """대기열 등록 직후 다른 워커가 매칭한 유저의 MATCHED 상태를 QUEUED로 덮어쓰지 않는다"""
+    # Given
+    await state_adapter.set_matched_pair("user-a", "INFP", "user-b", "ENFJ", room_id="room-1")
+
+    # When
+    await state_adapter.set_queued("user-a", "INFP")
+
+    # Then
+    assert (await state_adapter.get_state("user-a")).state == MatchState.MATCHED
@@ -0,0 +1,190 @@
+import asyncio
+import os
+import random
+from collections import Counter
+from typing import List, Optional, Tuple
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.match.adapter.output.persistence.redis_match_queue_adapter import RedisMatchQueueAdapter
+from app.match.adapter.output.persistence.redis_match_state_adapter import RedisMatchStateAdapter
+from app.match.application.port.output.match_state_port import MatchState
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+from tests.match.fixtures.fake_match_state_adapter import FakeMatchStateAdapter
+from tests.user.fixtures.fake_block_cache import FakeBlockCache
+
+pytestmark = pytest.mark.asyncio
+
+USER_COUNT = 60
+REQUESTS_PER_USER = 3
+REACTIVE_WORKERS = 4
+BATCH_WORKERS = 2
+SEEDS = (0, 1, 2)
+
+
+class InterleavingMatchQueue(FakeMatchQueueAdapter):
+    """연산마다 이벤트 루프에 양보해 여러 워커의 요청이 서로 끼어들게 하는 인메모리 대기열"""
+
+    async def enqueue(self, ticket: MatchTicket) -> None:
+        await asyncio.sleep(0)
+        await super().enqueue(ticket)
+
+    async def dequeue(self, mbti: MBTI) -> Optional[MatchTicket]:
+        await asyncio.sleep(0)
+        return await super().dequeue(mbti)
+
+    async def remove(self, user_id: str, mbti: MBTI) -> bool:
+        await asyncio.sleep(0)
+        return await super().remove(user_id, mbti)
+
+    async def get_waiting_tickets(self, mbti_list: List[str], limit_per_queue: int) -> List[MatchTicket]:
+        await asyncio.sleep(0)
+        return await super().get_waiting_tickets(mbti_list, limit_per_queue)
+
+
+class SlowChatRoomPort:
+    """채팅방 생성에 시간이 걸리는 채팅 포트 (만들어진 방의 참여자를 기록한다)"""
+
+    def __init__(self):
+        self.rooms: List[Tuple[str, str, str]] = []
+
+    async def create_chat_room(self, payload: dict) -> Optional[str]:
+        for _ in range(3):
+            await asyncio.sleep(0)
+        a, b = (u["userId"] for u in payload["users"])
+        self.rooms.append((payload["roomId"], a, b))
+        return payload["roomId"]
+
+    async def are_users_partners(self, user1_id: str, user2_id: str) -> bool:
+        await asyncio.sleep(0)
+        return False
+
+
+@pytest_asyncio.fixture(params=["fake", "redis"])
+async def shared_ports(request):
+    """모든 워커가 함께 쓰는 (대기열, 매칭 상태) 포트"""
+    if request.param == "fake":
+        yield InterleavingMatchQueue(), FakeMatchStateAdapter()
+        return
+
+    client = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"), decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    queue = RedisMatchQueueAdapter(client)
+    queue.key_prefix = "test:claim:queue:"
+    state = RedisMatchStateAdapter(client)
+    state.key_prefix = "test:claim:state:"
+    state.claim_key_prefix = "test:claim:lease:"
+    yield queue, state
+    keys = [key async for key in client.scan_iter("test:claim:*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+def _worker(queue, state, chat_room_port, reactive: bool) -> MatchUseCase:
+    return MatchUseCase(
+        match_queue_port=queue,
+        chat_room_port=chat_room_port,
+        block_repository=None,
+        match_state_port=state,
+        block_cache=FakeBlockCache(ready=True),
+        reactive=reactive,
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+async def test_no_user_is_matched_twice_across_workers(shared_ports, seed):
+    """
+    [원자적 선점] 여러 워커가 같은 유저들의 중복 요청과 배치 매칭을 동시에 처리해도
+    한 유저는 최대 한 번만 매칭되고, 매칭 상태도 그 채팅방을 가리킨다.
+    """
+    # Given
+    queue, state = shared_ports
+    chat_room_port = SlowChatRoomPort()
+    reactive_workers = [_worker(queue, state, chat_room_port, True) for _ in range(REACTIVE_WORKERS)]
+    batch_workers = [_worker(queue, state, chat_room_port, False) for _ in range(BATCH_WORKERS)]
+
+    rng = random.Random(seed)
+    users = [(f"user-{i}", MBTI(rng.choice(MBTICompatibility.ALL_MBTI))) for i in range(USER_COUNT)]
+    requests = [(user_id, mbti) for user_id, mbti in users for _ in range(REQUESTS_PER_USER)]
+    rng.shuffle(requests)
+    delays = [rng.randint(0, 300) for _ in requests]
+
+    async def send(i: int, user_id: str, mbti: MBTI):
+        # 요청이 조금씩 시차를 두고 도착하도록 이벤트 루프를 여러 번 양보한다
+        for _ in range(delays[i]):
+            await asyncio.sleep(0)
+        return await reactive_workers[i % REACTIVE_WORKERS].request_match(user_id, mbti, level=4)
+
+    async def run_batches():
+        for _ in range(5):
+            await asyncio.gather(*(w.match_waiting_users(limit_per_queue=16) for w in batch_workers))
+
+    # When
+    results = await asyncio.gather(
+        *(send(i, user_id, mbti) for i, (user_id, mbti) in enumerate(requests)),
+        run_batches(),
+    )
+
+    # Then
+    appearances = Counter(user_id for _, a, b in chat_room_port.rooms for user_id in (a, b))
+    assert chat_room_port.rooms
+    assert max(appearances.values()) == 1
+
+    for room_id, a, b in chat_room_port.rooms:
+        states = await state.get_states([a, b])
+        assert states[a].state == states[b].state == MatchState.MATCHED
+        assert states[a].room_id == states[b].room_id == room_id
+
+    matched_responses = [r for r in results[:-1] if r["status"] == "matched"]
+    assert len({r["roomId"] for r in matched_responses}) == len(matched_responses)
+
+    # 매칭되지 않은 유저는 선점 경합에서 밀려도 대기열에서 사라지지 않는다
+    for user_id, mbti in users:
+        if user_id not in appearances:
+            assert await queue.is_user_in_queue(user_id, mbti), user_id
+
+
+async def test_candidate_claimed_elsewhere_stays_in_queue():
+    """후보를 다른 워커가 선점하고 있으면 그 후보를 건너뛰고, 후보는 대기열에 그대로 남는다"""
+    # Given: 배치 워커가 대기 중인 후보를 선점한 상태
+    queue, state = InterleavingMatchQueue(), FakeMatchStateAdapter()
+    await queue.enqueue(MatchTicket(user_id="candidate", mbti=MBTI("ENFJ")))
+    await state.claim_pair("batch-partner", "candidate")
+    worker = _worker(queue, state, SlowChatRoomPort(), True)
+
+    # When
+    result = await worker.request_match("requester", MBTI("INFP"), level=4)
+
+    # Then
+    assert result["status"] == "waiting"
+    assert await queue.is_user_in_queue("candidate", MBTI("ENFJ"))
+    assert await queue.is_user_in_queue("requester", MBTI("INFP"))
+
+
+async def test_requester_claimed_elsewhere_waits_in_queue():
+    """요청자 본인을 다른 워커가 선점하고 있으면 후보는 그대로 두고 본인은 대기열에 등록해 기다린다"""
+    # Given
+    queue, state = InterleavingMatchQueue(), FakeMatchStateAdapter()
+    await queue.enqueue(MatchTicket(user_id="candidate", mbti=MBTI("ENFJ")))
+    await state.claim_pair("requester", "batch-partner")
+    worker = _worker(queue, state, SlowChatRoomPort(), True)
+
+    # When
+    result = await worker.request_match("requester", MBTI("INFP"), level=4)
+
+    # Then
+    assert result["status"] == "waiting"
+    assert await queue.is_user_in_queue("candidate", MBTI("ENFJ"))
+    assert await queue.is_user_in_queue("requester", MBTI("INFP"))
@@ -0,0 +1,360 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.match.application.port.output.match_state_port import MatchState, PairClaim, UserMatchState
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def fake_queue():
+    return FakeMatchQueueAdapter()
+
+
+@pytest.fixture
+def chat_room_port():
+    port = AsyncMock()
+    port.create_chat_room.return_value = "room-1"
+    port.are_users_partners.return_value = False
+    return port
+
+
+@pytest.fixture
+def notification_port():
+    return AsyncMock()
+
+
+@pytest.fixture
+def batch_usecase(fake_queue, chat_room_port, notification_port):
+    block_repository = Mock()
+    block_repository.get_blocked_user_ids.return_value = []
+    block_repository.get_blocker_ids.return_value = []
+    return MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+        match_notification_port=notification_port,
+        reactive=False,
+    )
+
+
+async def test_request_match_only_enqueues_in_batch_mode(batch_usecase, fake_queue, chat_room_port):
+    """
+    [배치 매칭] reactive=False면 요청 시 짝을 찾지 않고 대기열에만 등록한다.
+    """
+    # Given
+    await fake_queue.enqueue(MatchTicket("enfj", MBTI("ENFJ")))
+
+    # When
+    result = await batch_usecase.request_match("infp", MBTI("INFP"), level=1)
+
+    # Then
+    assert result["status"] == "waiting"
+    assert await fake_queue.is_user_in_queue("infp", MBTI("INFP"))
+    chat_room_port.create_chat_room.assert_not_called()
+
+
+async def test_match_waiting_users_pairs_and_notifies_both_users(
+    batch_usecase, fake_queue, chat_room_port, notification_port
+):
+    """
+    [배치 매칭] 짝지어진 두 유저를 대기열에서 빼고, 채팅방을 만든 뒤 양쪽 모두에게 알린다.
+    """
+    # Given
+    await batch_usecase.request_match("infp", MBTI("INFP"), level=1)
+    await batch_usecase.request_match("enfj", MBTI("ENFJ"), level=1)
+
+    # When
+    matched = await batch_usecase.match_waiting_users(limit_per_queue=16)
+
+    # Then
+    assert matched == 1
+    assert await fake_queue.get_queue_size(MBTI("INFP")) == 0
+    assert await fake_queue.get_queue_size(MBTI("ENFJ")) == 0
+    chat_room_port.create_chat_room.assert_called_once()
+    notified = {call.args[0]: call.args[1] for call in notification_port.notify_match_success.call_args_list}
+    assert notified["infp"]["partner"]["user_id"] == "enfj"
+    assert notified["enfj"]["partner"]["user_id"] == "infp"
+    assert notified["infp"]["roomId"] == notified["enfj"]["roomId"] == "room-1"
+
+
+async def test_match_waiting_users_skips_existing_partners(batch_usecase, fake_queue, chat_room_port):
+    """
+    [배치 매칭] 이미 채팅 중인 쌍은 짝짓지 않고 known_partners에 기록해 다음 배치에서 제외한다.
+    """
+    # Given
+    chat_room_port.are_users_partners.return_value = True
+    await batch_usecase.request_match("infp", MBTI("INFP"), level=1)
+    await batch_usecase.request_match("enfj", MBTI("ENFJ"), level=1)
+    known_partners = set()
+
+    # When
+    matched = await batch_usecase.match_waiting_users(limit_per_queue=16, known_partners=known_partners)
+
+    # Then
+    assert matched == 0
+    assert known_partners == {frozenset(("infp", "enfj"))}
+    assert await fake_queue.is_user_in_queue("infp", MBTI("INFP"))
+    assert await fake_queue.is_user_in_queue("enfj", MBTI("ENFJ"))
+    chat_room_port.create_chat_room.assert_not_called()
+
+
+async def test_match_waiting_users_requeues_partner_when_claim_fails(
+    batch_usecase, fake_queue, chat_room_port, notification_port
+):
+    """
+    [배치 매칭] 스냅샷 이후 한쪽이 취소했으면, 먼저 꺼낸 유저를 대기열에 되돌려 놓는다.
+    """
+    # Given
+    await batch_usecase.request_match("infp", MBTI("INFP"), level=1)
+    await batch_usecase.request_match("enfj", MBTI("ENFJ"), level=1)
+    snapshot = await fake_queue.get_waiting_tickets(["INFP", "ENFJ"], 16)
+    fake_queue.get_waiting_tickets = AsyncMock(return_value=snapshot)
+    await batch_usecase.cancel_match("enfj", MBTI("ENFJ"))
+
+    # When
+    matched = await batch_usecase.match_waiting_users(limit_per_queue=16)
+
+    # Then
+    assert matched == 0
+    assert await fake_queue.is_user_in_queue("infp", MBTI("INFP"))
+    chat_room_port.create_chat_room.assert_not_called()
+    notification_port.notify_match_success.assert_not_called()
+
+
+async def test_match_waiting_users_prefers_longer_waiting_users(batch_usecase, fake_queue):
+    """
+    [배치 매칭] 후보가 겹치면 now 기준으로 더 오래 기다린 유저가 먼저 짝지어진다.
+    """
+    # Given
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    old_ticket = MatchTicket("infp-old", MBTI("INFP"))
+    old_ticket.created_at = now - timedelta(seconds=200)
+    new_ticket = MatchTicket("infp-new", MBTI("INFP"))
+    new_ticket.created_at = now - timedelta(seconds=1)
+    enfj_ticket = MatchTicket("enfj", MBTI("ENFJ"))
+    enfj_ticket.created_at = now
+    for ticket in (new_ticket, old_ticket, enfj_ticket):
+        await fake_queue.enqueue(ticket)
+
+    # When
+    matched = await batch_usecase.match_waiting_users(limit_per_queue=16, now=now)
+
+    # Then
+    assert matched == 1
+    assert await fake_queue.is_user_in_queue("infp-new", MBTI("INFP"))
+    assert not await fake_queue.is_user_in_queue("infp-old", MBTI("INFP"))
+
+
+async def test_match_waiting_users_batches_match_state_calls(batch_usecase, fake_queue):
+    """
+    [배치 매칭] 매칭 상태는 한 번에 조회하고, 두 유저의 MATCHED 기록도 한 번에 처리한다.
+    """
+    # Given
+    match_state = AsyncMock()
+    match_state.get_states.return_value = {
+        "infp": None,
+        "enfj": None,
+        "intj": UserMatchState("intj", MatchState.MATCHED, room_id="room-0"),
+        "enfp": None,
+    }
+    batch_usecase.match_state = match_state
+    for user_id, mbti in (("infp", "INFP"), ("enfj", "ENFJ"), ("intj", "INTJ"), ("enfp", "ENFP")):
+        await fake_queue.enqueue(MatchTicket(user_id, MBTI(mbti)))
+
+    # When
+    matched = await batch_usecase.match_waiting_users(limit_per_queue=16)
+
+    # Then: MATCHED 상태인 INTJ와 짝지어진 ENFP는 건너뛴다
+    assert matched == 1
+    match_state.get_states.assert_called_once()
+    match_state.is_available_for_match.assert_not_called()
+    match_state.set_matched.assert_not_called()
+    match_state.set_matched_pair.assert_called_once()
+    kwargs = match_state.set_matched_pair.call_args.kwargs
+    assert {kwargs["user_id"], kwargs["partner_id"]} == {"infp", "enfj"}
+    assert await fake_queue.is_user_in_queue("enfp", MBTI("ENFP"))
+
+
+async def test_match_waiting_users_widens_level_as_tickets_wait(fake_queue, chat_room_port):
+    """
+    [단계 확장] max_level을 준 티켓은 기다린 시간만큼 허용 단계가 넓어져, 재요청 없이 다음 배치에서 매칭된다.
+    """
+    # Given: INFP-ISTJ는 4단계 궁합이고, 둘 다 1단계로 시작해 4단계까지 허용한다
+    block_repository = Mock()
+    block_repository.get_blocked_user_ids.return_value = []
+    block_repository.get_blocker_ids.return_value = []
+    metrics_port = AsyncMock()
+    usecase = MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+        reactive=False,
+        match_metrics_port=metrics_port,
+        widen_every_seconds=15,
+    )
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    for user_id, mbti in (("infp", "INFP"), ("istj", "ISTJ")):
+        ticket = MatchTicket(user_id, MBTI(mbti), level=1, max_level=4)
+        ticket.created_at = start
+        await fake_queue.enqueue(ticket)
+
+    # When
+    matched_early = await usecase.match_waiting_users(limit_per_queue=16, now=start + timedelta(seconds=10))
+    matched_later = await usecase.match_waiting_users(limit_per_queue=16, now=start + timedelta(seconds=46))
+
+    # Then: 매칭된 단계(4)로 두 유저의 대기 시간이 기록된다
+    assert (matched_early, matched_later) == (0, 1)
+    metrics_port.record_match_waits.assert_called_once_with([(46.0, 4), (46.0, 4)])
+
+
+
+async def test_reactive_request_applies_waiting_ticket_widened_level(fake_queue, chat_room_port):
+    """
+    [단계 확장] 즉시 매칭도 대기 중인 후보의 넓어진 단계를 따른다.
+    아직 넓어지지 않은 후보는 대기열에 되돌리고, 충분히 기다린 후보와는 매칭한다.
+    """
+    # Given: INFP-ISTJ는 4단계 궁합. 방금 들어온 ISTJ는 1단계, 오래 기다린 ISTJ는 4단계까지 넓어졌다
+    block_repository = Mock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    usecase = MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+        widen_every_seconds=15,
+    )
+    fresh_ticket = MatchTicket("istj-fresh", MBTI("ISTJ"), level=1, max_level=4)
+    waited_ticket = MatchTicket("istj-waited", MBTI("ISTJ"), level=1, max_level=4)
+    waited_ticket.created_at = datetime.now() - timedelta(seconds=60)
+    await fake_queue.enqueue(fresh_ticket)
+    await fake_queue.enqueue(waited_ticket)
+
+    # When
+    result = await usecase.request_match("infp", MBTI("INFP"), level=4)
+
+    # Then
+    assert result["status"] == "matched"
+    assert result["partner"]["user_id"] == "istj-waited"
+    assert await fake_queue.is_user_in_queue("istj-fresh", MBTI("ISTJ"))
+
+
+async def test_reactive_request_leaves_candidate_below_its_level_waiting(fake_queue, chat_room_port):
+    """
+    [단계 확장] 대기 중인 후보가 허용하지 않는 궁합 단계면 즉시 매칭하지 않고 둘 다 대기열에 남긴다.
+    """
+    # Given: max_level 없이 1단계만 허용하는 ISTJ
+    block_repository = Mock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    usecase = MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+        widen_every_seconds=15,
+    )
+    waited_ticket = MatchTicket("istj", MBTI("ISTJ"), level=1)
+    waited_ticket.created_at = datetime.now() - timedelta(seconds=60)
+    await fake_queue.enqueue(waited_ticket)
+
+    # When
+    result = await usecase.request_match("infp", MBTI("INFP"), level=4)
+
+    # Then
+    assert result["status"] == "waiting"
+    assert await fake_queue.is_user_in_queue("istj", MBTI("ISTJ"))
+    assert await fake_queue.is_user_in_queue("infp", MBTI("INFP"))
+    chat_room_port.create_chat_room.assert_not_called()
+
+
+async def test_reactive_request_peeks_candidates_without_reordering_queue(fake_queue, chat_room_port):
+    """
+    [단계 확장] 허용하지 않는 후보는 대기열에서 꺼내지 않으므로, 건너뛴 유저의 순서와 취소 상태가 그대로 유지된다.
+    """
+    # Given: 1단계만 허용하는 ISTJ 여럿 뒤에 4단계까지 넓어진 ISTJ가 기다린다
+    block_repository = Mock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    usecase = MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+        widen_every_seconds=15,
+    )
+    strict_ids = [f"istj-{i}" for i in range(5)]
+    for user_id in strict_ids:
+        await fake_queue.enqueue(MatchTicket(user_id, MBTI("ISTJ"), level=1))
+    waited_ticket = MatchTicket("istj-waited", MBTI("ISTJ"), level=1, max_level=4)
+    waited_ticket.created_at = datetime.now() - timedelta(seconds=60)
+    await fake_queue.enqueue(waited_ticket)
+    fake_queue.dequeue = AsyncMock(side_effect=AssertionError("후보를 pop 하면 안 됩니다"))
+
+    # When
+    result = await usecase.request_match("infp", MBTI("INFP"), level=4)
+
+    # Then
+    assert result["partner"]["user_id"] == "istj-waited"
+    waiting = await fake_queue.get_waiting_tickets(["ISTJ"], 16)
+    assert [ticket.user_id for ticket in waiting] == strict_ids
+
+
+async def test_reactive_request_tries_a_bounded_number_of_candidates(fake_queue, chat_room_port):
+    """
+    [단계 확장] 한 요청이 시도하는 후보 수에는 상한이 있어, 대기열이 길어도 요청 한 번의 비용이 제한된다.
+    """
+    # Given: 모든 후보가 이미 채팅 중인 상대
+    block_repository = Mock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    usecase = MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+    )
+    chat_room_port.are_users_partners.return_value = True
+    for mbti in ("ENFJ", "ENTJ", "INFJ"):
+        for i in range(10):
+            await fake_queue.enqueue(MatchTicket(f"{mbti.lower()}-{i}", MBTI(mbti), level=4))
+
+    # When
+    result = await usecase.request_match("infp", MBTI("INFP"), level=4)
+
+    # Then
+    assert result["status"] == "waiting"
+    assert chat_room_port.are_users_partners.await_count == MatchUseCase.MAX_CANDIDATES_PER_REQUEST
+    assert await fake_queue.get_queue_size(MBTI("ENFJ")) == 10
+
+
+async def test_reactive_request_reads_candidate_states_once(fake_queue, chat_room_port):
+    """
+    [즉시 매칭] 후보의 매칭 상태는 후보마다 조회하지 않고 한 번에 조회해, MATCHED 상태인 후보를 건너뛴다.
+    """
+    # Given
+    block_repository = Mock()
+    block_repository.find_by_blocker_and_blocked.return_value = None
+    match_state = AsyncMock()
+    match_state.get_state.return_value = None
+    match_state.get_states.return_value = {
+        "enfj-1": UserMatchState("enfj-1", MatchState.MATCHED, room_id="room-0"),
+        "enfj-2": None,
+    }
+    match_state.claim_pair.return_value = PairClaim(token="token")
+    usecase = MatchUseCase(
+        match_queue_port=fake_queue,
+        chat_room_port=chat_room_port,
+        block_repository=block_repository,
+        match_state_port=match_state,
+    )
+    for user_id in ("enfj-1", "enfj-2"):
+        await fake_queue.enqueue(MatchTicket(user_id, MBTI("ENFJ")))
+
+    # When
+    result = await usecase.request_match("infp", MBTI("INFP"), level=1)
+
+    # Then
+    assert result["partner"]["user_id"] == "enfj-2"
+    match_state.get_states.assert_awaited_once_with(["enfj-1", "enfj-2"])
+    match_state.is_available_for_match.assert_not_called()
+    assert await fake_queue.is_user_in_queue("enfj-1", MBTI("ENFJ"))
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.shared.vo.mbti import MBTI
 from app.match.domain.match_ticket import MatchTicket
 
@@ -19,4 +19,24 @@ def test_create_match_ticket():
 def test_match_ticket_validation():
     # Given / When / Then
     with pytest.raises(ValueError):
-        MatchTicket(user_id="", mbti=MBTI("INFP"))  # 빈 ID 테스트
\ No newline at end of file
+        MatchTicket(user_id="", mbti=MBTI("INFP"))  # 빈 ID 테스트
+
+def test_effective_level_widens_up_to_max_level():
+    # Given
+    ticket = MatchTicket(user_id="user_123", mbti=MBTI("INFP"), level=1, max_level=3)
+    now = ticket.created_at
+
+    # When / Then: 15초마다 한 단계씩 넓어지고 max_level에서 멈춘다
+    assert ticket.effective_level(now, widen_every_seconds=15) == 1
+    assert ticket.effective_level(now + timedelta(seconds=16), widen_every_seconds=15) == 2
+    assert ticket.effective_level(now + timedelta(seconds=600), widen_every_seconds=15) == 3
+
+
+def test_effective_level_stays_fixed_without_max_level():
+    # Given
+    ticket = MatchTicket(user_id="user_123", mbti=MBTI("INFP"), level=2)
+    later = ticket.created_at + timedelta(seconds=600)
+
+    # When / Then
+    assert ticket.max_level == 2
+    assert ticket.effective_level(later, widen_every_seconds=15) == 2
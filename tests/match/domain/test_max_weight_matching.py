@@ -0,0 +1,84 @@
+import itertools
+import random
+
+import pytest
+
+from app.match.domain.max_weight_matching import max_weight_matching
+
+
+def _brute_force_weight(edges):
+    """모든 매칭을 탐색해 최대 가중치를 구한다 (작은 그래프 검증용)"""
+    weights = {}
+    for u, v, w in edges:
+        weights[(min(u, v), max(u, v))] = w
+    nvertex = 1 + max(max(u, v) for u, v, _ in edges)
+
+    def best(i, used):
+        while i < nvertex and i in used:
+            i += 1
+        if i >= nvertex:
+            return 0
+        result = best(i + 1, used | {i})
+        for j in range(i + 1, nvertex):
+            if j not in used and (i, j) in weights:
+                result = max(result, weights[(i, j)] + best(i + 1, used | {i, j}))
+        return result
+
+    return best(0, frozenset())
+
+
+def _matching_weight(edges, mate):
+    weights = {(min(u, v), max(u, v)): w for u, v, w in edges}
+    return sum(weights[(v, m)] for v, m in enumerate(mate) if m > v)
+
+
+def test_empty_graph():
+    assert max_weight_matching([]) == []
+
+
+def test_prefers_heavier_total_over_single_heaviest_edge():
+    """가장 무거운 간선 하나보다 두 간선의 합이 크면 두 간선을 고른다"""
+    # Given: 0-1(5), 1-2(6), 2-3(5) → 0-1 + 2-3 = 10 > 1-2 = 6
+    edges = [(0, 1, 5), (1, 2, 6), (2, 3, 5)]
+
+    # When
+    mate = max_weight_matching(edges)
+
+    # Then
+    assert mate == [1, 0, 3, 2]
+
+
+def test_handles_odd_cycle_blossom():
+    """홀수 사이클(blossom)을 거쳐야 하는 증가 경로도 찾는다"""
+    # Given: 삼각형 0-1-2 와 2-3, 3-4
+    edges = [(0, 1, 8), (1, 2, 9), (0, 2, 10), (2, 3, 7), (3, 4, 6)]
+
+    # When
+    mate = max_weight_matching(edges)
+
+    # Then
+    assert _matching_weight(edges, mate) == _brute_force_weight(edges)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_brute_force_on_random_graphs(seed):
+    """무작위 작은 그래프에서 완전 탐색과 같은 최대 가중치를 찾는다"""
+    rng = random.Random(seed)
+    for _ in range(200):
+        # Given
+        nvertex = rng.randint(2, 9)
+        edges = [
+            (u, v, rng.randint(1, 20))
+            for u, v in itertools.combinations(range(nvertex), 2)
+            if rng.random() < 0.5
+        ]
+        if not edges:
+            continue
+
+        # When
+        mate = max_weight_matching(edges)
+
+        # Then: 유효한 매칭이고 가중치가 최대다
+        for v, m in enumerate(mate):
+            assert m == -1 or mate[m] == v
+        assert _matching_weight(edges, mate) == _brute_force_weight(edges)
@@ -0,0 +1,95 @@
+import itertools
+import random
+import timeit
+from collections import Counter
+
+import pytest
+
+from app.match.domain.mbti_compatibility import MBTICompatibility
+
+ALL_MBTI = MBTICompatibility.ALL_MBTI
+LEVELS = range(0, 6)
+
+
+def _reference_first_level(my_mbti: str, partner_mbti: str) -> int:
+    """미리 계산하기 전의 방식: 단계마다 규칙을 다시 평가해 상대가 처음 포함되는 단계를 찾는다"""
+    for level in (1, 2, 3):
+        if partner_mbti in MBTICompatibility._rule_targets(my_mbti, level):
+            return level
+    return 4
+
+
+@pytest.mark.parametrize("my_mbti", ALL_MBTI)
+def test_compiled_targets_match_rules(my_mbti):
+    """미리 계산한 탐색 대상이 모든 (MBTI, 단계)에서 규칙 평가 결과와 같다"""
+    for level in LEVELS:
+        # Given
+        expected = MBTICompatibility._rule_targets(my_mbti, level)
+
+        # When
+        targets = MBTICompatibility.get_targets(my_mbti, level)
+        values = MBTICompatibility.get_target_values(my_mbti, level)
+
+        # Then
+        assert {m.value for m in targets} == expected
+        assert set(values) == expected
+        assert len(values) == len(expected)
+        for partner_mbti in ALL_MBTI:
+            assert MBTICompatibility.is_target(my_mbti, partner_mbti, level) == (partner_mbti in expected)
+
+
+def test_level_matrix_matches_rules():
+    """단계 행렬이 양쪽 관점의 규칙 평가 중 더 나쁜 단계와 같다"""
+    for my_mbti, partner_mbti in itertools.product(ALL_MBTI, ALL_MBTI):
+        expected = max(
+            _reference_first_level(my_mbti, partner_mbti),
+            _reference_first_level(partner_mbti, my_mbti),
+        )
+        assert MBTICompatibility.get_level(my_mbti, partner_mbti) == expected
+
+
+def test_level_matrix_snapshot():
+    """알려진 궁합과 단계 분포가 유지된다"""
+    # Given / When
+    counts = Counter(level for row in MBTICompatibility.LEVEL_MATRIX for level in row)
+
+    # Then
+    assert set(MBTICompatibility.get_target_values("INFP", 1)) == {"ENFJ", "ENTJ"}
+    assert MBTICompatibility.get_level("INFP", "ENFJ") == 1
+    assert MBTICompatibility.get_level("INFP", "ISTJ") == 4
+    assert counts == {1: 32, 2: 100, 3: 62, 4: 62}
+    assert all(
+        MBTICompatibility.get_level(a, b) == MBTICompatibility.get_level(b, a)
+        for a, b in itertools.combinations(ALL_MBTI, 2)
+    )
+
+
+def test_vectorized_levels_match_single_lookups():
+    """여러 쌍을 한 번에 조회해도 쌍마다 조회한 결과와 같다"""
+    # Given
+    rng = random.Random(0)
+    mbtis = [rng.choice(ALL_MBTI) for _ in range(50)]
+    partners = [rng.choice(ALL_MBTI) for _ in range(50)]
+
+    # When
+    levels = MBTICompatibility.get_levels(mbtis, partners)
+    table = MBTICompatibility.get_pairwise_levels(mbtis)
+
+    # Then
+    assert levels == [MBTICompatibility.get_level(a, b) for a, b in zip(mbtis, partners)]
+    for i, j in itertools.product(range(len(mbtis)), repeat=2):
+        assert table[i][j] == MBTICompatibility.get_level(mbtis[i], mbtis[j])
+
+
+@pytest.mark.benchmark
+def test_compiled_targets_are_faster_than_rule_evaluation(capsys):
+    """미리 계산한 탐색 대상 조회가 매번 규칙을 평가하는 것보다 빠르다"""
+    # When
+    rules = timeit.timeit(lambda: [MBTICompatibility._rule_targets(m, 3) for m in ALL_MBTI], number=2000)
+    compiled = timeit.timeit(lambda: [MBTICompatibility.get_target_values(m, 3) for m in ALL_MBTI], number=2000)
+
+    with capsys.disabled():
+        print(f"\n[benchmark] get_targets x32000: rules {rules * 1000:.1f}ms, compiled {compiled * 1000:.1f}ms")
+
+    # Then
+    assert compiled < rules
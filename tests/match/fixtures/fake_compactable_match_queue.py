@@ -0,0 +1,39 @@
+from typing import Dict, List, Set, Tuple
+
+from app.shared.vo.mbti import MBTI
+
+
+class FakeCompactableMatchQueue:
+    """
+    MatchQueueCompactor 테스트용: Redis List(티켓 순서)와 Set(유효한 유저)을 메모리로 흉내낸다.
+    compact/get_ghost_ratios는 RedisMatchQueueAdapter의 Lua 스크립트/파이프라인과 같은 결과를 낸다.
+    """
+
+    def __init__(self):
+        self.lists: Dict[str, List[str]] = {}
+        self.sets: Dict[str, Set[str]] = {}
+        self.compact_calls = 0
+
+    def enqueue(self, user_id: str, mbti: str) -> None:
+        self.lists.setdefault(mbti, []).append(user_id)
+        self.sets.setdefault(mbti, set()).add(user_id)
+
+    def cancel(self, user_id: str, mbti: str) -> None:
+        self.sets.get(mbti, set()).discard(user_id)
+
+    async def compact(self, mbti: MBTI, start: int, count: int) -> Tuple[int, int]:
+        self.compact_calls += 1
+        tickets = self.lists.get(mbti.value, [])
+        valid = self.sets.get(mbti.value, set())
+        chunk = tickets[start:start + count]
+        kept = [user_id for user_id in chunk if user_id in valid]
+        tickets[start:start + count] = kept
+        return len(chunk), len(chunk) - len(kept)
+
+    async def get_ghost_ratios(self, mbti_list: List[str]) -> Dict[str, float]:
+        ratios = {}
+        for mbti in mbti_list:
+            list_size = len(self.lists.get(mbti, []))
+            set_size = len(self.sets.get(mbti, set()))
+            ratios[mbti] = max(0, list_size - set_size) / list_size if list_size else 0.0
+        return ratios
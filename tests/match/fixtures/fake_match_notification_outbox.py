@@ -0,0 +1,26 @@
+from typing import Any, Dict, List, Tuple
+
+from app.match.application.port.output.match_notification_outbox_port import MatchNotificationOutboxPort
+
+
+class FakeMatchNotificationOutbox(MatchNotificationOutboxPort):
+    """테스트용 인메모리 매칭 알림 아웃박스"""
+
+    def __init__(self):
+        self._pending: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        self._sequence = 0
+
+    async def append(self, user_id: str, payload: Dict[str, Any]) -> str:
+        self._sequence += 1
+        notification_id = f"{self._sequence}-0"
+        self._pending.setdefault(user_id, []).append((notification_id, payload))
+        return notification_id
+
+    async def get_pending(self, user_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        return list(self._pending.get(user_id, []))
+
+    async def ack(self, user_id: str, notification_ids: List[str]) -> int:
+        pending = self._pending.get(user_id, [])
+        remaining = [entry for entry in pending if entry[0] not in notification_ids]
+        self._pending[user_id] = remaining
+        return len(pending) - len(remaining)
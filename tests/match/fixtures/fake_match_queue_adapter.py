@@ -69,4 +69,13 @@ class FakeMatchQueueAdapter(MatchQueuePort):
         for ticket in self._queues[mbti_key]:
             if ticket.user_id == user_id:
                 return True
-        return False
\ No newline at end of file
+        return False
+
+    async def get_waiting_tickets(self, mbti_list: List[str], limit_per_queue: int) -> List[MatchTicket]:
+        """
+        테스트용: 각 MBTI 큐의 앞쪽 티켓을 제거하지 않고 반환
+        """
+        tickets = []
+        for mbti_str in mbti_list:
+            tickets.extend(list(self._queues.get(mbti_str, []))[:limit_per_queue])
+        return tickets
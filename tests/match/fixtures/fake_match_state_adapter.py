@@ -0,0 +1,89 @@
+import uuid
+from typing import Dict, List, Optional
+
+from app.match.application.port.output.match_state_port import (
+    MatchState,
+    MatchStatePort,
+    PairClaim,
+    UserMatchState,
+)
+
+
+class FakeMatchStateAdapter(MatchStatePort):
+    """
+    테스트용 인메모리 매칭 상태 저장소.
+    메서드 안에서 await 하지 않으므로 각 호출은 Redis Lua 스크립트처럼 원자적으로 동작한다.
+    (만료 시간은 다루지 않는다)
+    """
+
+    def __init__(self):
+        self._states: Dict[str, UserMatchState] = {}
+        self._claims: Dict[str, str] = {}
+
+    async def get_state(self, user_id: str) -> Optional[UserMatchState]:
+        return self._states.get(user_id)
+
+    async def get_states(self, user_ids: List[str]) -> Dict[str, Optional[UserMatchState]]:
+        return {user_id: self._states.get(user_id) for user_id in user_ids}
+
+    async def set_queued(self, user_id: str, mbti: str) -> None:
+        current = self._states.get(user_id)
+        if current and current.state in (MatchState.CHATTING, MatchState.MATCHED):
+            return
+        self._states[user_id] = UserMatchState(user_id, MatchState.QUEUED, mbti=mbti)
+
+    async def set_matched(
+        self,
+        user_id: str,
+        mbti: str,
+        room_id: str,
+        partner_id: str,
+        expire_seconds: int = 60
+    ) -> None:
+        self._states[user_id] = UserMatchState(
+            user_id, MatchState.MATCHED, mbti=mbti, room_id=room_id, partner_id=partner_id
+        )
+
+    async def set_matched_pair(
+        self,
+        user_id: str,
+        mbti: str,
+        partner_id: str,
+        partner_mbti: str,
+        room_id: str,
+        expire_seconds: int = 60
+    ) -> None:
+        await self.set_matched(user_id, mbti, room_id, partner_id, expire_seconds)
+        await self.set_matched(partner_id, partner_mbti, room_id, user_id, expire_seconds)
+
+    async def claim_pair(self, user_id: str, partner_id: str, lease_seconds: int = 10) -> PairClaim:
+        for candidate in (user_id, partner_id):
+            state = self._states.get(candidate)
+            if candidate in self._claims or (state and state.state == MatchState.MATCHED):
+                return PairClaim(conflict_user_id=candidate)
+
+        token = str(uuid.uuid4())
+        self._claims[user_id] = self._claims[partner_id] = token
+        return PairClaim(token=token)
+
+    async def release_pair(self, user_id: str, partner_id: str, token: str) -> None:
+        for candidate in (user_id, partner_id):
+            if self._claims.get(candidate) == token:
+                del self._claims[candidate]
+
+    async def set_chatting(self, user_id: str, room_id: str) -> None:
+        current = self._states.get(user_id)
+        self._states[user_id] = UserMatchState(
+            user_id,
+            MatchState.CHATTING,
+            mbti=current.mbti if current else None,
+            room_id=room_id,
+            partner_id=current.partner_id if current else None,
+        )
+
+    async def clear_state(self, user_id: str) -> None:
+        self._states.pop(user_id, None)
+
+    async def is_available_for_match(self, user_id: str) -> bool:
+        state = self._states.get(user_id)
+        return state is None or state.state != MatchState.MATCHED
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from app.match.application.service.batch_match_service import BatchMatchService
+from app.match.domain.match_ticket import MatchTicket
+from app.shared.vo.mbti import MBTI
+from tests.user.fixtures.fake_block_cache import FakeBlockCache
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _ticket(user_id: str, mbti: str, level: int = 4, waited_seconds: int = 0) -> MatchTicket:
+    ticket = MatchTicket(user_id, MBTI(mbti), level=level)
+    ticket.created_at = NOW - timedelta(seconds=waited_seconds)
+    return ticket
+
+
+def _pair_ids(pairs) -> set:
+    return {frozenset((a.user_id, b.user_id)) for a, b in pairs}
+
+
+@pytest.fixture
+def service():
+    return BatchMatchService(block_repository=Mock(), block_cache=FakeBlockCache(ready=True))
+
+
+@pytest.mark.asyncio
+async def test_pairs_best_compatibility_globally(service):
+    """
+    [배치 매칭] 먼저 온 순서가 아니라 전체 궁합 점수 합이 최대가 되도록 짝짓는다.
+    INFP-ENFJ, ENTJ-INTP 는 천생연분이므로, 교차 조합 대신 두 천생연분 쌍을 만든다.
+    """
+    # Given
+    tickets = [
+        _ticket("infp", "INFP"),
+        _ticket("entj", "ENTJ"),
+        _ticket("enfj", "ENFJ"),
+        _ticket("intp", "INTP"),
+    ]
+
+    # When
+    pairs = await service.find_pairs(tickets, now=NOW)
+
+    # Then
+    assert _pair_ids(pairs) == {frozenset(("infp", "enfj")), frozenset(("entj", "intp"))}
+
+
+@pytest.mark.asyncio
+async def test_respects_both_users_levels(service):
+    """
+    [배치 매칭] 두 유저 모두가 허용한 궁합 단계 안에서만 짝짓는다.
+    INFP-ISTJ 는 최악(4단계)이므로 한쪽이라도 4단계 미만을 요청했으면 짝짓지 않는다.
+    """
+    # Given
+    tickets = [_ticket("infp", "INFP", level=4), _ticket("istj", "ISTJ", level=1)]
+
+    # When
+    pairs = await service.find_pairs(tickets, now=NOW)
+
+    # Then
+    assert pairs == []
+
+
+@pytest.mark.asyncio
+async def test_skips_blocked_and_excluded_pairs():
+    """[배치 매칭] 차단 관계(양방향)나 제외된 쌍은 짝짓지 않는다"""
+    # Given
+    block_cache = FakeBlockCache(ready=True)
+    await block_cache.add_block("enfj", "infp")
+    service = BatchMatchService(block_repository=Mock(), block_cache=block_cache)
+    tickets = [
+        _ticket("infp", "INFP"),
+        _ticket("enfj", "ENFJ"),
+        _ticket("entj", "ENTJ"),
+        _ticket("intp", "INTP"),
+    ]
+
+    # When
+    pairs = await service.find_pairs(tickets, excluded_pairs={frozenset(("entj", "intp"))}, now=NOW)
+
+    # Then
+    pair_ids = _pair_ids(pairs)
+    assert frozenset(("infp", "enfj")) not in pair_ids
+    assert frozenset(("entj", "intp")) not in pair_ids
+    assert len(pairs) == 2
+
+
+@pytest.mark.asyncio
+async def test_prefers_longer_waiting_user_when_contended(service):
+    """[배치 매칭] 한 명을 두고 경쟁하면 더 오래 기다린 유저를 짝짓는다"""
+    # Given: 두 INFP가 한 명의 ENFJ를 두고 경쟁
+    tickets = [
+        _ticket("infp-new", "INFP", waited_seconds=5),
+        _ticket("infp-old", "INFP", waited_seconds=120),
+        _ticket("enfj", "ENFJ", waited_seconds=10),
+    ]
+
+    # When
+    pairs = await service.find_pairs(tickets, now=NOW)
+
+    # Then
+    assert _pair_ids(pairs) == {frozenset(("infp-old", "enfj"))}
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_block_repository_when_cache_is_not_ready():
+    """[배치 매칭] 차단 캐시가 준비되지 않았으면 MySQL 차단 목록을 사용한다"""
+    # Given
+    block_repository = Mock()
+    block_repository.get_blocked_user_ids.side_effect = lambda user_id: ["enfj"] if user_id == "infp" else []
+    block_repository.get_blocker_ids.side_effect = lambda user_id: ["infp"] if user_id == "enfj" else []
+    service = BatchMatchService(block_repository=block_repository, block_cache=FakeBlockCache(ready=False))
+
+    # When
+    pairs = await service.find_pairs([_ticket("infp", "INFP"), _ticket("enfj", "ENFJ")], now=NOW)
+
+    # Then
+    assert pairs == []
@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import Mock
+
+from app.shared.vo.mbti import MBTI
+from app.match.domain.match_ticket import MatchTicket
+from app.match.application.service.match_service import MatchService
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+from tests.user.fixtures.fake_block_cache import FakeBlockCache
+
+
+@pytest.mark.asyncio
+async def test_blocked_candidates_are_skipped_using_block_cache():
+    """
+    [차단 캐시] 준비된 캐시가 있으면 MySQL 조회 없이 차단된 후보(양방향)를 건너뛴다.
+    """
+    # Given
+    fake_queue = FakeMatchQueueAdapter()
+    block_repository = Mock()
+    block_cache = FakeBlockCache(ready=True)
+    await block_cache.add_block("me_infp", "blocked_by_me")
+    await block_cache.add_block("blocked_me", "me_infp")
+    service = MatchService(fake_queue, block_repository, block_cache)
+
+    for user_id in ("blocked_by_me", "blocked_me", "free_partner"):
+        await fake_queue.enqueue(MatchTicket(user_id, MBTI("ENFJ")))
+
+    # When
+    result = await service.find_partner(MatchTicket("me_infp", MBTI("INFP")), level=1)
+
+    # Then
+    assert result.user_id == "free_partner"
+    assert block_cache.lookups == 3
+    block_repository.find_by_blocker_and_blocked.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_block_repository_when_cache_is_not_ready():
+    """
+    [차단 캐시] 캐시가 아직 적재되지 않았으면 MySQL 양방향 조회로 차단 여부를 판단한다.
+    """
+    # Given
+    fake_queue = FakeMatchQueueAdapter()
+    block_repository = Mock()
+    block_repository.find_by_blocker_and_blocked.side_effect = (
+        lambda blocker_id, blocked_user_id: blocked_user_id == "me_infp" and blocker_id == "blocked_me"
+    )
+    service = MatchService(fake_queue, block_repository, FakeBlockCache(ready=False))
+
+    for user_id in ("blocked_me", "free_partner"):
+        await fake_queue.enqueue(MatchTicket(user_id, MBTI("ENFJ")))
+
+    # When
+    result = await service.find_partner(MatchTicket("me_infp", MBTI("INFP")), level=1)
+
+    # Then
+    assert result.user_id == "free_partner"
+    assert block_repository.find_by_blocker_and_blocked.call_count == 4
@@ -0,0 +1,191 @@
+import asyncio
+import random
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from app.match.application.usecase.match_usecase import MatchUseCase
+from app.match.domain.match_ticket import MatchTicket
+from app.match.domain.mbti_compatibility import MBTICompatibility
+from app.shared.vo.mbti import MBTI
+from tests.match.fixtures.fake_match_queue_adapter import FakeMatchQueueAdapter
+from tests.user.fixtures.fake_block_cache import FakeBlockCache
+
+pytestmark = [pytest.mark.asyncio, pytest.mark.benchmark]
+
+# 시뮬레이션 조건: 초당 평균 도착 인원, 도착을 받는 시간, 유저가 기다려 주는 시간 범위
+ARRIVALS_PER_SECOND = 1.0
+ARRIVAL_SECONDS = 300
+PATIENCE_SECONDS = (20, 90)
+# 유저가 고르는 허용 궁합 단계 분포 (1: 천생연분만 ~ 4: 전체)
+LEVEL_WEIGHTS = {1: 0.4, 2: 0.3, 3: 0.2, 4: 0.1}
+SEEDS = (1, 2, 3)
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@dataclass
+class SimUser:
+    user_id: str
+    mbti: MBTI
+    level: int
+    arrived_at: datetime
+    patience: int
+    matched_at: Optional[datetime] = None
+    gave_up: bool = False
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = START
+
+    def advance(self, seconds: int = 1) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+class SimulatedMatchQueue(FakeMatchQueueAdapter):
+    """
+    매 연산마다 이벤트 루프에 양보해 동시 요청이 서로 끼어들게 하고,
+    티켓의 created_at을 가상 시계 기준 도착 시각으로 맞추는 대기열
+    """
+
+    def __init__(self, users: Dict[str, SimUser]):
+        super().__init__()
+        self._users = users
+
+    async def enqueue(self, ticket: MatchTicket) -> None:
+        await asyncio.sleep(0)
+        ticket.created_at = self._users[ticket.user_id].arrived_at
+        await super().enqueue(ticket)
+
+    async def dequeue(self, mbti: MBTI) -> Optional[MatchTicket]:
+        await asyncio.sleep(0)
+        return await super().dequeue(mbti)
+
+    async def remove(self, user_id: str, mbti: MBTI) -> bool:
+        await asyncio.sleep(0)
+        return await super().remove(user_id, mbti)
+
+    async def get_sorted_targets_by_size(self, mbti_list: List[str]) -> List[Tuple[str, int]]:
+        await asyncio.sleep(0)
+        return await super().get_sorted_targets_by_size(mbti_list)
+
+
+class RecordingChatRoomPort:
+    """채팅방 생성 요청을 받으면 두 유저를 가상 시계 기준으로 매칭 완료 처리한다"""
+
+    def __init__(self, users: Dict[str, SimUser], clock: VirtualClock):
+        self._users = users
+        self._clock = clock
+        self.pairs: List[Tuple[SimUser, SimUser]] = []
+
+    async def create_chat_room(self, payload: dict) -> Optional[str]:
+        await asyncio.sleep(0)
+        a, b = (self._users[u["userId"]] for u in payload["users"])
+        a.matched_at = b.matched_at = self._clock.now
+        self.pairs.append((a, b))
+        return payload["roomId"]
+
+    async def are_users_partners(self, user1_id: str, user2_id: str) -> bool:
+        return False
+
+
+def _generate_users(seed: int) -> List[SimUser]:
+    """포아송 도착 과정으로 유저를 만든다 (MBTI, 허용 단계, 인내심은 무작위)"""
+    rng = random.Random(seed)
+    users = []
+    t = 0.0
+    while True:
+        t += rng.expovariate(ARRIVALS_PER_SECOND)
+        if t >= ARRIVAL_SECONDS:
+            return users
+        users.append(SimUser(
+            user_id=f"user-{len(users)}",
+            mbti=MBTI(rng.choice(MBTICompatibility.ALL_MBTI)),
+            level=rng.choices(list(LEVEL_WEIGHTS), weights=list(LEVEL_WEIGHTS.values()))[0],
+            arrived_at=START + timedelta(seconds=int(t)),
+            patience=rng.randint(*PATIENCE_SECONDS),
+        ))
+
+
+async def _simulate(seed: int, mode: str) -> Dict[str, float]:
+    users = _generate_users(seed)
+    by_id = {u.user_id: u for u in users}
+    clock = VirtualClock()
+    queue = SimulatedMatchQueue(by_id)
+    chat_room_port = RecordingChatRoomPort(by_id, clock)
+    use_case = MatchUseCase(
+        match_queue_port=queue,
+        chat_room_port=chat_room_port,
+        block_repository=None,
+        block_cache=FakeBlockCache(ready=True),
+        reactive=(mode == "reactive"),
+    )
+
+    pending = list(users)
+    waiting: List[SimUser] = []
+    end = START + timedelta(seconds=ARRIVAL_SECONDS + PATIENCE_SECONDS[1] + 1)
+    while clock.now < end:
+        # 1. 인내심이 다한 유저는 매칭을 취소하고 떠난다
+        for user in [u for u in waiting if u.matched_at is None]:
+            if clock.now >= user.arrived_at + timedelta(seconds=user.patience):
+                user.gave_up = True
+                await use_case.cancel_match(user.user_id, user.mbti)
+        waiting = [u for u in waiting if u.matched_at is None and not u.gave_up]
+
+        # 2. 이번 초에 도착한 유저들의 매칭 요청을 동시에 처리한다
+        arrivals = []
+        while pending and pending[0].arrived_at <= clock.now:
+            arrivals.append(pending.pop(0))
+        await asyncio.gather(*(use_case.request_match(u.user_id, u.mbti, u.level) for u in arrivals))
+        waiting.extend(u for u in arrivals if u.matched_at is None)
+
+        # 3. 배치 모드면 매 초 대기열 전체를 짝짓는다
+        if mode == "batch":
+            await use_case.match_waiting_users(limit_per_queue=16, now=clock.now)
+
+        clock.advance()
+
+    waits = [
+        (u.matched_at - u.arrived_at).total_seconds() if u.matched_at else u.patience
+        for u in users
+    ]
+    levels = [MBTICompatibility.get_level(a.mbti.value, b.mbti.value) for a, b in chat_room_port.pairs]
+    violations = sum(
+        1 for (a, b), level in zip(chat_room_port.pairs, levels) if level > min(a.level, b.level)
+    )
+    return {
+        "users": len(users),
+        "match_rate": sum(1 for u in users if u.matched_at) / len(users),
+        # 한쪽이라도 고르지 않은 궁합 단계로 짝지어진 매칭은 빼고 센 매칭률
+        "fair_match_rate": (sum(1 for u in users if u.matched_at) - 2 * violations) / len(users),
+        "median_wait": statistics.median(waits),
+        "mean_level": statistics.mean(levels) if levels else 0.0,
+        "violations": violations,
+    }
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+async def test_batch_matchmaker_beats_reactive_matching_under_load(seed, capsys):
+    """
+    같은 도착 시나리오에서 두 방식 모두 양쪽 유저가 고른 궁합 단계를 어기지 않으며,
+    배치 매칭이 요청 시 매칭보다 매칭률이 높고 평균 궁합 단계가 낮다.
+    """
+    # When
+    results = {mode: await _simulate(seed, mode) for mode in ("reactive", "batch")}
+
+    with capsys.disabled():
+        for mode, r in results.items():
+            print(f"\n[benchmark] seed={seed} {mode:>8}: users={r['users']} "
+                  f"match_rate={r['match_rate']:.1%} fair_match_rate={r['fair_match_rate']:.1%} "
+                  f"median_wait={r['median_wait']:.0f}s "
+                  f"mean_level={r['mean_level']:.2f} violations={r['violations']}")
+
+    # Then
+    reactive, batch = results["reactive"], results["batch"]
+    assert reactive["violations"] == batch["violations"] == 0
+    assert batch["fair_match_rate"] > reactive["fair_match_rate"]
+    assert batch["mean_level"] < reactive["mean_level"]
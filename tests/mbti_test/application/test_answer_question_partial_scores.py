@@ -0,0 +1,142 @@
+import uuid
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import (
+    HUMAN_QUESTION_COUNT,
+    TOTAL_QUESTION_COUNT,
+    AnswerQuestionService,
+)
+from app.mbti_test.domain import analyzer
+from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType
+from app.mbti_test.domain.models import AIQuestion, AIQuestionResponse, AnalyzeAnswerResponse
+from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
+
+ANSWERS = [
+    "주말엔 친구들이랑 같이 술자리 가서 수다 떨고 노는 게 최고지! ㅋㅋ",
+    "혼자만 있는 시간이 필요해. 집에서 조용히 쉬고 싶어요.",
+    "글쎄... 잘 모르겠어. 뭐 상관없어",
+    "만약에 내가 우주에 간다면 어떤 느낌일까? 상상만 해도 신기해",
+    "어제 3시에 친구 만나서 밥 먹었어",
+    "마치 구름 같아",
+    "왜 그렇게 생각해? 이유가 뭔데? 논리적으로 따져보자",
+    "헐 대박 진짜 속상했겠다 ㅠㅠ 마음이 아파",
+    "근데 그래서 결국 어떻게 됐는데?",
+    "여행 가기 전에 계획 미리 세우고 일정 체크리스트 만들어야지",
+    "그냥 그때 가서 봐서 일단 해보자~",
+    "꼭 해야 하는 건 미리 해",
+] + [f"AI 질문 답변 {i}" for i in range(12)]
+
+
+class SessionRepository:
+    """세션 하나만 저장하는 테스트용 저장소"""
+
+    def __init__(self, session: MBTITestSession):
+        self.session = session
+
+    def find_by_id(self, session_id):
+        return self.session if session_id == self.session.id else None
+
+    def save(self, session):
+        self.session = session
+        return session
+
+
+class AIProvider:
+    """턴마다 고정된 점수를 돌려주는 AI 제공자"""
+
+    def analyze_answer(self, command):
+        return AnalyzeAnswerResponse(dimension="EI", scores={"E": 2, "I": 1}, side="E", score=2, reasoning="")
+
+    def generate_questions(self, command):
+        return AIQuestionResponse(
+            turn=command.turn, questions=[AIQuestion(text=f"AI 질문 {command.turn}", target_dimensions=["E/I"])]
+        )
+
+
+@pytest.fixture
+def service_and_session():
+    session = MBTITestSession(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        test_type=TestType.HUMAN,
+        status=TestStatus.IN_PROGRESS,
+        created_at=datetime.now(),
+        greeting_completed=True,
+        pending_question="첫 번째 질문",
+    )
+    repository = SessionRepository(session)
+    service = AnswerQuestionService(repository, HumanQuestionProvider(), AIProvider())
+    return service, repository
+
+
+def _recomputed_partial_result(session: MBTITestSession) -> dict:
+    """비교 기준: 매 답변마다 전체 Human 답변을 다시 분석하고 AI 턴 점수를 더하던 기존 방식"""
+    result = analyzer.calculate_partial_mbti([t.answer for t in session.turns[:HUMAN_QUESTION_COUNT]])
+    for turn in session.turns[HUMAN_QUESTION_COUNT:]:
+        analyzer.add_scores(result["scores"], turn.scores)
+    return result
+
+
+def test_partial_result_matches_full_recomputation_every_turn(service_and_session):
+    """
+    누적 점수로 만든 부분 결과와 12번째 답변의 분석 결과가 매 턴 전체를 다시 계산한 결과와 같다
+    """
+    # Given
+    service, repository = service_and_session
+
+    for i, answer in enumerate(ANSWERS):
+        # When
+        response = service.execute(AnswerQuestionCommand(session_id=str(repository.session.id), answer=answer))
+
+        # Then
+        assert response.partial_analysis_result == _recomputed_partial_result(repository.session)
+        if i + 1 == HUMAN_QUESTION_COUNT:
+            mbti, scores, confidence = analyzer.run_analysis(ANSWERS[:HUMAN_QUESTION_COUNT])
+            assert response.analysis_result == {"mbti": mbti, "scores": scores, "confidence": confidence}
+
+    assert response.is_completed
+    assert len(repository.session.turns) == TOTAL_QUESTION_COUNT
+
+
+def test_each_answer_analyzes_only_the_new_turn(service_and_session):
+    """
+    턴이 쌓여도 답변 한 번에 키워드 분석은 새 답변 하나에 대해서만 수행된다
+    """
+    # Given
+    service, repository = service_and_session
+
+    with patch(
+        "app.mbti_test.application.use_case.answer_question_service.score_answer",
+        wraps=analyzer.score_answer,
+    ) as score_answer:
+        # When
+        calls_per_answer = []
+        for answer in ANSWERS:
+            before = score_answer.call_count
+            service.execute(AnswerQuestionCommand(session_id=str(repository.session.id), answer=answer))
+            calls_per_answer.append(score_answer.call_count - before)
+
+    # Then: Human phase는 답변당 한 번, AI phase는 저장된 턴 점수만 더한다
+    assert calls_per_answer == [1] * HUMAN_QUESTION_COUNT + [0] * (TOTAL_QUESTION_COUNT - HUMAN_QUESTION_COUNT)
+
+
+def test_session_without_partial_scores_is_rebuilt_from_turns(service_and_session):
+    """
+    누적 점수가 없는 이전 세션은 턴 기록으로 다시 계산한 뒤 이어서 누적한다
+    """
+    # Given: 14턴까지 진행한 뒤 누적 점수가 저장되지 않았던 세션
+    service, repository = service_and_session
+    for answer in ANSWERS[:14]:
+        service.execute(AnswerQuestionCommand(session_id=str(repository.session.id), answer=answer))
+    repository.session.partial_scores = None
+
+    # When
+    response = service.execute(AnswerQuestionCommand(session_id=str(repository.session.id), answer=ANSWERS[14]))
+
+    # Then
+    assert response.partial_analysis_result == _recomputed_partial_result(repository.session)
+    assert repository.session.partial_scores == response.partial_analysis_result["scores"]
@@ -0,0 +1,162 @@
+import asyncio
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.mbti_test.application.port.input.answer_question_use_case import AnswerQuestionCommand
+from app.mbti_test.application.use_case.answer_question_service import (
+    HUMAN_QUESTION_COUNT,
+    AnswerQuestionService,
+)
+from app.mbti_test.application.use_case.async_answer_question_service import AsyncAnswerQuestionService
+from app.mbti_test.domain import analyzer
+from app.mbti_test.domain.mbti_test_session import MBTITestSession, TestStatus, TestType
+from app.mbti_test.domain.models import AIQuestion, AIQuestionResponse, AnalyzeAnswerResponse
+from app.mbti_test.infrastructure.service.human_question_provider import HumanQuestionProvider
+from tests.mbti_test.application.test_answer_question_partial_scores import ANSWERS, SessionRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+class AIProvider:
+    """히스토리 길이에 따라 정해진 점수/질문을 돌려주는 AI 제공자 (동기)"""
+
+    def analyze_answer(self, command):
+        e = len(command.history) % 5
+        return AnalyzeAnswerResponse(
+            dimension=command.target_dimension, scores={"E": e, "I": 2}, side="E" if e >= 2 else "I",
+            score=max(e, 2), reasoning="",
+        )
+
+    def generate_questions(self, command):
+        return AIQuestionResponse(
+            turn=command.turn,
+            questions=[AIQuestion(text=f"AI 질문 {command.turn} ({len(command.history)})", target_dimensions=["E/I"])],
+        )
+
+
+class AsyncAIProvider:
+    """AIProvider와 같은 값을 돌려주는 비동기 제공자. delay만큼 기다렸다가 응답한다."""
+
+    def __init__(self, analyze_delay: float = 0.0, generate_delay: float = 0.0):
+        self.sync = AIProvider()
+        self.analyze_delay = analyze_delay
+        self.generate_delay = generate_delay
+        self.generate_calls = 0
+
+    async def analyze_answer(self, command):
+        await asyncio.sleep(self.analyze_delay)
+        return self.sync.analyze_answer(command)
+
+    async def generate_questions(self, command):
+        self.generate_calls += 1
+        await asyncio.sleep(self.generate_delay)
+        return self.sync.generate_questions(command)
+
+
+def _new_session() -> MBTITestSession:
+    return MBTITestSession(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        test_type=TestType.HUMAN,
+        status=TestStatus.IN_PROGRESS,
+        created_at=datetime.now(),
+        greeting_completed=True,
+        pending_question="첫 번째 질문",
+    )
+
+
+def _command(repository: SessionRepository, answer: str) -> AnswerQuestionCommand:
+    return AnswerQuestionCommand(session_id=str(repository.session.id), answer=answer)
+
+
+async def test_async_service_matches_sync_service_every_turn():
+    """비동기 서비스는 매 턴 동기 서비스와 같은 응답을 내고 같은 턴 기록을 남긴다"""
+    # Given
+    sync_repository = SessionRepository(_new_session())
+    async_repository = SessionRepository(_new_session())
+    async_repository.session.id = sync_repository.session.id  # 같은 seed로 같은 사람 질문 선택
+    sync_service = AnswerQuestionService(sync_repository, HumanQuestionProvider(), AIProvider())
+    async_service = AsyncAnswerQuestionService(async_repository, HumanQuestionProvider(), AsyncAIProvider())
+
+    for answer in ANSWERS:
+        # When
+        expected = sync_service.execute(_command(sync_repository, answer))
+        actual = await async_service.execute(_command(async_repository, answer))
+
+        # Then
+        assert actual == expected
+
+    assert actual.is_completed
+    assert async_repository.session.turns == sync_repository.session.turns
+    assert async_repository.session.pending_question_dimension == sync_repository.session.pending_question_dimension
+
+
+async def test_answer_analysis_and_next_question_run_concurrently():
+    """AI phase에서는 답변 분석과 다음 질문 생성을 동시에 기다린다 (두 호출 시간의 합이 아니라 최댓값)"""
+    # Given: AI phase에 들어선 세션
+    repository = SessionRepository(_new_session())
+    provider = AsyncAIProvider()
+    service = AsyncAnswerQuestionService(repository, HumanQuestionProvider(), provider)
+    for answer in ANSWERS[:HUMAN_QUESTION_COUNT + 1]:
+        await service.execute(_command(repository, answer))
+    provider.analyze_delay = provider.generate_delay = 0.2
+
+    # When
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    response = await service.execute(_command(repository, ANSWERS[HUMAN_QUESTION_COUNT + 1]))
+    elapsed = loop.time() - started
+
+    # Then
+    assert elapsed < 0.35
+    assert response.next_question.content.startswith("AI 질문 3 ")  # 14번째 답변 다음은 AI 3번째 질문
+
+
+async def test_slow_analysis_falls_back_to_keyword_analysis():
+    """답변 분석이 제한 시간을 넘기면 해당 차원의 키워드 분석 결과로 턴을 기록한다"""
+    # Given
+    repository = SessionRepository(_new_session())
+    provider = AsyncAIProvider()
+    service = AsyncAnswerQuestionService(
+        repository, HumanQuestionProvider(), provider, call_timeout_seconds=0.05
+    )
+    for answer in ANSWERS[:HUMAN_QUESTION_COUNT]:
+        await service.execute(_command(repository, answer))
+    repository.session.pending_question_dimension = "TF"
+    provider.analyze_delay = 1.0
+
+    # When
+    response = await service.execute(_command(repository, ANSWERS[6]))
+
+    # Then
+    turn = repository.session.turns[-1]
+    expected = analyzer.analyze_single_answer(ANSWERS[6], "TF")
+    assert (turn.dimension, turn.scores, turn.side, turn.score) == (
+        "TF", expected["scores"], expected["side"], expected["score"]
+    )
+    assert not response.is_completed
+
+
+async def test_slow_question_generation_retries_then_uses_fallback_question():
+    """다음 질문 생성이 매번 제한 시간을 넘기면 세 번 시도한 뒤 기본 질문을 보낸다"""
+    # Given
+    repository = SessionRepository(_new_session())
+    provider = AsyncAIProvider()
+    service = AsyncAnswerQuestionService(
+        repository, HumanQuestionProvider(), provider, call_timeout_seconds=0.05
+    )
+    for answer in ANSWERS[:HUMAN_QUESTION_COUNT]:
+        await service.execute(_command(repository, answer))
+    provider.generate_delay = 1.0
+    provider.generate_calls = 0
+
+    # When
+    response = await service.execute(_command(repository, ANSWERS[HUMAN_QUESTION_COUNT]))
+
+    # Then
+    assert provider.generate_calls == 3
+    assert response.next_question.content == "다음 질문입니다: 당신의 성격을 한 단어로 표현한다면?"
+    assert len(repository.session.turns) == HUMAN_QUESTION_COUNT + 1
+    assert response.question_number == HUMAN_QUESTION_COUNT + 2
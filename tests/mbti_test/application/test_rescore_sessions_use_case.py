@@ -0,0 +1,170 @@
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.router  # noqa: F401  (모든 ORM 모델 등록)
+from app.mbti_test.application.use_case.rescore_sessions_use_case import (
+    RescoreSessionsUseCase,
+    rescore_answers,
+)
+from app.mbti_test.infrastructure.mbti_test_models import MBTITestSessionModel
+from app.mbti_test.infrastructure.repository.mysql_session_rescore_repository import (
+    MySQLSessionRescoreRepository,
+)
+from config.database import Base
+
+HUMAN_ANSWERS = [
+    "주말엔 친구들이랑 같이 술자리 가서 수다 떨고 노는 게 최고지! ㅋㅋ",
+    "혼자만 있는 시간이 필요해. 집에서 조용히 쉬고 싶어요.",
+    "글쎄... 잘 모르겠어. 뭐 상관없어",
+    "만약에 내가 우주에 간다면 어떤 느낌일까? 상상만 해도 신기해",
+    "어제 3시에 친구 만나서 밥 먹었어",
+    "마치 구름 같아",
+    "왜 그렇게 생각해? 이유가 뭔데? 논리적으로 따져보자",
+    "헐 대박 진짜 속상했겠다 ㅠㅠ 마음이 아파",
+    "근데 그래서 결국 어떻게 됐는데?",
+    "여행 가기 전에 계획 미리 세우고 일정 체크리스트 만들어야지",
+    "그냥 그때 가서 봐서 일단 해보자~",
+    "꼭 해야 하는 건 미리 해",
+]
+
+# 저장 당시 분석기가 매긴 값이라고 가정: 사람 턴은 모두 E/S/T/J 1점, AI 턴은 I/N/F/P 2점
+STALE_HUMAN_SIDES = {"EI": "E", "SN": "S", "TF": "T", "JP": "J"}
+AI_SIDES = {"EI": "I", "SN": "N", "TF": "F", "JP": "P"}
+
+
+def _answers(offset: int = 0) -> list[dict]:
+    answers = []
+    for i in range(12):
+        dim = ("EI", "SN", "TF", "JP")[i // 3]
+        answers.append({
+            "turn_number": i + 1,
+            "question": f"질문 {i}",
+            "answer": HUMAN_ANSWERS[(i + offset) % 12],
+            "dimension": dim,
+            "side": STALE_HUMAN_SIDES[dim],
+            "score": 1,
+        })
+    for i in range(12):
+        dim = ("EI", "SN", "TF", "JP")[i % 4]
+        answers.append({
+            "turn_number": 13 + i,
+            "question": f"AI 질문 {i}",
+            "answer": f"AI 질문 답변 {i}",
+            "dimension": dim,
+            "side": AI_SIDES[dim],
+            "score": 2,
+        })
+    return answers
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rescore.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _add_session(session_factory, answers, status="COMPLETED", result=None) -> str:
+    session_id = str(uuid.uuid4())
+    db = session_factory()
+    db.add(MBTITestSessionModel(
+        id=session_id,
+        user_id=str(uuid.uuid4()),
+        status=status,
+        answers=answers,
+        result_mbti=result.mbti if result else "ESTJ",
+        result_dimension_scores=result.dimension_scores if result else {
+            "E": 100, "I": 0, "S": 100, "N": 0, "T": 100, "F": 0, "J": 100, "P": 0,
+        },
+    ))
+    db.commit()
+    db.close()
+    return session_id
+
+
+def _load(session_factory, session_id) -> MBTITestSessionModel:
+    db = session_factory()
+    try:
+        return db.get(MBTITestSessionModel, session_id)
+    finally:
+        db.close()
+
+
+def test_rescore_answers_rescores_human_turns_and_keeps_ai_turns():
+    """사람 턴은 저장된 side/score 대신 현재 분석기로 다시 매기고, AI 턴은 저장된 값을 그대로 쓴다"""
+    # Given
+    answers = _answers()
+    other_stale = [{**ans, "side": AI_SIDES[ans["dimension"]], "score": 5} for ans in answers[:12]] + answers[12:]
+    other_ai = answers[:12] + [{**ans, "score": 10} for ans in answers[12:]]
+
+    # When
+    result = rescore_answers(answers)
+
+    # Then: 저장 당시 값(차원마다 사람 턴 3점, AI 턴 6점)으로 계산한 33:67과 다르다
+    assert rescore_answers(other_stale).dimension_scores == result.dimension_scores
+    assert rescore_answers(other_ai).dimension_scores != result.dimension_scores
+    assert result.dimension_scores != {"E": 33, "I": 67, "S": 33, "N": 67, "T": 33, "F": 67, "J": 33, "P": 67}
+
+
+def test_execute_bulk_updates_only_changed_completed_sessions(session_factory):
+    """결과가 바뀐 COMPLETED 세션만 갱신하고, 이미 같은 결과이거나 진행 중인 세션은 건드리지 않는다"""
+    # Given
+    stale_id = _add_session(session_factory, _answers())
+    _add_session(session_factory, _answers(1), result=rescore_answers(_answers(1)))
+    in_progress_id = _add_session(session_factory, _answers(2), status="IN_PROGRESS")
+    repository = MySQLSessionRescoreRepository(session_factory)
+
+    # When
+    report = RescoreSessionsUseCase(repository, chunk_size=2).execute()
+
+    # Then
+    expected = rescore_answers(_answers())
+    stale = _load(session_factory, stale_id)
+    assert (stale.result_mbti, stale.result_dimension_scores) == (expected.mbti, expected.dimension_scores)
+    assert _load(session_factory, in_progress_id).result_mbti == "ESTJ"
+    assert (report.scanned, report.updated) == (2, 1)
+
+
+def test_dry_run_reports_confidence_shift_without_writing(session_factory):
+    """dry_run이면 DB는 그대로 두고, 차원별 확신도 분포의 전/후 변화와 글자 변경 수만 보고한다"""
+    # Given: 저장된 결과는 모든 차원이 100:0 (확신도 100)
+    session_id = _add_session(session_factory, _answers())
+    repository = MySQLSessionRescoreRepository(session_factory)
+    expected = rescore_answers(_answers())
+
+    # When
+    report = RescoreSessionsUseCase(repository, dry_run=True).execute().to_dict()
+
+    # Then
+    assert _load(session_factory, session_id).result_mbti == "ESTJ"
+    assert (report["scanned"], report["updated"]) == (1, 1)
+    assert report["mbti_changed"] == int(expected.mbti != "ESTJ")
+    for index, (dim, shift) in enumerate(report["dimensions"].items()):
+        assert shift["before"]["80-100"] == 1
+        assert shift["mean_before"] == 100
+        assert sum(shift["after"].values()) == 1
+        a, b = dim
+        assert shift["mean_after"] == abs(expected.dimension_scores[a] - expected.dimension_scores[b])
+        assert shift["flipped"] == int(expected.mbti[index] != "ESTJ"[index])
+
+
+def test_process_pool_matches_in_process_rescoring(session_factory):
+    """프로세스 풀로 병렬 채점해도 현재 프로세스에서 채점한 것과 같은 리포트가 나온다"""
+    # Given
+    for offset in range(12):
+        _add_session(session_factory, _answers(offset))
+    repository = MySQLSessionRescoreRepository(session_factory)
+
+    # When
+    in_process = RescoreSessionsUseCase(repository, chunk_size=5, dry_run=True).execute()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = RescoreSessionsUseCase(repository, executor=executor, chunk_size=5, dry_run=True).execute()
+
+    # Then
+    assert parallel.to_dict() == in_process.to_dict()
+    assert parallel.scanned == 12
@@ -0,0 +1,103 @@
+import random
+from collections import Counter
+
+import pytest
+
+from app.mbti_test.domain import analyzer
+from app.mbti_test.domain.analyzer import DICTIONARY, analyze_single_answer, calculate_partial_mbti, find_keyword_hits
+from app.mbti_test.domain.keyword_automaton import KeywordAutomaton
+
+# 실제 답변과 비슷한 한국어 답변 모음 (키워드가 겹치거나 다른 키워드에 포함되는 경우 포함)
+ANSWER_CORPUS = [
+    "주말엔 친구들이랑 같이 술자리 가서 수다 떨고 노는 게 최고지! ㅋㅋ",
+    "혼자만 있는 시간이 필요해. 집에서 조용히 쉬고 싶어요.",
+    "조용한 카페에서 독서하면서 사색하는 게 좋아",
+    "다같이 모임하면 기빨려서 집콕하고 싶음",
+    "글쎄... 잘 모르겠어. 뭐 상관없어",
+    "만약에 내가 우주에 간다면 어떤 느낌일까? 상상만 해도 신기해",
+    "어제 3시에 친구 만나서 밥 먹었어",
+    "왜 그렇게 생각해? 이유가 뭔데? 논리적으로 따져보자",
+    "헐 대박 진짜 속상했겠다 ㅠㅠ 마음이 아파",
+    "여행 가기 전에 계획 미리 세우고 일정 체크리스트 만들어야지",
+    "그냥 그때 가서 봐서 일단 해보자~",
+    "인싸 아닌 사람도 파티는 좋아할 수 있지",
+    "",
+    "ㅇㅋ",
+    "방구석에서 이어폰 끼고 침대에 누워 있는 게 힐링이야. 회식 번개는 피곤해",
+]
+
+
+def _naive_hits(text: str) -> Counter:
+    """비교 기준: 키워드마다 `in`으로 검사하던 기존 방식"""
+    return Counter(
+        (dim_key, trait, k["w"])
+        for dim_key, traits in DICTIONARY.items()
+        for trait, keyword_list in traits.items()
+        for k in keyword_list
+        if k["word"] in text
+    )
+
+
+def _generated_corpus(seed: int, size: int = 300) -> list[str]:
+    """키워드 조각과 일반 글자를 섞어 겹침/부분 일치가 많은 답변을 만든다"""
+    rng = random.Random(seed)
+    words = [k["word"] for traits in DICTIONARY.values() for kl in traits.values() for k in kl]
+    filler = list("가나다라마바사 아자차카타파하 .!?~ㅋㅎ")
+    corpus = []
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(1, 12)):
+            word = rng.choice(words)
+            if rng.random() < 0.3:
+                word = word[: rng.randint(1, len(word))]
+            parts.append(word)
+            parts.append("".join(rng.choices(filler, k=rng.randint(0, 3))))
+        corpus.append("".join(parts))
+    return corpus
+
+
+def test_automaton_finds_overlapping_and_nested_keywords():
+    # Given
+    automaton = KeywordAutomaton(["조용", "조용히", "용히", "히", "혼자", "혼자만"])
+
+    # When
+    found = automaton.find("혼자만 조용히 혼자")
+
+    # Then: 겹치거나 포함된 키워드도 모두, 여러 번 나와도 한 번만
+    assert {automaton.words[i] for i in found} == {"조용", "조용히", "용히", "히", "혼자", "혼자만"}
+    assert automaton.find("") == set()
+
+
+def test_automaton_rejects_empty_keyword():
+    # Given / When / Then
+    with pytest.raises(ValueError):
+        KeywordAutomaton(["같이", ""])
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_keyword_hits_match_naive_scan(seed):
+    # Given
+    corpus = ANSWER_CORPUS + _generated_corpus(seed)
+
+    # When / Then
+    for text in corpus:
+        assert Counter(find_keyword_hits(text)) == _naive_hits(text), text
+
+
+def test_analyzer_results_match_naive_scan(monkeypatch):
+    # Given
+    answers = [a for a in ANSWER_CORPUS if a] + _generated_corpus(seed=3, size=12)
+    with_automaton = (
+        calculate_partial_mbti(answers),
+        [analyze_single_answer(a, dim) for a in answers for dim in DICTIONARY],
+    )
+
+    # When: 키워드 검사를 기존 방식으로 바꿔 같은 답변을 다시 분석
+    monkeypatch.setattr(analyzer, "find_keyword_hits", lambda text: list(_naive_hits(text).elements()))
+    with_naive_scan = (
+        calculate_partial_mbti(answers),
+        [analyze_single_answer(a, dim) for a in answers for dim in DICTIONARY],
+    )
+
+    # Then
+    assert with_automaton == with_naive_scan
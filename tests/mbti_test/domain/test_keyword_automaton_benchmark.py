@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from app.mbti_test.domain.analyzer import find_keyword_hits
+from tests.mbti_test.domain.test_keyword_automaton import ANSWER_CORPUS, _generated_corpus, _naive_hits
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 20
+
+
+def _throughput(scan, corpus: list[str]) -> float:
+    """corpus를 ROUNDS번 훑은 초당 답변 처리 수"""
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for text in corpus:
+            scan(text)
+    return ROUNDS * len(corpus) / (time.perf_counter() - started)
+
+
+def test_automaton_outperforms_naive_scan(capsys):
+    """사전 전체를 한 번 훑는 오토마톤이 키워드마다 `in` 검사하는 방식보다 초당 더 많은 답변을 처리한다"""
+    # Given
+    corpus = [a for a in ANSWER_CORPUS if a] + _generated_corpus(seed=0, size=500)
+
+    # When
+    naive = _throughput(_naive_hits, corpus)
+    automaton = _throughput(find_keyword_hits, corpus)
+
+    with capsys.disabled():
+        print(f"\n[benchmark] keyword scan naive: {naive:,.0f} answers/s, automaton: {automaton:,.0f} answers/s "
+              f"({len(corpus)} answers x {ROUNDS})")
+
+    # Then
+    assert automaton > naive
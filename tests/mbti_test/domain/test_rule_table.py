@@ -0,0 +1,286 @@
+import random
+import re
+
+import pytest
+
+from app.mbti_test.domain.analyzer import (
+    LINGUISTIC_RULES,
+    PATTERN_RULES,
+    SINGLE_ANSWER_PATTERN_RULES,
+    analyze_linguistic_detail,
+    analyze_single_answer,
+    find_keyword_hits,
+    score_answer,
+)
+from app.mbti_test.domain.rule_table import Rule, RuleSet
+from tests.mbti_test.domain.test_keyword_automaton import ANSWER_CORPUS, _generated_corpus
+
+# 규칙들이 서로 겹치거나 끝맺음/부호에 걸리도록 만든 답변 조각
+RULE_FRAGMENTS = [
+    "왜", "?", "왜?", "근데", "그래서", "했다.", "함.", "임", "지!", "까", "다",
+    "!", "♥", "ㅠㅠ", "ㅋㅋ", "ㅎㅎ", "구나", "네요", "잖아요", "~", "..", "아아", "으으",
+    "3개", "10분", "만원", "먹었어", "갔다왔어", "마치", "~처럼", "것 같", "을까", "아마", "혹시",
+    "뭔가", "약간", "해야", "할게", "꼭", "계획", "글쎄", "몰라", "일단", "그냥", "봐서",
+    "없", "안", "못", "아무", "요", ".", "만약에", "~라면", "현실", "맛있", "속상", "체크", "시간",
+    " ", "  ", "\n", "가", "나", "친구", "집에서",
+]
+
+
+def _reference_linguistic_detail(ans: str, dim: str, scores: dict):
+    """비교 기준: 규칙표 도입 전 정밀 언어 분석 (re.search를 규칙마다 호출)"""
+    if not isinstance(ans, str) or not ans: return
+
+    ans_len = len(ans.replace(" ", ""))  # 공백 제외 글자 수로 변경 (더 정확함)
+    clean_ans = ans.strip()
+
+    # --- [EI] 에너지 방향성 ---
+    if dim == "EI":
+        # E: 긴 문장, 활기찬 부호
+        if ans_len > 30: scores["E"] += 2  # 기준 40 -> 30으로 완화
+        if "!" in clean_ans or "~" in clean_ans: scores["E"] += 1
+        if "ㅋㅋ" in clean_ans or "ㅎㅎ" in clean_ans: scores["E"] += 1
+
+        # I: 짧은 문장, '없'는 부정어, 쉼
+        # "아무 스케줄 없이 푹 쉬는 하루" -> 공백 제외 12글자 -> 이제 걸림!
+        if ans_len < 15: scores["I"] += 2
+        if clean_ans.endswith(".") or clean_ans.endswith("요"): scores["I"] += 1
+
+        # [추가] 소극적/부정적 표현은 I일 확률 높음
+        if re.search(r"없|안|못|아무", clean_ans): scores["I"] += 1
+
+    # --- [SN] 인식 방식 (들여쓰기 수정 완료) ---
+    if dim == "SN":
+        # 1. [S] 숫자와 단위 = 현실 감각
+        # 예: "3개", "10분", "만원"
+        if re.search(r"[0-9]+|일|월|년|개|번|시|분|원", clean_ans):
+            scores["S"] += 2
+
+        # 2. [S] 과거 시제/완료형 = 직접 경험한 사실
+        # 예: "먹었어", "갔다왔어", "봤어" -> 경험 기반(S)
+        if re.search(r"았|었|했|봤|갔|왔", clean_ans):
+            scores["S"] += 1.5
+
+        # 3. [N] 비유적 표현 (직유/은유)
+        # 예: "마치 구름 같아", "그림처럼 예뻐"
+        if re.search(r"마치|~처럼|~같이|~양|듯한", clean_ans):
+            scores["N"] += 3  # 비유는 N의 강력한 신호
+
+        # 4. [N] 불확실/추측/미래 시제
+        # 예: "일 것 같아", "아마도", "그러지 않을까?"
+        if re.search(r"것 같|을까|겠지|지도|아마|혹시", clean_ans):
+            scores["N"] += 2
+
+        # 5. [N] 모호한 수식어
+        # 예: "뭔가 느낌이", "약간 그런 거"
+        if re.search(r"뭔가|약간|묘한|이상한|그런", clean_ans):
+            scores["N"] += 1
+
+    # --- [TF] 판단 근거 (들여쓰기 수정 완료) ---
+    if dim == "TF":
+        # 1. [T] 의문문과 인과관계 (따지는 말투)
+        # 예: "왜?", "그래서?", "근데 그게 맞아?"
+        if "?" in clean_ans:
+            scores["T"] += 1.5
+        if "왜" in clean_ans and "?" in clean_ans:  # "왜?" 콤보는 강력한 T
+            scores["T"] += 2
+
+        # 2. [T] 논리적 접속사
+        # 예: "근데", "하지만", "그러니까", "결국"
+        if re.search(r"근데|하지만|그래서|그러니까|결국|즉", clean_ans):
+            scores["T"] += 1.5
+
+        # 3. [T] 단정적/건조한 어미
+        # 예: "~다.", "~함.", "~임.", "~지."
+        if re.search(r"(다|함|임|지|까)(\.|!|$)", clean_ans):
+            scores["T"] += 1
+
+        # 4. [F] 감탄사와 이모티콘 (풍부한 리액션)
+        # 예: "!", "ㅠㅠ", "ㅎㅎㅎ", "♥"
+        if re.search(r"!|♥|♡", clean_ans):
+            scores["F"] += 1.5
+        if re.search(r"[ㅠㅜㅎㅋ]{2,}", clean_ans):  # 2글자 이상 연속 (ㅠㅠ, ㅋㅋ)
+            scores["F"] += 2
+
+        # 5. [F] 공감/부드러운 어미
+        # 예: "~구나", "~네요", "~가요", "~잖아요"
+        if re.search(r"구나|네요|아요|어요|죠|잖아요", clean_ans):
+            scores["F"] += 1.5
+
+        # 6. [F] 길게 끄는 말투 (감정의 여운)
+        # 예: "아~~~", "진짜...", "그렇구나..."
+        if re.search(r"~|\.\.|[아어으]{2,}", clean_ans):  # 모음 길게(아아아)
+            scores["F"] += 1.5
+
+    # --- [JP] 생활 양식 (들여쓰기 수정 완료) ---
+    if dim == "JP":
+        if re.search(r"해야|할게|하자|필수|꼭|계획", clean_ans): scores["J"] += 2
+        if re.search(r"글쎄|아마|몰라|일단|그냥|봐서", clean_ans): scores["P"] += 2
+
+
+def _reference_score_answer(ans) -> dict:
+    """비교 기준: 규칙표 도입 전 답변 점수 계산"""
+    scores = {k: 0 for k in "EISNTFJP"}
+
+    # 안전한 문자열 처리
+    if not isinstance(ans, str) or not ans: return scores
+
+    # [플래그] 이번 답변이 키워드나 패턴에 걸렸는지 확인
+    is_detected = False
+
+    # 1. 전차원 교차 분석 (Dictionary Scanning)
+    for _, trait, weight in find_keyword_hits(ans):
+        scores[trait] += weight
+        is_detected = True  # 감지됨!
+
+    # 2. 정규식 패턴 분석 (Regex Scanning)
+    # [SN]
+    if re.search(r"만약에|~라면|상상|미래|혹시|가정|세계관", ans):
+        scores["N"] += 3;
+        is_detected = True
+    # [S] 오감(시각,미각 등)을 나타내는 표현 + 현실 인식
+    if re.search(r"맛있|배고파|색깔|냄새|소리|보여|들려|아파|추워|더워|현실|당장|팩트|실제", ans):
+        scores["S"] += 3;
+        is_detected = True
+
+    # [TF]
+    # T: 원인 분석 및 해결책 제시
+    if re.search(r"왜|이유|원인|논리|따져|생각해|해결|방법", ans):
+        scores["T"] += 4;
+        is_detected = True
+    # F: 감정 이입 및 리액션
+    if re.search(r"속상|서운|어떡해|마음|괜찮|좋겠|대박|헐|진짜|기쁨|행복", ans):
+        scores["F"] += 4;
+        is_detected = True
+
+    # [JP]
+    if re.search(r"계획|미리|체크|일정", ans):
+        scores["J"] += 3;
+        is_detected = True
+    if re.search(r"봐서|그때|일단|그냥", ans):
+        scores["P"] += 3;
+        is_detected = True
+
+    # =======================================================
+    # [NEW] 3. 최후의 보루: 아무것도 안 잡혔으면 N(추상) +1
+    # =======================================================
+    if not is_detected:
+        # "뭔가 감지가 안 되는 묘한 답변 -> 추상적(N)일 확률 높음"
+        scores["N"] += 1
+
+    # 4. 정밀 언어 분석 (보정은 보정대로 계속 수행)
+    # (N+1을 받았더라도, 말투에서 I나 P가 감지될 수 있으므로 수행)
+    _reference_linguistic_detail(ans, "EI", scores)
+    _reference_linguistic_detail(ans, "SN", scores)
+    _reference_linguistic_detail(ans, "TF", scores)
+    _reference_linguistic_detail(ans, "JP", scores)
+
+    return scores
+
+
+def _reference_single_answer(answer: str, dimension: str) -> dict:
+    """비교 기준: 규칙표 도입 전 단일 답변 분석"""
+    scores = {k: 0 for k in dimension}  # 예: {'E':0, 'I':0}
+    is_detected = False  # 감지 플래그
+
+    # 1. 키워드
+    for dim_key, trait, weight in find_keyword_hits(answer):
+        if dim_key == dimension:
+            scores[trait] += weight
+            is_detected = True
+
+    # 2. 정규식 패턴 (N+1 보정을 위해 감지 여부 체크)
+    if dimension == "SN":
+        if re.search(r"만약에|~라면|상상|미래|혹시", answer): scores["N"] += 3; is_detected = True
+        if re.search(r"현실|당장|팩트|실제", answer): scores["S"] += 3; is_detected = True
+    if dimension == "TF":
+        if re.search(r"왜|이유|논리|따져", answer): scores["T"] += 4; is_detected = True
+        if re.search(r"속상|서운|어떡해|마음", answer): scores["F"] += 4; is_detected = True
+    if dimension == "JP":
+        if re.search(r"계획|체크|리스트|시간", answer): scores["J"] += 3; is_detected = True
+        if re.search(r"봐서|그때|일단|그냥", answer): scores["P"] += 3; is_detected = True
+
+    # 3. [최후의 보루] 미감지 시 N+1 (SN 차원 질문이 아니더라도 N 점수 부여)
+    # 단일 차원 분석이므로 'N'이 있는 dimension(SN)일 때만 적용하는 것이 논리적임
+    if not is_detected and "N" in scores:
+        scores["N"] += 1
+
+    # 4. [중요] 정밀 언어 분석 (무조건 실행하여 1~2점 누적)
+    _reference_linguistic_detail(answer, dimension, scores)
+
+    # 점수 계산
+    trait1, trait2 = tuple(dimension)
+    score1 = scores.get(trait1, 0)
+    score2 = scores.get(trait2, 0)
+
+    side = trait1 if score1 >= score2 else trait2
+    score = score1 if score1 >= score2 else score2
+
+    return {"scores": scores, "side": side, "score": score}
+
+
+def _rule_corpus(seed: int, size: int = 400) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choices(RULE_FRAGMENTS, k=rng.randint(1, 10))) for _ in range(size)]
+
+
+def _corpus() -> list[str]:
+    return ANSWER_CORPUS + ["   ", "요", "왜", "?"] + _generated_corpus(seed=5, size=200) + _rule_corpus(seed=0)
+
+
+def test_rule_set_finds_every_rule_like_re_search():
+    # Given: 같은 위치에서 겹치는 규칙들
+    rules = [
+        Rule("why", r"왜", "T", 1, "TF"),
+        Rule("question", r"\?", "T", 1, "TF"),
+        Rule("why_question", r"왜[\s\S]*\?", "T", 1, "TF"),
+        Rule("ending", r"(?:\.|요)$", "I", 1, "EI"),
+    ]
+    rule_set = RuleSet(rules)
+
+    # When / Then
+    for text in ["왜?", "왜 그랬어요", "그래요?", "", "abc"]:
+        assert [r.name for r in rule_set.hits(text)] == [r.name for r in rules if r.search(text)], text
+
+
+def test_rule_set_can_leave_out_a_rule():
+    """규칙표에서 규칙 하나를 빼고 다시 만들면 그 규칙만 걸리지 않는다 (규칙 A/B 비교용)"""
+    # Given
+    without_question = RuleSet(r for r in LINGUISTIC_RULES if r.name != "tf_question")
+
+    # When
+    names = {r.name for r in without_question.hits("왜 그래?")}
+
+    # Then
+    assert "tf_question" not in names
+    assert "tf_why_question" in names
+
+
+def test_rule_names_are_unique():
+    names = [r.name for r in LINGUISTIC_RULES + PATTERN_RULES + SINGLE_ANSWER_PATTERN_RULES]
+    assert len(names) == len(set(names))
+
+
+def test_linguistic_detail_matches_reference():
+    for text in _corpus():
+        for dim in ("EI", "SN", "TF", "JP"):
+            # Given
+            expected = {k: 0 for k in "EISNTFJP"}
+            actual = {k: 0 for k in "EISNTFJP"}
+
+            # When
+            _reference_linguistic_detail(text, dim, expected)
+            analyze_linguistic_detail(text, dim, actual)
+
+            # Then
+            assert actual == expected, (text, dim)
+
+
+def test_score_answer_matches_reference():
+    for text in _corpus():
+        assert score_answer(text) == _reference_score_answer(text), text
+
+
+@pytest.mark.parametrize("dimension", ["EI", "SN", "TF", "JP"])
+def test_analyze_single_answer_matches_reference(dimension):
+    for text in _corpus():
+        assert analyze_single_answer(text, dimension) == _reference_single_answer(text, dimension), text
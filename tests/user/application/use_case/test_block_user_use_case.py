@@ -1,5 +1,6 @@
+import threading
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from app.user.application.use_case.block_user_use_case import BlockUserUseCaseImpl
 from app.user.domain.block import Block
@@ -34,7 +35,8 @@ def block_user_use_case(mock_block_repository, mock_user_repository, mock_deacti
 
 
 class TestBlockUser:
-    def test_block_user_successfully(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+    @pytest.mark.asyncio
+    async def test_block_user_successfully(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
         # given
         blocker_id = uuid.uuid4()
         blocked_id = uuid.uuid4()
@@ -46,7 +48,7 @@ class TestBlockUser:
         mock_block_repository.find_by_blocker_and_blocked.return_value = None
 
         # when
-        block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+        await block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
 
         # then
         mock_block_repository.save.assert_called_once()
@@ -56,7 +58,8 @@ class TestBlockUser:
         assert saved_block.blocked_id == blocked_id
         mock_deactivate_chat_room_use_case.execute.assert_called_once_with(user1_id=blocker_id, user2_id=blocked_id)
 
-    def test_block_user_who_is_already_blocked(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+    @pytest.mark.asyncio
+    async def test_block_user_who_is_already_blocked(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
         # given
         blocker_id = uuid.uuid4()
         blocked_id = uuid.uuid4()
@@ -70,8 +73,88 @@ class TestBlockUser:
         )
 
         # when
-        block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+        await block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
 
         # then
         mock_block_repository.save.assert_not_called()
         mock_deactivate_chat_room_use_case.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_block_user_updates_block_cache(self, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+        # given
+        blocker_id = uuid.uuid4()
+        blocked_id = uuid.uuid4()
+        block_cache = AsyncMock()
+        use_case = BlockUserUseCaseImpl(
+            block_repository=mock_block_repository,
+            user_repository=mock_user_repository,
+            deactivate_chat_room_use_case=mock_deactivate_chat_room_use_case,
+            block_cache=block_cache
+        )
+
+        blocker = User(id=str(blocker_id), email="blocker@test.com", mbti=MBTI("INTJ"), gender=Gender("FEMALE"))
+        blocked = User(id=str(blocked_id), email="blocked@test.com", mbti=MBTI("ENFP"), gender=Gender("MALE"))
+
+        mock_user_repository.find_by_id.side_effect = [blocker, blocked]
+        mock_block_repository.find_by_blocker_and_blocked.return_value = None
+
+        # when
+        await use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+
+        # then
+        mock_block_repository.save.assert_called_once()
+        block_cache.add_block.assert_awaited_once_with(str(blocker_id), str(blocked_id))
+
+    @pytest.mark.asyncio
+    async def test_block_user_removes_active_chat_pair(self, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+        # given
+        blocker_id = uuid.uuid4()
+        blocked_id = uuid.uuid4()
+        active_chat_pairs = AsyncMock()
+        use_case = BlockUserUseCaseImpl(
+            block_repository=mock_block_repository,
+            user_repository=mock_user_repository,
+            deactivate_chat_room_use_case=mock_deactivate_chat_room_use_case,
+            active_chat_pairs=active_chat_pairs
+        )
+
+        blocker = User(id=str(blocker_id), email="blocker@test.com", mbti=MBTI("INTJ"), gender=Gender("FEMALE"))
+        blocked = User(id=str(blocked_id), email="blocked@test.com", mbti=MBTI("ENFP"), gender=Gender("MALE"))
+
+        mock_user_repository.find_by_id.side_effect = [blocker, blocked]
+        mock_block_repository.find_by_blocker_and_blocked.return_value = None
+
+        # when
+        await use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+
+        # then
+        active_chat_pairs.remove.assert_awaited_once_with(str(blocker_id), str(blocked_id))
+
+    @pytest.mark.asyncio
+    async def test_block_user_runs_sql_off_the_event_loop(self, block_user_use_case, mock_block_repository, mock_user_repository, mock_deactivate_chat_room_use_case):
+        # given
+        blocker_id = uuid.uuid4()
+        blocked_id = uuid.uuid4()
+        loop_thread = threading.get_ident()
+        sql_threads = []
+
+        blocker = User(id=str(blocker_id), email="blocker@test.com", mbti=MBTI("INTJ"), gender=Gender("FEMALE"))
+        blocked = User(id=str(blocked_id), email="blocked@test.com", mbti=MBTI("ENFP"), gender=Gender("MALE"))
+
+        def find_by_id(user_id):
+            sql_threads.append(threading.get_ident())
+            return blocker if user_id == str(blocker_id) else blocked
+
+        mock_user_repository.find_by_id.side_effect = find_by_id
+        mock_block_repository.find_by_blocker_and_blocked.return_value = None
+        mock_block_repository.save.side_effect = lambda block: sql_threads.append(threading.get_ident())
+        mock_deactivate_chat_room_use_case.execute.side_effect = (
+            lambda **kwargs: sql_threads.append(threading.get_ident())
+        )
+
+        # when
+        await block_user_use_case.block(blocker_id=blocker_id, blocked_id=blocked_id)
+
+        # then: 유저 조회/차단 저장/채팅방 비활성화는 이벤트 루프 스레드가 아닌 곳에서 실행된다
+        assert len(sql_threads) == 4
+        assert loop_thread not in sql_threads
@@ -0,0 +1,160 @@
+import os
+import random
+import uuid
+from unittest.mock import Mock
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.router  # noqa: F401  (모든 ORM 모델 등록)
+from app.user.application.use_case.block_user_use_case import BlockUserUseCaseImpl
+from app.user.application.use_case.warm_up_block_cache_use_case import WarmUpBlockCacheUseCase
+from app.user.domain.block import Block
+from app.user.infrastructure.model.user_model import UserModel
+from app.user.infrastructure.repository.mysql_block_repository import MySQLBlockRepository
+from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
+from app.user.infrastructure.repository.redis_block_cache_repository import RedisBlockCacheRepository
+from config.database import Base
+from tests.user.fixtures.fake_block_cache import FakeBlockCache
+
+pytestmark = pytest.mark.asyncio
+
+USER_COUNT = 30
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'blocks.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def user_ids(db):
+    ids = [str(uuid.uuid4()) for _ in range(USER_COUNT)]
+    for i, user_id in enumerate(ids):
+        db.add(UserModel(id=user_id, email=f"user{i}@test.com"))
+    db.commit()
+    return ids
+
+
+class RedisBlockCacheForTest(RedisBlockCacheRepository):
+    """실제 키와 섞이지 않도록 테스트 전용 접두사를 쓰는 Redis 캐시"""
+
+    BLOCKED_KEY_PREFIX = "test:block:blocked:"
+    BLOCKED_BY_KEY_PREFIX = "test:block:blocked_by:"
+    READY_KEY = "test:block:ready"
+    REBUILD_LOCK_KEY = "test:block:rebuild_lock"
+
+
+@pytest_asyncio.fixture(params=["fake", "redis"])
+async def block_cache(request):
+    if request.param == "fake":
+        yield FakeBlockCache()
+        return
+
+    client = aioredis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"), decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis 서버에 연결할 수 없습니다")
+
+    yield RedisBlockCacheForTest(client)
+    keys = [key async for key in client.scan_iter(match="test:block:*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+def _random_blocks(user_ids: list[str], count: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    pairs = set()
+    while len(pairs) < count:
+        blocker_id, blocked_id = rng.sample(user_ids, 2)
+        pairs.add((blocker_id, blocked_id))
+    return sorted(pairs)
+
+
+async def _assert_consistent_with_sql(block_cache, block_repository: MySQLBlockRepository, user_ids: list[str]):
+    """모든 유저 쌍에 대해 캐시 결과가 MySQL 양방향 조회 결과와 같은지 확인한다"""
+    for user_id in user_ids:
+        candidates = [other for other in user_ids if other != user_id]
+        expected = {
+            other for other in candidates
+            if block_repository.find_by_blocker_and_blocked(user_id, other)
+            or block_repository.find_by_blocker_and_blocked(other, user_id)
+        }
+        assert await block_cache.find_blocked_among(user_id, candidates) == expected
+
+
+async def test_warm_up_cache_matches_blocks_table(db, user_ids, block_cache):
+    """blocks 테이블로 적재한 캐시는 MySQL 조회와 같은 차단 관계를 돌려준다"""
+    # Given
+    block_repository = MySQLBlockRepository(db)
+    for blocker_id, blocked_id in _random_blocks(user_ids, count=60, seed=1):
+        block_repository.save(Block(blocker_id=blocker_id, blocked_id=blocked_id))
+
+    # When
+    loaded = await WarmUpBlockCacheUseCase(block_repository, block_cache).execute()
+
+    # Then
+    assert loaded == 60
+    assert await block_cache.is_ready()
+    await _assert_consistent_with_sql(block_cache, block_repository, user_ids)
+
+
+async def test_block_use_case_keeps_cache_consistent_after_warm_up(db, user_ids, block_cache):
+    """적재 이후 BlockUserUseCase로 생긴 차단도 캐시에 반영된다"""
+    # Given
+    block_repository = MySQLBlockRepository(db)
+    for blocker_id, blocked_id in _random_blocks(user_ids, count=20, seed=2):
+        block_repository.save(Block(blocker_id=blocker_id, blocked_id=blocked_id))
+    await WarmUpBlockCacheUseCase(block_repository, block_cache).execute()
+
+    use_case = BlockUserUseCaseImpl(
+        block_repository=block_repository,
+        user_repository=MySQLUserRepository(db),
+        deactivate_chat_room_use_case=Mock(),
+        block_cache=block_cache
+    )
+
+    # When
+    for blocker_id, blocked_id in _random_blocks(user_ids, count=40, seed=3):
+        await use_case.block(blocker_id=uuid.UUID(blocker_id), blocked_id=uuid.UUID(blocked_id))
+
+    # Then
+    await _assert_consistent_with_sql(block_cache, block_repository, user_ids)
+
+
+async def test_cache_is_not_ready_before_warm_up(block_cache):
+    """적재 전에는 None을 돌려 MySQL 조회로 동작하게 한다"""
+    # When
+    result = await block_cache.find_blocked_among("user-a", ["user-b"])
+
+    # Then
+    assert result is None
+
+
+async def test_warm_up_skips_ready_cache_unless_forced(db, user_ids, block_cache):
+    """이미 준비된 캐시는 다시 적재하지 않고, force면 다시 적재한다"""
+    # Given
+    block_repository = MySQLBlockRepository(db)
+    block_repository.save(Block(blocker_id=user_ids[0], blocked_id=user_ids[1]))
+    use_case = WarmUpBlockCacheUseCase(block_repository, block_cache)
+    await use_case.execute()
+
+    # When
+    skipped = await use_case.execute()
+    rebuilt = await use_case.execute(force=True)
+
+    # Then
+    assert skipped == 0
+    assert rebuilt == 1
+    assert await block_cache.find_blocked_among(user_ids[1], [user_ids[0]]) == {user_ids[0]}
@@ -0,0 +1,43 @@
+from app.user.application.port.block_cache_port import BlockCachePort
+
+
+class FakeBlockCache(BlockCachePort):
+    """테스트용 Fake 차단 관계 캐시 (RedisBlockCacheRepository와 같은 동작을 메모리로 흉내낸다)"""
+
+    def __init__(self, ready: bool = False):
+        self._blocked: dict[str, set[str]] = {}
+        self._blocked_by: dict[str, set[str]] = {}
+        self._ready = ready
+        self._rebuilding = False
+        self.lookups = 0
+
+    async def add_block(self, blocker_id: str, blocked_id: str) -> None:
+        self._blocked.setdefault(blocker_id, set()).add(blocked_id)
+        self._blocked_by.setdefault(blocked_id, set()).add(blocker_id)
+
+    async def find_blocked_among(self, user_id: str, candidate_ids: list[str]) -> set[str] | None:
+        self.lookups += 1
+        if not self._ready:
+            return None
+        related = self._blocked.get(user_id, set()) | self._blocked_by.get(user_id, set())
+        return {candidate_id for candidate_id in candidate_ids if candidate_id in related}
+
+    async def is_ready(self) -> bool:
+        return self._ready
+
+    async def begin_rebuild(self) -> bool:
+        if self._rebuilding:
+            return False
+        self._rebuilding = True
+        self._ready = False
+        self._blocked.clear()
+        self._blocked_by.clear()
+        return True
+
+    async def load(self, pairs: list[tuple[str, str]]) -> None:
+        for blocker_id, blocked_id in pairs:
+            await self.add_block(blocker_id, blocked_id)
+
+    async def finish_rebuild(self) -> None:
+        self._ready = True
+        self._rebuilding = False